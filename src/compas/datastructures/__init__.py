@@ -30,6 +30,7 @@ Data structure
 
     HalfEdge
     BaseMesh
+    CompactMesh
 
 
 Algorithms
@@ -49,6 +50,9 @@ Algorithms
     mesh_face_adjacency
     mesh_flip_cycles
     mesh_geodesic_distances_numpy
+    GeodesicSolver
+    MeshBVH
+    RayMesh
     mesh_is_connected
     mesh_isolines_numpy
     mesh_merge_faces
@@ -99,6 +99,54 @@ class Datastructure(Base):
             else:
                 json.dump(self.data, f, cls=DataEncoder)
 
+    @classmethod
+    def from_npz(cls, filepath):
+        """Construct a datastructure from structured data contained in a binary npz file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the npz file.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Datastructure`
+            An object of the type of ``cls``.
+
+        Notes
+        -----
+        This constructor method is meant to be used in conjunction with the
+        corresponding *to_npz* method.
+        See :class:`compas.files.NPZ` for the details of the format.
+        """
+        from compas.files.npz_numpy import NPZReader
+        reader = NPZReader(filepath)
+        try:
+            datastructure = cls()
+            reader.load(datastructure)
+        finally:
+            reader.close()
+        return datastructure
+
+    def to_npz(self, filepath, compressed=False):
+        """Serialise the structured data representing the datastructure to a binary npz file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path to the npz file.
+        compressed : bool, optional
+            Compress the file.
+            Default is ``False``.
+
+        Notes
+        -----
+        The data is stored losslessly, as with *to_json*,
+        but the topology and the attributes are stored as typed arrays.
+        """
+        from compas.files.npz_numpy import NPZWriter
+        NPZWriter(filepath, self, compressed=compressed).write()
+
     def copy(self, cls=None):
         """Make an independent copy of the datastructure object.
 
@@ -29,10 +29,12 @@ from .trimming import *  # noqa: F401 F403
 
 if not IPY:
     from .bbox_numpy import *  # noqa: F401 F403
+    from .bvh_numpy import *  # noqa: F401 F403
     from .contours_numpy import *  # noqa: F401 F403
     from .descent_numpy import *  # noqa: F401 F403
     from .geodesics_numpy import *  # noqa: F401 F403
     from .pull_numpy import *  # noqa: F401 F403
+    from .raycast_numpy import *  # noqa: F401 F403
     from .smoothing_numpy import *  # noqa: F401 F403
     from .transformations_numpy import *  # noqa: F401 F403
 
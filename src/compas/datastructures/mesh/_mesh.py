@@ -59,6 +59,33 @@ class Mesh(BaseMesh):
         from compas.datastructures.mesh.transformations_numpy import mesh_transform_numpy
         mesh_transform_numpy(self, M)
 
+    @classmethod
+    def from_compact(cls, compact):
+        """Construct a mesh from an array-backed compact mesh.
+
+        Parameters
+        ----------
+        compact : :class:`compas.datastructures.CompactMesh`
+            The compact mesh.
+
+        Returns
+        -------
+        Mesh
+            A mesh object.
+        """
+        return compact.to_mesh(cls)
+
+    def to_compact(self):
+        """Convert the mesh to an array-backed compact mesh.
+
+        Returns
+        -------
+        :class:`compas.datastructures.CompactMesh`
+            The compact mesh.
+        """
+        from compas.datastructures.mesh.core.compact_numpy import CompactMesh
+        return CompactMesh.from_mesh(self)
+
     # def to_trimesh(self):
     #     # convert to mesh with only triangle faces
     #     # provides options that define the rules for triangulation
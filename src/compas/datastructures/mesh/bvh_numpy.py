@@ -0,0 +1,426 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from itertools import chain
+
+from numpy import arange
+from numpy import argpartition
+from numpy import asarray
+from numpy import clip
+from numpy import concatenate
+from numpy import cumsum
+from numpy import einsum
+from numpy import errstate
+from numpy import float64
+from numpy import fromiter
+from numpy import full
+from numpy import int64
+from numpy import inf
+from numpy import maximum
+from numpy import minimum
+from numpy import repeat
+from numpy import unique
+from numpy import where
+from numpy import zeros
+
+from scipy.spatial import cKDTree
+
+from compas.datastructures.mesh.core.geometry_numpy import mesh_vertex_face_buffers
+from compas.datastructures.mesh.core.geometry_numpy import _face_corners
+
+
+__all__ = ['MeshBVH']
+
+
+class MeshBVH(object):
+    """Bounding volume hierarchy of the triangles of a mesh, for batched closest point queries.
+
+    Parameters
+    ----------
+    vertices : array-like
+        The XYZ coordinates of the vertices.
+    triangles : array-like
+        The vertex indices of the triangles.
+    leafsize : int, optional
+        The maximum number of triangles per leaf.
+        Default is ``8``.
+
+    Attributes
+    ----------
+    vertices : array
+        The ``(n, 3)`` array of vertex coordinates.
+    triangles : array
+        The ``(t, 3)`` array of vertex indices of the triangles.
+    triangle_face : array
+        The index of the face of every triangle, in the order of ``mesh.faces()``,
+        if the hierarchy was constructed from a mesh.
+    order : array
+        The triangle indices, in the order of the leaves of the tree.
+    box_min : array
+        The lower corners of the axis-aligned bounding boxes of the nodes.
+    box_max : array
+        The upper corners of the axis-aligned bounding boxes of the nodes.
+    left : array
+        The index of the first child of every node, or ``-1`` for leaves.
+        The second child is ``left + 1``.
+    start : array
+        The start of the triangles of every leaf in :attr:`order`.
+    end : array
+        The end of the triangles of every leaf in :attr:`order`.
+
+    Notes
+    -----
+    The tree is built once by splitting the triangles at the median of their centroids
+    along the longest axis of the centroid bounds.
+
+    The queries traverse the tree for all points at the same time, one level per step.
+    The distance to the nearest vertex bounds the search,
+    and the closest points on all candidate triangles are computed in one vectorized pass.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], [[0, 1, 2, 3]])
+    >>> bvh = MeshBVH.from_mesh(mesh)
+    >>> points, faces, uvw = bvh.closest_points([[0.5, 0.25, 1.0], [2.0, 0.5, 0.0]])
+    >>> points.tolist()
+    [[0.5, 0.25, 0.0], [1.0, 0.5, 0.0]]
+    >>> faces.tolist()
+    [0, 0]
+
+    """
+
+    def __init__(self, vertices, triangles, leafsize=8):
+        self.vertices = asarray(vertices, dtype=float64).reshape((-1, 3))
+        self.triangles = asarray(triangles, dtype=int64).reshape((-1, 3))
+        self.triangle_face = arange(self.triangles.shape[0])
+        self.leafsize = leafsize
+        self._build()
+        corners = unique(self.triangles)
+        self._kdtree = cKDTree(self.vertices[corners]) if corners.size else None
+
+    @classmethod
+    def from_mesh(cls, mesh, leafsize=8):
+        """Construct a hierarchy from the faces of a mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh` or :class:`compas.datastructures.CompactMesh`
+            A mesh.
+            Faces with more than three vertices are split into a triangle fan.
+        leafsize : int, optional
+            The maximum number of triangles per leaf.
+            Default is ``8``.
+
+        Returns
+        -------
+        MeshBVH
+
+        """
+        xyz, offsets, indices = mesh_vertex_face_buffers(mesh)
+        return cls._from_buffers(xyz, offsets, indices, leafsize)
+
+    @classmethod
+    def from_vertices_and_faces(cls, vertices, faces, leafsize=8):
+        """Construct a hierarchy from a list of vertices and a list of faces.
+
+        Parameters
+        ----------
+        vertices : array-like
+            The XYZ coordinates of the vertices.
+        faces : list
+            The faces as lists of vertex indices.
+            Faces with more than three vertices are split into a triangle fan.
+        leafsize : int, optional
+            The maximum number of triangles per leaf.
+            Default is ``8``.
+
+        Returns
+        -------
+        MeshBVH
+
+        """
+        offsets = zeros(len(faces) + 1, dtype=int64)
+        offsets[1:] = cumsum([len(face) for face in faces])
+        indices = fromiter(chain.from_iterable(faces), int64, int(offsets[-1]))
+        return cls._from_buffers(vertices, offsets, indices, leafsize)
+
+    @classmethod
+    def _from_buffers(cls, xyz, offsets, indices, leafsize):
+        face, _, _ = _face_corners(offsets)
+        corner = arange(indices.size)
+        fan = corner[corner - offsets[face] >= 2]
+        triangles = zeros((fan.size, 3), dtype=int64)
+        triangles[:, 0] = indices[offsets[face[fan]]]
+        triangles[:, 1] = indices[fan - 1]
+        triangles[:, 2] = indices[fan]
+        bvh = cls(xyz, triangles, leafsize=leafsize)
+        bvh.triangle_face = face[fan]
+        return bvh
+
+    def _build(self):
+        T = self.vertices[self.triangles]
+        lo = T.min(axis=1)
+        hi = T.max(axis=1)
+        centroids = T.mean(axis=1)
+        t = self.triangles.shape[0]
+        order = arange(t)
+        box_min = []
+        box_max = []
+        left = []
+        start = []
+        end = []
+        stack = [(0, 0, t)]
+        box_min.append(None)
+        box_max.append(None)
+        left.append(-1)
+        start.append(0)
+        end.append(t)
+        while stack:
+            node, s, e = stack.pop()
+            selection = order[s:e]
+            if selection.size:
+                box_min[node] = lo[selection].min(axis=0)
+                box_max[node] = hi[selection].max(axis=0)
+            else:
+                box_min[node] = zeros(3)
+                box_max[node] = zeros(3)
+            if e - s <= self.leafsize:
+                continue
+            c = centroids[selection]
+            axis = (c.max(axis=0) - c.min(axis=0)).argmax()
+            m = (e - s) // 2
+            order[s:e] = selection[argpartition(c[:, axis], m)]
+            child = len(left)
+            left[node] = child
+            for cs, ce in ((s, s + m), (s + m, e)):
+                box_min.append(None)
+                box_max.append(None)
+                left.append(-1)
+                start.append(cs)
+                end.append(ce)
+            stack.append((child, s, s + m))
+            stack.append((child + 1, s + m, e))
+        self.order = order
+        self.box_min = asarray(box_min, dtype=float64).reshape((-1, 3))
+        self.box_max = asarray(box_max, dtype=float64).reshape((-1, 3))
+        self.left = asarray(left, dtype=int64)
+        self.start = asarray(start, dtype=int64)
+        self.end = asarray(end, dtype=int64)
+
+    def _leaves(self, pi, ni):
+        """Expand pairs of query and leaf node indices into pairs of query and triangle indices."""
+        counts = self.end[ni] - self.start[ni]
+        offsets = repeat(self.start[ni] - counts.cumsum() + counts, counts)
+        return repeat(pi, counts), self.order[arange(counts.sum()) + offsets]
+
+    def _children(self, pi, ni):
+        """Expand pairs of query and internal node indices into pairs of query and child node indices."""
+        left = self.left[ni]
+        return repeat(pi, 2), (left[:, None] + arange(2)[None, :]).ravel()
+
+    def _candidates(self, points, bound):
+        """Collect the pairs of point and triangle indices with a bounding box closer than the bound per point."""
+        pi = arange(points.shape[0])
+        ni = zeros(points.shape[0], dtype=int64)
+        pairs_p = []
+        pairs_t = []
+        while pi.size:
+            p = points[pi]
+            d = maximum(maximum(self.box_min[ni] - p, p - self.box_max[ni]), 0)
+            keep = einsum('ij,ij->i', d, d) <= bound[pi]
+            pi = pi[keep]
+            ni = ni[keep]
+            leaf = self.left[ni] < 0
+            lp, lt = self._leaves(pi[leaf], ni[leaf])
+            pairs_p.append(lp)
+            pairs_t.append(lt)
+            pi, ni = self._children(pi[~leaf], ni[~leaf])
+        return concatenate(pairs_p), concatenate(pairs_t)
+
+    def closest_points(self, points, chunksize=10000):
+        """Compute the closest points on the mesh.
+
+        Parameters
+        ----------
+        points : array-like
+            The XYZ coordinates of the query points.
+        chunksize : int, optional
+            The number of points processed at the same time.
+            Default is ``10000``.
+
+        Returns
+        -------
+        tuple
+            * The ``(p, 3)`` array of closest points.
+            * The index of the face of the closest point of every query point.
+            * The ``(p, 3)`` array of barycentric coordinates of the closest points,
+              with respect to the vertices of the triangle in :attr:`triangles`.
+
+        Raises
+        ------
+        ValueError
+            If there are query points, but the mesh has no faces.
+
+        """
+        points = asarray(points, dtype=float64).reshape((-1, 3))
+        n = points.shape[0]
+        if n and self._kdtree is None:
+            raise ValueError('The mesh has no faces to find closest points on.')
+        xyz = zeros((n, 3))
+        faces = zeros(n, dtype=int64)
+        uvw = zeros((n, 3))
+        triangles = zeros(n, dtype=int64)
+        for i in range(0, n, chunksize):
+            j = min(i + chunksize, n)
+            xyz[i:j], triangles[i:j], uvw[i:j] = self._closest_points(points[i:j])
+        faces[:] = self.triangle_face[triangles]
+        return xyz, faces, uvw
+
+    def _closest_points(self, points):
+        d, _ = self._kdtree.query(points)
+        # a small margin prevents losing the triangles of the nearest vertex to rounding
+        bound = (d * (1 + 1e-9) + 1e-12) ** 2
+        pi, ti = self._candidates(points, bound)
+        abc = self.vertices[self.triangles[ti]]
+        cp, bary = _closest_points_on_triangles(points[pi], abc[:, 0], abc[:, 1], abc[:, 2])
+        r = cp - points[pi]
+        d2 = einsum('ij,ij->i', r, r)
+        best = full(points.shape[0], inf)
+        minimum.at(best, pi, d2)
+        first = zeros(points.shape[0], dtype=int64)
+        closest = (d2 == best[pi]).nonzero()[0]
+        first[pi[closest]] = closest
+        return cp[first], ti[first], bary[first]
+
+    def pull_vertices(self, mesh, keys=None):
+        """Pull vertices of another mesh onto the closest points of this mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh`
+            The mesh with the vertices to pull.
+        keys : list, optional
+            The keys of the vertices to pull.
+            Default is all vertices.
+
+        Notes
+        -----
+        This can be used in the callbacks of smoothing and remeshing algorithms
+        to keep the vertices on a target surface.
+
+        Examples
+        --------
+        >>> from compas.datastructures import Mesh, mesh_smooth_area
+        >>> target = Mesh.from_polyhedron(12)
+        >>> mesh = target.copy()
+        >>> bvh = MeshBVH.from_mesh(target)
+        >>> mesh_smooth_area(mesh, kmax=10, callback=lambda k, args: bvh.pull_vertices(mesh))
+
+        """
+        if keys is None:
+            keys = list(mesh.vertices())
+        xyz, _, _ = self.closest_points(mesh.vertices_attributes('xyz', keys=keys))
+        for key, point in zip(keys, xyz.tolist()):
+            mesh.vertex_attributes(key, 'xyz', point)
+
+
+def _closest_points_on_triangles(p, a, b, c):
+    """Compute the closest points on triangles and their barycentric coordinates.
+
+    The regions of the triangles are tested in the order of Ericson's algorithm,
+    Real-Time Collision Detection, 5.1.5.
+    Triangles without area are treated as the union of their edges.
+    """
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    bp = p - b
+    cp = p - c
+    d1 = einsum('ij,ij->i', ab, ap)
+    d2 = einsum('ij,ij->i', ac, ap)
+    d3 = einsum('ij,ij->i', ab, bp)
+    d4 = einsum('ij,ij->i', ac, bp)
+    d5 = einsum('ij,ij->i', ab, cp)
+    d6 = einsum('ij,ij->i', ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with errstate(divide='ignore', invalid='ignore'):
+        # interior
+        area = va + vb + vc
+        v = where(area != 0, vb / area, 0.0)
+        w = where(area != 0, vc / area, 0.0)
+        # edge bc
+        mask = (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0)
+        denom = (d4 - d3) + (d5 - d6)
+        t = where(denom != 0, (d4 - d3) / denom, 0.0)
+        v = where(mask, 1 - t, v)
+        w = where(mask, t, w)
+        # edge ac
+        mask = (vb <= 0) & (d2 >= 0) & (d6 <= 0)
+        denom = d2 - d6
+        t = where(denom != 0, d2 / denom, 0.0)
+        v = where(mask, 0.0, v)
+        w = where(mask, t, w)
+        # vertex c
+        mask = (d6 >= 0) & (d5 <= d6)
+        v = where(mask, 0.0, v)
+        w = where(mask, 1.0, w)
+        # edge ab
+        mask = (vc <= 0) & (d1 >= 0) & (d3 <= 0)
+        denom = d1 - d3
+        t = where(denom != 0, d1 / denom, 0.0)
+        v = where(mask, t, v)
+        w = where(mask, 0.0, w)
+        # vertex b
+        mask = (d3 >= 0) & (d4 <= d3)
+        v = where(mask, 1.0, v)
+        w = where(mask, 0.0, w)
+        # vertex a
+        mask = (d1 <= 0) & (d2 <= 0)
+        v = where(mask, 0.0, v)
+        w = where(mask, 0.0, w)
+
+    # the regions are not defined for triangles without area
+    flat = (area == 0).nonzero()[0]
+    if flat.size:
+        v[flat], w[flat] = _closest_points_on_edges(p[flat], a[flat], b[flat], c[flat])
+
+    u = 1 - v - w
+    bary = concatenate((u[:, None], v[:, None], w[:, None]), axis=1)
+    points = a + v[:, None] * ab + w[:, None] * ac
+    return points, bary
+
+
+def _closest_points_on_edges(p, a, b, c):
+    """Compute the barycentric coordinates ``v`` and ``w`` of the closest points on the edges of triangles."""
+    best = full(p.shape[0], inf)
+    v = zeros(p.shape[0])
+    w = zeros(p.shape[0])
+    # the edges, with the coordinates v and w of their start and end
+    for start, end, (v0, v1), (w0, w1) in ((a, b, (0, 1), (0, 0)), (b, c, (1, 0), (0, 1)), (c, a, (0, 0), (1, 0))):
+        edge = end - start
+        length = einsum('ij,ij->i', edge, edge)
+        with errstate(divide='ignore', invalid='ignore'):
+            t = where(length > 0, einsum('ij,ij->i', p - start, edge) / length, 0.0)
+        t = clip(t, 0.0, 1.0)
+        r = start + t[:, None] * edge - p
+        d = einsum('ij,ij->i', r, r)
+        closer = d < best
+        best = where(closer, d, best)
+        v = where(closer, v0 + t * (v1 - v0), v)
+        w = where(closer, w0 + t * (w1 - w0), w)
+    return v, w
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+    doctest.testmod(globs=globals())
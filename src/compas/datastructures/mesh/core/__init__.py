@@ -10,6 +10,7 @@ from .operations import *  # noqa: F401 F403
 from .clean import *  # noqa: F401 F403
 
 if not IPY:
+    from .compact_numpy import *  # noqa: F401 F403
     from .matrices import *  # noqa: F401 F403
 
 __all__ = [name for name in dir() if not name.startswith('_')]
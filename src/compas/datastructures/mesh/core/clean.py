@@ -2,7 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.utilities import geometric_key
+from compas.utilities import weld_points
 
 
 __all__ = [
@@ -50,12 +50,13 @@ def mesh_delete_duplicate_vertices(mesh, precision=None):
     36
 
     """
-    key_gkey = {key: geometric_key(mesh.vertex_attributes(key, 'xyz'), precision=precision) for key in mesh.vertices()}
-    gkey_key = {gkey: key for key, gkey in iter(key_gkey.items())}
+    keys = list(mesh.vertices())
+    index, last = weld_points([mesh.vertex_attributes(key, 'xyz') for key in keys], precision=precision)
+    # every vertex is replaced by the last vertex with the same geometric key
+    key_key = {key: keys[last[group]] for key, group in zip(keys, index)}
 
-    for key in list(mesh.vertices()):
-        test = gkey_key[key_gkey[key]]
-        if test != key:
+    for key in keys:
+        if key_key[key] != key:
             del mesh.vertex[key]
             del mesh.halfedge[key]
             for u in mesh.halfedge:
@@ -67,7 +68,7 @@ def mesh_delete_duplicate_vertices(mesh, precision=None):
     for fkey in mesh.faces():
         seen = set()
         face = []
-        for key in [gkey_key[key_gkey[key]] for key in mesh.face_vertices(fkey)]:
+        for key in [key_key[key] for key in mesh.face_vertices(fkey)]:
             if key not in seen:
                 seen.add(key)
                 face.append(key)
@@ -0,0 +1,1041 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from copy import deepcopy
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from numpy import arange
+from numpy import argsort
+from numpy import array
+from numpy import asarray
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import diff
+from numpy import empty
+from numpy import float64
+from numpy import full
+from numpy import int64
+from numpy import repeat
+from numpy import searchsorted
+from numpy import unique
+from numpy import where
+from numpy import zeros
+
+from .geometry_numpy import mesh_edge_buffers
+from .geometry_numpy import edges_lengths_numpy
+from .geometry_numpy import faces_areas_numpy
+from .geometry_numpy import faces_centroids_numpy
+from .geometry_numpy import faces_normals_numpy
+from .geometry_numpy import vertices_normals_numpy
+
+
+__all__ = ['CompactMesh']
+
+
+class CompactMesh(object):
+    """Array-backed storage for the geometry and topology of a polygon mesh.
+
+    Parameters
+    ----------
+    vertices : array-like, optional
+        The XYZ coordinates of the vertices.
+    faces : list, optional
+        The faces as lists of indices into the list of vertices.
+
+    Attributes
+    ----------
+    attributes : dict
+        Named attributes related to the data structure as a whole.
+    default_vertex_attributes : dict
+        Named attributes and default values of the vertices.
+    default_edge_attributes : dict
+        Named attributes and default values of the edges.
+    default_face_attributes : dict
+        Named attributes and default values of the faces.
+    vertex_keys : array
+        The identifiers of the vertices, in insertion order.
+    xyz : array
+        The ``(n, 3)`` array of vertex coordinates.
+    face_keys : array
+        The identifiers of the faces, in insertion order.
+    face_offsets : array
+        CSR row pointer into ``face_indices``.
+        The vertices of face ``i`` are ``face_indices[face_offsets[i]:face_offsets[i + 1]]``.
+    face_indices : array
+        The vertex indices (not keys) of all faces, concatenated.
+    halfedge_vertex : array
+        The index of the start vertex of every halfedge.
+    halfedge_face : array
+        The index of the face of every halfedge, or ``-1`` for boundary halfedges.
+    halfedge_next : array
+        The index of the next halfedge in the same face (or along the same boundary).
+    halfedge_twin : array
+        The index of the opposite halfedge.
+    vertexdata : dict
+        Vertex attributes other than the coordinates, per vertex key.
+    facedata : dict
+        Face attributes, per face key.
+    edgedata : dict
+        Edge attributes, per edge key.
+    halfedge : mapping, read-only
+        A dict-like view on the halfedges with the same structure as :attr:`HalfEdge.halfedge`.
+
+    Notes
+    -----
+    The first ``len(face_indices)`` halfedges correspond one-to-one with the
+    face corners in ``face_indices``. The remaining halfedges run along the
+    boundaries of the mesh and have no face.
+
+    The compact mesh is meant for storing and traversing large meshes that
+    do not change topology. It can be converted to and from a regular mesh
+    without loss of information with :meth:`from_mesh` and :meth:`to_mesh`.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> compact = CompactMesh.from_mesh(mesh)
+    >>> compact.number_of_faces()
+    6
+    >>> compact.to_mesh(Mesh).data == mesh.data
+    True
+
+    """
+
+    def __init__(self, vertices=None, faces=None):
+        super(CompactMesh, self).__init__()
+        self._max_vertex = -1
+        self._max_face = -1
+        self._vertex_sorter = None
+        self._vertex_contiguous = True
+        self._face_sorter = None
+        self._face_contiguous = True
+        self.attributes = {'name': 'Mesh'}
+        self.default_vertex_attributes = {'x': 0.0, 'y': 0.0, 'z': 0.0}
+        self.default_edge_attributes = {}
+        self.default_face_attributes = {}
+        self.vertex_keys = empty(0, dtype=int64)
+        self.xyz = empty((0, 3), dtype=float64)
+        self.face_keys = empty(0, dtype=int64)
+        self.face_offsets = zeros(1, dtype=int64)
+        self.face_indices = empty(0, dtype=int64)
+        self.halfedge_vertex = empty(0, dtype=int64)
+        self.halfedge_face = empty(0, dtype=int64)
+        self.halfedge_next = empty(0, dtype=int64)
+        self.halfedge_twin = empty(0, dtype=int64)
+        self.vertex_offsets = zeros(1, dtype=int64)
+        self.vertex_halfedges = empty(0, dtype=int64)
+        self.vertexdata = {}
+        self.facedata = {}
+        self.edgedata = {}
+        if vertices is not None:
+            self._set_vertices_and_faces(vertices, faces or [])
+
+    # --------------------------------------------------------------------------
+    # descriptors
+    # --------------------------------------------------------------------------
+
+    @property
+    def name(self):
+        """str : The name of the data structure."""
+        return self.attributes.get('name') or self.__class__.__name__
+
+    @name.setter
+    def name(self, value):
+        self.attributes['name'] = value
+
+    @property
+    def halfedge(self):
+        return _HalfEdgeView(self)
+
+    adjacency = halfedge
+
+    # --------------------------------------------------------------------------
+    # constructors
+    # --------------------------------------------------------------------------
+
+    @classmethod
+    def from_vertices_and_faces(cls, vertices, faces):
+        """Construct a compact mesh from a list of vertices and faces.
+
+        Parameters
+        ----------
+        vertices : array-like
+            The XYZ coordinates of the vertices.
+        faces : list
+            The faces as lists of indices into the list of vertices.
+
+        Returns
+        -------
+        :class:`CompactMesh`
+
+        Notes
+        -----
+        Faces are cleaned up in the same way as by :meth:`HalfEdge.add_face`.
+        Consecutive duplicate vertices are removed and faces with fewer than
+        three vertices are skipped.
+
+        """
+        return cls(vertices, faces)
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        """Construct a compact mesh from a (dict-based) mesh.
+
+        Parameters
+        ----------
+        mesh : :class:`compas.datastructures.Mesh`
+            A mesh object.
+
+        Returns
+        -------
+        :class:`CompactMesh`
+
+        """
+        compact = cls()
+        compact.attributes.update(deepcopy(mesh.attributes))
+        compact.default_vertex_attributes.update(deepcopy(mesh.default_vertex_attributes))
+        compact.default_edge_attributes.update(deepcopy(mesh.default_edge_attributes))
+        compact.default_face_attributes.update(deepcopy(mesh.default_face_attributes))
+
+        x0, y0, z0 = [compact.default_vertex_attributes.get(axis, 0.0) for axis in 'xyz']
+        vertex_keys = []
+        xyz = []
+        for key, attr in mesh.vertex.items():
+            vertex_keys.append(key)
+            xyz.append((attr.get('x', x0), attr.get('y', y0), attr.get('z', z0)))
+            data = {name: value for name, value in attr.items() if name not in ('x', 'y', 'z')}
+            if data:
+                compact.vertexdata[key] = deepcopy(data)
+
+        key_index = {key: index for index, key in enumerate(vertex_keys)}
+        face_keys = []
+        degrees = []
+        indices = []
+        for fkey, vertices in mesh.face.items():
+            face_keys.append(fkey)
+            degrees.append(len(vertices))
+            indices += [key_index[key] for key in vertices]
+            attr = mesh.facedata.get(fkey)
+            if attr:
+                compact.facedata[fkey] = deepcopy(attr)
+
+        compact.vertex_keys = array(vertex_keys, dtype=int64)
+        compact.xyz = array(xyz, dtype=float64).reshape((-1, 3))
+        compact.face_keys = array(face_keys, dtype=int64)
+        compact.face_offsets = concatenate(([0], cumsum(degrees, dtype=int64))).astype(int64)
+        compact.face_indices = array(indices, dtype=int64)
+        compact.edgedata = deepcopy(mesh.edgedata)
+        compact._max_vertex = mesh._max_vertex
+        compact._max_face = mesh._max_face
+        compact._update_index()
+        compact._build_halfedges()
+        return compact
+
+    def to_mesh(self, cls=None):
+        """Convert the compact mesh to a (dict-based) mesh.
+
+        Parameters
+        ----------
+        cls : type, optional
+            The type of mesh to construct.
+            Default is :class:`compas.datastructures.Mesh`.
+
+        Returns
+        -------
+        :class:`compas.datastructures.Mesh`
+
+        """
+        if cls is None:
+            from compas.datastructures import Mesh
+            cls = Mesh
+        mesh = cls()
+        mesh.attributes.update(deepcopy(self.attributes))
+        mesh.default_vertex_attributes.update(deepcopy(self.default_vertex_attributes))
+        mesh.default_edge_attributes.update(deepcopy(self.default_edge_attributes))
+        mesh.default_face_attributes.update(deepcopy(self.default_face_attributes))
+
+        vertex = mesh.vertex
+        halfedge = mesh.halfedge
+        for key, (x, y, z) in zip(self.vertex_keys.tolist(), self.xyz.tolist()):
+            attr = {'x': x, 'y': y, 'z': z}
+            if key in self.vertexdata:
+                attr.update(deepcopy(self.vertexdata[key]))
+            vertex[key] = attr
+            halfedge[key] = {}
+
+        keys = self.vertex_keys[self.face_indices].tolist()
+        offsets = self.face_offsets.tolist()
+        for fkey, start, end in zip(self.face_keys.tolist(), offsets[:-1], offsets[1:]):
+            vertices = keys[start:end]
+            mesh.face[fkey] = vertices
+            mesh.facedata[fkey] = deepcopy(self.facedata.get(fkey, {}))
+            for u, v in zip(vertices, vertices[1:] + vertices[:1]):
+                halfedge[u][v] = fkey
+                if u not in halfedge[v]:
+                    halfedge[v][u] = None
+
+        mesh.edgedata = deepcopy(self.edgedata)
+        mesh._max_vertex = self._max_vertex
+        mesh._max_face = self._max_face
+        return mesh
+
+    def to_vertices_and_faces(self):
+        """Return the vertices and faces of the mesh.
+
+        Returns
+        -------
+        tuple
+            A list of vertex coordinates and a list of faces,
+            with each face a list of indices into the list of vertices.
+
+        """
+        indices = self.face_indices.tolist()
+        offsets = self.face_offsets.tolist()
+        faces = [indices[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        return self.xyz.tolist(), faces
+
+    # --------------------------------------------------------------------------
+    # internals
+    # --------------------------------------------------------------------------
+
+    def _set_vertices_and_faces(self, vertices, faces):
+        xyz = asarray(vertices, dtype=float64).reshape((-1, 3))
+        degrees = asarray([len(face) for face in faces], dtype=int64)
+        if degrees.size:
+            indices = asarray([index for face in faces for index in face], dtype=int64)
+        else:
+            indices = empty(0, dtype=int64)
+        # remove consecutive duplicates (including a closing vertex)
+        # and drop faces that end up with fewer than three vertices
+        offsets = concatenate(([0], cumsum(degrees))).astype(int64)
+        face = repeat(arange(degrees.size), degrees)
+        nxt = arange(indices.size) + 1
+        nxt[offsets[1:][degrees > 0] - 1] = offsets[:-1][degrees > 0]
+        keep = indices != indices[nxt]
+        degrees = bincount(face[keep], minlength=degrees.size)
+        valid = degrees >= 3
+        keep &= valid[face]
+        degrees = degrees[valid]
+
+        self.vertex_keys = arange(xyz.shape[0], dtype=int64)
+        self.xyz = xyz
+        self.face_keys = arange(degrees.size, dtype=int64)
+        self.face_offsets = concatenate(([0], cumsum(degrees))).astype(int64)
+        self.face_indices = indices[keep]
+        self._max_vertex = xyz.shape[0] - 1
+        self._max_face = degrees.size - 1
+        self._update_index()
+        self._build_halfedges()
+
+    def _update_index(self):
+        n = self.vertex_keys.size
+        self._vertex_contiguous = bool(n == 0 or (self.vertex_keys[0] == 0 and self.vertex_keys[-1] == n - 1 and (diff(self.vertex_keys) == 1).all()))
+        self._vertex_sorter = None if self._vertex_contiguous else argsort(self.vertex_keys, kind='stable')
+        f = self.face_keys.size
+        self._face_contiguous = bool(f == 0 or (self.face_keys[0] == 0 and self.face_keys[-1] == f - 1 and (diff(self.face_keys) == 1).all()))
+        self._face_sorter = None if self._face_contiguous else argsort(self.face_keys, kind='stable')
+
+    def _build_halfedges(self):
+        n = self.vertex_keys.size
+        offsets = self.face_offsets
+        degrees = diff(offsets)
+        m = self.face_indices.size
+
+        face = repeat(arange(degrees.size, dtype=int64), degrees)
+        nxt = arange(1, m + 1, dtype=int64)
+        if m:
+            nxt[offsets[1:] - 1] = offsets[:-1]
+        u = self.face_indices
+        v = u[nxt]
+
+        # a halfedge (v, u) is the twin of (u, v)
+        # if the same halfedge occurs more than once
+        # the one from the last face wins, as in the dict-based mesh
+        code = u * n + v
+        order = argsort(code, kind='stable')
+        ordered = code[order]
+        twin = _find_last(ordered, order, v * n + u)
+
+        # halfedges without a twin get a boundary twin without a face
+        missing = (twin == -1).nonzero()[0]
+        bcode, binverse = unique(v[missing] * n + u[missing], return_inverse=True)
+        borigin = bcode // n
+        btarget = bcode % n
+        twin[missing] = m + binverse.ravel()
+        btwin = _find_last(ordered, order, btarget * n + borigin)
+
+        # along a boundary the next halfedge starts where the previous one ends
+        bnext = searchsorted(borigin, btarget)
+        found = bnext < borigin.size
+        found[found] = borigin[bnext[found]] == btarget[found]
+        bnext = where(found, bnext + m, -1)
+
+        self.halfedge_vertex = concatenate((u, borigin)).astype(int64)
+        self.halfedge_face = concatenate((face, full(bcode.size, -1, dtype=int64)))
+        self.halfedge_next = concatenate((nxt, bnext)).astype(int64)
+        self.halfedge_twin = concatenate((twin, btwin)).astype(int64)
+
+        outgoing = argsort(self.halfedge_vertex, kind='stable')
+        self.vertex_halfedges = outgoing.astype(int64)
+        self.vertex_offsets = concatenate(([0], cumsum(bincount(self.halfedge_vertex, minlength=n)))).astype(int64)
+
+    def _vertex_index(self, key):
+        """Convert one or more vertex keys to vertex indices."""
+        keys = asarray(key, dtype=int64)
+        n = self.vertex_keys.size
+        if self._vertex_contiguous:
+            index = keys
+        else:
+            position = searchsorted(self.vertex_keys, keys, sorter=self._vertex_sorter)
+            index = self._vertex_sorter[position.clip(0, max(n - 1, 0))] if n else position
+        valid = (index >= 0) & (index < n)
+        if valid.all():
+            valid = self.vertex_keys[index] == keys
+        if not valid.all():
+            raise KeyError(key)
+        return index if index.ndim else int(index)
+
+    def _face_index(self, fkey):
+        """Convert one or more face keys to face indices."""
+        keys = asarray(fkey, dtype=int64)
+        f = self.face_keys.size
+        if self._face_contiguous:
+            index = keys
+        else:
+            position = searchsorted(self.face_keys, keys, sorter=self._face_sorter)
+            index = self._face_sorter[position.clip(0, max(f - 1, 0))] if f else position
+        valid = (index >= 0) & (index < f)
+        if valid.all():
+            valid = self.face_keys[index] == keys
+        if not valid.all():
+            raise KeyError(fkey)
+        return index if index.ndim else int(index)
+
+    def _halfedge_target(self, h):
+        """The index of the end vertex of one or more halfedges."""
+        return self.halfedge_vertex[self.halfedge_twin[h]]
+
+    def _primary_halfedges(self):
+        """Mask of the halfedges that are the twin of their own twin.
+
+        If a halfedge occurs in more than one face, only the one of the last face is primary.
+        Every connection between two vertices is therefore represented by exactly two primary halfedges.
+        """
+        return self.halfedge_twin[self.halfedge_twin] == arange(self.halfedge_twin.size)
+
+    def _face_key(self, f):
+        return None if f < 0 else int(self.face_keys[f])
+
+    # --------------------------------------------------------------------------
+    # helpers
+    # --------------------------------------------------------------------------
+
+    def key_index(self):
+        """Returns a dictionary that maps vertex keys to vertex indices.
+
+        Returns
+        -------
+        dict
+            A dictionary of key-index pairs.
+
+        """
+        return {key: index for index, key in enumerate(self.vertex_keys.tolist())}
+
+    vertex_index = key_index
+
+    def index_key(self):
+        """Returns a dictionary that maps vertex indices to vertex keys.
+
+        Returns
+        -------
+        dict
+            A dictionary of index-key pairs.
+
+        """
+        return dict(enumerate(self.vertex_keys.tolist()))
+
+    index_vertex = index_key
+
+    # --------------------------------------------------------------------------
+    # accessors
+    # --------------------------------------------------------------------------
+
+    def vertices(self, data=False):
+        """Iterate over the vertices of the mesh.
+
+        Parameters
+        ----------
+        data : bool, optional
+            Return the vertex data as well as the vertex keys.
+
+        Yields
+        ------
+        int or tuple
+            The next vertex identifier, if ``data`` is false.
+            The next vertex as a (key, attr) tuple, if ``data`` is true.
+        """
+        for key in self.vertex_keys.tolist():
+            if not data:
+                yield key
+            else:
+                yield key, self.vertex_attributes(key)
+
+    def faces(self, data=False):
+        """Iterate over the faces of the mesh.
+
+        Parameters
+        ----------
+        data : bool, optional
+            Return the face data as well as the face keys.
+
+        Yields
+        ------
+        int or tuple
+            The next face identifier, if ``data`` is false.
+            The next face as a (fkey, attr) tuple, if ``data`` is true.
+        """
+        for fkey in self.face_keys.tolist():
+            if not data:
+                yield fkey
+            else:
+                yield fkey, self.face_attributes(fkey)
+
+    def edges(self, data=False):
+        """Iterate over the edges of the mesh.
+
+        Parameters
+        ----------
+        data : bool, optional
+            Return the edge data as well as the edge vertex keys.
+
+        Yields
+        ------
+        tuple
+            The next edge as a (u, v) tuple, if ``data`` is false.
+            The next edge as a ((u, v), data) tuple, if ``data`` is true.
+        """
+        for u, v in self.edges_array().tolist():
+            if not data:
+                yield u, v
+            else:
+                yield (u, v), self.edge_attributes((u, v))
+
+    def edges_array(self):
+        """Return the edges of the mesh as an array of pairs of vertex keys.
+
+        Returns
+        -------
+        array
+            A ``(e, 2)`` array of vertex keys.
+        """
+        n = self.vertex_keys.size
+        h = self.vertex_halfedges
+        u = self.halfedge_vertex[h]
+        v = self._halfedge_target(h)
+        # keep the first occurrence of every connection
+        # in the order in which the vertices are stored
+        code = u.clip(max=v) * n + u.clip(min=v)
+        _, first = unique(code, return_index=True)
+        first.sort()
+        return self.vertex_keys[concatenate((u[first], v[first])).reshape((2, -1)).T]
+
+    # --------------------------------------------------------------------------
+    # attributes
+    # --------------------------------------------------------------------------
+
+    def vertex_attribute(self, key, name):
+        """Get the value of a named attribute of one vertex.
+
+        Parameters
+        ----------
+        key : int
+            The vertex identifier.
+        name : str
+            The name of the attribute.
+
+        Returns
+        -------
+        object or None
+            The value of the attribute,
+            or ``None`` if the vertex does not have the attribute.
+        """
+        index = self._vertex_index(key)
+        if name in ('x', 'y', 'z'):
+            return float(self.xyz[index, 'xyz'.index(name)])
+        data = self.vertexdata.get(key)
+        if data and name in data:
+            return data[name]
+        return self.default_vertex_attributes.get(name)
+
+    def vertex_attributes(self, key, names=None):
+        """Get multiple attributes of a vertex.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+        names : list, optional
+            A list of attribute names.
+
+        Returns
+        -------
+        dict or list
+            If the parameter ``names`` is empty,
+            a dictionary of all attribute name-value pairs of the vertex.
+            If the parameter ``names`` is not empty,
+            a list of the values corresponding to the requested attribute names.
+        """
+        if names:
+            return [self.vertex_attribute(key, name) for name in names]
+        attr = dict(self.default_vertex_attributes)
+        attr.update(zip('xyz', self.vertex_coordinates(key)))
+        attr.update(self.vertexdata.get(key) or {})
+        return attr
+
+    def face_attribute(self, key, name):
+        """Get the value of a named attribute of one face.
+
+        Parameters
+        ----------
+        key : int
+            The face identifier.
+        name : str
+            The name of the attribute.
+
+        Returns
+        -------
+        object or None
+            The value of the attribute,
+            or ``None`` if the face does not have the attribute.
+        """
+        self._face_index(key)
+        data = self.facedata.get(key)
+        if data and name in data:
+            return data[name]
+        return self.default_face_attributes.get(name)
+
+    def face_attributes(self, key, names=None):
+        """Get multiple attributes of a face.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the face.
+        names : list, optional
+            A list of attribute names.
+
+        Returns
+        -------
+        dict or list
+            If the parameter ``names`` is empty,
+            a dictionary of all attribute name-value pairs of the face.
+            If the parameter ``names`` is not empty,
+            a list of the values corresponding to the requested attribute names.
+        """
+        if names:
+            return [self.face_attribute(key, name) for name in names]
+        self._face_index(key)
+        attr = dict(self.default_face_attributes)
+        attr.update(self.facedata.get(key) or {})
+        return attr
+
+    def edge_attributes(self, edge, names=None):
+        """Get multiple attributes of an edge.
+
+        Parameters
+        ----------
+        edge : 2-tuple of int
+            The identifier of the edge.
+        names : list, optional
+            A list of attribute names.
+
+        Returns
+        -------
+        dict or list
+            If the parameter ``names`` is empty,
+            a dictionary of all attribute name-value pairs of the edge.
+            If the parameter ``names`` is not empty,
+            a list of the values corresponding to the requested attribute names.
+        """
+        u, v = edge
+        if not self.has_edge((u, v)):
+            raise KeyError(edge)
+        attr = dict(self.default_edge_attributes)
+        attr.update(self.edgedata.get("-".join(map(str, sorted(edge)))) or {})
+        if names:
+            return [attr.get(name) for name in names]
+        return attr
+
+    # --------------------------------------------------------------------------
+    # info
+    # --------------------------------------------------------------------------
+
+    def number_of_vertices(self):
+        """Count the number of vertices in the mesh."""
+        return int(self.vertex_keys.size)
+
+    def number_of_faces(self):
+        """Count the number of faces in the mesh."""
+        return int(self.face_keys.size)
+
+    def number_of_edges(self):
+        """Count the number of edges in the mesh."""
+        return int(self._primary_halfedges().sum()) // 2
+
+    def is_empty(self):
+        """Boolean whether the mesh is empty."""
+        return self.vertex_keys.size == 0
+
+    # --------------------------------------------------------------------------
+    # vertex topology
+    # --------------------------------------------------------------------------
+
+    def has_vertex(self, key):
+        """Verify that a vertex is in the mesh."""
+        try:
+            self._vertex_index(key)
+        except (KeyError, IndexError):
+            return False
+        return True
+
+    def _vertex_outgoing(self, key):
+        i = self._vertex_index(key)
+        return self.vertex_halfedges[self.vertex_offsets[i]:self.vertex_offsets[i + 1]]
+
+    def vertex_neighbors(self, key):
+        """Return the neighbors of a vertex.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+
+        Returns
+        -------
+        list
+            The list of neighboring vertices.
+        """
+        return list(self.halfedge[key])
+
+    def vertex_degree(self, key):
+        """Count the neighbors of a vertex."""
+        return len(self.halfedge[key])
+
+    def vertices_degrees(self):
+        """Compute the degree of all vertices at once.
+
+        Returns
+        -------
+        array
+            The degree per vertex, in the order of :meth:`vertices`.
+        """
+        primary = self._primary_halfedges()
+        return bincount(self.halfedge_vertex[primary], minlength=self.vertex_keys.size)
+
+    def vertex_faces(self, key):
+        """The faces connected to a vertex.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+
+        Returns
+        -------
+        list
+            The faces connected to a vertex.
+        """
+        return [fkey for fkey in self.halfedge[key].values() if fkey is not None]
+
+    def is_vertex_on_boundary(self, key):
+        """Verify that a vertex is on a boundary."""
+        return bool((self.halfedge_face[self._vertex_outgoing(key)] == -1).any())
+
+    def vertex_coordinates(self, key, axes='xyz'):
+        """Return the coordinates of a vertex.
+
+        Parameters
+        ----------
+        key : int
+            The identifier of the vertex.
+        axes : str, optional
+            The axes along which to take the coordinates.
+
+        Returns
+        -------
+        list
+            Coordinates of the vertex.
+        """
+        xyz = self.xyz[self._vertex_index(key)].tolist()
+        if axes == 'xyz':
+            return xyz
+        return [xyz['xyz'.index(axis)] for axis in axes]
+
+    # --------------------------------------------------------------------------
+    # edge topology
+    # --------------------------------------------------------------------------
+
+    def has_edge(self, key):
+        """Verify that the mesh contains a specific edge."""
+        u, v = key
+        return self.has_vertex(u) and v in self.halfedge[u]
+
+    def has_halfedge(self, key):
+        """Verify that a halfedge is part of the mesh."""
+        return self.has_edge(key)
+
+    def halfedge_face(self, u, v):
+        """Find the face corresponding to a halfedge."""
+        return self.halfedge[u][v]
+
+    def is_edge_on_boundary(self, u, v):
+        """Verify that an edge is on the boundary."""
+        return self.halfedge[v][u] is None or self.halfedge[u][v] is None
+
+    # --------------------------------------------------------------------------
+    # face topology
+    # --------------------------------------------------------------------------
+
+    def has_face(self, fkey):
+        """Verify that a face is part of the mesh."""
+        try:
+            self._face_index(fkey)
+        except (KeyError, IndexError):
+            return False
+        return True
+
+    def face_vertices(self, fkey):
+        """The vertices of a face.
+
+        Parameters
+        ----------
+        fkey : int
+            Identifier of the face.
+
+        Returns
+        -------
+        list
+            Ordered vertex identifiers.
+        """
+        f = self._face_index(fkey)
+        return self.vertex_keys[self.face_indices[self.face_offsets[f]:self.face_offsets[f + 1]]].tolist()
+
+    def face_halfedges(self, fkey):
+        """The halfedges of a face.
+
+        Parameters
+        ----------
+        fkey : int
+            Identifier of the face.
+
+        Returns
+        -------
+        list
+            The halfedges of a face.
+        """
+        vertices = self.face_vertices(fkey)
+        return list(zip(vertices, vertices[1:] + vertices[:1]))
+
+    def face_neighbors(self, fkey):
+        """Return the neighbors of a face across its edges.
+
+        Parameters
+        ----------
+        fkey : int
+            Identifier of the face.
+
+        Returns
+        -------
+        list
+            The identifiers of the neighboring faces.
+        """
+        nbrs = []
+        for u, v in self.face_halfedges(fkey):
+            nbr = self.halfedge[v][u]
+            if nbr is not None:
+                nbrs.append(nbr)
+        return nbrs
+
+    def face_degree(self, fkey):
+        """Count the neighbors of a face."""
+        return len(self.face_neighbors(fkey))
+
+    def face_coordinates(self, fkey, axes='xyz'):
+        """Compute the coordinates of the vertices of a face."""
+        f = self._face_index(fkey)
+        xyz = self.xyz[self.face_indices[self.face_offsets[f]:self.face_offsets[f + 1]]]
+        return xyz[:, ['xyz'.index(axis) for axis in axes]].tolist()
+
+    # --------------------------------------------------------------------------
+    # bulk geometry
+    # --------------------------------------------------------------------------
+
+    def vertices_normals(self):
+        """Compute the normals of all vertices.
+
+        Returns
+        -------
+        array
+            A ``(n, 3)`` array of normal vectors, in the order of :meth:`vertices`.
+        """
+        return vertices_normals_numpy(self.xyz, self.face_offsets, self.face_indices)
+
+    def edges_lengths(self):
+        """Compute the lengths of all edges.
+
+        Returns
+        -------
+        array
+            The length per edge, in the order of :meth:`edges`.
+        """
+        return edges_lengths_numpy(*mesh_edge_buffers(self))
+
+    def faces_normals(self, unitized=True):
+        """Compute the normals of all faces.
+
+        Parameters
+        ----------
+        unitized : bool, optional
+            Unitize the normal vectors.
+            Default is ``True``.
+
+        Returns
+        -------
+        array
+            A ``(f, 3)`` array of normal vectors, in the order of :meth:`faces`.
+        """
+        return faces_normals_numpy(self.xyz, self.face_offsets, self.face_indices, unitized=unitized)
+
+    def faces_areas(self):
+        """Compute the areas of all faces.
+
+        Returns
+        -------
+        array
+            The area per face, in the order of :meth:`faces`.
+        """
+        return faces_areas_numpy(self.xyz, self.face_offsets, self.face_indices)
+
+    def faces_centroids(self):
+        """Compute the centroids of all faces.
+
+        Returns
+        -------
+        array
+            A ``(f, 3)`` array of centroids, in the order of :meth:`faces`.
+        """
+        return faces_centroids_numpy(self.xyz, self.face_offsets, self.face_indices)
+
+
+class _HalfEdgeView(Mapping):
+    """Read-only view with the structure of the halfedge dict of a regular mesh."""
+
+    def __init__(self, compact):
+        self._compact = compact
+
+    def __getitem__(self, key):
+        compact = self._compact
+        outgoing = compact._vertex_outgoing(key)
+        keys = compact.vertex_keys[compact._halfedge_target(outgoing)].tolist()
+        faces = compact.halfedge_face[outgoing].tolist()
+        nbrs = {}
+        for nbr, f in zip(keys, faces):
+            nbrs[nbr] = compact._face_key(f)
+        return nbrs
+
+    def __iter__(self):
+        return iter(self._compact.vertex_keys.tolist())
+
+    def __len__(self):
+        return int(self._compact.vertex_keys.size)
+
+    def __contains__(self, key):
+        return self._compact.has_vertex(key)
+
+
+def _find_last(ordered, order, codes):
+    """Find the last occurrence of codes in a sorted array of codes.
+
+    Returns the original index of the occurrence, or ``-1`` if the code does not occur.
+    """
+    position = searchsorted(ordered, codes, side='right') - 1
+    found = position >= 0
+    found[found] = ordered[position[found]] == codes[found]
+    result = full(codes.size, -1, dtype=int64)
+    result[found] = order[position[found]]
+    return result
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import gc
+    import time
+    import tracemalloc
+
+    import compas
+    from compas.datastructures import Mesh
+
+    mesh = Mesh.from_obj(compas.get('faces_big.obj'))
+    vertices, faces = mesh.to_vertices_and_faces()
+
+    # scale up the input by tiling copies of the mesh
+    # to get a few hundred thousand faces
+
+    n = len(vertices)
+    tiles = 64
+    big_vertices = []
+    big_faces = []
+    for i in range(tiles):
+        dx = 1000.0 * i
+        big_vertices += [[x + dx, y, z] for x, y, z in vertices]
+        big_faces += [[index + i * n for index in face] for face in faces]
+
+    print('vertices: {}, faces: {}'.format(len(big_vertices), len(big_faces)))
+
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.time()
+    mesh = Mesh.from_vertices_and_faces(big_vertices, big_faces)
+    t1 = time.time()
+    dict_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    gc.collect()
+    tracemalloc.start()
+    t2 = time.time()
+    compact = CompactMesh.from_vertices_and_faces(big_vertices, big_faces)
+    t3 = time.time()
+    compact_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print('build:  dict {:.3f}s, {:.1f} MB'.format(t1 - t0, dict_memory / 1e6))
+    print('build:  compact {:.3f}s, {:.1f} MB'.format(t3 - t2, compact_memory / 1e6))
+
+    t0 = time.time()
+    degrees = [mesh.vertex_degree(key) for key in mesh.vertices()]
+    t1 = time.time()
+    compact_degrees = compact.vertices_degrees()
+    t2 = time.time()
+
+    assert degrees == compact_degrees.tolist()
+    print('degree: dict {:.3f}s, compact {:.3f}s'.format(t1 - t0, t2 - t1))
+
+    t0 = time.time()
+    xyz = [mesh.vertex_coordinates(key) for fkey in mesh.faces() for key in mesh.face_vertices(fkey)]
+    t1 = time.time()
+    compact_xyz = compact.xyz[compact.face_indices]
+    t2 = time.time()
+
+    assert len(xyz) == len(compact_xyz)
+    print('corner coordinates: dict {:.3f}s, compact {:.3f}s'.format(t1 - t0, t2 - t1))
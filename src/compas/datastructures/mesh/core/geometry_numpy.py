@@ -0,0 +1,327 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from itertools import chain
+
+from numpy import arange
+from numpy import argsort
+from numpy import array
+from numpy import bincount
+from numpy import cross
+from numpy import diff
+from numpy import einsum
+from numpy import empty
+from numpy import float64
+from numpy import fromiter
+from numpy import int64
+from numpy import repeat
+from numpy import searchsorted
+from numpy import sqrt
+from numpy import where
+from numpy import zeros
+
+
+__all__ = []
+
+
+# ==============================================================================
+# Buffers
+# ==============================================================================
+
+
+def mesh_vertex_face_buffers(mesh):
+    """Collect the vertex coordinates and the face connectivity of a mesh in flat arrays.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh` or :class:`compas.datastructures.CompactMesh`
+        A mesh object.
+
+    Returns
+    -------
+    tuple
+        * The ``(n, 3)`` array of vertex coordinates, in the order of ``mesh.vertices()``.
+        * The CSR row pointer of the faces.
+        * The vertex indices of all faces, concatenated.
+
+    Notes
+    -----
+    For a compact mesh, the stored arrays are returned directly.
+    For a regular mesh, the buffers are collected from the dictionaries without
+    visiting the faces one by one in Python.
+
+    """
+    if hasattr(mesh, 'face_indices'):
+        return mesh.xyz, mesh.face_offsets, mesh.face_indices
+    keys, xyz = _vertex_buffer(mesh)
+    faces = list(mesh.face.values())
+    degrees = fromiter(map(len, faces), int64, len(faces))
+    offsets = zeros(len(faces) + 1, dtype=int64)
+    offsets[1:] = degrees.cumsum()
+    corners = fromiter(chain.from_iterable(faces), int64, int(offsets[-1]))
+    return xyz, offsets, keys_to_indices(keys, corners)
+
+
+def mesh_edge_buffers(mesh):
+    """Collect the vertex coordinates and the edges of a mesh in flat arrays.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh` or :class:`compas.datastructures.CompactMesh`
+        A mesh object.
+
+    Returns
+    -------
+    tuple
+        * The ``(n, 3)`` array of vertex coordinates, in the order of ``mesh.vertices()``.
+        * The ``(e, 2)`` array of vertex indices of the edges, in the order of ``mesh.edges()``.
+
+    """
+    if hasattr(mesh, 'face_indices'):
+        return mesh.xyz, keys_to_indices(mesh.vertex_keys, mesh.edges_array())
+    keys, xyz = _vertex_buffer(mesh)
+    edges = fromiter(chain.from_iterable(mesh.edges()), int64).reshape((-1, 2))
+    return xyz, keys_to_indices(keys, edges)
+
+
+def _vertex_buffer(mesh):
+    vertex = mesh.vertex
+    keys = fromiter(vertex, int64, len(vertex))
+    xyz = array([[attr['x'], attr['y'], attr['z']] for attr in vertex.values()], dtype=float64).reshape((-1, 3))
+    return keys, xyz
+
+
+def keys_to_indices(keys, values):
+    """Convert vertex keys to indices into an array of keys.
+
+    Parameters
+    ----------
+    keys : array
+        The vertex keys, in storage order.
+    values : array
+        The keys to convert.
+
+    Returns
+    -------
+    array
+        The positions of the values in ``keys``.
+
+    """
+    n = keys.size
+    if n == 0 or (keys[0] == 0 and keys[-1] == n - 1 and (diff(keys) == 1).all()):
+        return values
+    sorter = argsort(keys)
+    return sorter[searchsorted(keys, values, sorter=sorter)]
+
+
+def _face_corners(offsets):
+    """The face of every corner and the previous corner in the same face."""
+    degrees = diff(offsets)
+    face = repeat(arange(degrees.size), degrees)
+    previous = arange(offsets[-1]) - 1
+    previous[offsets[:-1][degrees > 0]] = offsets[1:][degrees > 0] - 1
+    return face, previous, degrees
+
+
+def _face_fan(xyz, offsets, indices):
+    """Cross products of the triangle fan around the centroid of every face."""
+    face, previous, degrees = _face_corners(offsets)
+    points = xyz[indices]
+    centroids = _sum_per_face(points, face, degrees.size) / degrees.clip(min=1)[:, None]
+    vectors = points - centroids[face]
+    return face, cross(vectors[previous], vectors), centroids
+
+
+def _sum_per_face(values, face, f):
+    result = empty((f, 3))
+    for axis in range(3):
+        result[:, axis] = bincount(face, values[:, axis], minlength=f)
+    return result
+
+
+def _normalize(vectors):
+    lengths = sqrt(einsum('ij,ij->i', vectors, vectors))
+    return vectors / where(lengths > 0, lengths, 1.0)[:, None]
+
+
+# ==============================================================================
+# Kernels
+# ==============================================================================
+
+
+def faces_normals_numpy(xyz, offsets, indices, unitized=True):
+    """Compute the normals of all faces in one pass.
+
+    Parameters
+    ----------
+    xyz : array
+        The vertex coordinates.
+    offsets : array
+        The CSR row pointer of the faces.
+    indices : array
+        The vertex indices of all faces, concatenated.
+    unitized : bool, optional
+        Unitize the normal vectors.
+        Default is ``True``.
+
+    Returns
+    -------
+    array
+        A ``(f, 3)`` array of normal vectors.
+
+    Notes
+    -----
+    The normals are computed in the same way as by :func:`compas.geometry.normal_polygon`.
+
+    """
+    face, fan, _ = _face_fan(xyz, offsets, indices)
+    normals = _sum_per_face(fan, face, offsets.size - 1)
+    if unitized:
+        return _normalize(normals)
+    return normals
+
+
+def faces_areas_numpy(xyz, offsets, indices):
+    """Compute the areas of all faces in one pass.
+
+    Parameters
+    ----------
+    xyz : array
+        The vertex coordinates.
+    offsets : array
+        The CSR row pointer of the faces.
+    indices : array
+        The vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    array
+        The area per face.
+
+    Notes
+    -----
+    The areas are computed in the same way as by :func:`compas.geometry.area_polygon`.
+
+    """
+    face, fan, _ = _face_fan(xyz, offsets, indices)
+    f = offsets.size - 1
+    if not f:
+        return zeros(0)
+    # the triangles of the fan that are flipped with respect to the first one
+    # have a negative contribution
+    first = fan[offsets[:-1]]
+    sign = where(einsum('ij,ij->i', fan, first[face]) > 0, 0.5, -0.5)
+    return bincount(face, sign * sqrt(einsum('ij,ij->i', fan, fan)), minlength=f)
+
+
+def faces_centroids_numpy(xyz, offsets, indices):
+    """Compute the centroids of all faces in one pass.
+
+    Parameters
+    ----------
+    xyz : array
+        The vertex coordinates.
+    offsets : array
+        The CSR row pointer of the faces.
+    indices : array
+        The vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    array
+        A ``(f, 3)`` array of centroids.
+
+    """
+    face, _, degrees = _face_corners(offsets)
+    return _sum_per_face(xyz[indices], face, degrees.size) / degrees.clip(min=1)[:, None]
+
+
+def vertices_normals_numpy(xyz, offsets, indices):
+    """Compute the normals of all vertices in one pass.
+
+    Parameters
+    ----------
+    xyz : array
+        The vertex coordinates.
+    offsets : array
+        The CSR row pointer of the faces.
+    indices : array
+        The vertex indices of all faces, concatenated.
+
+    Returns
+    -------
+    array
+        A ``(n, 3)`` array of normal vectors.
+
+    Notes
+    -----
+    The normal of a vertex is the normalized average of the (non-unitized) normals
+    of the connected faces.
+    Vertices without faces get a zero vector.
+
+    """
+    face, fan, _ = _face_fan(xyz, offsets, indices)
+    normals = _sum_per_face(fan, face, offsets.size - 1)
+    n = xyz.shape[0]
+    result = empty((n, 3))
+    for axis in range(3):
+        result[:, axis] = bincount(indices, normals[face, axis], minlength=n)
+    return _normalize(result)
+
+
+def edges_lengths_numpy(xyz, edges):
+    """Compute the lengths of edges in one pass.
+
+    Parameters
+    ----------
+    xyz : array
+        The vertex coordinates.
+    edges : array
+        A ``(e, 2)`` array of vertex indices.
+
+    Returns
+    -------
+    array
+        The length per edge.
+
+    """
+    edges = array(edges, dtype=int64).reshape((-1, 2))
+    vectors = xyz[edges[:, 1]] - xyz[edges[:, 0]]
+    return sqrt(einsum('ij,ij->i', vectors, vectors))
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import time
+
+    import compas
+    from compas.datastructures import Mesh
+    from compas.datastructures import mesh_subdivide_quad
+
+    mesh = Mesh.from_obj(compas.get('faces_big.obj'))
+    mesh = mesh_subdivide_quad(mesh, k=2)
+
+    print('vertices: {}, faces: {}'.format(mesh.number_of_vertices(), mesh.number_of_faces()))
+
+    t0 = time.time()
+    normals = [mesh.face_normal(fkey) for fkey in mesh.faces()]
+    areas = [mesh.face_area(fkey) for fkey in mesh.faces()]
+    t1 = time.time()
+    bulk_normals = mesh.faces_normals()
+    bulk_areas = mesh.faces_areas()
+    t2 = time.time()
+
+    print('faces:    loop {:.3f}s, bulk {:.3f}s'.format(t1 - t0, t2 - t1))
+
+    t0 = time.time()
+    normals = [mesh.vertex_normal(key) for key in mesh.vertices()]
+    t1 = time.time()
+    bulk_normals = mesh.vertices_normals()
+    t2 = time.time()
+
+    print('vertices: loop {:.3f}s, bulk {:.3f}s'.format(t1 - t0, t2 - t1))
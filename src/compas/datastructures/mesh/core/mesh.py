@@ -6,6 +6,8 @@ import collections
 import sys
 from math import pi
 
+from compas import IPY
+
 from .halfedge import HalfEdge
 
 from compas.files import OBJ
@@ -112,7 +114,7 @@ class BaseMesh(HalfEdge):
     # --------------------------------------------------------------------------
 
     @classmethod
-    def from_obj(cls, filepath, precision=None):
+    def from_obj(cls, filepath, precision=None, fast=False):
         """Construct a mesh object from the data described in an OBJ file.
 
         Parameters
@@ -121,6 +123,10 @@ class BaseMesh(HalfEdge):
             The path to the file.
         precision: str, optional
             The precision of the geometric map that is used to connect the lines.
+        fast : bool, optional
+            Stream the file into typed arrays with :class:`compas.files.OBJReaderNumpy`.
+            In this mode, vertices are only welded if a precision is provided.
+            Default is ``False``.
 
         Returns
         -------
@@ -142,9 +148,11 @@ class BaseMesh(HalfEdge):
         --------
         >>>
         """
-        obj = OBJ(filepath, precision)
+        obj = OBJ(filepath, precision, fast=fast)
         obj.read()
         vertices = obj.vertices
+        if fast:
+            vertices = vertices.tolist()
         faces = obj.faces
         edges = obj.lines
         if faces:
@@ -926,6 +934,25 @@ class BaseMesh(HalfEdge):
             C += angle_points(self.vertex_coordinates(vkey), self.vertex_coordinates(u), self.vertex_coordinates(v))
         return 2 * pi - C
 
+    def vertices_normals(self):
+        """Compute the normals of all vertices at once.
+
+        Returns
+        -------
+        array or list
+            A ``(n, 3)`` array of normal vectors, in the order of :meth:`vertices`.
+            In IronPython, a list of vectors.
+
+        Notes
+        -----
+        For manifold meshes, the normals are the same as the ones computed one by one with :meth:`vertex_normal`.
+        """
+        if IPY:
+            return [self.vertex_normal(key) for key in self.vertices()]
+        from .geometry_numpy import mesh_vertex_face_buffers
+        from .geometry_numpy import vertices_normals_numpy
+        return vertices_normals_numpy(*mesh_vertex_face_buffers(self))
+
     # --------------------------------------------------------------------------
     # edge geometry
     # --------------------------------------------------------------------------
@@ -1050,6 +1077,21 @@ class BaseMesh(HalfEdge):
         """
         return normalize_vector(self.edge_vector(u, v))
 
+    def edges_lengths(self):
+        """Compute the lengths of all edges at once.
+
+        Returns
+        -------
+        array or list
+            The length per edge, in the order of :meth:`edges`.
+            In IronPython, a list of lengths.
+        """
+        if IPY:
+            return [self.edge_length(u, v) for u, v in self.edges()]
+        from .geometry_numpy import mesh_edge_buffers
+        from .geometry_numpy import edges_lengths_numpy
+        return edges_lengths_numpy(*mesh_edge_buffers(self))
+
     # --------------------------------------------------------------------------
     # face geometry
     # --------------------------------------------------------------------------
@@ -1136,6 +1178,57 @@ class BaseMesh(HalfEdge):
         """
         return area_polygon(self.face_coordinates(fkey))
 
+    def faces_normals(self, unitized=True):
+        """Compute the normals of all faces at once.
+
+        Parameters
+        ----------
+        unitized : bool, optional
+            Unitize the normal vectors.
+            Default is ``True``.
+
+        Returns
+        -------
+        array or list
+            A ``(f, 3)`` array of normal vectors, in the order of :meth:`faces`.
+            In IronPython, a list of vectors.
+        """
+        if IPY:
+            return [self.face_normal(fkey, unitized=unitized) for fkey in self.faces()]
+        from .geometry_numpy import mesh_vertex_face_buffers
+        from .geometry_numpy import faces_normals_numpy
+        return faces_normals_numpy(*mesh_vertex_face_buffers(self), unitized=unitized)
+
+    def faces_centroids(self):
+        """Compute the centroids of all faces at once.
+
+        Returns
+        -------
+        array or list
+            A ``(f, 3)`` array of centroids, in the order of :meth:`faces`.
+            In IronPython, a list of points.
+        """
+        if IPY:
+            return [self.face_centroid(fkey) for fkey in self.faces()]
+        from .geometry_numpy import mesh_vertex_face_buffers
+        from .geometry_numpy import faces_centroids_numpy
+        return faces_centroids_numpy(*mesh_vertex_face_buffers(self))
+
+    def faces_areas(self):
+        """Compute the areas of all faces at once.
+
+        Returns
+        -------
+        array or list
+            The area per face, in the order of :meth:`faces`.
+            In IronPython, a list of areas.
+        """
+        if IPY:
+            return [self.face_area(fkey) for fkey in self.faces()]
+        from .geometry_numpy import mesh_vertex_face_buffers
+        from .geometry_numpy import faces_areas_numpy
+        return faces_areas_numpy(*mesh_vertex_face_buffers(self))
+
     def face_flatness(self, fkey, maxdev=0.02):
         """Compute the flatness of the mesh face.
 
@@ -2,25 +2,33 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from numpy import arange
 from numpy import array
+from numpy import asarray
 from numpy import cross
 from numpy import bincount
+from numpy import hstack
+from numpy import setdiff1d
+from numpy import unique
 from numpy import zeros
 from numpy import mean
 from numpy import tan
 from numpy import arccos
 from numpy import sum
 
+from scipy.sparse import coo_matrix
 from scipy.sparse import spdiags
+from scipy.sparse.csgraph import connected_components
 from scipy.sparse.linalg import splu
 
 from compas.numerical import normrow
 from compas.numerical import normalizerow
 
-from compas.datastructures.mesh.core import trimesh_cotangent_laplacian_matrix
 
-
-__all__ = ['mesh_geodesic_distances_numpy']
+__all__ = [
+    'mesh_geodesic_distances_numpy',
+    'GeodesicSolver',
+]
 
 
 def mesh_geodesic_distances_numpy(mesh, sources, m=1.0):
@@ -33,86 +41,193 @@ def mesh_geodesic_distances_numpy(mesh, sources, m=1.0):
     sources : list
         A list of vertex identifiers from which the distances should be calculated.
     m : float (1.0)
-        ?
+        Multiplier of the squared mean edge length that defines the time step of the heat flow.
 
     Returns
     -------
     array
         Distance values.
 
-    """
-    Lc = trimesh_cotangent_laplacian_matrix(mesh)
-
-    key_index = mesh.key_index()
-    vertices = mesh.vertices_attributes('xyz')
-    faces = [[key_index[key] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
-
-    V = array(vertices)
-    F = array(faces, dtype=int)
-
-    e01 = V[F[:, 1]] - V[F[:, 0]]
-    e12 = V[F[:, 2]] - V[F[:, 1]]
-    e20 = V[F[:, 0]] - V[F[:, 2]]
-
-    normal = cross(e01, e12)
-    A2 = normrow(normal)
-    A3 = A2.ravel() / 6
-
-    VA = zeros(V.shape[0])
-    for i in (0, 1, 2):
-        b = bincount(F[:, i], A3)
-        VA[:len(b)] += b
-    VA = spdiags(VA, 0, V.shape[0], V.shape[0])
-
-    h = mean([normrow(e01), normrow(e12), normrow(e20)])
-    t = m * h ** 2
-
-    u0 = zeros(V.shape[0])
-    u0[sources] = 1.0
-
-    # A = VA - t * Lc
-    # print(A.sum(axis=1))
-
-    u = splu((VA - t * Lc).tocsc()).solve(u0)
+    Notes
+    -----
+    For distances from many different sources on the same mesh, use :class:`GeodesicSolver`.
 
-    unit = normal / A2
-
-    unit_e01 = cross(unit, e01)
-    unit_e12 = cross(unit, e12)
-    unit_e20 = cross(unit, e20)
-
-    grad_u = (
-        unit_e01 * u[F[:, 2], None] +
-        unit_e12 * u[F[:, 0], None] +
-        unit_e20 * u[F[:, 1], None]) / A2
-
-    X = - grad_u / normrow(grad_u)
-
-    div_X = zeros(V.shape[0])
-
-    for i1, i2, i3 in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]:
-        v1 = F[:, i1]
-        v2 = F[:, i2]
-        v3 = F[:, i3]
+    """
+    return GeodesicSolver(mesh, m=m).distances(sources)
 
-        e1 = V[v2] - V[v1]
-        e2 = V[v3] - V[v1]
-        e0 = V[v3] - V[v2]
 
-        a = 1 / tan(arccos(sum(normalizerow(-e2) * normalizerow(-e0), axis=1)))
-        b = 1 / tan(arccos(sum(normalizerow(-e1) * normalizerow(+e0), axis=1)))
+class GeodesicSolver(object):
+    """Geodesic distance solver with the heat method for repeated queries on the same mesh.
 
-        div_X += bincount(
-            v1,
-            0.5 * (a * sum(e1 * X, axis=1) + b * sum(e2 * X, axis=1)),
-            minlength=V.shape[0])
+    Parameters
+    ----------
+    mesh : compas.datastructures.Mesh
+        A triangle mesh.
+    m : float, optional
+        Multiplier of the squared mean edge length that defines the time step of the heat flow.
+        Default is ``1.0``.
 
-    # print(Lc.sum(axis=1))
+    Attributes
+    ----------
+    key_index : dict
+        Map of vertex identifiers to row indices of the distance arrays.
+    G : sparse matrix
+        The gradient operator, mapping the heat values at the vertices
+        to the XYZ components of the gradient per face, with shape ``(3 * f, v)``.
+    D : sparse matrix
+        The divergence operator, mapping the XYZ components of a vector field per face
+        to the integrated divergence per vertex, with shape ``(v, 3 * f)``.
+
+    Notes
+    -----
+    The cotangent Laplacian, the vertex areas, the gradient and divergence operators,
+    and the factorisations of the heat flow and Poisson systems are computed once.
+    Every query only requires two back substitutions and two sparse products.
+    Many sets of sources are solved together, as the columns of one right-hand side.
+
+    The Poisson system only determines the distances up to a constant.
+    Therefore, the distance of one vertex per connected component is fixed during the solve,
+    and the minimum distance per component is shifted to zero afterwards.
+
+    Examples
+    --------
+    >>> import compas
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_obj(compas.get('faces.obj'))
+    >>> mesh.quads_to_triangles()
+    >>> solver = GeodesicSolver(mesh)
+    >>> D = solver.distances_many([[0], [35]])
+    >>> D.shape
+    (2, 36)
+    >>> print(round(D[0, 0], 3), round(D[1, 35], 3))
+    0.0 0.0
 
-    phi = splu(Lc.tocsc()).solve(div_X)
-    phi -= phi.min()
+    """
 
-    return phi
+    def __init__(self, mesh, m=1.0):
+        self.key_index = mesh.key_index()
+        vertices = mesh.vertices_attributes('xyz')
+        faces = [[self.key_index[key] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+
+        V = array(vertices, dtype=float)
+        F = array(faces, dtype=int)
+        v = V.shape[0]
+        f = F.shape[0]
+
+        e01 = V[F[:, 1]] - V[F[:, 0]]
+        e12 = V[F[:, 2]] - V[F[:, 1]]
+        e20 = V[F[:, 0]] - V[F[:, 2]]
+
+        normal = cross(e01, e12)
+        A2 = normrow(normal)
+        A3 = A2.ravel() / 6
+
+        VA = zeros(v)
+        for i in (0, 1, 2):
+            VA += bincount(F[:, i], A3, minlength=v)
+        VA = spdiags(VA, 0, v, v)
+
+        h = mean([normrow(e01), normrow(e12), normrow(e20)])
+        t = m * h ** 2
+
+        # gradient
+        unit = normal / A2
+        rows = (3 * arange(f)[:, None] + arange(3)[None, :]).ravel()
+        data = []
+        cols = []
+        for e, i in ((e01, 2), (e12, 0), (e20, 1)):
+            data.append((cross(unit, e) / A2).ravel())
+            cols.append(F[:, i].repeat(3))
+        self.G = coo_matrix((hstack(data), (hstack([rows] * 3), hstack(cols))), shape=(3 * f, v)).tocsr()
+
+        # divergence and cotangent laplacian
+        data = []
+        rows = []
+        cols = []
+        ij = []
+        weights = []
+        for i1, i2, i3 in [(0, 1, 2), (1, 2, 0), (2, 0, 1)]:
+            v1 = F[:, i1]
+            v2 = F[:, i2]
+            v3 = F[:, i3]
+
+            e1 = V[v2] - V[v1]
+            e2 = V[v3] - V[v1]
+            e0 = V[v3] - V[v2]
+
+            a = 1 / tan(arccos(sum(normalizerow(-e2) * normalizerow(-e0), axis=1)))
+            b = 1 / tan(arccos(sum(normalizerow(-e1) * normalizerow(+e0), axis=1)))
+
+            data.append((0.5 * (a[:, None] * e1 + b[:, None] * e2)).ravel())
+            rows.append(v1.repeat(3))
+            cols.append(arange(3 * f))
+            ij.append((v1, v2))
+            weights.append(0.5 * a)
+        self.D = coo_matrix((hstack(data), (hstack(rows), hstack(cols))), shape=(v, 3 * f)).tocsr()
+
+        i, j = hstack(ij)
+        W = coo_matrix((hstack(weights), (i, j)), shape=(v, v)).tocsr()
+        W = W + W.T
+        Lc = W - spdiags(asarray(W.sum(axis=1)).ravel(), 0, v, v)
+        self._heat = splu((VA - t * Lc).tocsc())
+
+        # the poisson system is singular up to a constant per connected component
+        # the value of one vertex per component is fixed at zero
+        _, labels = connected_components(W, directed=False)
+        _, first = unique(labels, return_index=True)
+        self._free = setdiff1d(arange(v), first)
+        self._poisson = splu(Lc.tocsr()[self._free][:, self._free].tocsc())
+        self._labels = labels
+
+    def distances(self, sources):
+        """Compute the geodesic distances from the vertices to a set of source vertices.
+
+        Parameters
+        ----------
+        sources : list
+            A list of vertex identifiers from which the distances should be calculated.
+
+        Returns
+        -------
+        array
+            Distance values.
+
+        """
+        return self.distances_many([sources])[0]
+
+    def distances_many(self, sources):
+        """Compute the geodesic distances from the vertices to many sets of source vertices.
+
+        Parameters
+        ----------
+        sources : list
+            A list of lists of vertex identifiers.
+            Every list is a set of sources from which distances should be calculated.
+
+        Returns
+        -------
+        array
+            Distance values, with one row per set of sources.
+
+        """
+        k = len(sources)
+        u0 = zeros((len(self.key_index), k))
+        for i, keys in enumerate(sources):
+            u0[[self.key_index[key] for key in keys], i] = 1.0
+
+        u = self._heat.solve(u0)
+
+        grad_u = self.G.dot(u).reshape((-1, 3, k))
+        X = - grad_u / (sum(grad_u ** 2, axis=1) ** 0.5)[:, None, :]
+
+        div_X = self.D.dot(X.reshape((-1, k)))
+
+        phi = zeros((len(self.key_index), k))
+        phi[self._free] = self._poisson.solve(asarray(div_X)[self._free])
+        for label in range(self._labels.max() + 1):
+            select = self._labels == label
+            phi[select] -= phi[select].min(axis=0)
+        return phi.T
 
 
 # ==============================================================================
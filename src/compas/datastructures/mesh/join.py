@@ -3,7 +3,7 @@ from __future__ import absolute_import
 from __future__ import division
 
 from compas.utilities import pairwise
-from compas.utilities import geometric_key
+from compas.utilities import weld_points
 
 __all__ = [
     'mesh_weld',
@@ -12,7 +12,7 @@ __all__ = [
 ]
 
 
-def mesh_weld(mesh, precision=None, cls=None):
+def mesh_weld(mesh, precision=None, cls=None, tolerance=None):
     """Weld vertices of a mesh within some precision distance.
 
     Parameters
@@ -24,24 +24,29 @@ def mesh_weld(mesh, precision=None, cls=None):
     cls : type (None)
         Type of the welded mesh.
         This defaults to the type of the first mesh in the list.
+    tolerance : float (None)
+        Additionally weld vertices that are closer to each other than this distance.
 
     Returns
     -------
     mesh
         The welded mesh.
 
+    Notes
+    -----
+    The vertices are welded with :func:`compas.utilities.weld_points`.
+
     """
     if cls is None:
         cls = type(mesh)
 
-    geo = geometric_key
-
-    key_xyz = {key: mesh.vertex_coordinates(key) for key in mesh.vertices()}
-    gkey_key = {geo(xyz, precision): key for key, xyz in key_xyz.items()}
-    gkey_index = {gkey: index for index, gkey in enumerate(gkey_key)}
+    keys = list(mesh.vertices())
+    points = [mesh.vertex_coordinates(key) for key in keys]
+    index, last = weld_points(points, precision, tolerance)
+    key_index = dict(zip(keys, index))
 
-    vertices = [key_xyz[key] for gkey, key in gkey_key.items()]
-    faces = [[gkey_index[geo(key_xyz[key], precision)] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
+    vertices = [points[i] for i in last]
+    faces = [[key_index[key] for key in mesh.face_vertices(fkey)] for fkey in mesh.faces()]
 
     faces[:] = [[u for u, v in pairwise(face + face[:1]) if u != v] for face in faces]
     faces[:] = [face for face in faces if len(face) > 2]  # make sure no face has less than 3 vertices
@@ -95,7 +100,7 @@ def meshes_join(meshes, cls=None):
     return cls.from_vertices_and_faces(vertices, faces)
 
 
-def meshes_join_and_weld(meshes, precision=None, cls=None):
+def meshes_join_and_weld(meshes, precision=None, cls=None, tolerance=None):
     """Join and and weld meshes within some precision distance.
 
     Parameters
@@ -104,6 +109,11 @@ def meshes_join_and_weld(meshes, precision=None, cls=None):
         A list of meshes.
     precision: str
         Tolerance distance for welding.
+    cls : type (None)
+        The type of the joined mesh.
+        This defaults to the type of the first mesh in the list.
+    tolerance : float (None)
+        Additionally weld vertices that are closer to each other than this distance.
 
     Returns
     -------
@@ -111,7 +121,7 @@ def meshes_join_and_weld(meshes, precision=None, cls=None):
         The joined and welded mesh.
 
     """
-    return mesh_weld(meshes_join(meshes, cls=cls), precision=precision)
+    return mesh_weld(meshes_join(meshes, cls=cls), precision=precision, tolerance=tolerance)
 
 
 # ==============================================================================
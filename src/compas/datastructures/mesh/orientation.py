@@ -12,83 +12,6 @@ __all__ = [
 ]
 
 
-def _mesh_face_adjacency(mesh, nmax=10, radius=10.0):
-    fkey_index = {fkey: index for index, fkey in enumerate(mesh.faces())}
-    index_fkey = {index: fkey for index, fkey in enumerate(mesh.faces())}
-    points = [mesh.face_centroid(fkey) for fkey in mesh.faces()]
-
-    k = min(mesh.number_of_faces(), nmax)
-
-    try:
-        from scipy.spatial import cKDTree
-
-        tree = cKDTree(points)
-        _, closest = tree.query(points, k=k, n_jobs=-1)
-
-    except Exception:
-        # try:
-        #     from Rhino.Geometry import RTree
-        #     from Rhino.Geometry import Sphere
-        #     from Rhino.Geometry import Point3d
-
-        # except Exception:
-        from compas.geometry import KDTree
-
-        tree = KDTree(points)
-        closest = [tree.nearest_neighbors(point, k) for point in points]
-        closest = [[index for xyz, index, d in nnbrs] for nnbrs in closest]
-
-        # else:
-        #     tree = RTree()
-        #     for i, point in enumerate(points):
-        #         tree.Insert(Point3d(* point), i)
-
-        #     def callback(sender, e):
-        #         data = e.Tag
-        #         data.append(e.Id)
-
-        #     closest = []
-        #     for i, point in enumerate(points):
-        #         sphere = Sphere(Point3d(* point), radius)
-        #         data = []
-        #         tree.Search(sphere, callback, data)
-        #         closest.append(data)
-
-    adjacency = {}
-
-    for fkey in mesh.faces():
-        nbrs = []
-        index = fkey_index[fkey]
-        found = set()
-
-        nnbrs = set(closest[index])
-
-        for u, v in mesh.face_halfedges(fkey):
-            for index in nnbrs:
-                nbr = index_fkey[index]
-
-                if nbr == fkey:
-                    continue
-                if nbr in found:
-                    continue
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-
-        adjacency[fkey] = nbrs
-
-    return adjacency
-
-
 def mesh_face_adjacency(mesh):
     """Build a face adjacency dict.
 
@@ -106,47 +29,29 @@ def mesh_face_adjacency(mesh):
     -----
     This algorithm is used primarily to unify the cycle directions of a given mesh.
     Therefore, the premise is that the topological information of the mesh is corrupt
-    and cannot be used to construct the adjacency structure. The algorithm is thus
-    purely geometrical, but uses a spatial indexing tree to speed up the search.
+    and cannot be used to construct the adjacency structure. The algorithm thus only
+    uses the vertices of the faces, and collects the faces of every edge in a dictionary,
+    regardless of the direction in which the faces traverse the edge.
 
     """
-    f = mesh.number_of_faces()
-
-    if f > 100:
-        return _mesh_face_adjacency(mesh)
+    edge_faces = {}
+    for fkey in mesh.faces():
+        for u, v in mesh.face_halfedges(fkey):
+            edge = (u, v) if u < v else (v, u)
+            if edge in edge_faces:
+                edge_faces[edge].append(fkey)
+            else:
+                edge_faces[edge] = [fkey]
 
     adjacency = {}
-    faces = list(mesh.faces())
 
     for fkey in mesh.faces():
-        # faces = []
-        # for key in mesh.face_vertices(fkey):
-        #     for nbr in mesh.halfedge[key]:
-        #         fnbr = mesh.halfedge[key][nbr]
-        #         if fnbr is not None:
-        #             faces.append(fnbr)
-
         nbrs = []
-        found = set()
 
         for u, v in mesh.face_halfedges(fkey):
-            for nbr in faces:
-                if nbr == fkey:
-                    continue
-                if nbr in found:
-                    continue
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-
-                for a, b in mesh.face_halfedges(nbr):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
+            for nbr in edge_faces[(u, v) if u < v else (v, u)]:
+                if nbr != fkey and nbr not in nbrs:
+                    nbrs.append(nbr)
 
         adjacency[fkey] = nbrs
 
@@ -0,0 +1,291 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from numpy import arange
+from numpy import asarray
+from numpy import bincount
+from numpy import broadcast_to
+from numpy import concatenate
+from numpy import cross
+from numpy import einsum
+from numpy import errstate
+from numpy import float64
+from numpy import fmax
+from numpy import fmin
+from numpy import full
+from numpy import inf
+from numpy import int64
+from numpy import lexsort
+from numpy import minimum
+from numpy import zeros
+
+from compas.datastructures.mesh.bvh_numpy import MeshBVH
+
+
+__all__ = ['RayMesh']
+
+
+class RayMesh(MeshBVH):
+    """Batched ray and line intersections with the triangles of a mesh.
+
+    Parameters
+    ----------
+    vertices : array-like
+        The XYZ coordinates of the vertices.
+    triangles : array-like
+        The vertex indices of the triangles.
+    leafsize : int, optional
+        The maximum number of triangles per leaf of the bounding volume hierarchy.
+        Default is ``8``.
+
+    Notes
+    -----
+    A ray is a point ``o`` and a direction ``d``, and the intersections are the points ``o + t * d``
+    with ``tmin < t <= tmax``.
+    Rays are infinite by default.
+    A line segment from ``a`` to ``b`` is the ray with ``o = a``, ``d = b - a`` and ``tmax = 1``,
+    and an infinite line is the ray with ``tmin = -inf``.
+
+    All rays are traversed through the bounding volume hierarchy at the same time, one level per step,
+    and the intersections with the triangles of the visited leaves
+    are computed with the Moeller-Trumbore algorithm in one vectorized pass per level.
+
+    Examples
+    --------
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> raymesh = RayMesh.from_mesh(mesh)
+    >>> points, faces, t = raymesh.intersect([[0, 0, -5]], [[0, 0, 1]])
+    >>> print(round(t[0], 3))
+    3.845
+    >>> raymesh.contains([[0, 0, 0], [0, 0, 2]]).tolist()
+    [True, False]
+
+    """
+
+    def _traverse(self, origins, directions, tmin, tmax, mode):
+        """Find the intersections of rays and triangles.
+
+        With mode ``'first'``, only the first intersection per ray is kept,
+        with mode ``'any'``, the traversal of a ray stops at its first intersection,
+        and with mode ``'all'``, all intersections are collected.
+        """
+        n = origins.shape[0]
+        with errstate(divide='ignore'):
+            inverse = 1.0 / directions
+        limit = tmax.copy()
+        face = full(n, -1, dtype=int64)
+        hits_r = []
+        hits_t = []
+        hits_f = []
+        pi = arange(n)
+        ni = zeros(n, dtype=int64)
+        while pi.size:
+            o = origins[pi]
+            with errstate(invalid='ignore'):
+                t1 = (self.box_min[ni] - o) * inverse[pi]
+                t2 = (self.box_max[ni] - o) * inverse[pi]
+            near = fmax.reduce(fmin(t1, t2), axis=1)
+            far = fmin.reduce(fmax(t1, t2), axis=1)
+            keep = (near <= far) & (far > tmin[pi]) & (near <= limit[pi])
+            if mode == 'any':
+                keep &= face[pi] < 0
+            pi = pi[keep]
+            ni = ni[keep]
+            leaf = self.left[ni] < 0
+            ri, ti = self._leaves(pi[leaf], ni[leaf])
+            t = _intersect_rays_triangles(origins[ri], directions[ri], self.vertices[self.triangles[ti]])
+            hit = (t > tmin[ri]) & (t <= limit[ri])
+            ri = ri[hit]
+            ti = ti[hit]
+            t = t[hit]
+            if mode == 'all':
+                hits_r.append(ri)
+                hits_t.append(t)
+                hits_f.append(ti)
+            elif mode == 'any':
+                face[ri] = ti
+            else:
+                minimum.at(limit, ri, t)
+                closest = t == limit[ri]
+                face[ri[closest]] = ti[closest]
+            pi, ni = self._children(pi[~leaf], ni[~leaf])
+        if mode == 'all':
+            return concatenate(hits_r), concatenate(hits_t), concatenate(hits_f)
+        return limit, face
+
+    def _rays(self, origins, directions, tmin, tmax):
+        origins = asarray(origins, dtype=float64).reshape((-1, 3))
+        directions = asarray(directions, dtype=float64).reshape((-1, 3))
+        n = max(origins.shape[0], directions.shape[0])
+        origins = broadcast_to(origins, (n, 3))
+        directions = broadcast_to(directions, (n, 3))
+        tmin = broadcast_to(asarray(tmin, dtype=float64), (n, )).copy()
+        tmax = broadcast_to(asarray(inf if tmax is None else tmax, dtype=float64), (n, )).copy()
+        return origins, directions, tmin, tmax
+
+    def intersect(self, origins, directions, tmin=0.0, tmax=None):
+        """Compute the first intersection of rays with the mesh.
+
+        Parameters
+        ----------
+        origins : array-like
+            The XYZ coordinates of the origins of the rays,
+            or of one origin for all rays.
+        directions : array-like
+            The XYZ components of the directions of the rays,
+            or of one direction for all rays.
+        tmin : float or array-like, optional
+            The start of the rays, as multiple of the directions.
+            Default is ``0.0``.
+        tmax : float or array-like, optional
+            The end of the rays, as multiple of the directions.
+            Default is ``None``, for infinite rays.
+
+        Returns
+        -------
+        tuple
+            * The ``(k, 3)`` array of intersection points, with ``nan`` if a ray does not hit the mesh.
+            * The index of the hit face of every ray, or ``-1``.
+            * The parameter of the intersection along every ray, or ``inf``.
+
+        """
+        origins, directions, tmin, tmax = self._rays(origins, directions, tmin, tmax)
+        t, triangles = self._traverse(origins, directions, tmin, tmax, 'first')
+        miss = triangles < 0
+        t[miss] = inf
+        faces = full(triangles.shape[0], -1, dtype=int64)
+        faces[~miss] = self.triangle_face[triangles[~miss]]
+        with errstate(invalid='ignore'):
+            points = origins + t[:, None] * directions
+        points[miss] = float('nan')
+        return points, faces, t
+
+    def intersect_all(self, origins, directions, tmin=0.0, tmax=None):
+        """Compute all intersections of rays with the mesh.
+
+        Parameters
+        ----------
+        origins : array-like
+            The XYZ coordinates of the origins of the rays,
+            or of one origin for all rays.
+        directions : array-like
+            The XYZ components of the directions of the rays,
+            or of one direction for all rays.
+        tmin : float or array-like, optional
+            The start of the rays, as multiple of the directions.
+            Default is ``0.0``.
+        tmax : float or array-like, optional
+            The end of the rays, as multiple of the directions.
+            Default is ``None``, for infinite rays.
+
+        Returns
+        -------
+        tuple
+            * The index of the ray of every intersection.
+            * The ``(h, 3)`` array of intersection points.
+            * The index of the hit face of every intersection.
+            * The parameter of every intersection along its ray.
+
+            The intersections are sorted per ray, in the order of the parameters.
+
+        """
+        origins, directions, tmin, tmax = self._rays(origins, directions, tmin, tmax)
+        rays, t, triangles = self._traverse(origins, directions, tmin, tmax, 'all')
+        order = lexsort((t, rays))
+        rays = rays[order]
+        t = t[order]
+        points = origins[rays] + t[:, None] * directions[rays]
+        return rays, points, self.triangle_face[triangles[order]], t
+
+    def occluded(self, origins, directions, tmin=0.0, tmax=None):
+        """Verify if rays hit the mesh.
+
+        Parameters
+        ----------
+        origins : array-like
+            The XYZ coordinates of the origins of the rays,
+            or of one origin for all rays.
+        directions : array-like
+            The XYZ components of the directions of the rays,
+            or of one direction for all rays.
+        tmin : float or array-like, optional
+            The start of the rays, as multiple of the directions.
+            Default is ``0.0``.
+        tmax : float or array-like, optional
+            The end of the rays, as multiple of the directions.
+            Default is ``None``, for infinite rays.
+
+        Returns
+        -------
+        array
+            ``True`` for every ray with at least one intersection.
+
+        Notes
+        -----
+        The traversal of a ray stops at the first intersection that is found,
+        which is not necessarily the closest one.
+
+        """
+        origins, directions, tmin, tmax = self._rays(origins, directions, tmin, tmax)
+        _, triangles = self._traverse(origins, directions, tmin, tmax, 'any')
+        return triangles >= 0
+
+    def contains(self, points):
+        """Verify if points lie inside the mesh.
+
+        Parameters
+        ----------
+        points : array-like
+            The XYZ coordinates of the points.
+
+        Returns
+        -------
+        array
+            ``True`` for every point inside the mesh.
+
+        Notes
+        -----
+        The mesh should be closed.
+        A point is inside if a ray from the point crosses the mesh an odd number of times.
+        The direction of the rays is chosen such that they are unlikely to pass exactly through edges or vertices
+        of meshes that are aligned with the coordinate axes.
+
+        """
+        points = asarray(points, dtype=float64).reshape((-1, 3))
+        direction = asarray([0.5772, 0.5784, 0.5764])
+        rays, _, _, _ = self.intersect_all(points, direction)
+        return bincount(rays, minlength=points.shape[0]) % 2 == 1
+
+
+def _intersect_rays_triangles(origins, directions, triangles):
+    """Compute the parameters of the intersections of rays and triangles with the Moeller-Trumbore algorithm.
+
+    The parameter is ``nan`` if a ray does not intersect its triangle.
+    """
+    a = triangles[:, 0]
+    e1 = triangles[:, 1] - a
+    e2 = triangles[:, 2] - a
+    p = cross(directions, e2)
+    det = einsum('ij,ij->i', e1, p)
+    with errstate(divide='ignore', invalid='ignore'):
+        inverse = 1.0 / det
+        s = origins - a
+        u = einsum('ij,ij->i', s, p) * inverse
+        q = cross(s, e1)
+        v = einsum('ij,ij->i', directions, q) * inverse
+        t = einsum('ij,ij->i', e2, q) * inverse
+    miss = (det == 0) | (u < 0) | (v < 0) | (u + v > 1)
+    t[miss] = float('nan')
+    return t
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+    doctest.testmod(globs=globals())
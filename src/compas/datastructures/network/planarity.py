@@ -6,8 +6,6 @@ from math import cos
 from math import sin
 from math import pi
 
-from itertools import product
-
 import compas
 
 from compas.geometry import angle_vectors_xy
@@ -39,6 +37,71 @@ def network_embed_in_plane_proxy(data, fixed=None, straightline=True):
     return network.to_data()
 
 
+def _find_crossings(edges, vertices):
+    """Generate the pairs of crossing edges, with a uniform grid of cells as spatial hash.
+
+    Parameters
+    ----------
+    edges : list
+        The edges, as pairs of vertex keys.
+    vertices : dict
+        The XY(Z) coordinates of the vertices.
+
+    Yields
+    ------
+    tuple
+        The indices of two crossing edges.
+
+    Notes
+    -----
+    Every edge is registered in all cells overlapped by its bounding box.
+    Only the pairs of edges in the same cell with overlapping bounding boxes are tested for intersection,
+    and every pair is only tested in the cell that contains the lower left corner of the overlap of the boxes.
+
+    """
+    boxes = []
+    for u, v in edges:
+        a = vertices[u]
+        b = vertices[v]
+        boxes.append((min(a[0], b[0]), min(a[1], b[1]), max(a[0], b[0]), max(a[1], b[1])))
+    if not boxes:
+        return
+
+    # the cell size is the mean size of the bounding boxes of the edges
+    size = sum(max(xmax - xmin, ymax - ymin) for xmin, ymin, xmax, ymax in boxes) / len(boxes)
+    if size == 0:
+        size = 1.0
+
+    cells = {}
+    for index, (xmin, ymin, xmax, ymax) in enumerate(boxes):
+        for i in range(int(xmin // size), int(xmax // size) + 1):
+            for j in range(int(ymin // size), int(ymax // size) + 1):
+                if (i, j) in cells:
+                    cells[i, j].append(index)
+                else:
+                    cells[i, j] = [index]
+
+    for (i, j), indices in cells.items():
+        for n, e1 in enumerate(indices):
+            u1, v1 = edges[e1]
+            xmin1, ymin1, xmax1, ymax1 = boxes[e1]
+            for e2 in indices[n + 1:]:
+                u2, v2 = edges[e2]
+                if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
+                    continue
+                xmin2, ymin2, xmax2, ymax2 = boxes[e2]
+                if xmin2 > xmax1 or xmin1 > xmax2 or ymin2 > ymax1 or ymin1 > ymax2:
+                    continue
+                if int(max(xmin1, xmin2) // size) != i or int(max(ymin1, ymin2) // size) != j:
+                    continue
+                a = vertices[u1]
+                b = vertices[v1]
+                c = vertices[u2]
+                d = vertices[v2]
+                if is_intersection_segment_segment_xy((a, b), (c, d)):
+                    yield e1, e2
+
+
 def network_is_crossed(network):
     """Verify if a network has crossing edges.
 
@@ -58,28 +121,13 @@ def network_is_crossed(network):
     This algorithm assumes that the network lies in the XY plane.
 
     """
-    for (u1, v1), (u2, v2) in product(network.edges(), network.edges()):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        a = network.node_attributes(u1, 'xy')
-        b = network.node_attributes(v1, 'xy')
-        c = network.node_attributes(u2, 'xy')
-        d = network.node_attributes(v2, 'xy')
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
-    return False
+    vertices = {key: network.node_attributes(key, 'xy') for key in network.nodes()}
+    return _are_edges_crossed(list(network.edges()), vertices)
 
 
 def _are_edges_crossed(edges, vertices):
-    for (u1, v1), (u2, v2) in product(edges, edges):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        a = vertices[u1]
-        b = vertices[v1]
-        c = vertices[u2]
-        d = vertices[v2]
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            return True
+    for _ in _find_crossings(edges, vertices):
+        return True
     return False
 
 
@@ -122,21 +170,9 @@ def network_find_crossings(network):
     This algorithm assumes that the network lies in the XY plane.
 
     """
-    crossings = set()
-    for (u1, v1), (u2, v2) in product(network.edges(), network.edges()):
-        if u1 == u2 or v1 == v2 or u1 == v2 or u2 == v1:
-            continue
-        if ((u1, v1), (u2, v2)) in crossings:
-            continue
-        if ((u2, v2), (u1, v1)) in crossings:
-            continue
-        a = network.node_attributes(u1, 'xy')
-        b = network.node_attributes(v1, 'xy')
-        c = network.node_attributes(u2, 'xy')
-        d = network.node_attributes(v2, 'xy')
-        if is_intersection_segment_segment_xy((a, b), (c, d)):
-            crossings.add(((u1, v1), (u2, v2)))
-    return list(crossings)
+    edges = list(network.edges())
+    vertices = {key: network.node_attributes(key, 'xy') for key in network.nodes()}
+    return [(edges[e1], edges[e2]) for e1, e2 in _find_crossings(edges, vertices)]
 
 
 def network_is_xy(network):
@@ -322,5 +358,14 @@ def network_embed_in_plane(network, fixed=None, straightline=True):
 
 if __name__ == '__main__':
 
-    import doctest
-    doctest.testmod(globs=globals())
+    from time import time
+
+    from compas.datastructures import Network
+
+    network = Network.from_obj(compas.get('lines_bigger.obj'))
+
+    tic = time()
+    crossings = network_find_crossings(network)
+    toc = time() - tic
+
+    print('{} edges, {} crossings: {:.3f}s'.format(network.number_of_edges(), len(crossings), toc))
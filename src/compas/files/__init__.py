@@ -15,6 +15,7 @@ GLTF
 
     GLTF
     GLTFReader
+    GLTFReaderNumpy
     GLTFParser
     GLTFContent
     GLTFMesh
@@ -32,6 +33,34 @@ OBJ
     OBJReader
     OBJParser
     OBJWriter
+    OBJReaderNumpy
+    OBJParserNumpy
+
+
+LAS
+===
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    LAS
+    LASReader
+    LASParser
+    LASReaderNumpy
+    LASParserNumpy
+
+
+NPZ
+===
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    NPZ
+    NPZReader
+    NPZWriter
 
 
 OFF
@@ -57,6 +86,8 @@ PLY
     PLYReader
     PLYParser
     PLYWriter
+    PLYReaderNumpy
+    PLYParserNumpy
 
 
 STL
@@ -70,6 +101,8 @@ STL
     STLReader
     STLParser
     STLWriter
+    STLReaderNumpy
+    STLParserNumpy
 
 
 URDF
@@ -100,6 +133,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
+
 from .dxf import *  # noqa: F401 F403
 from .gltf import *  # noqa: F401 F403
 from .las import *  # noqa: F401 F403
@@ -110,4 +145,11 @@ from .stl import *  # noqa: F401 F403
 from .urdf import *  # noqa: F401 F403
 from .xml import *  # noqa: F401 F403
 
+if not compas.IPY:
+    from .las_numpy import *  # noqa: F401 F403
+    from .npz_numpy import *  # noqa: F401 F403
+    from .obj_numpy import *  # noqa: F401 F403
+    from .ply_numpy import *  # noqa: F401 F403
+    from .stl_numpy import *  # noqa: F401 F403
+
 __all__ = [name for name in dir() if not name.startswith('_')]
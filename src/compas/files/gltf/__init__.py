@@ -2,6 +2,8 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import compas
+
 from .gltf import GLTF
 from .gltf_content import GLTFContent
 from .gltf_exporter import GLTFExporter
@@ -17,3 +19,8 @@ __all__ = [
     'GLTFParser',
     'GLTFExporter',
 ]
+
+if not compas.IPY:
+    from .gltf_reader_numpy import GLTFReaderNumpy
+
+    __all__ += ['GLTFReaderNumpy']
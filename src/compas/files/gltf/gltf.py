@@ -4,6 +4,8 @@ from __future__ import absolute_import
 
 import os
 
+import compas
+
 from compas.files.gltf.gltf_exporter import GLTFExporter
 from compas.files.gltf.gltf_parser import GLTFParser
 from compas.files.gltf.gltf_reader import GLTFReader
@@ -39,8 +41,16 @@ class GLTF(object):
         self._exporter = None
 
     def read(self):
-        """Read the glTF located at :attr:`compas.files.GLTF.filepath` and load its content."""
-        self._reader = GLTFReader(self.filepath)
+        """Read the glTF located at :attr:`compas.files.GLTF.filepath` and load its content.
+
+        Outside of IronPython, the data of the file is read into NumPy arrays
+        with :class:`compas.files.GLTFReaderNumpy`.
+        """
+        if not compas.IPY:
+            from compas.files.gltf.gltf_reader_numpy import GLTFReaderNumpy
+            self._reader = GLTFReaderNumpy(self.filepath)
+        else:
+            self._reader = GLTFReader(self.filepath)
         self._parser = GLTFParser(self._reader)
         self._is_parsed = True
 
@@ -98,8 +108,6 @@ class GLTF(object):
 
 if __name__ == '__main__':
 
-    import compas
-
     from compas.datastructures import Mesh, mesh_transformed
     from compas.utilities import download_file_from_remote
     from compas_viewers.multimeshviewer import MultiMeshViewer
@@ -4,9 +4,14 @@ from __future__ import absolute_import
 
 import array
 import base64
+import hashlib
 import json
 import os
+import shutil
 import struct
+import tempfile
+
+import compas
 
 from compas.files.gltf.constants import COMPONENT_TYPE_ENUM
 from compas.files.gltf.constants import COMPONENT_TYPE_FLOAT
@@ -43,6 +48,15 @@ class GLTFExporter(object):
         with the exception of external image data.
         When ``False``, the data will be written to an external binary file or chunk.
 
+    Notes
+    -----
+    Outside of IronPython, the data of every accessor is converted to bytes in one step with NumPy.
+    Accessors with identical data share the same part of the binary buffer,
+    such that meshes with the same data are only stored once, even if they are used by different nodes.
+    The binary buffer is written to a temporary file while the accessors are added,
+    and copied from there into the *.bin* file or the binary chunk of the *.glb* file on export,
+    such that it is never held in memory as a whole, unless the data is embedded.
+
     """
 
     def __init__(self, filepath, content, embed_data=False):
@@ -64,7 +78,9 @@ class GLTFExporter(object):
         self._texture_index_by_key = {}
         self._sampler_index_by_key = {}
         self._image_index_by_key = {}
-        self._buffer = b''
+        self._accessor_index_by_hash = {}
+        self._buffer_file = None
+        self._buffer_length = 0
 
         self.load()
 
@@ -99,7 +115,9 @@ class GLTFExporter(object):
         self._texture_index_by_key = self._get_index_by_key(self._content.textures)
         self._sampler_index_by_key = self._get_index_by_key(self._content.samplers)
         self._image_index_by_key = self._get_index_by_key(self._content.images)
-        self._buffer = b''
+        self._accessor_index_by_hash = {}
+        self._close_buffer()
+        self._buffer_length = 0
 
         self._set_path_attributes()
         self._add_meshes()
@@ -114,6 +132,18 @@ class GLTFExporter(object):
         self._add_animations()
         self._add_buffer()
 
+    @property
+    def _buffer(self):
+        if self._buffer_file is None:
+            return b''
+        self._buffer_file.seek(0)
+        return self._buffer_file.read()
+
+    def _close_buffer(self):
+        if self._buffer_file is not None:
+            self._buffer_file.close()
+            self._buffer_file = None
+
     def _get_index_by_key(self, d):
         return {key: index for index, key in enumerate(d)}
 
@@ -130,9 +160,9 @@ class GLTFExporter(object):
         if self._ext == '.gltf':
             with open(self.gltf_filepath, 'w') as f:
                 f.write(gltf_json)
-            if not self._embed_data and len(self._buffer) > 0:
+            if not self._embed_data and self._buffer_length > 0:
                 with open(self.get_bin_path(), 'wb') as f:
-                    f.write(self._buffer)
+                    self._write_buffer(f)
 
         if self._ext == '.glb':
             with open(self.gltf_filepath, 'wb') as f:
@@ -142,7 +172,7 @@ class GLTFExporter(object):
                 spaces_gltf = (4 - (length_gltf & 3)) & 3
                 length_gltf += spaces_gltf
 
-                length_bin = len(self._buffer)
+                length_bin = self._buffer_length
                 zeros_bin = (4 - (length_bin & 3)) & 3
                 length_bin += zeros_bin
 
@@ -163,10 +193,14 @@ class GLTFExporter(object):
                 if length_bin > 0:
                     f.write(struct.pack('<I', length_bin))
                     f.write('BIN\0'.encode())
-                    f.write(self._buffer)
+                    self._write_buffer(f)
                     for i in range(0, zeros_bin):
                         f.write('\0'.encode())
 
+    def _write_buffer(self, f):
+        self._buffer_file.seek(0)
+        shutil.copyfileobj(self._buffer_file, f)
+
     def _add_images(self):
         if not self._content.images:
             return
@@ -237,9 +271,9 @@ class GLTFExporter(object):
         self._gltf_dict['meshes'] = mesh_list
 
     def _add_buffer(self):
-        if not self._buffer:
+        if not self._buffer_length:
             return
-        buffer = {'byteLength': len(self._buffer)}
+        buffer = {'byteLength': self._buffer_length}
         if self._embed_data:
             buffer['uri'] = 'data:application/octet-stream;base64,' + base64.b64encode(self._buffer).decode('ascii')
         elif self._ext == '.gltf':
@@ -260,12 +294,13 @@ class GLTFExporter(object):
         samplers_list = [None] * len(sampler_index_by_key)
         for key, sampler_data in animation_data.samplers_dict.items():
             input_accessor = self._construct_accessor(sampler_data.input, COMPONENT_TYPE_FLOAT, TYPE_SCALAR, include_bounds=True)
+            output = sampler_data.output
             type_ = TYPE_VEC3
-            if isinstance(sampler_data.output[0], int) or isinstance(sampler_data.output[0], float):
+            if getattr(output, 'ndim', None) == 1 or isinstance(output[0], int) or isinstance(output[0], float):
                 type_ = TYPE_SCALAR
-            elif len(sampler_data.output[0]) == 4:
+            elif len(output[0]) == 4:
                 type_ = TYPE_VEC4
-            output_accessor = self._construct_accessor(sampler_data.output, COMPONENT_TYPE_FLOAT, type_)
+            output_accessor = self._construct_accessor(output, COMPONENT_TYPE_FLOAT, type_)
             samplers_list[sampler_index_by_key[key]] = sampler_data.to_data(input_accessor, output_accessor)
         return samplers_list
 
@@ -333,19 +368,41 @@ class GLTFExporter(object):
     def _construct_accessor(self, data, component_type, type_, include_bounds=False):
         if data is None:
             return None
+
+        if not compas.IPY:
+            from compas.files.gltf.gltf_exporter_numpy import accessor_bytes_numpy
+            bytes_, count, minimum, maximum = accessor_bytes_numpy(data, component_type, NUM_COMPONENTS_BY_TYPE_ENUM[type_], include_bounds)
+        else:
+            bytes_, count, minimum, maximum = self._accessor_bytes(data, component_type, type_, include_bounds)
+
+        # accessors with the same data are only stored once
+        key = (component_type, type_, count, include_bounds, hashlib.sha1(bytes_).hexdigest())
+        if key in self._accessor_index_by_hash:
+            return self._accessor_index_by_hash[key]
+
+        buffer_view_index = self._construct_buffer_view(bytes_)
+        accessor_dict = {
+            'bufferView': buffer_view_index,
+            'count': count,
+            'componentType': component_type,
+            'type': type_,
+        }
+        if include_bounds and minimum is not None:
+            accessor_dict['min'] = minimum
+            accessor_dict['max'] = maximum
+
+        self._gltf_dict.setdefault('accessors', []).append(accessor_dict)
+
+        index = len(self._gltf_dict['accessors']) - 1
+        self._accessor_index_by_hash[key] = index
+        return index
+
+    def _accessor_bytes(self, data, component_type, type_, include_bounds=False):
         count = len(data)
 
         fmt_char = COMPONENT_TYPE_ENUM[component_type]
         fmt = '<' + fmt_char * NUM_COMPONENTS_BY_TYPE_ENUM[type_]
 
-        component_size = struct.calcsize('<' + fmt_char)
-        if component_type == 'MAT2' and component_size == 1:
-            fmt = '<FFxxFFxx'.replace('F', fmt_char)
-        elif component_type == 'MAT3' and component_size == 1:
-            fmt = '<FFFxFFFxFFFx'.replace('F', fmt_char)
-        elif component_type == 'MAT3' and component_size == 2:
-            fmt = '<FFFxxFFFxxFFFxx'.replace('F', fmt_char)
-
         component_len = struct.calcsize(fmt)
 
         # ensure bytes_ length is divisible by 4
@@ -363,13 +420,11 @@ class GLTFExporter(object):
             else:
                 struct.pack_into(fmt, bytes_, (i * component_len), *datum)
 
-        buffer_view_index = self._construct_buffer_view(bytes_)
-        accessor_dict = {
-            'bufferView': buffer_view_index,
-            'count': count,
-            'componentType': component_type,
-            'type': type_,
-        }
+        if not USE_BYTEARRAY_BUFFERS:
+            bytes_ = bytearray(bytes_)
+
+        minimum = None
+        maximum = None
         if include_bounds:
             try:
                 # Here we check if ``data`` contains tuples,
@@ -382,12 +437,8 @@ class GLTFExporter(object):
                 # so min and max are more simply computed.
                 minimum = (min(data),)
                 maximum = (max(data),)
-            accessor_dict['min'] = minimum
-            accessor_dict['max'] = maximum
-
-        self._gltf_dict.setdefault('accessors', []).append(accessor_dict)
 
-        return len(self._gltf_dict['accessors']) - 1
+        return bytes_, count, minimum, maximum
 
     def _construct_buffer_view(self, bytes_):
         if not bytes_:
@@ -404,11 +455,18 @@ class GLTFExporter(object):
         return len(self._gltf_dict['bufferViews']) - 1
 
     def _update_buffer(self, bytes_):
-        byte_offset = len(self._buffer)
+        byte_offset = self._buffer_length
         # If bytes_ was not created as bytearray, cast now
         if not USE_BYTEARRAY_BUFFERS:
             bytes_ = bytearray(bytes_)
-        self._buffer += bytes_
+        # keep the next buffer view aligned to 4 bytes
+        padding = (4 - len(bytes_) % 4) % 4
+        if self._buffer_file is None:
+            self._buffer_file = tempfile.TemporaryFile(suffix='.bin')
+        self._buffer_file.write(bytes(bytes_))
+        if padding:
+            self._buffer_file.write(b'\0' * padding)
+        self._buffer_length += len(bytes_) + padding
         return byte_offset
 
     def _set_path_attributes(self):
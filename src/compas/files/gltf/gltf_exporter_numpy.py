@@ -0,0 +1,51 @@
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+from numpy import asarray
+from numpy import ascontiguousarray
+
+from compas.files.gltf.constants import COMPONENT_TYPE_ENUM
+
+
+__all__ = []
+
+
+def accessor_bytes_numpy(data, component_type, num_components, include_bounds=False):
+    """Convert the data of an accessor to bytes in one step.
+
+    Parameters
+    ----------
+    data : list or array
+        The elements of the accessor.
+    component_type : int
+        The glTF component type.
+    num_components : int
+        The number of components per element.
+    include_bounds : bool, optional
+        Compute the minimum and maximum per component.
+
+    Returns
+    -------
+    tuple
+        * The little-endian bytes of the elements, padded to a multiple of 4 bytes.
+        * The number of elements.
+        * The minimum per component, or None.
+        * The maximum per component, or None.
+
+    Notes
+    -----
+    The bounds are computed from the converted components,
+    such that they match the values that are stored in the file.
+
+    """
+    components = asarray(data, dtype='<' + COMPONENT_TYPE_ENUM[component_type]).reshape((-1, num_components))
+    count = components.shape[0]
+    bytes_ = ascontiguousarray(components).tobytes()
+    bytes_ += b'\0' * ((4 - len(bytes_) % 4) % 4)
+    minimum = None
+    maximum = None
+    if include_bounds and count:
+        minimum = components.min(axis=0).tolist()
+        maximum = components.max(axis=0).tolist()
+    return bytes_, count, minimum, maximum
@@ -9,6 +9,7 @@ from compas.files.gltf.data_classes import PrimitiveData
 from compas.files.gltf.helpers import get_weighted_mesh_vertices
 from compas.files.gltf.helpers import get_unweighted_primitive_vertices
 from compas.files.gltf.helpers import get_mode
+from compas.files.gltf.helpers import is_array_data
 
 
 class GLTFMesh(object):
@@ -28,11 +29,15 @@ class GLTFMesh(object):
         GLTF context in which the mesh exists.
     key : int
         Key of the mesh used in :attr:`compas.files.GLTFMesh.context.meshes`.
-    vertices : list
-        List of xyz-tuples representing the points of the mesh.
-    faces : list
+    vertices : list or array
+        List of xyz-tuples representing the points of the mesh,
+        or a ``(v, 3)`` array if the mesh was read with :class:`compas.files.GLTFReaderNumpy`.
+    faces : list or array
         List of tuples referencing the indices of :attr:`compas.files.GLTFMesh.vertices`
-        representing faces of the mesh.
+        representing faces of the mesh,
+        or a ``(f, 3)`` array if the mesh was read with :class:`compas.files.GLTFReaderNumpy`.
+        If the primitives of the mesh have different modes, for example triangles and lines,
+        the faces are always a list of tuples of different sizes.
 
     """
     def __init__(self, primitive_data_list, context, mesh_name=None, weights=None, extras=None, extensions=None):
@@ -65,16 +70,37 @@ class GLTFMesh(object):
 
     @property
     def faces(self):
+        if is_array_data([primitive_data.attributes['POSITION'] for primitive_data in self.primitive_data_list]):
+            # primitives of different modes have faces of different sizes, which do not fit in one array
+            if len(set(VERTEX_COUNT_BY_MODE[primitive_data.mode] for primitive_data in self.primitive_data_list)) == 1:
+                return self._faces_numpy()
         faces = []
         shift = 0
         for primitive_data in self.primitive_data_list:
-            shifted_indices = self.shift_indices(primitive_data.indices, shift)
+            indices = primitive_data.indices
+            if is_array_data([indices]):
+                indices = indices.tolist()
+            shifted_indices = self.shift_indices(indices, shift)
             group_size = VERTEX_COUNT_BY_MODE[primitive_data.mode]
             grouped_indices = self.group_indices(shifted_indices, group_size)
             faces.extend(grouped_indices)
             shift += len(primitive_data.attributes['POSITION'])
         return faces
 
+    def _faces_numpy(self):
+        from numpy import asarray
+        from numpy import concatenate
+        from numpy import int64
+
+        faces = []
+        shift = 0
+        for primitive_data in self.primitive_data_list:
+            group_size = VERTEX_COUNT_BY_MODE[primitive_data.mode]
+            indices = asarray(primitive_data.indices, dtype=int64)
+            faces.append(indices[:indices.size - indices.size % group_size].reshape((-1, group_size)) + shift)
+            shift += len(primitive_data.attributes['POSITION'])
+        return concatenate(faces)
+
     def shift_indices(self, indices, shift):
         """Given a list of indices, returns a list of indices, all shifted by ``shift``.
 
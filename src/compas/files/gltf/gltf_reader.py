@@ -52,8 +52,7 @@ class GLTFReader(object):
         self.read()
 
     def read(self):
-        with open(self.filepath, 'rb') as f:
-            self._bin_content = self._get_memoryview(f.read())
+        self._bin_content = self._read_file(self.filepath)
 
         is_glb = self._bin_content[:4] == b'glTF'
 
@@ -173,7 +172,7 @@ class GLTFReader(object):
                 sparse_indices_buffer_view_index,
                 sparse_count,
                 sparse_indices_component_type,
-                accessor_offset,
+                sparse_indices_data.get('byteOffset', 0),
                 NUM_COMPONENTS_BY_TYPE_ENUM['SCALAR']
             )
 
@@ -183,31 +182,33 @@ class GLTFReader(object):
                 sparse_values_buffer_view_index,
                 sparse_count,
                 component_type,
-                accessor_offset,
+                sparse_values_data.get('byteOffset', 0),
                 num_components
             )
 
             for index, data_index in enumerate(sparse_indices):
                 data[data_index] = sparse_values[index]
 
-            if accessor.get('normalized', False):
-                for index, tuple_ in enumerate(data):
-                    new_tuple = ()
-                    for i in tuple_:
-                        if component_type == COMPONENT_TYPE_BYTE:
-                            new_tuple += (max(float(i / 127.0), -1.0),)
-                        elif component_type == COMPONENT_TYPE_UNSIGNED_BYTE:
-                            new_tuple += (float(i / 255.0),)
-                        elif component_type == COMPONENT_TYPE_SHORT:
-                            new_tuple += (max(float(i / 32767.0), -1.0),)
-                        elif component_type == COMPONENT_TYPE_UNSIGNED_SHORT:
-                            new_tuple += (i / 65535.0,)
-                        else:
-                            new_tuple += (float(i),)
-                    data[index] = new_tuple
+        if accessor.get('normalized', False):
+            for index, tuple_ in enumerate(data):
+                if num_components == 1:
+                    data[index] = self._normalize(tuple_, component_type)
+                else:
+                    data[index] = tuple(self._normalize(i, component_type) for i in tuple_)
 
         return data
 
+    def _normalize(self, i, component_type):
+        if component_type == COMPONENT_TYPE_BYTE:
+            return max(float(i / 127.0), -1.0)
+        if component_type == COMPONENT_TYPE_UNSIGNED_BYTE:
+            return float(i / 255.0)
+        if component_type == COMPONENT_TYPE_SHORT:
+            return max(float(i / 32767.0), -1.0)
+        if component_type == COMPONENT_TYPE_UNSIGNED_SHORT:
+            return i / 65535.0
+        return float(i)
+
     def _read_from_buffer_view(self, buffer_view_index, count, component_type, accessor_offset, num_components):
         buffer_view = self.json['bufferViews'][buffer_view_index]
 
@@ -259,14 +260,16 @@ class GLTFReader(object):
             string = self.get_data_uri_data(uri)
             buffer = self._get_memoryview(base64.b64decode(string))
         else:
-            filepath = self.get_filepath(uri)
-            with open(filepath, 'rb') as f:
-                buffer = self._get_memoryview(f.read())
+            buffer = self._read_file(self.get_filepath(uri))
 
         self._buffers[buffer_index] = buffer
 
         return buffer
 
+    def _read_file(self, filepath):
+        with open(filepath, 'rb') as f:
+            return self._get_memoryview(f.read())
+
     def _release_buffer(self, buffer):
         try:
             buffer.release()
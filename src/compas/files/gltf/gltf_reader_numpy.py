@@ -0,0 +1,146 @@
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+
+from numpy import dtype
+from numpy import float64
+from numpy import maximum
+from numpy import memmap
+from numpy import ndarray
+from numpy import uint8
+from numpy import zeros
+
+from compas.files.gltf.constants import COMPONENT_TYPE_BYTE
+from compas.files.gltf.constants import COMPONENT_TYPE_ENUM
+from compas.files.gltf.constants import COMPONENT_TYPE_SHORT
+from compas.files.gltf.constants import COMPONENT_TYPE_UNSIGNED_BYTE
+from compas.files.gltf.constants import COMPONENT_TYPE_UNSIGNED_SHORT
+from compas.files.gltf.constants import NUM_COMPONENTS_BY_TYPE_ENUM
+from compas.files.gltf.constants import TYPE_MAT2
+from compas.files.gltf.constants import TYPE_MAT3
+from compas.files.gltf.constants import TYPE_MAT4
+from compas.files.gltf.gltf_reader import GLTFReader
+
+
+__all__ = [
+    'GLTFReaderNumpy',
+]
+
+
+NORMALIZATION_BY_COMPONENT_TYPE = {
+    COMPONENT_TYPE_BYTE: 127.0,
+    COMPONENT_TYPE_UNSIGNED_BYTE: 255.0,
+    COMPONENT_TYPE_SHORT: 32767.0,
+    COMPONENT_TYPE_UNSIGNED_SHORT: 65535.0,
+}
+
+MATRIX_SIZE_BY_TYPE = {
+    TYPE_MAT2: 2,
+    TYPE_MAT3: 3,
+    TYPE_MAT4: 4,
+}
+
+
+class GLTFReaderNumpy(GLTFReader):
+    """Read the contents of a *glTF* or *glb* version 2 file into NumPy arrays.
+
+    Parameters
+    ----------
+    filepath: str
+        Path to the file.
+
+    Attributes
+    ----------
+    filepath : str
+        String containing the path to the glTF.
+    json : dict
+        Dictionary object containing the contents of the glTF.
+    data : list
+        List of arrays containing the data of the accessors.
+        Scalar accessors are one-dimensional arrays,
+        and other accessors are ``(count, components)`` arrays.
+    image_data : list
+        List containing image data.
+
+    Notes
+    -----
+    The *glb* file and external binary files are memory-mapped,
+    and every accessor without sparse substitution or normalization
+    is a read-only view on the mapped bytes, with the component type, byte stride and count of the accessor.
+    Sparse substitution and normalization are applied to copies of the views, in one vectorized step.
+
+    """
+
+    def _read_file(self, filepath):
+        return memoryview(memmap(filepath, dtype=uint8, mode='r'))
+
+    def _release_buffer(self, buffer):
+        # the arrays of the accessors may be views on the buffer
+        pass
+
+    def _access_data(self, accessor):
+        count = accessor['count']
+        component_type = accessor['componentType']
+        type_ = accessor['type']
+
+        # This situation indicates use of an extension.
+        if 'sparse' not in accessor and 'bufferView' not in accessor:
+            return None
+
+        if 'bufferView' in accessor:
+            data = self._array_from_buffer_view(accessor['bufferView'], count, component_type, accessor.get('byteOffset', 0), type_)
+        else:
+            data = self.get_generic_data(NUM_COMPONENTS_BY_TYPE_ENUM[type_], count, component_type)
+
+        if 'sparse' in accessor:
+            sparse = accessor['sparse']
+            indices = self._array_from_buffer_view(
+                sparse['indices']['bufferView'],
+                sparse['count'],
+                sparse['indices']['componentType'],
+                sparse['indices'].get('byteOffset', 0),
+                'SCALAR'
+            )
+            values = self._array_from_buffer_view(
+                sparse['values']['bufferView'],
+                sparse['count'],
+                component_type,
+                sparse['values'].get('byteOffset', 0),
+                type_
+            )
+            data = data.copy()
+            data[indices] = values
+
+        if accessor.get('normalized', False) and component_type in NORMALIZATION_BY_COMPONENT_TYPE:
+            data = maximum(data / NORMALIZATION_BY_COMPONENT_TYPE[component_type], -1.0)
+
+        return data
+
+    def _array_from_buffer_view(self, buffer_view_index, count, component_type, accessor_offset, type_):
+        """Map the elements of an accessor in a buffer view to an array, without copying them."""
+        buffer_view = self.json['bufferViews'][buffer_view_index]
+        buffer = self._get_buffer(buffer_view['buffer'])
+        offset = buffer_view.get('byteOffset', 0) + accessor_offset
+
+        component = dtype('<' + COMPONENT_TYPE_ENUM[component_type])
+        size = component.itemsize
+        num_components = NUM_COMPONENTS_BY_TYPE_ENUM[type_]
+
+        if type_ in MATRIX_SIZE_BY_TYPE:
+            # the columns of matrices are aligned to multiples of 4 bytes
+            n = MATRIX_SIZE_BY_TYPE[type_]
+            column = (n * size + 3) // 4 * 4
+            stride = buffer_view.get('byteStride', n * column)
+            data = ndarray((count, n, n), dtype=component, buffer=buffer, offset=offset, strides=(stride, column, size))
+            return data.reshape((count, num_components))
+
+        stride = buffer_view.get('byteStride', num_components * size)
+        if num_components == 1:
+            return ndarray((count, ), dtype=component, buffer=buffer, offset=offset, strides=(stride, ))
+        return ndarray((count, num_components), dtype=component, buffer=buffer, offset=offset, strides=(stride, size))
+
+    def get_generic_data(self, num_components, count, component_type=None):
+        component = float64 if component_type is None else dtype('<' + COMPONENT_TYPE_ENUM[component_type])
+        if num_components == 1:
+            return zeros(count, dtype=component)
+        return zeros((count, num_components), dtype=component)
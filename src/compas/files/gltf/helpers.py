@@ -39,6 +39,8 @@ def get_weighted_mesh_vertices(mesh, weights):
     be interpolating between two geometries in an animation.  This returns the vertices of the augmented
     mesh.
     """
+    if is_array_data([primitive_data.attributes['POSITION'] for primitive_data in mesh.primitive_data_list]):
+        return get_weighted_mesh_vertices_numpy(mesh, weights)
     vertices = []
     for primitive_data in mesh.primitive_data_list:
         position_target_data = [target['POSITION'] for target in primitive_data.targets]
@@ -47,9 +49,36 @@ def get_weighted_mesh_vertices(mesh, weights):
     return vertices
 
 
+def get_weighted_mesh_vertices_numpy(mesh, weights):
+    """Vectorized version of :func:`get_weighted_mesh_vertices` for meshes with data in arrays."""
+    from numpy import asarray
+    from numpy import concatenate
+    from numpy import float64
+
+    vertices = []
+    for primitive_data in mesh.primitive_data_list:
+        positions = asarray(primitive_data.attributes['POSITION'], dtype=float64).copy()
+        for weight, target in zip(weights, primitive_data.targets):
+            target = asarray(target['POSITION'], dtype=float64)
+            n = min(positions.shape[1], target.shape[1], 3)
+            positions[:, :n] += weight * target[:, :n]
+        vertices.append(positions)
+    return concatenate(vertices)
+
+
 def get_unweighted_primitive_vertices(primitive_data_list):
     """This returns the vertices within a primitive without any weighted morph targets applied."""
-    return list(itertools.chain(*[primitive.attributes['POSITION'] for primitive in primitive_data_list]))
+    positions = [primitive.attributes['POSITION'] for primitive in primitive_data_list]
+    if is_array_data(positions):
+        from numpy import concatenate
+        from numpy import float64
+        return concatenate(positions).astype(float64)
+    return list(itertools.chain(*positions))
+
+
+def is_array_data(data_list):
+    """Returns ``True`` if all items of ``data_list`` are arrays, as read by :class:`compas.files.GLTFReaderNumpy`."""
+    return bool(data_list) and all(hasattr(data, 'ndim') for data in data_list)
 
 
 def get_mode(faces):
@@ -2,18 +2,123 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import math
+import struct
 
-__all__ = []
+import compas
+
+
+__all__ = [
+    'LAS',
+    'LASReader',
+    'LASParser',
+]
+
+
+HEADER = struct.Struct('<4sHH16sBB32s32sHHHIIBHI5I3d3d6d')
+
+HEADER_FIELDS = [
+    'file_signature',
+    'file_source_id',
+    'global_encoding',
+    'guid',
+    'version_major',
+    'version_minor',
+    'system_identifier',
+    'generating_software',
+    'creation_day',
+    'creation_year',
+    'header_size',
+    'offset_to_point_data',
+    'number_of_vlrs',
+    'point_format',
+    'point_record_length',
+    'legacy_number_of_points',
+]
+
+VLR_HEADER = struct.Struct('<H16sHH32s')
+
+# LAS 1.4 adds the 64-bit point count after the offset of the extended variable length records
+EXTENDED_COUNT = struct.Struct('<QIQ')
+EXTENDED_COUNT_OFFSET = 235
+
+WAVE_PACKET_FIELDS = [
+    ('wave_packet_descriptor', 'B'),
+    ('wave_packet_offset', 'Q'),
+    ('wave_packet_size', 'I'),
+    ('return_point_location', 'f'),
+    ('x_t', 'f'),
+    ('y_t', 'f'),
+    ('z_t', 'f'),
+]
+
+LEGACY_FIELDS = [
+    ('X', 'i'),
+    ('Y', 'i'),
+    ('Z', 'i'),
+    ('intensity', 'H'),
+    ('returns', 'B'),
+    ('classification', 'B'),
+    ('scan_angle', 'b'),
+    ('user_data', 'B'),
+    ('point_source_id', 'H'),
+]
+
+EXTENDED_FIELDS = [
+    ('X', 'i'),
+    ('Y', 'i'),
+    ('Z', 'i'),
+    ('intensity', 'H'),
+    ('returns', 'B'),
+    ('flags', 'B'),
+    ('classification', 'B'),
+    ('user_data', 'B'),
+    ('scan_angle', 'h'),
+    ('point_source_id', 'H'),
+    ('gps_time', 'd'),
+]
+
+GPS_TIME_FIELDS = [('gps_time', 'd')]
+RGB_FIELDS = [('red', 'H'), ('green', 'H'), ('blue', 'H')]
+NIR_FIELDS = [('nir', 'H')]
+
+POINT_FIELDS = {
+    0: LEGACY_FIELDS,
+    1: LEGACY_FIELDS + GPS_TIME_FIELDS,
+    2: LEGACY_FIELDS + RGB_FIELDS,
+    3: LEGACY_FIELDS + GPS_TIME_FIELDS + RGB_FIELDS,
+    4: LEGACY_FIELDS + GPS_TIME_FIELDS + WAVE_PACKET_FIELDS,
+    5: LEGACY_FIELDS + GPS_TIME_FIELDS + RGB_FIELDS + WAVE_PACKET_FIELDS,
+    6: EXTENDED_FIELDS,
+    7: EXTENDED_FIELDS + RGB_FIELDS,
+    8: EXTENDED_FIELDS + RGB_FIELDS + NIR_FIELDS,
+    9: EXTENDED_FIELDS + WAVE_PACKET_FIELDS,
+    10: EXTENDED_FIELDS + RGB_FIELDS + NIR_FIELDS + WAVE_PACKET_FIELDS,
+}
+
+CHUNK_SIZE = 1000000
 
 
 class LAS(object):
     """LASer file format.
 
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+    precision : str, optional
+        Not used.
+
+    Notes
+    -----
+    Uncompressed files of versions 1.0 to 1.4, with point data record formats 0 to 10, are supported.
+    Outside of IronPython, files are read with :class:`compas.files.LASReaderNumpy`
+    and :class:`compas.files.LASParserNumpy`.
+
     See Also
     --------
     * http://www.asprs.org/wp-content/uploads/2010/12/LAS_1_4_r13.pdf
 
-
     """
 
     def __init__(self, filepath, precision=None):
@@ -25,8 +130,14 @@ class LAS(object):
         self._parser = None
 
     def read(self):
-        self._reader = LASReader(self.filepath)
-        self._parser = LASParser(self._reader, precision=self.precision)
+        if not compas.IPY:
+            from compas.files.las_numpy import LASReaderNumpy
+            from compas.files.las_numpy import LASParserNumpy
+            self._reader = LASReaderNumpy(self.filepath)
+            self._parser = LASParserNumpy(self._reader, precision=self.precision)
+        else:
+            self._reader = LASReader(self.filepath)
+            self._parser = LASParser(self._reader, precision=self.precision)
         self._is_parsed = True
 
     @property
@@ -43,26 +154,277 @@ class LAS(object):
 
 
 class LASReader(object):
-    """"""
+    """Read the header and the point records of an uncompressed *las* file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+
+    Attributes
+    ----------
+    header : dict
+        The fields of the public header block.
+    vlrs : list
+        The variable length records, as dictionaries with a ``user_id``, ``record_id``, ``description`` and ``data``.
+    version : tuple
+        The major and minor version of the file.
+    point_format : int
+        The point data record format.
+    record_length : int
+        The size of a point data record in bytes, including extra bytes.
+    count : int
+        The number of point records.
+    scale : list
+        The scale factors of the X, Y and Z coordinates.
+    offset : list
+        The offsets of the X, Y and Z coordinates.
+    bounds : tuple
+        The minimum and maximum XYZ coordinates, as stored in the header.
+
+    Notes
+    -----
+    The points are only read when they are requested, with :meth:`read_points` or :meth:`iter_points`.
+    The records are unpacked one by one with :mod:`struct`.
+    See :class:`compas.files.LASReaderNumpy` for reading large files.
+
+    The coordinates of the records are integers, which are converted to the coordinates of the points
+    with ``xyz = XYZ * scale + offset``.
+    Bounding box filters are applied to the integers, which avoids converting rejected records.
+
+    """
 
     def __init__(self, filepath):
         self.filepath = filepath
+        self.header = None
+        self.vlrs = None
+        self.version = None
+        self.point_format = None
+        self.record_length = None
+        self.count = None
+        self.scale = None
+        self.offset = None
+        self.bounds = None
         self.read()
 
+    @property
+    def fields(self):
+        """list : The names and :mod:`struct` codes of the standard fields of the point records."""
+        return POINT_FIELDS[self.point_format]
+
     def read(self):
-        pass
+        with open(self.filepath, 'rb') as fh:
+            data = fh.read(EXTENDED_COUNT_OFFSET + EXTENDED_COUNT.size)
+            if len(data) < HEADER.size or data[:4] != b'LASF':
+                raise ValueError('Not a LAS file: {}'.format(self.filepath))
+            values = HEADER.unpack_from(data)
+            header = dict(zip(HEADER_FIELDS, values))
+            header['number_of_points_by_return'] = list(values[16:21])
+            header['scale'] = list(values[21:24])
+            header['offset'] = list(values[24:27])
+            header['max_x'], header['min_x'], header['max_y'], header['min_y'], header['max_z'], header['min_z'] = values[27:33]
+            count = header['legacy_number_of_points']
+            if (header['version_major'], header['version_minor']) >= (1, 4) and header['header_size'] >= EXTENDED_COUNT_OFFSET + EXTENDED_COUNT.size:
+                header['start_of_first_evlr'], header['number_of_evlrs'], header['number_of_points'] = EXTENDED_COUNT.unpack_from(data, EXTENDED_COUNT_OFFSET)
+                count = header['number_of_points'] or count
+            header['number_of_points'] = count
+            fh.seek(header['header_size'])
+            self.vlrs = []
+            for _ in range(header['number_of_vlrs']):
+                _, user_id, record_id, length, description = VLR_HEADER.unpack(fh.read(VLR_HEADER.size))
+                self.vlrs.append({
+                    'user_id': user_id.rstrip(b'\0').decode('ascii', 'replace'),
+                    'record_id': record_id,
+                    'description': description.rstrip(b'\0').decode('ascii', 'replace'),
+                    'data': fh.read(length)})
+
+        point_format = header['point_format']
+        if point_format & 0xC0:
+            raise ValueError('Compressed LAZ files are not supported: {}'.format(self.filepath))
+        if point_format not in POINT_FIELDS:
+            raise ValueError('Unknown point data record format {}: {}'.format(point_format, self.filepath))
+
+        self.header = header
+        self.version = header['version_major'], header['version_minor']
+        self.point_format = point_format
+        self.record_length = header['point_record_length']
+        self.count = count
+        self.scale = header['scale']
+        self.offset = header['offset']
+        self.bounds = ([header['min_x'], header['min_y'], header['min_z']],
+                       [header['max_x'], header['max_y'], header['max_z']])
+
+        if self.record_length < struct.calcsize('<' + ''.join(code for _, code in self.fields)):
+            raise ValueError('Point data records of {} bytes are too short for format {}: {}'.format(self.record_length, point_format, self.filepath))
+
+    def _raw_bounds(self, box):
+        """Convert a box to the range of the integer coordinates of the records inside the box.
+
+        Returns None if the box does not overlap the bounds in the header.
+        """
+        xmin, ymin, zmin = [min(axis) for axis in zip(*box)]
+        xmax, ymax, zmax = [max(axis) for axis in zip(*box)]
+        lower, upper = self.bounds
+        if xmin > upper[0] or ymin > upper[1] or zmin > upper[2] or xmax < lower[0] or ymax < lower[1] or zmax < lower[2]:
+            return None
+        raw_min = [int(math.ceil((a - o) / s)) for a, o, s in zip((xmin, ymin, zmin), self.offset, self.scale)]
+        raw_max = [int(math.floor((a - o) / s)) for a, o, s in zip((xmax, ymax, zmax), self.offset, self.scale)]
+        return raw_min, raw_max
+
+    def _decode(self, records):
+        """Convert the values of a list of records to the attributes of the points."""
+        names = [name for name, _ in self.fields]
+        sx, sy, sz = self.scale
+        ox, oy, oz = self.offset
+        returns = names.index('returns')
+        intensity = names.index('intensity')
+        classification = names.index('classification')
+        if self.point_format < 6:
+            bits, classes = 3, 0x1F
+        else:
+            bits, classes = 4, 0xFF
+        mask = (1 << bits) - 1
+        points = {
+            'xyz': [[r[0] * sx + ox, r[1] * sy + oy, r[2] * sz + oz] for r in records],
+            'intensity': [r[intensity] for r in records],
+            'classification': [r[classification] & classes for r in records],
+            'return_number': [r[returns] & mask for r in records],
+            'number_of_returns': [(r[returns] >> bits) & mask for r in records],
+        }
+        if 'gps_time' in names:
+            gps_time = names.index('gps_time')
+            points['gps_time'] = [r[gps_time] for r in records]
+        if 'red' in names:
+            red = names.index('red')
+            points['color'] = [list(r[red:red + 3]) for r in records]
+        return points
+
+    def iter_points(self, chunk_size=CHUNK_SIZE, box=None, classes=None, step=1):
+        """Iterate over the points of the file in chunks.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The number of records that is read per chunk, before filtering.
+        box : list, optional
+            The XYZ coordinates of the corners of a box, for example two opposite corners,
+            or the eight corners of :func:`compas.geometry.bounding_box`.
+            Only the points inside the axis-aligned bounding box of the corners are returned.
+        classes : list, optional
+            Only return the points with one of these classifications.
+        step : int, optional
+            Only read every ``step``-th record of the file.
+            Decimation is applied before the other filters.
+
+        Yields
+        ------
+        dict
+            For every chunk with at least one point that passes the filters, the attributes of the points.
+
+            * ``'xyz'``: the XYZ coordinates.
+            * ``'intensity'``: the intensity of the pulse return.
+            * ``'classification'``: the class.
+            * ``'return_number'``: the number of the return of the pulse.
+            * ``'number_of_returns'``: the total number of returns of the pulse.
+            * ``'gps_time'``: the GPS time, if the record format has it.
+            * ``'color'``: the red, green and blue components, if the record format has them.
+
+        """
+        raw = None
+        if box is not None:
+            raw = self._raw_bounds(box)
+            if raw is None:
+                return
+        classes = None if classes is None else set(classes)
+        record = struct.Struct('<' + ''.join(code for _, code in self.fields))
+        names = [name for name, _ in self.fields]
+        classification = names.index('classification')
+        classmask = 0x1F if self.point_format < 6 else 0xFF
+        length = self.record_length
+        chunk_size = max(chunk_size // step, 1) * step
+        with open(self.filepath, 'rb') as fh:
+            fh.seek(self.header['offset_to_point_data'])
+            for start in range(0, self.count, chunk_size):
+                n = min(chunk_size, self.count - start)
+                data = fh.read(n * length)
+                records = []
+                for i in range(0, n, step):
+                    r = record.unpack_from(data, i * length)
+                    if raw is not None:
+                        (xmin, ymin, zmin), (xmax, ymax, zmax) = raw
+                        if not (xmin <= r[0] <= xmax and ymin <= r[1] <= ymax and zmin <= r[2] <= zmax):
+                            continue
+                    if classes is not None and r[classification] & classmask not in classes:
+                        continue
+                    records.append(r)
+                if records:
+                    yield self._decode(records)
+
+    def read_points(self, box=None, classes=None, step=1):
+        """Read all points of the file that pass the filters.
+
+        Parameters
+        ----------
+        box : list, optional
+            The XYZ coordinates of the corners of a box.
+            Only the points inside the axis-aligned bounding box of the corners are returned.
+        classes : list, optional
+            Only return the points with one of these classifications.
+        step : int, optional
+            Only read every ``step``-th record of the file.
+
+        Returns
+        -------
+        dict
+            The attributes of the points, as in :meth:`iter_points`.
+
+        """
+        points = self._decode([])
+        for chunk in self.iter_points(box=box, classes=classes, step=step):
+            for name in points:
+                points[name] += chunk[name]
+        return points
 
 
 class LASParser(object):
-    """"""
+    """Parse the points of a *las* file.
+
+    Parameters
+    ----------
+    reader : :class:`LASReader`
+        A reader.
+    precision : str, optional
+        Not used.
+
+    Attributes
+    ----------
+    points : list
+        The XYZ coordinates of the points.
+    intensity : list
+        The intensity of the points.
+    classification : list
+        The class of the points.
+    colors : list
+        The red, green and blue components of the colors of the points,
+        or None if the file has no colors.
+
+    """
 
-    def __init__(self, reader, precision):
+    def __init__(self, reader, precision=None):
         self.reader = reader
         self.precision = precision
+        self.points = None
+        self.intensity = None
+        self.classification = None
+        self.colors = None
         self.parse()
 
     def parse(self):
-        pass
+        points = self.reader.read_points()
+        self.points = points['xyz']
+        self.intensity = points['intensity']
+        self.classification = points['classification']
+        self.colors = points.get('color')
 
 
 # ==============================================================================
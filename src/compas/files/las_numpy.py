@@ -0,0 +1,232 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+from numpy import concatenate
+from numpy import dtype
+from numpy import float64
+from numpy import isin
+from numpy import memmap
+from numpy import ones
+from numpy import stack
+from numpy import zeros
+
+from compas.files.las import CHUNK_SIZE
+from compas.files.las import HEADER
+from compas.files.las import POINT_FIELDS
+from compas.files.las import LASParser
+from compas.files.las import LASReader
+
+
+__all__ = [
+    'LASReaderNumpy',
+    'LASParserNumpy',
+]
+
+
+class LASReaderNumpy(LASReader):
+    """Read the point records of an uncompressed *las* file through a memory map.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+
+    Attributes
+    ----------
+    records : array
+        A structured array of all point records, with the fields of :attr:`fields` as data type,
+        mapped onto the file.
+
+    Notes
+    -----
+    The header and the variable length records are read by :class:`compas.files.LASReader`.
+    The point records are not loaded when the reader is created.
+    Only the chunks of the memory map that are visited by :meth:`iter_points` are read from disk,
+    and the coordinates, classes and decimation of a chunk are filtered with array operations
+    before the remaining records are converted.
+
+    Examples
+    --------
+    >>> reader = LASReaderNumpy(filepath)  # doctest: +SKIP
+    >>> for points in reader.iter_points(classes=[2], step=10):  # doctest: +SKIP
+    ...     print(points['xyz'].shape)
+
+    """
+
+    def __init__(self, filepath):
+        self.records = None
+        super(LASReaderNumpy, self).__init__(filepath)
+
+    @property
+    def record_type(self):
+        """numpy.dtype : The structured data type of the point records, including extra bytes."""
+        return _record_type(self.point_format, self.record_length)
+
+    def read(self):
+        super(LASReaderNumpy, self).read()
+        if not self.count:
+            self.records = zeros(0, dtype=self.record_type)
+            return
+        self.records = memmap(self.filepath, dtype=self.record_type, mode='r', offset=self.header['offset_to_point_data'], shape=(self.count, ))
+
+    def _decode(self, records):
+        records = asarray(records)
+        if self.point_format < 6:
+            bits, classes = 3, 0x1F
+        else:
+            bits, classes = 4, 0xFF
+        mask = (1 << bits) - 1
+        xyz = stack((records['X'], records['Y'], records['Z']), axis=-1).astype(float64)
+        xyz *= self.scale
+        xyz += self.offset
+        points = {
+            'xyz': xyz,
+            'intensity': records['intensity'].copy(),
+            'classification': records['classification'] & classes,
+            'return_number': records['returns'] & mask,
+            'number_of_returns': (records['returns'] >> bits) & mask,
+        }
+        if 'gps_time' in records.dtype.names:
+            points['gps_time'] = records['gps_time'].copy()
+        if 'red' in records.dtype.names:
+            points['color'] = stack((records['red'], records['green'], records['blue']), axis=-1)
+        return points
+
+    def iter_points(self, chunk_size=CHUNK_SIZE, box=None, classes=None, step=1):
+        raw = None
+        if box is not None:
+            raw = self._raw_bounds(box)
+            if raw is None:
+                return
+        classmask = 0x1F if self.point_format < 6 else 0xFF
+        chunk_size = max(chunk_size // step, 1) * step
+        for start in range(0, self.count, chunk_size):
+            records = self.records[start:start + chunk_size:step]
+            keep = ones(records.shape[0], dtype=bool)
+            if raw is not None:
+                for name, lower, upper in zip('XYZ', raw[0], raw[1]):
+                    values = records[name]
+                    keep &= values >= lower
+                    keep &= values <= upper
+            if classes is not None:
+                keep &= isin(records['classification'] & classmask, list(classes))
+            if not keep.any():
+                continue
+            yield self._decode(records if keep.all() else records[keep])
+
+    def read_points(self, box=None, classes=None, step=1):
+        chunks = list(self.iter_points(box=box, classes=classes, step=step))
+        if not chunks:
+            return self._decode(self.records[:0])
+        if len(chunks) == 1:
+            return chunks[0]
+        return {name: concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+    iter_points.__doc__ = LASReader.iter_points.__doc__
+    read_points.__doc__ = LASReader.read_points.__doc__
+
+
+def _record_type(point_format, record_length):
+    fields = POINT_FIELDS[point_format]
+    names = [name for name, _ in fields]
+    formats = ['<' + code for _, code in fields]
+    offsets = []
+    offset = 0
+    for code in formats:
+        offsets.append(offset)
+        offset += dtype(code).itemsize
+    return dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': record_length})
+
+
+class LASParserNumpy(LASParser):
+    """Parse the points of a *las* file into arrays.
+
+    Parameters
+    ----------
+    reader : :class:`LASReaderNumpy`
+        A reader.
+    precision : str, optional
+        Not used.
+
+    Attributes
+    ----------
+    xyz : array
+        The ``(n, 3)`` array of the XYZ coordinates of the points.
+    intensity : array
+        The intensity of the points.
+    classification : array
+        The class of the points.
+    colors : array
+        The ``(n, 3)`` array of the red, green and blue components of the colors of the points,
+        or None if the file has no colors.
+
+    """
+
+    def __init__(self, reader, precision=None):
+        self.xyz = None
+        self._points = None
+        super(LASParserNumpy, self).__init__(reader, precision=precision)
+
+    def parse(self):
+        points = self.reader.read_points()
+        self.xyz = points['xyz']
+        self.intensity = points['intensity']
+        self.classification = points['classification']
+        self.colors = points.get('color')
+
+    @property
+    def points(self):
+        """list : The XYZ coordinates of the points."""
+        if self._points is None and self.xyz is not None:
+            self._points = self.xyz.tolist()
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import os
+    import tempfile
+    import time
+
+    from numpy.random import default_rng
+
+    n = 2000000
+    rng = default_rng(0)
+    records = zeros(n, dtype=_record_type(3, 34))
+    records['X'] = rng.integers(0, 100000, n)
+    records['Y'] = rng.integers(0, 100000, n)
+    records['Z'] = rng.integers(0, 10000, n)
+    records['returns'] = 1 | (1 << 3)
+    records['classification'] = rng.integers(1, 7, n)
+
+    filepath = os.path.join(tempfile.gettempdir(), 'las_numpy.las')
+    with open(filepath, 'wb') as fh:
+        fh.write(HEADER.pack(b'LASF', 0, 0, b'', 1, 2, b'', b'', 1, 2020, HEADER.size, HEADER.size, 0, 3, 34, n,
+                             n, 0, 0, 0, 0, 0.01, 0.01, 0.01, 0.0, 0.0, 0.0, 1000.0, 0.0, 1000.0, 0.0, 100.0, 0.0))
+        fh.write(records.tobytes())
+
+    print('points: {}'.format(n))
+
+    t0 = time.time()
+    LASParser(LASReader(filepath))
+    t1 = time.time()
+    LASParserNumpy(LASReaderNumpy(filepath))
+    t2 = time.time()
+    print('read:   struct {:.3f}s, memmap {:.3f}s'.format(t1 - t0, t2 - t1))
+
+    reader = LASReaderNumpy(filepath)
+    box = [[0, 0, 0], [500, 500, 100]]
+    t0 = time.time()
+    count = sum(points['xyz'].shape[0] for points in reader.iter_points(box=box, classes=[2], step=2))
+    t1 = time.time()
+    print('filter: {} points in {:.3f}s'.format(count, t1 - t0))
@@ -0,0 +1,560 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import json
+
+from numpy import array
+from numpy import bool_
+from numpy import cumsum
+from numpy import float64
+from numpy import frombuffer
+from numpy import int64
+from numpy import load
+from numpy import savez
+from numpy import savez_compressed
+from numpy import uint8
+from numpy import zeros
+
+import compas
+from compas.utilities import DataDecoder
+from compas.utilities import DataEncoder
+
+
+__all__ = [
+    'NPZ',
+    'NPZReader',
+    'NPZWriter',
+]
+
+
+# the nested tables of the data of every type of data structure
+# that are stored as arrays, with their depth and the kind of their leaves
+LAYOUTS = {
+    'halfedge': {
+        'vertex': ('rows', 1),
+        'face': ('lists', 1),
+        'facedata': ('rows', 1),
+        'edgedata': ('rows', 1),
+    },
+    'graph': {
+        'node': ('rows', 1),
+        'edge': ('rows', 2),
+        'adjacency': ('values', 2),
+    },
+    'halfface': {
+        'vertex': ('rows', 1),
+        'halfface': ('lists', 1),
+        'cell': ('values', 3),
+        'plane': ('values', 3),
+        'edge_data': ('rows', 1),
+        'face_data': ('rows', 1),
+        'cell_data': ('rows', 1),
+    },
+}
+
+MISSING = object()
+
+
+class NPZ(object):
+    """Read and write data structures in a binary container based on the NumPy *npz* format.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+    compressed : bool, optional
+        Compress the arrays when writing.
+        Default is ``False``.
+
+    Notes
+    -----
+    The container stores the same data as the JSON representation of the data structure.
+    The topology and the attributes are stored as typed arrays, one per column of attribute values,
+    and all other data as JSON in the header of the file.
+    The arrays are only read when they are needed, see :class:`NPZReader`.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> from compas.datastructures import Mesh
+    >>> mesh = Mesh.from_polyhedron(6)
+    >>> filepath = os.path.join(tempfile.gettempdir(), 'mesh.npz')
+    >>> NPZ(filepath).write(mesh)
+    >>> NPZ(filepath).data == mesh.data
+    True
+
+    """
+
+    def __init__(self, filepath, compressed=False):
+        self.filepath = filepath
+        self.compressed = compressed
+        self._is_parsed = False
+        self._reader = None
+        self._writer = None
+
+    def read(self):
+        self._reader = NPZReader(self.filepath)
+        self._is_parsed = True
+
+    def write(self, datastructure):
+        self._writer = NPZWriter(self.filepath, datastructure, compressed=self.compressed)
+        self._writer.write()
+
+    @property
+    def reader(self):
+        if not self._is_parsed:
+            self.read()
+        return self._reader
+
+    @property
+    def data(self):
+        """dict : The data of the data structure stored in the file."""
+        return self.reader.data
+
+
+class NPZReader(object):
+    """Read the data of a data structure from a binary *npz* container.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+
+    Attributes
+    ----------
+    header : dict
+        The information about the stored data.
+
+    Notes
+    -----
+    The arrays of the container are loaded only when a table is accessed,
+    and every table is converted to nested dicts only once.
+    The columns of a table can also be accessed as arrays, without converting anything.
+
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.header = None
+        self._arrays = None
+        self._tables = {}
+        self.read()
+
+    def read(self):
+        self._arrays = load(self.filepath)
+        self.header = json.loads(self._arrays['header'].tobytes().decode('utf-8'), cls=DataDecoder)
+
+    def close(self):
+        """Close the file."""
+        self._arrays.close()
+
+    @property
+    def datatype(self):
+        """str : The data type of the stored data structure."""
+        return self.header['datatype']
+
+    @property
+    def data(self):
+        """dict : The data of the data structure."""
+        data = {}
+        for name in self.header['order']:
+            data[name] = self.table(name)
+        if self.header['wrapper'] is None:
+            return data
+        wrapped = dict(self.header['wrapper'])
+        wrapped['data'] = data
+        return wrapped
+
+    def table(self, name):
+        """Get one of the items of the data of the data structure.
+
+        Parameters
+        ----------
+        name : str
+            The name of the item, for example ``'vertex'``.
+
+        Returns
+        -------
+        object
+            The item in the same form as in the data of the data structure.
+
+        """
+        if name in self.header['json']:
+            return self.header['json'][name]
+        if name not in self._tables:
+            self._tables[name] = _decode_table(self._arrays, name, self.header['tables'][name])
+        return self._tables[name]
+
+    def keys(self, name):
+        """Get the keys of the rows of a table.
+
+        Parameters
+        ----------
+        name : str
+            The name of the table.
+
+        Returns
+        -------
+        list
+            The keys of the first level of the table.
+
+        """
+        spec = self.header['tables'][name]
+        return _decode(self._arrays, '{}.keys.0'.format(name), spec['keys'][0])
+
+    def columns(self, name):
+        """Get the attribute columns of a table of rows as arrays.
+
+        Parameters
+        ----------
+        name : str
+            The name of the table, for example ``'vertex'``.
+
+        Returns
+        -------
+        dict
+            For every attribute name, the array of its values, in the order of :meth:`keys`.
+            Missing values and ``None`` are zero in numeric columns.
+            Columns that cannot be represented as typed arrays are lists.
+
+        Examples
+        --------
+        >>> columns = reader.columns('vertex')  # doctest: +SKIP
+        >>> xyz = numpy.vstack([columns['x'], columns['y'], columns['z']]).T  # doctest: +SKIP
+
+        """
+        spec = self.header['tables'][name]
+        if spec['kind'] != 'rows':
+            raise ValueError('The table is not a table of rows: {}'.format(name))
+        columns = {}
+        for index, (attr, dtype) in enumerate(spec['columns']):
+            prefix = '{}.column.{}'.format(name, index)
+            if dtype == 'json':
+                columns[attr] = [None if value is MISSING else value for value in _decode(self._arrays, prefix, dtype)]
+            else:
+                columns[attr] = self._arrays[prefix]
+        return columns
+
+    def load(self, datastructure):
+        """Load the stored data into a data structure.
+
+        Parameters
+        ----------
+        datastructure : :class:`compas.datastructures.Datastructure`
+            A data structure of the stored type.
+
+        Notes
+        -----
+        The halfedges of a mesh are rebuilt directly from the faces,
+        without adding the vertices and faces one by one.
+
+        """
+        data = self.data
+        if self.header['layout'] != 'halfedge' or self.header['wrapper'] is None:
+            datastructure.data = data
+            return
+        data = data['data']
+        datastructure.attributes.update(data['attributes'])
+        datastructure.default_vertex_attributes.update(data.get('dva') or {})
+        datastructure.default_face_attributes.update(data.get('dfa') or {})
+        datastructure.default_edge_attributes.update(data.get('dea') or {})
+        vertex = data.get('vertex') or {}
+        face = data.get('face') or {}
+        facedata = data.get('facedata') or {}
+        halfedge = {key: {} for key in vertex}
+        for fkey, vertices in face.items():
+            for u, v in zip(vertices, vertices[1:] + vertices[:1]):
+                halfedge[u][v] = fkey
+                if u not in halfedge[v]:
+                    halfedge[v][u] = None
+        datastructure.vertex = vertex
+        datastructure.face = face
+        datastructure.halfedge = halfedge
+        datastructure.facedata = {fkey: facedata.get(fkey) or {} for fkey in face}
+        datastructure.edgedata = {uv: attr or {} for uv, attr in (data.get('edgedata') or {}).items()}
+        datastructure._max_vertex = data.get('max_vertex', -1)
+        datastructure._max_face = data.get('max_face', -1)
+
+
+class NPZWriter(object):
+    """Write the data of a data structure to a binary *npz* container.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+        The extension is not changed.
+    datastructure : :class:`compas.datastructures.Datastructure`
+        A mesh, network or volmesh.
+    compressed : bool, optional
+        Compress the arrays.
+        Default is ``False``.
+
+    Notes
+    -----
+    Every nested table of the data is flattened level by level.
+    Every level is stored as an array of keys and an array with the index of the parent of every key.
+    Tables of attribute dicts are stored as one array per attribute,
+    with masks for missing values and for ``None``.
+    Values of mixed types, and tables or values that do not fit this layout are stored as JSON.
+
+    """
+
+    def __init__(self, filepath, datastructure, compressed=False):
+        self.filepath = filepath
+        self.datastructure = datastructure
+        self.compressed = compressed
+
+    def write(self):
+        data = self.datastructure.data
+        if 'compas' in data and 'data' in data:
+            wrapper = {key: value for key, value in data.items() if key != 'data'}
+            data = data['data']
+        else:
+            wrapper = None
+        layout = _layout(self.datastructure)
+        header = {
+            'compas': compas.__version__,
+            'datatype': self.datastructure.dtype,
+            'layout': layout,
+            'wrapper': wrapper,
+            'order': list(data),
+            'tables': {},
+            'json': {},
+        }
+        arrays = {}
+        for name, value in data.items():
+            spec = LAYOUTS.get(layout, {}).get(name)
+            if spec and isinstance(value, dict):
+                table = {}
+                try:
+                    header['tables'][name] = _encode_table(table, name, value, *spec)
+                except TypeError:
+                    pass
+                else:
+                    arrays.update(table)
+                    continue
+            header['json'][name] = value
+        arrays['header'] = frombuffer(json.dumps(header, cls=DataEncoder).encode('utf-8'), dtype=uint8)
+        # a file object prevents numpy from appending ".npz" to the path
+        with open(self.filepath, 'wb') as fh:
+            if self.compressed:
+                savez_compressed(fh, **arrays)
+            else:
+                savez(fh, **arrays)
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _layout(datastructure):
+    from compas.datastructures import HalfEdge
+    from compas.datastructures import Graph
+    from compas.datastructures import HalfFace
+
+    if isinstance(datastructure, HalfEdge):
+        return 'halfedge'
+    if isinstance(datastructure, Graph):
+        return 'graph'
+    if isinstance(datastructure, HalfFace):
+        return 'halfface'
+    return None
+
+
+def _encode_table(arrays, name, table, kind, depth):
+    """Flatten a nested table into arrays and return its specification."""
+    spec = {'kind': kind, 'depth': depth, 'keys': [], 'columns': []}
+    items = [table]
+    for level in range(depth):
+        keys = []
+        parents = []
+        children = []
+        for parent, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise TypeError('Nested tables must be dicts.')
+            for key, child in item.items():
+                keys.append(key)
+                parents.append(parent)
+                children.append(child)
+        spec['keys'].append(_encode(arrays, '{}.keys.{}'.format(name, level), keys))
+        if level:
+            arrays['{}.parents.{}'.format(name, level)] = array(parents, dtype=int64)
+        items = children
+
+    if kind == 'rows':
+        attrs = {}
+        for row in items:
+            if not isinstance(row, dict):
+                raise TypeError('Rows must be dicts.')
+            for attr in row:
+                attrs[attr] = None
+        for index, attr in enumerate(attrs):
+            values = [row.get(attr, MISSING) for row in items]
+            spec['columns'].append([attr, _encode(arrays, '{}.column.{}'.format(name, index), values)])
+
+    elif kind == 'lists':
+        if not all(isinstance(item, list) for item in items):
+            raise TypeError('Items must be lists.')
+        offsets = zeros(len(items) + 1, dtype=int64)
+        offsets[1:] = cumsum([len(item) for item in items])
+        arrays['{}.offsets'.format(name)] = offsets
+        spec['columns'].append([None, _encode(arrays, '{}.values'.format(name), [value for item in items for value in item])])
+
+    else:
+        spec['columns'].append([None, _encode(arrays, '{}.values'.format(name), items)])
+
+    return spec
+
+
+def _encode(arrays, prefix, values):
+    """Store a list of values as a typed array and return its type."""
+    missing = [value is MISSING for value in values]
+    null = [value is None for value in values]
+    actual = [value for value in values if value is not None and value is not MISSING]
+    types = set(type(value) for value in actual)
+
+    if not types:
+        dtype = 'empty'
+        data = zeros(len(values), dtype=bool_)
+    elif types == {bool}:
+        dtype = 'bool'
+        data = array([value is True for value in values], dtype=bool_)
+    elif types == {int}:
+        dtype = 'int'
+        try:
+            data = array([value if type(value) is int else 0 for value in values], dtype=int64)
+        except OverflowError:
+            dtype = None
+    elif types <= {int, float}:
+        dtype = 'number'
+        data = array([value if type(value) in (int, float) else 0.0 for value in values], dtype=float64)
+        # integers are marked unless they cannot be converted exactly
+        ints = [type(value) is int for value in values]
+        if any(ints):
+            if any(value != int(x) for value, x, i in zip(values, data, ints) if i):
+                dtype = None
+            else:
+                arrays[prefix + '.ints'] = array(ints, dtype=bool_)
+    elif types == {str} and not any(value.endswith('\x00') for value in actual):
+        # numpy strips trailing null characters
+        dtype = 'str'
+        data = array([value if type(value) is str else '' for value in values], dtype=str)
+    else:
+        dtype = None
+
+    if dtype is None:
+        arrays.pop(prefix + '.ints', None)
+        dtype = 'json'
+        text = json.dumps([None if value is MISSING else value for value in values], cls=DataEncoder)
+        data = frombuffer(text.encode('utf-8'), dtype=uint8)
+
+    arrays[prefix] = data
+    if any(missing):
+        arrays[prefix + '.missing'] = array(missing, dtype=bool_)
+    if any(null) and dtype != 'json':
+        arrays[prefix + '.null'] = array(null, dtype=bool_)
+    return dtype
+
+
+def _decode(arrays, prefix, dtype):
+    """Convert a typed array back to a list of values."""
+    data = arrays[prefix]
+    if dtype == 'json':
+        values = json.loads(data.tobytes().decode('utf-8'), cls=DataDecoder)
+    elif dtype == 'empty':
+        values = [None] * data.size
+    else:
+        values = data.tolist()
+        if dtype == 'number' and prefix + '.ints' in arrays:
+            for index in arrays[prefix + '.ints'].nonzero()[0].tolist():
+                values[index] = int(values[index])
+    if prefix + '.null' in arrays:
+        for index in arrays[prefix + '.null'].nonzero()[0].tolist():
+            values[index] = None
+    if prefix + '.missing' in arrays:
+        for index in arrays[prefix + '.missing'].nonzero()[0].tolist():
+            values[index] = MISSING
+    return values
+
+
+def _decode_table(arrays, name, spec):
+    """Rebuild a nested table from its arrays."""
+    depth = spec['depth']
+    kind = spec['kind']
+    keys = [_decode(arrays, '{}.keys.{}'.format(name, level), dtype) for level, dtype in enumerate(spec['keys'])]
+
+    if kind == 'rows':
+        leaves = [{} for _ in keys[-1]]
+        for index, (attr, dtype) in enumerate(spec['columns']):
+            values = _decode(arrays, '{}.column.{}'.format(name, index), dtype)
+            for row, value in zip(leaves, values):
+                if value is not MISSING:
+                    row[attr] = value
+    elif kind == 'lists':
+        offsets = arrays['{}.offsets'.format(name)].tolist()
+        values = _decode(arrays, '{}.values'.format(name), spec['columns'][0][1])
+        leaves = [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+    else:
+        leaves = _decode(arrays, '{}.values'.format(name), spec['columns'][0][1])
+
+    table = {}
+    items = [table]
+    for level in range(depth):
+        children = leaves if level == depth - 1 else [{} for _ in keys[level]]
+        if level:
+            parents = arrays['{}.parents.{}'.format(name, level)].tolist()
+        else:
+            parents = [0] * len(keys[level])
+        for key, parent, child in zip(keys[level], parents, children):
+            items[parent][key] = child
+        items = children
+    return table
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import os
+    import tempfile
+    import time
+
+    from compas.datastructures import Mesh
+    from compas.datastructures import mesh_subdivide_quad
+
+    mesh = Mesh.from_obj(compas.get('faces_big.obj'))
+    mesh = mesh_subdivide_quad(mesh, k=2)
+    mesh.update_default_vertex_attributes(is_fixed=False)
+    mesh.update_default_edge_attributes(q=1.0)
+    for key in mesh.vertices():
+        mesh.vertex_attribute(key, 'is_fixed', mesh.is_vertex_on_boundary(key))
+    for edge in mesh.edges():
+        mesh.edge_attribute(edge, 'q', 2.0)
+
+    print('vertices: {}'.format(mesh.number_of_vertices()))
+
+    path_json = os.path.join(tempfile.gettempdir(), 'npz_numpy.json')
+    path_npz = os.path.join(tempfile.gettempdir(), 'npz_numpy.npz')
+
+    t0 = time.time()
+    mesh.to_json(path_json)
+    t1 = time.time()
+    mesh.to_npz(path_npz)
+    t2 = time.time()
+
+    print('write: json {:.3f}s, npz {:.3f}s'.format(t1 - t0, t2 - t1))
+    print('size:  json {}, npz {}'.format(os.path.getsize(path_json), os.path.getsize(path_npz)))
+
+    t0 = time.time()
+    a = Mesh.from_json(path_json)
+    t1 = time.time()
+    b = Mesh.from_npz(path_npz)
+    t2 = time.time()
+
+    print('read:  json {:.3f}s, npz {:.3f}s'.format(t1 - t0, t2 - t1))
+    assert a.data == b.data == mesh.data
@@ -2,15 +2,13 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from collections import OrderedDict
-
 try:
     from urllib.request import urlopen
 except ImportError:
     from urllib2 import urlopen
 
 import compas
-from compas.utilities import geometric_key
+from compas.utilities import weld_points
 
 
 __all__ = [
@@ -24,21 +22,48 @@ __all__ = [
 class OBJ(object):
     """Read and write files in OBJ format.
 
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+    precision : str, optional
+        The precision of the geometric keys used to identify vertices.
+        In fast mode, vertices are only welded if a precision is provided.
+    fast : bool, optional
+        Stream the vertices, faces and lines of the file into typed arrays.
+        Default is ``False``.
+
+    Notes
+    -----
+    In fast mode, the vertices are returned as an array
+    and all records other than vertices, faces and lines are ignored.
+    See :class:`compas.files.OBJReaderNumpy` for more information.
+
     References
     ----------
     .. [1] http://paulbourke.net/dataformats/obj/
 
     """
 
-    def __init__(self, filepath, precision=None):
+    def __init__(self, filepath, precision=None, fast=False):
         self.filepath = filepath
         self.precision = precision
+        self.fast = fast
         self._is_parsed = False
         self._reader = None
         self._parser = None
         self._writer = None
 
     def read(self):
+        if self.fast:
+            from compas.files.obj_numpy import OBJReaderNumpy
+            from compas.files.obj_numpy import OBJParserNumpy
+            self._reader = OBJReaderNumpy(self.filepath)
+            self._parser = OBJParserNumpy(self._reader, precision=self.precision)
+            self._reader.read()
+            self._parser.parse()
+            self._is_parsed = True
+            return
         self._reader = OBJReader(self.filepath)
         self._parser = OBJParser(self._reader, precision=self.precision)
         self._reader.open()
@@ -361,18 +386,9 @@ class OBJParser(object):
         # self.parse()
 
     def parse(self):
-        index_key = OrderedDict()
-        vertex = OrderedDict()
-
-        for i, xyz in enumerate(iter(self.reader.vertices)):
-            key = geometric_key(xyz, self.precision)
-            index_key[i] = key
-            vertex[key] = xyz
-
-        key_index = {key: index for index, key in enumerate(vertex)}
-        index_index = {index: key_index[key] for index, key in iter(index_key.items())}
+        index_index, last = weld_points(self.reader.vertices, self.precision)
 
-        self.vertices = [xyz for xyz in iter(vertex.values())]
+        self.vertices = [self.reader.vertices[index] for index in last]
         self.points = [index_index[index] for index in self.reader.points]
         self.lines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) == 2]
         self.polylines = [[index_index[index] for index in line] for line in self.reader.lines if len(line) > 2]
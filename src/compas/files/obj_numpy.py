@@ -0,0 +1,359 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import re
+
+try:
+    from urllib.request import urlopen
+except ImportError:
+    from urllib2 import urlopen
+
+from numpy import bincount
+from numpy import concatenate
+from numpy import cumsum
+from numpy import empty
+from numpy import float64
+from numpy import frombuffer
+from numpy import fromstring
+from numpy import int64
+from numpy import ones
+from numpy import repeat
+from numpy import uint8
+from numpy import zeros
+
+from compas.geometry import weld_points_numpy
+
+
+__all__ = [
+    'OBJReaderNumpy',
+    'OBJParserNumpy',
+]
+
+
+CHUNKSIZE = 2 ** 24
+
+VERTEX = (b'v ', b'v\t')
+FACE = (b'f ', b'f\t')
+LINE = (b'l ', b'l\t')
+
+SLASHES = re.compile(br'/\S*')
+
+
+class OBJReaderNumpy(object):
+    """Stream the vertices, faces and lines of an *obj* file into typed arrays.
+
+    Parameters
+    ----------
+    filepath : str
+        Path or URL of the file.
+    chunksize : int, optional
+        The number of bytes that is read and parsed at once.
+        Default is ``2 ** 24``.
+
+    Attributes
+    ----------
+    vertices : array
+        The ``(n, 3)`` array of vertex coordinates.
+    weights : array
+        The vertex weights.
+    face_offsets : array
+        The CSR row pointer of the faces.
+    face_indices : array
+        The zero-based vertex indices of all faces, concatenated.
+    line_offsets : array
+        The CSR row pointer of the lines.
+    line_indices : array
+        The zero-based vertex indices of all lines, concatenated.
+
+    Notes
+    -----
+    The file is read in binary chunks of complete lines.
+    Per chunk, the ``v``, ``f`` and ``l`` records are collected and converted
+    to numbers with a single call to :func:`numpy.fromstring`,
+    without creating Python objects per vertex or per index.
+    Texture and normal references of face vertices (``f 1/1/1 ...``) are ignored,
+    and so are all other records, such as groups and free-form geometry.
+    For the full reader, see :class:`compas.files.OBJReader`.
+
+    """
+
+    def __init__(self, filepath, chunksize=CHUNKSIZE):
+        self.filepath = filepath
+        self.chunksize = chunksize
+        self.vertices = empty((0, 3), dtype=float64)
+        self.weights = empty(0, dtype=float64)
+        self.face_offsets = zeros(1, dtype=int64)
+        self.face_indices = empty(0, dtype=int64)
+        self.line_offsets = zeros(1, dtype=int64)
+        self.line_indices = empty(0, dtype=int64)
+        self._vertices = []
+        self._weights = []
+        self._faces = []
+        self._lines = []
+        self._v = 0
+
+    def open(self):
+        if self.filepath.startswith('http'):
+            return urlopen(self.filepath)
+        return open(self.filepath, 'rb')
+
+    def read(self):
+        """Read the file, chunk by chunk."""
+        fh = self.open()
+        try:
+            remainder = b''
+            while True:
+                data = fh.read(self.chunksize)
+                if not data:
+                    break
+                data = remainder + data
+                cut = data.rfind(b'\n')
+                # a line that ends with a backslash continues on the next line
+                while cut > 0 and data[cut - 1:cut] == b'\\':
+                    cut = data.rfind(b'\n', 0, cut - 1)
+                if cut < 0:
+                    remainder = data
+                    continue
+                remainder = data[cut + 1:]
+                self._read_chunk(data[:cut + 1])
+            if remainder:
+                self._read_chunk(remainder)
+        finally:
+            fh.close()
+        self.post()
+
+    def post(self):
+        if self._vertices:
+            self.vertices = concatenate(self._vertices)
+            self.weights = concatenate(self._weights)
+        self.face_offsets, self.face_indices = _join(self._faces)
+        self.line_offsets, self.line_indices = _join(self._lines)
+        self._vertices = []
+        self._weights = []
+        self._faces = []
+        self._lines = []
+
+    def _read_chunk(self, chunk):
+        if b'\r' in chunk:
+            chunk = chunk.replace(b'\r', b'')
+        if b'\\\n' in chunk:
+            chunk = chunk.replace(b'\\\n', b' ')
+        lines = chunk.split(b'\n')
+
+        vertices = [line[2:] for line in lines if line[:2] in VERTEX]
+        faces = [line[2:] for line in lines if line[:2] in FACE]
+        edges = [line[2:] for line in lines if line[:2] in LINE]
+
+        # the number of vertices before the chunk
+        # is needed to resolve relative (negative) indices
+        v = self._v
+
+        if vertices:
+            self._read_vertices(vertices)
+        if faces:
+            self._faces.append(self._read_elements(faces, 3, FACE, lines, v))
+        if edges:
+            self._lines.append(self._read_elements(edges, 2, LINE, lines, v))
+
+    def _read_vertices(self, lines):
+        n = len(lines)
+        values = fromstring(b'\n'.join(lines), dtype=float64, sep=' ')
+        if values.size == 3 * n:
+            xyz = values.reshape((n, 3))
+            weights = ones(n, dtype=float64)
+        elif values.size == 4 * n:
+            values = values.reshape((n, 4))
+            xyz = values[:, :3]
+            weights = values[:, 3]
+        else:
+            # mixed records are parsed one by one
+            # records that are not of the form "x y z" or "x y z w" are skipped
+            xyz = []
+            weights = []
+            for line in lines:
+                parts = line.split()
+                if len(parts) == 3:
+                    xyz.append([float(x) for x in parts])
+                    weights.append(1.0)
+                elif len(parts) == 4:
+                    xyz.append([float(x) for x in parts[:3]])
+                    weights.append(float(parts[3]))
+            xyz = concatenate((empty((0, 3)), xyz)).reshape((-1, 3))
+            weights = concatenate((empty(0), weights))
+        self._vertices.append(xyz)
+        self._weights.append(weights)
+        self._v += xyz.shape[0]
+
+    def _read_elements(self, lines, minimum, heads, records, v):
+        text = b'\n'.join(lines)
+        if b'/' in text:
+            text = SLASHES.sub(b'', text)
+        values = fromstring(text, dtype=int64, sep=' ')
+
+        # count the tokens per line from the starts of the tokens
+        data = frombuffer(text, dtype=uint8)
+        space = (data == 32) | (data == 9) | (data == 10)
+        start = ~space
+        start[1:] &= space[:-1]
+        line = cumsum(data == 10)
+        counts = bincount(line[start], minlength=len(lines))
+
+        if counts.sum() != values.size:
+            raise ValueError('Invalid face or line indices.')
+
+        negative = values < 0
+        if negative.any():
+            # relative indices refer to the vertices defined before the element
+            nv = []
+            count = v
+            for record in records:
+                head = record[:2]
+                if head in VERTEX:
+                    count += 1
+                elif head in heads:
+                    nv.append(count)
+            nv = repeat(nv, counts)
+            values[negative] += nv[negative] + 1
+
+        keep = counts >= minimum
+        if not keep.all():
+            values = values[repeat(keep, counts)]
+            counts = counts[keep]
+        return counts, values - 1
+
+
+class OBJParserNumpy(object):
+    """Convert the data of an array-based *obj* reader to vertices and faces.
+
+    Parameters
+    ----------
+    reader : :class:`OBJReaderNumpy`
+        A reader.
+    precision : str, optional
+        The precision used for welding vertices with (almost) identical coordinates.
+        Supported values are any float precision (for example ``'3f'``),
+        or decimal integer (``'d'``).
+        Default is ``None``, in which case the vertices are not welded.
+
+    Attributes
+    ----------
+    vertices : array
+        The ``(n, 3)`` array of vertex coordinates.
+    face_offsets : array
+        The CSR row pointer of the faces.
+    face_indices : array
+        The vertex indices of all faces, concatenated.
+    line_offsets : array
+        The CSR row pointer of lines and polylines.
+    line_indices : array
+        The vertex indices of all lines and polylines, concatenated.
+
+    Notes
+    -----
+    Vertices are welded with :func:`compas.geometry.weld_points_numpy`,
+    which identifies the same vertices as the geometric keys used by :class:`compas.files.OBJParser`.
+
+    """
+
+    def __init__(self, reader, precision=None):
+        self.reader = reader
+        self.precision = precision
+        self.vertices = None
+        self.weights = None
+        self.face_offsets = None
+        self.face_indices = None
+        self.line_offsets = None
+        self.line_indices = None
+        self.groups = {}
+
+    def parse(self):
+        reader = self.reader
+        self.vertices = reader.vertices
+        self.weights = reader.weights
+        self.face_offsets = reader.face_offsets
+        self.face_indices = reader.face_indices
+        self.line_offsets = reader.line_offsets
+        self.line_indices = reader.line_indices
+        if self.precision:
+            index, last = weld_points_numpy(self.vertices, self.precision)
+            self.vertices = self.vertices[last]
+            self.face_indices = index[self.face_indices]
+            self.line_indices = index[self.line_indices]
+
+    @property
+    def faces(self):
+        """list : The faces as lists of vertex indices."""
+        return _split(self.face_offsets, self.face_indices)
+
+    @property
+    def lines(self):
+        """list : The lines as pairs of vertex indices."""
+        return [line for line in _split(self.line_offsets, self.line_indices) if len(line) == 2]
+
+    @property
+    def polylines(self):
+        """list : The polylines as lists of vertex indices."""
+        return [line for line in _split(self.line_offsets, self.line_indices) if len(line) > 2]
+
+    @property
+    def points(self):
+        return []
+
+
+# ==============================================================================
+# Helpers
+# ==============================================================================
+
+
+def _join(parts):
+    if not parts:
+        return zeros(1, dtype=int64), empty(0, dtype=int64)
+    counts = concatenate([counts for counts, _ in parts])
+    indices = concatenate([indices for _, indices in parts])
+    offsets = zeros(counts.size + 1, dtype=int64)
+    cumsum(counts, out=offsets[1:])
+    return offsets, indices
+
+
+def _split(offsets, indices):
+    offsets = offsets.tolist()
+    indices = indices.tolist()
+    return [indices[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import os
+    import tempfile
+    import time
+
+    import compas
+    from compas.datastructures import Mesh
+    from compas.datastructures import mesh_subdivide_quad
+    from compas.files import OBJ
+
+    mesh = Mesh.from_obj(compas.get('faces_big.obj'))
+    mesh = mesh_subdivide_quad(mesh, k=3)
+    filepath = os.path.join(tempfile.gettempdir(), 'obj_numpy.obj')
+    mesh.to_obj(filepath)
+
+    print('size: {:.1f}MB'.format(os.path.getsize(filepath) / 2 ** 20))
+
+    t0 = time.time()
+    obj = OBJ(filepath)
+    obj.read()
+    t1 = time.time()
+    fast = OBJ(filepath, fast=True)
+    fast.read()
+    t2 = time.time()
+    welded = OBJ(filepath, precision='3f', fast=True)
+    welded.read()
+    t3 = time.time()
+
+    print('read: default {:.3f}s, fast {:.3f}s, fast and welded {:.3f}s'.format(t1 - t0, t2 - t1, t3 - t2))
+    assert obj.faces == welded.faces
@@ -17,6 +17,11 @@ __all__ = [
 class PLY(object):
     """Polygon file format, or Stanford triangle format.
 
+    Notes
+    -----
+    Outside of IronPython, files are read with :class:`compas.files.PLYReaderNumpy`
+    and :class:`compas.files.PLYParserNumpy`.
+
     References
     ----------
     .. [1] http://paulbourke.net/dataformats/ply/
@@ -32,8 +37,14 @@ class PLY(object):
         self._writer = None
 
     def read(self):
-        self._reader = PLYReader(self.filepath)
-        self._parser = PLYParser(self._reader, precision=self.precision)
+        if not compas.IPY:
+            from compas.files.ply_numpy import PLYReaderNumpy
+            from compas.files.ply_numpy import PLYParserNumpy
+            self._reader = PLYReaderNumpy(self.filepath)
+            self._parser = PLYParserNumpy(self._reader, precision=self.precision)
+        else:
+            self._reader = PLYReader(self.filepath)
+            self._parser = PLYParser(self._reader, precision=self.precision)
         self._is_parsed = True
 
     def write(self, mesh, **kwargs):
@@ -95,24 +106,40 @@ class PLYReader(object):
     }
 
     number_of_bytes_per_type = {
+        'int8': 1,
         'char': 1,
+        'uint8': 1,
         'uchar': 1,
+        'int16': 2,
         'short': 2,
+        'uint16': 2,
         'ushort': 2,
+        'int32': 4,
         'int': 4,
+        'uint32': 4,
         'uint': 4,
+        'float32': 4,
         'float': 4,
+        'float64': 8,
         'double': 8
     }
 
     struct_format_per_type = {
+        'int8': 'b',
         'char': 'c',
+        'uint8': 'B',
         'uchar': 'B',
+        'int16': 'h',
         'short': 'h',
+        'uint16': 'H',
         'ushort': 'H',
+        'int32': 'i',
         'int': 'i',
+        'uint32': 'I',
         'uint': 'I',
+        'float32': 'f',
         'float': 'f',
+        'float64': 'd',
         'double': 'd'
     }
 
@@ -167,15 +194,30 @@ class PLYReader(object):
     # read the header
     # ==========================================================================
 
+    @staticmethod
+    def _read_header_line(file):
+        # lines end with \n, \r\n, or \r (for example in files exported by Rhino)
+        line = b''
+        while True:
+            char = file.read(1)
+            if not char or char == b'\n':
+                return line + char
+            if char == b'\r':
+                char = file.read(1)
+                if char and char != b'\n':
+                    file.seek(-1, 1)
+                return line + b'\r'
+            line += char
+
     def read_header(self):
         # the header is always in ascii format
-        # read it as text
-        # otherwise file.tell() can't be used reliably
-        # to figure out where the header ends
-        with open(self.filepath) as file:
+        # but it is read in binary mode
+        # such that file.tell() is the byte offset of the end of the header
+        # and the binary data after the header is not decoded
+        with open(self.filepath, 'rb') as file:
             file.seek(0)
 
-            line = file.readline().rstrip()
+            line = self._read_header_line(file).decode('ascii', 'replace').rstrip()
 
             if line.lower() != 'ply':
                 raise Exception('not a valid ply file')
@@ -185,8 +227,10 @@ class PLYReader(object):
             element_type = None
 
             while True:
-                line = file.readline()
-                line = line.rstrip()
+                line = self._read_header_line(file)
+                if not line:
+                    raise Exception('not a valid ply file')
+                line = line.decode('ascii', 'replace').rstrip()
 
                 self.header.append(line)
 
@@ -400,32 +444,20 @@ class PLYReader(object):
 
     def read_faces_binary_wo_numpy(self):
         ext = self.binary_byte_order[self.format]
-        fmt = ext
-        chunk = 0
-        for prop in self.face_properties:
-            if len(prop) == 2:
-                pname, ptype = prop
-                chunk += self.number_of_bytes_per_type[ptype]
-                fmt += self.struct_format_per_type[ptype]
-            elif len(prop) == 3:
-                pname, ptype, plen = prop
-                chunk += self.number_of_bytes_per_type[plen]
-                chunk += self.number_of_bytes_per_type[ptype] * 3
-                fmt += self.struct_format_per_type[plen]
-                fmt += self.struct_format_per_type[ptype] * 3
-            else:
-                pass
         for i in range(self.number_of_faces):
-            data = self.file.read(chunk)
-            data = struct.unpack(fmt, data)
             face = {}
-            for i, prop in enumerate(self.face_properties):
+            for prop in self.face_properties:
                 if len(prop) == 2:
                     pname, ptype = prop
-                    face[pname] = data[i]
+                    data = self.file.read(self.number_of_bytes_per_type[ptype])
+                    face[pname] = struct.unpack(ext + self.struct_format_per_type[ptype], data)[0]
                 elif len(prop) == 3:
+                    # the length of a list is stored in front of its items
                     pname, ptype, plen = prop
-                    face[pname] = list(data[2:])
+                    data = self.file.read(self.number_of_bytes_per_type[plen])
+                    n = struct.unpack(ext + self.struct_format_per_type[plen], data)[0]
+                    data = self.file.read(self.number_of_bytes_per_type[ptype] * n)
+                    face[pname] = list(struct.unpack(ext + self.struct_format_per_type[ptype] * n, data))
             self.faces.append(face)
 
     def read_faces_binary(self):
@@ -462,7 +494,17 @@ class PLYParser(object):
 
     def parse(self):
         self.vertices = [(vertex['x'], vertex['y'], vertex['z']) for vertex in self.reader.vertices]
-        self.faces = [face['vertex_indices'] for face in self.reader.faces]
+        name = face_list_property(self.reader.face_properties)
+        self.faces = [face[name] for face in self.reader.faces]
+
+
+def face_list_property(properties):
+    """Find the name of the list property with the vertices of the faces."""
+    names = [prop[0] for prop in properties if len(prop) == 3]
+    for name in ('vertex_indices', 'vertex_index'):
+        if name in names:
+            return name
+    return names[0] if names else None
 
 
 class PLYWriter(object):
@@ -0,0 +1,370 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import struct
+
+from numpy import arange
+from numpy import asarray
+from numpy import concatenate
+from numpy import cumsum
+from numpy import diff
+from numpy import dtype
+from numpy import empty
+from numpy import float64
+from numpy import frombuffer
+from numpy import int8
+from numpy import int64
+from numpy import memmap
+from numpy import stack
+from numpy import uint8
+from numpy import zeros
+
+from compas.files.ply import PLYParser
+from compas.files.ply import PLYReader
+from compas.files.ply import face_list_property
+
+
+__all__ = [
+    'PLYReaderNumpy',
+    'PLYParserNumpy',
+]
+
+
+class PLYReaderNumpy(PLYReader):
+    """Read the elements of a *ply* file into columns of typed arrays.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+
+    Attributes
+    ----------
+    vertex_data : dict
+        The scalar properties of the vertices, as one array per property.
+    edge_data : dict
+        The scalar properties of the edges, as one array per property.
+    face_data : dict
+        The scalar properties of the faces, as one array per property.
+    face_lists : dict
+        The list properties of the faces, for example the vertex indices,
+        as a tuple of offsets and items per property.
+        The items of face ``i`` are ``items[offsets[i]:offsets[i + 1]]``.
+
+    Notes
+    -----
+    The elements of binary files are read from a memory map of the file.
+    Elements without list properties are read as one structured array.
+    If all lists of an element have the same length as in its first record, for example for triangle meshes,
+    the element is read as one structured array as well.
+    Otherwise, only the lengths of the lists are read record by record, to find the start of every record,
+    and all properties are then extracted from the raw bytes in one vectorized pass.
+
+    ASCII files are read with :class:`compas.files.PLYReader`, and then converted to arrays.
+    The lists of dictionaries of the vertices and faces of :class:`compas.files.PLYReader` are not filled.
+
+    """
+
+    def __init__(self, filepath):
+        self.vertex_data = {}
+        self.edge_data = {}
+        self.face_data = {}
+        self.face_lists = {}
+        super(PLYReaderNumpy, self).__init__(filepath)
+
+    def read_data(self):
+        super(PLYReaderNumpy, self).read_data()
+        self.vertex_data, _ = self._columns(self.vertices, self.vertex_properties)
+        self.face_data, self.face_lists = self._columns(self.faces, self.face_properties)
+        self.vertices = []
+        self.faces = []
+
+    def _columns(self, records, properties):
+        """Convert a list of dictionaries to columns.
+
+        The values of floating point properties are stored as double precision,
+        as they are parsed from the text of the file.
+        """
+        columns = {}
+        lists = {}
+        for prop in properties:
+            name = prop[0]
+            item = dtype(self.binary_property_types[prop[1]])
+            if item.kind == 'f':
+                item = dtype(float64)
+            if len(prop) == 2:
+                columns[name] = asarray([record[name] for record in records], dtype=item).reshape(-1)
+            else:
+                offsets = concatenate(([0], cumsum([len(record[name]) for record in records]))).astype(int64)
+                items = asarray([index for record in records for index in record[name]], dtype=item).reshape(-1)
+                lists[name] = offsets, items
+        return columns, lists
+
+    def read_data_binary(self):
+        if not self.end_header:
+            raise Exception('header has not been read, or the file is not valid')
+        buffer = memmap(self.filepath, dtype=uint8, mode='r')
+        try:
+            offset = self.end_header
+            for section in self.sections:
+                if section == 'vertex':
+                    self.vertex_data, _, offset = self._read_element_binary(buffer, offset, self.number_of_vertices, self.vertex_properties)
+                elif section == 'edge':
+                    self.edge_data, _, offset = self._read_element_binary(buffer, offset, self.number_of_edges, self.edge_properties)
+                elif section == 'face':
+                    self.face_data, self.face_lists, offset = self._read_element_binary(buffer, offset, self.number_of_faces, self.face_properties)
+        finally:
+            # release the file
+            del buffer
+
+    def _type(self, ptype):
+        return dtype(self.binary_byte_order[self.format] + self.binary_property_types[ptype])
+
+    def _first_record(self, buffer, offset, properties):
+        """Compute the layout of the first record of an element.
+
+        Returns the fields of the record as structured data type, and the lengths of its lists.
+        """
+        fields = []
+        lengths = []
+        for prop in properties:
+            if len(prop) == 2:
+                fields.append((prop[0], self._type(prop[1])))
+            else:
+                name, ptype, plen = prop
+                length = int(frombuffer(buffer, dtype=self._type(plen), count=1, offset=offset + dtype(fields).itemsize)[0])
+                lengths.append(length)
+                fields.append(('{}.length'.format(name), self._type(plen)))
+                fields.append((name, self._type(ptype), (length, )))
+        return dtype(fields), lengths
+
+    def _read_element_binary(self, buffer, offset, count, properties):
+        """Read all records of an element.
+
+        Returns the scalar properties, the list properties, and the offset of the next element.
+        """
+        columns = {}
+        lists = {}
+        if not count:
+            for prop in properties:
+                if len(prop) == 2:
+                    columns[prop[0]] = empty(0, dtype=self._type(prop[1]).newbyteorder('='))
+                else:
+                    lists[prop[0]] = zeros(1, dtype=int64), empty(0, dtype=self._type(prop[1]).newbyteorder('='))
+            return columns, lists, offset
+
+        record, lengths = self._first_record(buffer, offset, properties)
+        if record.itemsize * count <= buffer.size - offset:
+            records = frombuffer(buffer, dtype=record, count=count, offset=offset)
+            names = [prop[0] for prop in properties if len(prop) == 3]
+            if all((records['{}.length'.format(name)] == length).all() for name, length in zip(names, lengths)):
+                for prop in properties:
+                    name = prop[0]
+                    values = records[name]
+                    values = values.astype(values.dtype.base.newbyteorder('='))
+                    if len(prop) == 2:
+                        columns[name] = values
+                    else:
+                        lists[name] = arange(count + 1, dtype=int64) * values.shape[1], values.reshape(-1)
+                return columns, lists, offset + record.itemsize * count
+
+        lengths = self._list_lengths(buffer, offset, count, properties)
+        position = self._record_starts(offset, properties, lengths)
+        for prop in properties:
+            name = prop[0]
+            if len(prop) == 2:
+                item = self._type(prop[1])
+                columns[name] = _gather(buffer, position, position + item.itemsize, item)
+                position = position + item.itemsize
+            else:
+                item = self._type(prop[1])
+                size = self._type(prop[2]).itemsize
+                length = lengths[name]
+                start = position + size
+                position = start + length * item.itemsize
+                has_items = length > 0
+                offsets = concatenate(([0], cumsum(length))).astype(int64)
+                lists[name] = offsets, _gather(buffer, start[has_items], position[has_items], item)
+        return columns, lists, int(position[-1])
+
+    def _list_lengths(self, buffer, offset, count, properties):
+        """Read the lengths of the lists of all records of an element, one record after the other."""
+        order = self.binary_byte_order[self.format]
+        view = memoryview(buffer)
+        steps = []
+        for prop in properties:
+            if len(prop) == 2:
+                steps.append((None, self._type(prop[1]).itemsize, 0))
+            else:
+                steps.append((struct.Struct(order + self._type(prop[2]).char), self._type(prop[2]).itemsize, self._type(prop[1]).itemsize))
+        lengths = [[0] * count for prop in properties]
+        position = offset
+        if len(steps) == 1 or sum(1 for step in steps if step[0] is not None) == 1:
+            # a single list, with scalars in front of it and after it
+            k = [i for i, step in enumerate(steps) if step[0] is not None][0]
+            before = sum(step[1] for step in steps[:k])
+            after = sum(step[1] for step in steps[k + 1:])
+            fmt, size, itemsize = steps[k]
+            fixed = before + size + after
+            result = lengths[k]
+            if size == 1:
+                for i in range(count):
+                    length = view[position + before]
+                    result[i] = length
+                    position += fixed + length * itemsize
+            else:
+                unpack = fmt.unpack_from
+                for i in range(count):
+                    length = unpack(view, position + before)[0]
+                    result[i] = length
+                    position += fixed + length * itemsize
+        else:
+            for i in range(count):
+                for k, (fmt, size, itemsize) in enumerate(steps):
+                    if fmt is None:
+                        position += size
+                    else:
+                        length = fmt.unpack_from(view, position)[0]
+                        lengths[k][i] = length
+                        position += size + length * itemsize
+        view.release()
+        return {prop[0]: asarray(length, dtype=int64) for prop, length in zip(properties, lengths) if len(prop) == 3}
+
+    def _record_starts(self, offset, properties, lengths):
+        """Compute the byte offsets of all records of an element from the lengths of their lists."""
+        sizes = 0
+        for prop in properties:
+            if len(prop) == 2:
+                sizes = sizes + self._type(prop[1]).itemsize
+            else:
+                sizes = sizes + self._type(prop[2]).itemsize + lengths[prop[0]] * self._type(prop[1]).itemsize
+        return offset + concatenate(([0], cumsum(sizes)[:-1])).astype(int64)
+
+
+def _gather(buffer, starts, ends, item):
+    """Extract the values in a number of byte ranges of a buffer, in one pass.
+
+    The ranges are sorted, do not overlap and are not empty.
+    """
+    if not starts.size:
+        return empty(0, dtype=item.newbyteorder('='))
+    lower = int(starts[0])
+    upper = int(ends[-1])
+    marks = zeros(upper - lower + 1, dtype=int8)
+    marks[starts - lower] = 1
+    marks[ends - lower] = -1
+    inside = cumsum(marks[:-1], dtype=int8).view(bool)
+    values = buffer[lower:upper][inside].view(item)
+    return values.astype(item.newbyteorder('='))
+
+
+class PLYParserNumpy(PLYParser):
+    """Convert the elements of a *ply* file to vertices and faces.
+
+    Parameters
+    ----------
+    reader : :class:`PLYReaderNumpy`
+        A reader.
+    precision : str, optional
+        Not used.
+
+    Attributes
+    ----------
+    xyz : array
+        The ``(n, 3)`` array of vertex coordinates.
+    face_offsets : array
+        CSR row pointer into ``face_indices``.
+        The vertices of face ``i`` are ``face_indices[face_offsets[i]:face_offsets[i + 1]]``.
+    face_indices : array
+        The vertex indices of all faces, concatenated.
+
+    """
+
+    def __init__(self, reader, precision=None):
+        self.xyz = None
+        self.face_offsets = None
+        self.face_indices = None
+        self._vertices = None
+        self._faces = None
+        super(PLYParserNumpy, self).__init__(reader, precision=precision)
+
+    def parse(self):
+        data = self.reader.vertex_data
+        if self.reader.number_of_vertices:
+            self.xyz = stack((data['x'], data['y'], data['z']), axis=1).astype(float64)
+        else:
+            self.xyz = zeros((0, 3), dtype=float64)
+        name = face_list_property(self.reader.face_properties)
+        if name is None:
+            self.face_offsets = zeros(1, dtype=int64)
+            self.face_indices = empty(0, dtype=int64)
+        else:
+            offsets, items = self.reader.face_lists[name]
+            self.face_offsets = offsets
+            self.face_indices = items.astype(int64)
+
+    @property
+    def vertices(self):
+        """list : The XYZ coordinates of the vertices."""
+        if self._vertices is None and self.xyz is not None:
+            self._vertices = self.xyz.tolist()
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._vertices = vertices
+
+    @property
+    def faces(self):
+        """list : The faces as lists of vertex indices."""
+        if self._faces is None and self.face_indices is not None:
+            degrees = diff(self.face_offsets)
+            if degrees.size and (degrees == degrees[0]).all() and degrees[0]:
+                self._faces = self.face_indices.reshape((-1, int(degrees[0]))).tolist()
+            else:
+                indices = self.face_indices.tolist()
+                offsets = self.face_offsets.tolist()
+                self._faces = [indices[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces):
+        self._faces = faces
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import os
+    import tempfile
+    import time
+
+    from numpy.random import default_rng
+
+    n = 1000000
+    rng = default_rng(0)
+    filepath = os.path.join(tempfile.gettempdir(), 'ply_numpy.ply')
+
+    for name, degrees in (('triangles', zeros(2 * n, dtype=int64) + 3), ('mixed', rng.integers(3, 5, 2 * n))):
+        header = ['ply', 'format binary_little_endian 1.0',
+                  'element vertex {}'.format(n), 'property float x', 'property float y', 'property float z',
+                  'property uchar red', 'property uchar green', 'property uchar blue',
+                  'element face {}'.format(degrees.size), 'property list uchar int vertex_indices', 'end_header', '']
+        vertices = zeros(n, dtype=[('xyz', '<f4', (3, )), ('rgb', 'u1', (3, ))])
+        vertices['xyz'] = rng.random((n, 3))
+        offsets = concatenate(([0], cumsum(1 + 4 * degrees)))
+        faces = zeros(int(offsets[-1]), dtype=uint8)
+        faces[offsets[:-1]] = degrees
+        with open(filepath, 'wb') as fh:
+            fh.write('\n'.join(header).encode('ascii'))
+            fh.write(vertices.tobytes())
+            fh.write(faces.tobytes())
+
+        t0 = time.time()
+        parser = PLYParserNumpy(PLYReaderNumpy(filepath))
+        t1 = time.time()
+        print('{}: {} vertices, {} faces, {:.3f}s'.format(name, parser.xyz.shape[0], parser.face_offsets.size - 1, t1 - t0))
@@ -5,7 +5,7 @@ from __future__ import division
 import struct
 import compas
 from compas.geometry import Translation
-from compas.utilities import geometric_key
+from compas.utilities import weld_points
 
 
 __all__ = [
@@ -17,6 +17,21 @@ __all__ = [
 
 
 class STL(object):
+    """Read and write files in STL format.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+    precision : str, optional
+        The precision of the geometric keys used to identify vertices of ASCII files.
+
+    Notes
+    -----
+    Outside of IronPython, binary files are read with :class:`compas.files.STLReaderNumpy`
+    and :class:`compas.files.STLParserNumpy`.
+
+    """
 
     def __init__(self, filepath, precision=None):
         self.filepath = filepath
@@ -27,6 +42,14 @@ class STL(object):
         self._writer = None
 
     def read(self):
+        if not compas.IPY:
+            from compas.files.stl_numpy import STLReaderNumpy
+            from compas.files.stl_numpy import STLParserNumpy
+            if STLReaderNumpy.is_binary(self.filepath):
+                self._reader = STLReaderNumpy(self.filepath)
+                self._parser = STLParserNumpy(self._reader, precision=self.precision)
+                self._is_parsed = True
+                return
         self._reader = STLReader(self.filepath)
         self._parser = STLParser(self._reader, precision=self.precision)
         self._is_parsed = True
@@ -229,25 +252,21 @@ class STLParser(object):
         self.parse()
 
     def parse(self):
-        gkey_index = {}
+        facets = self.reader.facets
+        points = [xyz for facet in facets for xyz in facet['vertices'][:3]]
+        if facets and 'keys' in facets[0]:
+            # binary files identify vertices by the bytes of their coordinates
+            key_index = {}
+            index = [key_index.setdefault(key, len(key_index)) for facet in facets for key in facet['keys'][:3]]
+        else:
+            index, _ = weld_points(points, self.precision)
+        # every vertex gets the coordinates of its first occurrence
         vertices = []
-        faces = []
-        for facet in self.reader.facets:
-            face = []
-            facet_vertices = facet['vertices']
-            for i in range(3):
-                xyz = facet_vertices[i]
-                if 'keys' in facet:
-                    gkey = facet['keys'][i]
-                else:
-                    gkey = geometric_key(xyz, self.precision)
-                if gkey not in gkey_index:
-                    gkey_index[gkey] = len(vertices)
-                    vertices.append(xyz)
-                face.append(gkey_index[gkey])
-            faces.append(face)
+        for xyz, i in zip(points, index):
+            if i == len(vertices):
+                vertices.append(xyz)
         self.vertices = vertices
-        self.faces = faces
+        self.faces = [index[i:i + 3] for i in range(0, len(index), 3)]
 
 
 class STLWriter(object):
@@ -313,6 +332,10 @@ class STLWriter(object):
             raise ValueError('Mesh must have fewer than 4294967295 faces to be written to binary STL.')
 
     def write_binary_faces(self):
+        if not compas.IPY:
+            from compas.files.stl_numpy import stl_binary_facets_numpy
+            self.file.write(stl_binary_facets_numpy(self.mesh))
+            return
         vertex_xyz = self.vertex_xyz
         for face in self.mesh.faces():
             self.file.write(struct.pack('<3f', *self.mesh.face_normal(face)))
@@ -0,0 +1,254 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import os
+
+from numpy import arange
+from numpy import argsort
+from numpy import ascontiguousarray
+from numpy import dtype
+from numpy import empty
+from numpy import float64
+from numpy import frombuffer
+from numpy import int64
+from numpy import memmap
+from numpy import uint32
+from numpy import unique
+from numpy import zeros
+
+
+__all__ = [
+    'STLReaderNumpy',
+    'STLParserNumpy',
+]
+
+
+HEADER = 80
+
+FACET = dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attributes', '<u2'),
+])
+
+
+class STLReaderNumpy(object):
+    """Read all facets of a binary *stl* file at once.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the file.
+
+    Attributes
+    ----------
+    header : bytes
+        The 80-byte header of the file.
+    normals : array
+        The ``(f, 3)`` array of facet normals.
+    vertices : array
+        The ``(f, 3, 3)`` array of the vertex coordinates of every facet.
+
+    Notes
+    -----
+    The file is memory-mapped and the facets are read as one structured array
+    with :data:`FACET` as data type, without unpacking the facets one by one.
+    ASCII files are not supported, see :class:`compas.files.STLReader`.
+
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.header = None
+        self.normals = None
+        self.vertices = None
+        self.read()
+
+    @staticmethod
+    def is_binary(filepath):
+        """Verify that a file is a binary *stl* file.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the file.
+
+        Returns
+        -------
+        bool
+            True if the size of the file matches the number of facets in its header.
+            False otherwise.
+
+        Notes
+        -----
+        The size of a binary file is fully determined by the number of facets,
+        which makes this check more reliable than looking for the keyword ``solid``
+        in the header, which is also used by many binary files.
+
+        """
+        size = os.path.getsize(filepath)
+        if size < HEADER + 4:
+            return False
+        with open(filepath, 'rb') as fh:
+            fh.seek(HEADER)
+            n = int(frombuffer(fh.read(4), dtype='<u4')[0])
+        return size == HEADER + 4 + n * FACET.itemsize
+
+    def read(self):
+        with open(self.filepath, 'rb') as fh:
+            self.header = fh.read(HEADER)
+            n = int(frombuffer(fh.read(4), dtype='<u4')[0])
+        if not n:
+            self.normals = zeros((0, 3), dtype=float64)
+            self.vertices = zeros((0, 3, 3), dtype=float64)
+            return
+        facets = memmap(self.filepath, dtype=FACET, mode='r', offset=HEADER + 4, shape=(n, ))
+        try:
+            self.normals = facets['normal'].astype(float64)
+            self.vertices = facets['vertices'].astype(float64)
+        finally:
+            # release the file
+            del facets
+
+
+class STLParserNumpy(object):
+    """Convert the facets of a binary *stl* file to vertices and faces.
+
+    Parameters
+    ----------
+    reader : :class:`STLReaderNumpy`
+        A reader.
+    precision : str, optional
+        Not used.
+        Like :class:`compas.files.STLParser`, vertices of binary files are welded
+        if their coordinates are identical, bit for bit.
+
+    Attributes
+    ----------
+    xyz : array
+        The ``(n, 3)`` array of vertex coordinates.
+    triangles : array
+        The ``(f, 3)`` array of vertex indices of the faces.
+
+    Notes
+    -----
+    The vertices are identified by the bytes of their coordinates in one call to :func:`numpy.unique`.
+    The unique vertices are numbered in order of first occurrence, as by :class:`compas.files.STLParser`.
+
+    """
+
+    def __init__(self, reader, precision=None):
+        self.reader = reader
+        self.precision = precision
+        self.xyz = None
+        self.triangles = None
+        self._vertices = None
+        self._faces = None
+        self.parse()
+
+    def parse(self):
+        points = self.reader.vertices.reshape((-1, 3))
+        if not points.shape[0]:
+            self.xyz = zeros((0, 3), dtype=float64)
+            self.triangles = zeros((0, 3), dtype=int64)
+            return
+        # the float32 values are converted to float64 exactly
+        # so the bits of the float32 values identify the vertices
+        bits = ascontiguousarray(points.astype('<f4')).view(uint32)
+        _, first, inverse = unique(bits, axis=0, return_index=True, return_inverse=True)
+        order = argsort(first, kind='stable')
+        rank = empty(order.size, dtype=int64)
+        rank[order] = arange(order.size)
+        self.xyz = points[first[order]]
+        self.triangles = rank[inverse.reshape(-1)].reshape((-1, 3))
+
+    @property
+    def vertices(self):
+        """list : The XYZ coordinates of the vertices."""
+        if self._vertices is None:
+            self._vertices = self.xyz.tolist()
+        return self._vertices
+
+    @property
+    def faces(self):
+        """list : The faces as lists of vertex indices."""
+        if self._faces is None:
+            self._faces = self.triangles.tolist()
+        return self._faces
+
+
+def stl_binary_facets_numpy(mesh):
+    """Pack the faces of a triangle mesh into the contiguous buffer of a binary *stl* file.
+
+    Parameters
+    ----------
+    mesh : :class:`compas.datastructures.Mesh`
+        A triangle mesh.
+
+    Returns
+    -------
+    bytes
+        The facets, without header and number of facets.
+
+    """
+    from compas.datastructures.mesh.core.geometry_numpy import mesh_vertex_face_buffers
+    from compas.datastructures.mesh.core.geometry_numpy import faces_normals_numpy
+
+    xyz, offsets, indices = mesh_vertex_face_buffers(mesh)
+    facets = zeros(offsets.size - 1, dtype=FACET)
+    facets['normal'] = faces_normals_numpy(xyz, offsets, indices)
+    facets['vertices'] = xyz[indices.reshape((-1, 3))]
+    return facets.tobytes()
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import struct
+    import tempfile
+    import time
+
+    import compas
+    from compas.datastructures import Mesh
+    from compas.datastructures import mesh_subdivide_quad
+    from compas.files import STLReader
+    from compas.files import STLParser
+    from compas.files import STLWriter
+
+    mesh = Mesh.from_obj(compas.get('faces_big.obj'))
+    mesh = mesh_subdivide_quad(mesh, k=3)
+    mesh.quads_to_triangles()
+    filepath = os.path.join(tempfile.gettempdir(), 'stl_numpy.stl')
+
+    print('faces: {}'.format(mesh.number_of_faces()))
+
+    writer = STLWriter(filepath, mesh, binary=True)
+    t0 = time.time()
+    with open(filepath, 'wb') as writer.file:
+        writer.write_binary_header()
+        writer.write_binary_num_faces()
+        vertex_xyz = writer.vertex_xyz
+        for face in mesh.faces():
+            writer.file.write(struct.pack('<3f', *mesh.face_normal(face)))
+            for vertex in mesh.face_vertices(face):
+                writer.file.write(struct.pack('<3f', *vertex_xyz[vertex]))
+            writer.file.write(b'\0\0')
+    t1 = time.time()
+    writer.write()
+    t2 = time.time()
+
+    print('write: struct {:.3f}s, buffer {:.3f}s'.format(t1 - t0, t2 - t1))
+
+    t0 = time.time()
+    parser = STLParser(STLReader(filepath))
+    t1 = time.time()
+    parser_numpy = STLParserNumpy(STLReaderNumpy(filepath))
+    t2 = time.time()
+
+    print('read:  struct {:.3f}s, memmap {:.3f}s'.format(t1 - t0, t2 - t1))
+    assert [list(xyz) for xyz in parser.vertices] == parser_numpy.vertices
+    assert parser.faces == parser_numpy.faces
@@ -347,8 +347,12 @@ Point Sets
     convex_hull_numpy
     convex_hull_xy
     convex_hull_xy_numpy
+    IncrementalHull
     oriented_bounding_box_numpy
     oriented_bounding_box_xy_numpy
+    KDTree
+    KDTreeNumpy
+    weld_points_numpy
 
 
 Distance
@@ -498,6 +502,8 @@ Pointclouds
     :toctree: generated/
     :nosignatures:
 
+    Pointcloud
+    PointcloudNumpy
     icp_numpy
 
 
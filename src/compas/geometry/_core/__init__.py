@@ -2,6 +2,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import compas
+
 from ._algebra import *  # noqa: F401 F403
 
 from .constructors import *  # noqa: F401 F403
@@ -15,5 +17,8 @@ from .quaternions import *  # noqa: F401 F403
 from .tangent import *  # noqa: F401 F403
 from .kdtree import *  # noqa: F401 F403
 
+if not compas.IPY:
+    from .kdtree_numpy import *  # noqa: F401 F403
+
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -3,8 +3,11 @@ from __future__ import absolute_import
 from __future__ import division
 
 import collections
-
-from compas.geometry._core import distance_point_point_sqrd
+from heapq import heappush
+from heapq import heapreplace
+from itertools import compress
+from operator import itemgetter
+from operator import not_
 
 
 __all__ = [
@@ -14,6 +17,9 @@ __all__ = [
 
 Node = collections.namedtuple("Node", 'point axis label left right')
 
+# below this number of points, the ranges of the children are sorted instead of partitioned
+PARTITION_SIZE = 256
+
 
 class KDTree(object):
     """A tree for nearest neighbor search in a k-dimensional space.
@@ -35,6 +41,15 @@ class KDTree(object):
     -----
     For more info, see [1]_ and [2]_.
 
+    The tree is built without recursion, from lists of point indices that are sorted once along every axis.
+    At every split, the lists are partitioned stably around the median,
+    such that they stay sorted within the ranges of the children.
+    Only small ranges are sorted again.
+    The searches are also non-recursive and visit every node at most once,
+    also when more than one neighbor is requested.
+
+    For large point sets, see :class:`compas.geometry.KDTreeNumpy`.
+
     References
     ----------
     .. [1] Wikipedia. *k-d tree*.
@@ -44,7 +59,13 @@ class KDTree(object):
 
     Examples
     --------
-    >>>
+    >>> cloud = [[float(i), float(i % 7), 0.0] for i in range(100)]
+    >>> tree = KDTree(cloud)
+    >>> xyz, label, distance = tree.nearest_neighbor([10.2, 3.1, 0.0])
+    >>> label
+    10
+    >>> [label for xyz, label, distance in tree.nearest_neighbors([10.2, 3.1, 0.0], 3)]
+    [10, 11, 9]
 
     """
 
@@ -60,7 +81,7 @@ class KDTree(object):
         Parameters
         ----------
         objects : list
-            The tree objects.
+            The tree objects, as pairs of point coordinates and labels.
         axis : int, optional
             The axis along which to build.
 
@@ -73,17 +94,140 @@ class KDTree(object):
         if not objects:
             return None
 
-        objects.sort(key=lambda o: o[0][axis])
-        median_idx = len(objects) // 2
-        median_point, median_label = objects[median_idx]
-        next_axis = (axis + 1) % 3
+        points = [point for point, _ in objects]
+        labels = [label for _, label in objects]
+        coords = [[point[a] for point in points] for a in range(3)]
+
+        # the indices are sorted once along every axis
+        # every node takes the median of its range of the list of its axis
+        # and partitions the ranges of the other two lists stably around it
+        # such that all lists stay sorted within the ranges of its children
+        order = [sorted(range(len(objects)), key=coords[a].__getitem__) for a in range(3)]
+        side = bytearray(len(objects))
+        medians = []
+        children = []
+        stack = [(0, len(objects), axis, None, 0)]
+
+        while stack:
+            start, end, axis, parent, child = stack.pop()
+            mid = (start + end) // 2
+            current = order[axis]
+            median = current[mid]
+
+            node = len(medians)
+            medians.append((median, axis))
+            children.append([None, None])
+            if parent is not None:
+                children[parent][child] = node
+
+            next_axis = (axis + 1) % 3
+            if end - start > PARTITION_SIZE:
+                for i in current[start:mid + 1]:
+                    side[i] = 1
+                for i in current[mid + 1:end]:
+                    side[i] = 0
+                for other in order:
+                    if other is current:
+                        continue
+                    segment = other[start:end]
+                    flags = itemgetter(*segment)(side)
+                    left = list(compress(segment, flags))
+                    left.remove(median)
+                    other[start:mid] = left
+                    other[mid] = median
+                    other[mid + 1:end] = compress(segment, map(not_, flags))
+            elif end - start > 1:
+                # small ranges are sorted for the children directly
+                # and the third list is no longer needed below them
+                key = coords[next_axis].__getitem__
+                following = order[next_axis]
+                following[start:mid] = sorted(current[start:mid], key=key)
+                following[mid + 1:end] = sorted(current[mid + 1:end], key=key)
+            if start < mid:
+                stack.append((start, mid, next_axis, node, 0))
+            if mid + 1 < end:
+                stack.append((mid + 1, end, next_axis, node, 1))
+
+        # children are always created after their parents
+        # so the nodes can be assembled in reverse order
+        nodes = [None] * len(medians)
+        for node in range(len(medians) - 1, -1, -1):
+            median, axis = medians[node]
+            left, right = children[node]
+            nodes[node] = Node(
+                points[median],
+                axis,
+                labels[median],
+                None if left is None else nodes[left],
+                None if right is None else nodes[right])
+
+        return nodes[0]
+
+    def _search(self, point, number=None, radius=None, exclude=None):
+        """Find the neighbors of a point in a single traversal of the tree.
 
-        return Node(
-            median_point,
-            axis,
-            median_label,
-            self.build(objects[:median_idx], next_axis),
-            self.build(objects[median_idx + 1:], next_axis))
+        Parameters
+        ----------
+        point : list
+            XYZ coordinates of the base point.
+        number : int, optional
+            The maximum number of neighbors.
+        radius : float, optional
+            The maximum distance of the neighbors.
+        exclude : set, optional
+            Labels of nodes to skip.
+
+        Returns
+        -------
+        list
+            Tuples of squared distance, label and coordinates, in no particular order.
+
+        """
+        if number is not None and number < 1:
+            return []
+        x, y, z = point[0], point[1], point[2]
+        bound = float('inf') if radius is None else radius ** 2
+        found = []
+        count = 0
+        stack = [(self.root, 0.0)]
+
+        while stack:
+            node, d2 = stack.pop()
+            if node is None:
+                continue
+            if number is not None and count == number:
+                bound = -found[0][0]
+            if d2 > bound:
+                continue
+
+            p = node.point
+            dx = x - p[0]
+            dy = y - p[1]
+            dz = z - p[2]
+            d2 = dx * dx + dy * dy + dz * dz
+
+            if d2 <= bound and (not exclude or node.label not in exclude):
+                if number is None:
+                    found.append((-d2, count, node))
+                    count += 1
+                elif count < number:
+                    heappush(found, (-d2, count, node))
+                    count += 1
+                elif d2 < bound:
+                    heapreplace(found, (-d2, count, node))
+
+            d = point[node.axis] - p[node.axis]
+            if d <= 0:
+                close, far = node.left, node.right
+            else:
+                close, far = node.right, node.left
+
+            # the far side is pushed first so that the close side is visited first
+            # it is skipped on the way back if it can no longer contain a neighbor
+            stack.append((far, d * d))
+            stack.append((close, 0.0))
+
+        return [(-d2, node.label, node.point) for d2, _, node in found]
 
     def nearest_neighbor(self, point, exclude=None):
         """Find the nearest neighbor to a given point,
@@ -105,30 +249,11 @@ class KDTree(object):
             Distance to the base point.
 
         """
-        def search(node):
-            if node is None:
-                return
-
-            d2 = distance_point_point_sqrd(point, node.point)
-            if d2 < best[2]:
-                if node.label not in exclude:
-                    best[:] = node.point, node.label, d2
-
-            d = point[node.axis] - node.point[node.axis]
-            if d <= 0:
-                close, far = node.left, node.right
-            else:
-                close, far = node.right, node.left
-
-            search(close)
-            if d ** 2 < best[2]:
-                search(far)
-
-        exclude = exclude or set()
-        best = [None, None, float('inf')]
-        search(self.root)
-        best[2] **= 0.5
-        return best
+        found = self._search(point, 1, exclude=exclude)
+        if not found:
+            return [None, None, float('inf')]
+        d2, label, xyz = found[0]
+        return [xyz, label, d2 ** 0.5]
 
     def nearest_neighbors(self, point, number, distance_sort=False):
         """Find the N nearest neighbors to a given point.
@@ -136,7 +261,7 @@ class KDTree(object):
         Parameters
         ----------
         point : list
-            XYZ coordinates of the bbase point.
+            XYZ coordinates of the base point.
         number : int
             The number of nearest neighbors.
         distance_sort : bool, optional
@@ -147,17 +272,64 @@ class KDTree(object):
         -------
         list
             A list of N nearest neighbors.
+            Every neighbor is a list with its XYZ coordinates, its label, and its distance to the base point.
+
+        Notes
+        -----
+        The neighbors are always returned in order of increasing distance,
+        regardless of the value of ``distance_sort``.
+        If the tree contains fewer than N points, all points are returned.
 
         """
-        nnbrs = []
-        exclude = set()
-        for i in range(number):
-            nnbr = self.nearest_neighbor(point, exclude)
-            nnbrs.append(nnbr)
-            exclude.add(nnbr[1])
+        found = self._search(point, number)
+        found.sort(key=lambda item: item[0])
+        return [[xyz, label, d2 ** 0.5] for d2, label, xyz in found]
+
+    def nearest_neighbors_many(self, points, number, distance_sort=False):
+        """Find the N nearest neighbors to each of a number of points.
+
+        Parameters
+        ----------
+        points : list
+            XYZ coordinates of the base points.
+        number : int
+            The number of nearest neighbors per point.
+        distance_sort : bool, optional
+            Sort the nearest neighbors by distance to the base point.
+            Default is ``False``.
+
+        Returns
+        -------
+        list
+            Per base point, a list of N nearest neighbors as returned by :meth:`nearest_neighbors`.
+
+        """
+        return [self.nearest_neighbors(point, number, distance_sort=distance_sort) for point in points]
+
+    def radius_search(self, point, radius, distance_sort=False):
+        """Find all neighbors within a given distance from a point.
+
+        Parameters
+        ----------
+        point : list
+            XYZ coordinates of the base point.
+        radius : float
+            The search radius.
+        distance_sort : bool, optional
+            Sort the neighbors by distance to the base point.
+            Default is ``False``.
+
+        Returns
+        -------
+        list
+            A list of neighbors.
+            Every neighbor is a list with its XYZ coordinates, its label, and its distance to the base point.
+
+        """
+        found = self._search(point, radius=radius)
         if distance_sort:
-            return sorted(nnbrs, key=lambda nnbr: nnbr[2])
-        return nnbrs
+            found.sort(key=lambda item: item[0])
+        return [[xyz, label, d2 ** 0.5] for d2, label, xyz in found]
 
 
 # ==============================================================================
@@ -166,56 +338,54 @@ class KDTree(object):
 
 if __name__ == '__main__':
 
-    from compas.geometry import pointcloud_xy
-    from compas_plotters import Plotter
+    import random
+    import time
 
-    plotter = Plotter()
+    def build_recursive(objects, axis=0):
+        # the previous implementation
+        # sorts copies of the objects on every level of the tree
+        if not objects:
+            return None
+        objects.sort(key=lambda o: o[0][axis])
+        median_idx = len(objects) // 2
+        median_point, median_label = objects[median_idx]
+        next_axis = (axis + 1) % 3
+        return Node(
+            median_point,
+            axis,
+            median_label,
+            build_recursive(objects[:median_idx], next_axis),
+            build_recursive(objects[median_idx + 1:], next_axis))
 
-    cloud = pointcloud_xy(999, (-500, 500))
-    point = cloud[0]
+    def nearest_neighbors_repeated(tree, point, number):
+        # the previous implementation
+        # runs a full search for every neighbor
+        nnbrs = []
+        exclude = set()
+        for i in range(number):
+            nnbr = tree.nearest_neighbor(point, exclude)
+            nnbrs.append(nnbr)
+            exclude.add(nnbr[1])
+        return nnbrs
+
+    cloud = [[random.uniform(-500, 500) for _ in range(3)] for _ in range(100000)]
+    objects = [(xyz, index) for index, xyz in enumerate(cloud)]
 
+    t0 = time.time()
+    build_recursive(objects[:])
+    t1 = time.time()
     tree = KDTree(cloud)
+    t2 = time.time()
+
+    print('build: recursive {:.3f}s, iterative {:.3f}s'.format(t1 - t0, t2 - t1))
+
+    points = cloud[:1000]
+
+    t0 = time.time()
+    a = [nearest_neighbors_repeated(tree, point, 10) for point in points]
+    t1 = time.time()
+    b = tree.nearest_neighbors_many(points, 10)
+    t2 = time.time()
 
-    n = 50
-    nnbrs = []
-    exclude = set()
-
-    for i in range(n):
-        nnbr = tree.nearest_neighbor(point, exclude)
-        nnbrs.append(nnbr)
-        exclude.add(nnbr[1])
-
-    for nnbr in nnbrs:
-        print(nnbr)
-
-    points = []
-    for index, (x, y, z) in enumerate(cloud):
-        points.append({
-            'pos': [x, y],
-            'facecolor': '#000000',
-            'edgecolor': '#000000',
-            'radius': 1.0
-        })
-    points.append({
-        'pos': point[0:2],
-        'facecolor': '#ff0000',
-        'edgecolor': '#ff0000',
-        'radius': 5.0
-    })
-
-    lines = []
-    for xyz, label, dist in nnbrs:
-        points[label]['facecolor'] = '#00ff00'
-        points[label]['edgecolor'] = '#00ff00'
-        points[label]['radius'] = 3.0
-
-        lines.append({
-            'start': point[0:2],
-            'end': xyz[0:2],
-            'color': '#000000',
-            'width': 0.1,
-        })
-
-    plotter.draw_lines(lines)
-    plotter.draw_points(points)
-    plotter.show()
+    assert [[label for _, label, _ in nnbrs] for nnbrs in a] == [[label for _, label, _ in nnbrs] for nnbrs in b]
+    print('knn:   repeated {:.3f}s, single pass {:.3f}s'.format(t1 - t0, t2 - t1))
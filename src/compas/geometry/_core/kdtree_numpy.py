@@ -0,0 +1,249 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import asarray
+from numpy import float64
+from numpy import inf
+
+from scipy.spatial import cKDTree
+
+
+__all__ = [
+    'KDTreeNumpy'
+]
+
+
+class KDTreeNumpy(object):
+    """An array-backed tree for nearest neighbor search in 3D space.
+
+    Parameters
+    ----------
+    objects : list or array, optional
+        The XYZ coordinates of the points to populate the tree with.
+        If objects are provided, the tree is built automatically.
+        Defaults to ``None``.
+
+    Attributes
+    ----------
+    points : array
+        The ``(n, 3)`` array of point coordinates.
+        The labels of the points are their row indices.
+
+    Notes
+    -----
+    The tree has the same interface as :class:`compas.geometry.KDTree`,
+    but the points are stored in a single array and the searches are performed
+    in compiled code. In addition, :meth:`query` returns the results of
+    batched searches as arrays, without creating Python objects per neighbor.
+
+    Examples
+    --------
+    >>> cloud = [[float(i), float(i % 7), 0.0] for i in range(100)]
+    >>> tree = KDTreeNumpy(cloud)
+    >>> xyz, label, distance = tree.nearest_neighbor([10.2, 3.1, 0.0])
+    >>> label
+    10
+
+    """
+
+    def __init__(self, objects=None):
+        self.points = None
+        self._tree = None
+        if objects is not None and len(objects):
+            self.build(objects)
+
+    def build(self, objects):
+        """Populate the tree with given points.
+
+        Parameters
+        ----------
+        objects : list or array
+            The XYZ coordinates of the points.
+
+        """
+        self.points = asarray(objects, dtype=float64).reshape((-1, 3))
+        self._tree = cKDTree(self.points)
+
+    def _neighbors(self, distances, indices):
+        n = self.points.shape[0]
+        return [[self.points[index].tolist(), int(index), float(distance)]
+                for distance, index in zip(distances, indices) if index < n]
+
+    def query(self, points, number=1, workers=1):
+        """Find the N nearest neighbors to each of a number of points.
+
+        Parameters
+        ----------
+        points : list or array
+            XYZ coordinates of the base points.
+        number : int, optional
+            The number of nearest neighbors per point.
+            Default is ``1``.
+        workers : int, optional
+            The number of threads that search for the neighbors of the points in parallel.
+            Use ``-1`` for all available processors.
+            Default is ``1``.
+
+        Returns
+        -------
+        tuple
+            * A ``(m, number)`` array of distances, sorted per row.
+            * A ``(m, number)`` array of point indices.
+
+        Notes
+        -----
+        If the tree contains fewer than N points, the missing neighbors
+        have an infinite distance and an index equal to the number of points in the tree.
+
+        Parallel searches require SciPy 1.6 or later.
+
+        """
+        points = asarray(points, dtype=float64).reshape((-1, 3))
+        if workers == 1:
+            distances, indices = self._tree.query(points, k=[k + 1 for k in range(number)])
+        else:
+            distances, indices = self._tree.query(points, k=[k + 1 for k in range(number)], workers=workers)
+        return distances, indices
+
+    def nearest_neighbor(self, point, exclude=None):
+        """Find the nearest neighbor to a given point,
+        excluding neighbors that have already been found.
+
+        Parameters
+        ----------
+        point : list
+            XYZ coordinates of the base point.
+        exclude : set, optional
+            A set of points to exclude from the search.
+            Defaults to an empty set.
+
+        Returns
+        -------
+        list:
+            XYZ coordinates of the nearest neighbor.
+            Label of the nearest neighbor.
+            Distance to the base point.
+
+        """
+        exclude = exclude or set()
+        number = 1 + len(exclude)
+        distances, indices = self.query(point, min(number, self.points.shape[0]))
+        for nnbr in self._neighbors(distances[0], indices[0]):
+            if nnbr[1] not in exclude:
+                return nnbr
+        return [None, None, inf]
+
+    def nearest_neighbors(self, point, number, distance_sort=False):
+        """Find the N nearest neighbors to a given point.
+
+        Parameters
+        ----------
+        point : list
+            XYZ coordinates of the base point.
+        number : int
+            The number of nearest neighbors.
+        distance_sort : bool, optional
+            Sort the nearest neighbors by distance to the base point.
+            Default is ``False``.
+
+        Returns
+        -------
+        list
+            A list of N nearest neighbors.
+            Every neighbor is a list with its XYZ coordinates, its label, and its distance to the base point.
+
+        Notes
+        -----
+        The neighbors are always returned in order of increasing distance,
+        regardless of the value of ``distance_sort``.
+
+        """
+        return self.nearest_neighbors_many([point], number)[0]
+
+    def nearest_neighbors_many(self, points, number, distance_sort=False):
+        """Find the N nearest neighbors to each of a number of points.
+
+        Parameters
+        ----------
+        points : list or array
+            XYZ coordinates of the base points.
+        number : int
+            The number of nearest neighbors per point.
+        distance_sort : bool, optional
+            Sort the nearest neighbors by distance to the base point.
+            Default is ``False``.
+
+        Returns
+        -------
+        list
+            Per base point, a list of N nearest neighbors as returned by :meth:`nearest_neighbors`.
+
+        """
+        if number < 1:
+            return [[] for _ in range(len(points))]
+        distances, indices = self.query(points, number)
+        return [self._neighbors(d, i) for d, i in zip(distances, indices)]
+
+    def radius_search(self, point, radius, distance_sort=False):
+        """Find all neighbors within a given distance from a point.
+
+        Parameters
+        ----------
+        point : list
+            XYZ coordinates of the base point.
+        radius : float
+            The search radius.
+        distance_sort : bool, optional
+            Sort the neighbors by distance to the base point.
+            Default is ``False``.
+
+        Returns
+        -------
+        list
+            A list of neighbors.
+            Every neighbor is a list with its XYZ coordinates, its label, and its distance to the base point.
+
+        """
+        point = asarray(point, dtype=float64).reshape(3)
+        indices = asarray(self._tree.query_ball_point(point, radius), dtype=int)
+        vectors = self.points[indices] - point
+        distances = (vectors ** 2).sum(axis=1) ** 0.5
+        if distance_sort:
+            order = distances.argsort(kind='stable')
+            distances = distances[order]
+            indices = indices[order]
+        return self._neighbors(distances, indices)
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import time
+
+    from numpy.random import rand
+
+    from compas.geometry import KDTree
+
+    cloud = rand(1000000, 3) * 1000
+
+    t0 = time.time()
+    tree = KDTreeNumpy(cloud)
+    t1 = time.time()
+    distances, indices = tree.query(cloud[:100000], 10)
+    t2 = time.time()
+
+    print('numpy:  build {:.3f}s, 100000 x knn(10) {:.3f}s'.format(t1 - t0, t2 - t1))
+
+    points = cloud[:100000].tolist()
+
+    t0 = time.time()
+    tree = KDTree(points)
+    t1 = time.time()
+    nnbrs = tree.nearest_neighbors_many(points[:10000], 10)
+    t2 = time.time()
+
+    print('python: build {:.3f}s on 100000 points, 10000 x knn(10) {:.3f}s'.format(t1 - t0, t2 - t1))
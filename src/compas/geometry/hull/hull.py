@@ -11,6 +11,7 @@ from compas.geometry import cross_vectors_xy
 __all__ = [
     'convex_hull',
     'convex_hull_xy',
+    'IncrementalHull',
 ]
 
 
@@ -27,58 +28,282 @@ def convex_hull(points):
     list
         The triangular faces of the convex hull as lists of vertex indices
         referring to the original point coordinates.
+        The faces are oriented with their normals pointing outwards.
+        If all points lie in one plane, the list is empty.
 
     Notes
     -----
-    This algorithm is based on [1]_. Note that is not optimized and relatively
-    slow on large sets of points. For a more optimized version of this algorithm,
-    see [2]_.
+    This function uses :class:`IncrementalHull`, an implementation of the Quickhull algorithm [1]_.
 
     References
     ----------
-    .. [1] GitHubGist. *Convex Hull*.
-           Available at: https://gist.github.com/anonymous/5184ba0bcab21d3dd19781efd3aae543
-    .. [2] Thomas Diewald. *Convex Hull 3D - Quickhull Algorithm*.
-           Available at: https://web.archive.org/web/20180106161310/http://thomasdiewald.com/blog/?p=1888
+    .. [1] Barber, C.B., Dobkin, D.P., and Huhdanpaa, H.T. *The Quickhull algorithm for convex hulls*.
+           ACM Transactions on Mathematical Software, 22(4):469-483, 1996.
 
     Examples
     --------
-    >>>
+    >>> points = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1], [0.1, 0.1, 0.1]]
+    >>> len(convex_hull(points))
+    4
 
     """
-    def _normal_face(face):
-        u = subtract_vectors(points[face[1]], points[face[0]])
-        v = subtract_vectors(points[face[-1]], points[face[0]])
-        return cross_vectors(u, v)
+    hull = IncrementalHull(points)
+    return hull.faces
+
 
-    def _seen(face, p):
-        normal = _normal_face(face)
-        vec = subtract_vectors(points[p], points[face[0]])
-        return (dot_vectors(normal, vec) >= 0)
+class IncrementalHull(object):
+    """Convex hull of a growing set of points, with the Quickhull algorithm.
 
-    def _bdry(faces):
-        bdry_fw = set([(face[i - 1], face[i]) for face in faces for i in range(len(face))])
-        bdry_bk = set([(face[i], face[i - 1]) for face in faces for i in range(len(face))])
-        return bdry_fw - bdry_bk
+    Parameters
+    ----------
+    points : list, optional
+        XYZ coordinates of the initial points.
+    tol : float, optional
+        The tolerance for the visibility of faces from points,
+        relative to the size of the point set.
+        Default is ``1e-9``.
+    numpy : bool, optional
+        If ``True``, assign large batches of points to the faces of the hull with NumPy.
+        Default is ``False``.
+
+    Attributes
+    ----------
+    points : list
+        The XYZ coordinates of all points that were added.
+    face : dict
+        The faces of the hull, as triangles of point indices, per face key.
+    plane : dict
+        The unit normal and the offset of the plane of every face, per face key.
+    halfedge : dict
+        The key of the face of every directed edge of the hull.
+    outside : dict
+        The indices of the points that are outside the hull,
+        per face key of a face from which they are visible.
 
-    def _add_point(hull, p):
-        seen_faces = [face for face in hull if _seen(face, p)]
+    Notes
+    -----
+    Every point outside the hull is assigned to one face that it can see.
+    The hull is grown by adding, per face, the point that is farthest from it.
+    The faces visible from that point are found by walking from the face across the edges of the hull,
+    and only the points assigned to the removed faces are reassigned to the new faces.
 
-        if len(seen_faces) == len(hull):
-            # if can see all faces, unsee ones looking "down"
-            normal = _normal_face(seen_faces[0])
-            seen_faces = [face for face in seen_faces if dot_vectors(_normal_face(face), normal) > 0]
+    The planes of the faces are computed once, when the faces are created.
 
-        for face in seen_faces:
-            hull.remove(face)
+    Examples
+    --------
+    >>> hull = IncrementalHull([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    >>> len(hull.faces)
+    4
+    >>> created, deleted = hull.add_points([[1, 1, 1], [0.1, 0.1, 0.1]])
+    >>> len(created), len(deleted)
+    (3, 1)
+    >>> len(hull.faces)
+    6
 
-        for edge in _bdry(seen_faces):
-            hull.append([edge[0], edge[1], p])
+    """
 
-    hull = [[0, 1, 2], [0, 2, 1]]
-    for i in range(3, len(points)):
-        _add_point(hull, i)
-    return hull
+    def __init__(self, points=None, tol=1e-9, numpy=False):
+        self.points = []
+        self.tol = tol
+        self.numpy = numpy
+        self.face = {}
+        self.plane = {}
+        self.halfedge = {}
+        self.outside = {}
+        self._max_face = -1
+        self._eps = 0.0
+        self._pending = []
+        if points:
+            self.add_points(points)
+
+    @property
+    def faces(self):
+        """list : The faces of the hull as lists of point indices."""
+        return [list(face) for face in self.face.values()]
+
+    @property
+    def vertices(self):
+        """list : The indices of the points on the hull."""
+        return sorted(set(index for face in self.face.values() for index in face))
+
+    # --------------------------------------------------------------------------
+    # faces
+    # --------------------------------------------------------------------------
+
+    def _add_face(self, a, b, c):
+        pa, pb, pc = self.points[a], self.points[b], self.points[c]
+        n = cross_vectors(subtract_vectors(pb, pa), subtract_vectors(pc, pa))
+        length = dot_vectors(n, n) ** 0.5
+        n = [n[0] / length, n[1] / length, n[2] / length]
+        self._max_face += 1
+        key = self._max_face
+        self.face[key] = (a, b, c)
+        self.plane[key] = n, dot_vectors(n, pa)
+        self.halfedge[a, b] = key
+        self.halfedge[b, c] = key
+        self.halfedge[c, a] = key
+        self.outside[key] = []
+        return key
+
+    def _remove_face(self, key):
+        a, b, c = self.face.pop(key)
+        del self.plane[key]
+        del self.halfedge[a, b]
+        del self.halfedge[b, c]
+        del self.halfedge[c, a]
+        return self.outside.pop(key)
+
+    def _distance(self, key, index):
+        n, d = self.plane[key]
+        x, y, z = self.points[index]
+        return n[0] * x + n[1] * y + n[2] * z - d
+
+    # --------------------------------------------------------------------------
+    # construction
+    # --------------------------------------------------------------------------
+
+    def _start(self):
+        """Construct the initial tetrahedron from the pending points, if they are not coplanar."""
+        indices = self._pending
+        points = self.points
+        extremes = []
+        for axis in range(3):
+            extremes.append(min(indices, key=lambda i: points[i][axis]))
+            extremes.append(max(indices, key=lambda i: points[i][axis]))
+        size = max(points[extremes[2 * axis + 1]][axis] - points[extremes[2 * axis]][axis] for axis in range(3))
+        scale = max(max(abs(value) for value in points[i]) for i in extremes)
+        self._eps = self.tol * max(size, scale, 1.0)
+
+        def distance2(i, j):
+            u = subtract_vectors(points[j], points[i])
+            return dot_vectors(u, u)
+
+        a, b = max(((i, j) for i in extremes for j in extremes), key=lambda ij: distance2(*ij))
+        ab = subtract_vectors(points[b], points[a])
+
+        def distance_line(i):
+            n = cross_vectors(ab, subtract_vectors(points[i], points[a]))
+            return dot_vectors(n, n)
+
+        c = max(indices, key=distance_line)
+        if distance_line(c) ** 0.5 <= self._eps * dot_vectors(ab, ab) ** 0.5:
+            return False
+        n = cross_vectors(ab, subtract_vectors(points[c], points[a]))
+        n = [value / dot_vectors(n, n) ** 0.5 for value in n]
+
+        def distance_plane(i):
+            return abs(dot_vectors(n, subtract_vectors(points[i], points[a])))
+
+        d = max(indices, key=distance_plane)
+        if distance_plane(d) <= self._eps:
+            return False
+
+        # the faces of the tetrahedron are oriented away from the opposite vertex
+        if dot_vectors(n, subtract_vectors(points[d], points[a])) > 0:
+            b, c = c, b
+        for face in ((a, b, c), (a, d, b), (b, d, c), (c, d, a)):
+            self._add_face(*face)
+
+        others = [i for i in indices if i not in (a, b, c, d)]
+        self._pending = []
+        self._assign(others, list(self.face))
+        return True
+
+    def _assign(self, indices, faces):
+        """Assign points to the face from which they are farthest, if they can see any of the faces."""
+        if self.numpy and len(indices) * len(faces) > 10000:
+            from compas.geometry.hull.hull_numpy import _farthest_visible_faces_numpy
+            planes = [self.plane[key] for key in faces]
+            visible = _farthest_visible_faces_numpy([self.points[i] for i in indices], planes, self._eps)
+            for i, f in zip(indices, visible):
+                if f >= 0:
+                    self.outside[faces[f]].append(i)
+            return
+        eps = self._eps
+        for i in indices:
+            best = eps
+            face = None
+            for key in faces:
+                d = self._distance(key, i)
+                if d > best:
+                    best = d
+                    face = key
+            if face is not None:
+                self.outside[face].append(i)
+
+    def _add_eye(self, key, eye):
+        """Add a point to the hull, starting from a face that is visible from the point."""
+        eps = self._eps
+        visible = {key: True}
+        stack = [key]
+        horizon = []
+        while stack:
+            f = stack.pop()
+            a, b, c = self.face[f]
+            for u, v in ((a, b), (b, c), (c, a)):
+                g = self.halfedge[v, u]
+                if g not in visible:
+                    visible[g] = self._distance(g, eye) > eps
+                    if visible[g]:
+                        stack.append(g)
+                if not visible[g]:
+                    horizon.append((u, v))
+        deleted = [f for f in visible if visible[f]]
+        orphans = []
+        for f in deleted:
+            orphans += self._remove_face(f)
+        created = [self._add_face(u, v, eye) for u, v in horizon]
+        self._assign([i for i in orphans if i != eye], created)
+        return created, deleted
+
+    def _grow(self, faces):
+        created = set()
+        deleted = set()
+        stack = [key for key in faces if self.outside.get(key)]
+        while stack:
+            key = stack.pop()
+            if key not in self.face or not self.outside[key]:
+                continue
+            eye = max(self.outside[key], key=lambda i: self._distance(key, i))
+            new, old = self._add_eye(key, eye)
+            created.update(new)
+            deleted.update(old)
+            stack += [f for f in new if self.outside[f]]
+        return created, deleted
+
+    def add_points(self, points):
+        """Add points to the hull.
+
+        Parameters
+        ----------
+        points : list
+            XYZ coordinates of the points.
+
+        Returns
+        -------
+        tuple
+            * The keys of the faces that were added to the hull.
+            * The keys of the faces that were removed from the hull.
+
+            Faces that were added and removed again by the same call are not reported.
+
+        Notes
+        -----
+        Points are kept pending until they define a hull that is not flat.
+
+        """
+        start = len(self.points)
+        self.points += [list(point) for point in points]
+        indices = list(range(start, len(self.points)))
+        if not self.face:
+            self._pending += indices
+            if len(self._pending) < 4 or not self._start():
+                return [], []
+            self._grow(list(self.face))
+            return sorted(self.face), []
+        self._assign(indices, list(self.face))
+        created, deleted = self._grow([key for key in self.face if self.outside[key]])
+        return sorted(created - deleted), sorted(deleted - created)
 
 
 def convex_hull_xy(points, strict=False):
@@ -156,41 +381,23 @@ def convex_hull_xy(points, strict=False):
 
 if __name__ == "__main__":
 
-    # import random
-    # from compas.utilities import flatten
-    # from compas.datastructures import Mesh
-    # from compas_viewers import MeshViewer
-    # from compas.topology import unify_cycles
-
-    # radius = 5
-    # origin = (0., 0., 0.)
-    # count = 0
-    # points = []
-
-    # while count < 1000:
-    #     x = (random.random() - 0.5) * radius * 2
-    #     y = (random.random() - 0.5) * radius * 2
-    #     z = (random.random() - 0.5) * radius * 2
-    #     pt = x, y, z
-
-    #     if distance_point_point(origin, pt) <= radius:
-    #         points.append(pt)
-    #         count += 1
-
-    # faces = convex_hull(points)
-    # vertices = list(set(flatten(faces)))
-
-    # i_index = {i: index for index, i in enumerate(vertices)}
+    import doctest
+    import random
+    import time
 
-    # vertices = [points[index] for index in vertices]
-    # faces = [[i_index[i] for i in face] for face in faces]
-    # faces = unify_cycles(vertices, faces)
+    doctest.testmod(globs=globals())
 
-    # mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    points = [[random.gauss(0, 1) for _ in range(3)] for _ in range(20000)]
 
-    # viewer = MeshViewer()
-    # viewer.mesh = mesh
-    # viewer.show()
+    t0 = time.time()
+    hull = IncrementalHull(points)
+    t1 = time.time()
+    hull = IncrementalHull(points, numpy=True)
+    t2 = time.time()
+    hull = IncrementalHull()
+    for i in range(0, len(points), 1000):
+        hull.add_points(points[i:i + 1000])
+    t3 = time.time()
 
-    import doctest
-    doctest.testmod(globs=globals())
+    print('faces: {}'.format(len(hull.faces)))
+    print('python {:.3f}s, numpy {:.3f}s, streaming {:.3f}s'.format(t1 - t0, t2 - t1, t3 - t2))
@@ -2,7 +2,9 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from numpy import arange
 from numpy import asarray
+from numpy import float64
 from scipy.spatial import ConvexHull
 
 
@@ -132,6 +134,39 @@ def convex_hull_xy_numpy(points):
     return hull.vertices, hull.simplices
 
 
+def _farthest_visible_faces_numpy(points, planes, eps, chunksize=10000):
+    """Find for every point the face of a hull from which it is farthest, among the faces it can see.
+
+    Parameters
+    ----------
+    points : list
+        XYZ coordinates of the points.
+    planes : list
+        The unit normal and the offset of the plane of every face.
+    eps : float
+        The minimum distance of a point to a face that can be seen from it.
+    chunksize : int, optional
+        The number of points per batch.
+
+    Returns
+    -------
+    array
+        The index of the face per point, or ``-1`` if the point is inside the hull.
+
+    """
+    points = asarray(points, dtype=float64).reshape((-1, 3))
+    normals = asarray([n for n, _ in planes], dtype=float64).reshape((-1, 3))
+    offsets = asarray([d for _, d in planes], dtype=float64)
+    faces = arange(points.shape[0])
+    step = max(1, chunksize * 100 // max(1, normals.shape[0]))
+    for i in range(0, points.shape[0], step):
+        distances = points[i:i + step].dot(normals.T) - offsets
+        best = distances.argmax(axis=1)
+        best[distances[arange(best.size), best] <= eps] = -1
+        faces[i:i + step] = best
+    return faces
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
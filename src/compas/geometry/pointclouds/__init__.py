@@ -2,6 +2,12 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+import compas
+
 from .pointcloud import *  # noqa: F401 F403
 
+if not compas.IPY:
+    from .pointcloud_numpy import *  # noqa: F401 F403
+    from .weld_numpy import *  # noqa: F401 F403
+
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -43,8 +43,9 @@ class Pointcloud(Primitive):
 
     @classmethod
     def from_ply(cls, filepath):
-        """Construct a pointcloud from a PLY file."""
-        pass
+        """Construct a pointcloud from the vertices of a PLY file."""
+        from compas.files import PLY
+        return cls(PLY(filepath).parser.vertices)
 
     @classmethod
     def from_pcd(cls, filepath):
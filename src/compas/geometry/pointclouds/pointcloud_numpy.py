@@ -0,0 +1,444 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import abs
+from numpy import asarray
+from numpy import bincount
+from numpy import einsum
+from numpy import empty
+from numpy import float64
+from numpy import floor
+from numpy import int64
+from numpy import matmul
+from numpy import sqrt
+from numpy import stack
+from numpy import unique
+from numpy.linalg import eigh
+from numpy.linalg import inv
+
+from compas.geometry import Box
+from compas.geometry import KDTreeNumpy
+from compas.geometry import Point
+from compas.geometry.pointclouds.pointcloud import Pointcloud
+
+
+__all__ = ['PointcloudNumpy']
+
+
+CHUNK_SIZE = 100000
+
+
+class PointcloudNumpy(Pointcloud):
+    """Point cloud backed by an array of coordinates and arrays of per-point attributes.
+
+    Parameters
+    ----------
+    points : array-like
+        The XYZ coordinates of the points.
+    point_attributes : dict, optional
+        Named arrays of per-point values, with one row per point.
+
+    Attributes
+    ----------
+    xyz : array
+        The ``(n, 3)`` array of the XYZ coordinates of the points.
+    point_attributes : dict
+        Named arrays of per-point values, with one row per point,
+        for example ``'normals'``, ``'intensity'`` or ``'color'``.
+    tree : :class:`compas.geometry.KDTreeNumpy`, read-only
+        A tree of the points for nearest neighbor searches.
+        The tree is built on first use, and rebuilt after the points have changed.
+
+    Notes
+    -----
+    The cloud has the same interface as :class:`compas.geometry.Pointcloud`,
+    but :class:`compas.geometry.Point` objects are only created when they are accessed individually,
+    or through :attr:`points`.
+    All other operations work on the arrays directly.
+    Filters, such as :meth:`crop` and :meth:`voxel_downsample`, return a new cloud,
+    with the point attributes of the remaining points.
+
+    Examples
+    --------
+    >>> cloud = PointcloudNumpy([[0, 0, 0], [0.1, 0, 0], [1, 0, 0], [1, 1, 0]], {'intensity': [1, 2, 3, 4]})
+    >>> cloud.voxel_downsample(0.5).xyz.tolist()
+    [[0.05, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]]
+    >>> cloud.crop([[0.5, -1, -1], [2, 0.5, 1]]).point_attributes['intensity'].tolist()
+    [3]
+
+    """
+
+    def __init__(self, points, point_attributes=None):
+        self._xyz = None
+        self._tree = None
+        self.point_attributes = {}
+        super(PointcloudNumpy, self).__init__(points)
+        if point_attributes:
+            for name, values in point_attributes.items():
+                self.set_point_attribute(name, values)
+
+    @property
+    def data(self):
+        return {'points': self._xyz.tolist(),
+                'point_attributes': {name: values.tolist() for name, values in self.point_attributes.items()}}
+
+    @data.setter
+    def data(self, data):
+        self.points = data['points']
+        self.point_attributes = {}
+        for name, values in data.get('point_attributes', {}).items():
+            self.set_point_attribute(name, values)
+
+    @property
+    def xyz(self):
+        return self._xyz
+
+    @xyz.setter
+    def xyz(self, xyz):
+        self._xyz = asarray(xyz, dtype=float64).reshape((-1, 3))
+        self._tree = None
+
+    @property
+    def points(self):
+        return [Point(*xyz) for xyz in self._xyz.tolist()]
+
+    @points.setter
+    def points(self, points):
+        self.xyz = points
+
+    @property
+    def tree(self):
+        if self._tree is None:
+            self._tree = KDTreeNumpy(self._xyz)
+        return self._tree
+
+    @classmethod
+    def from_data(cls, data):
+        return cls(data['points'], data.get('point_attributes'))
+
+    @classmethod
+    def from_las(cls, filepath, box=None, classes=None, step=1):
+        """Construct a point cloud from the points of a LAS file.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the file.
+        box : list, optional
+            The XYZ coordinates of the corners of a box.
+            Only the points inside the axis-aligned bounding box of the corners are read.
+        classes : list, optional
+            Only read the points with one of these classifications.
+        step : int, optional
+            Only read every ``step``-th point of the file.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointcloudNumpy`
+            A cloud with the point attributes of the file,
+            such as ``'intensity'``, ``'classification'`` and ``'color'``.
+
+        """
+        from compas.files import LASReaderNumpy
+        points = LASReaderNumpy(filepath).read_points(box=box, classes=classes, step=step)
+        xyz = points.pop('xyz')
+        return cls(xyz, points)
+
+    @classmethod
+    def from_ply(cls, filepath):
+        """Construct a point cloud from the vertices of a PLY file.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the file.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointcloudNumpy`
+            A cloud with the properties of the vertices as point attributes.
+            The properties ``nx``, ``ny`` and ``nz`` are combined into ``'normals'``,
+            and ``red``, ``green`` and ``blue`` into ``'color'``.
+
+        """
+        from compas.files import PLYReaderNumpy
+        data = dict(PLYReaderNumpy(filepath).vertex_data)
+        xyz = stack([data.pop(name) for name in 'xyz'], axis=1)
+        point_attributes = {}
+        for name, components in (('normals', ('nx', 'ny', 'nz')), ('color', ('red', 'green', 'blue'))):
+            if all(component in data for component in components):
+                point_attributes[name] = stack([data.pop(component) for component in components], axis=1)
+        point_attributes.update(data)
+        return cls(xyz, point_attributes)
+
+    def __repr__(self):
+        return 'PointcloudNumpy({} points)'.format(len(self))
+
+    def __len__(self):
+        return self._xyz.shape[0]
+
+    def __getitem__(self, key):
+        if key > len(self) - 1:
+            raise KeyError
+        return Point(*self._xyz[key].tolist())
+
+    def __setitem__(self, key, value):
+        if key > len(self) - 1:
+            raise KeyError
+        self._xyz[key] = value
+        self._tree = None
+
+    def __iter__(self):
+        return (Point(*xyz) for xyz in self._xyz.tolist())
+
+    # --------------------------------------------------------------------------
+    # attributes
+    # --------------------------------------------------------------------------
+
+    def set_point_attribute(self, name, values):
+        """Set the values of an attribute of all points.
+
+        Parameters
+        ----------
+        name : str
+            The name of the attribute.
+        values : array-like
+            The values, with one row per point.
+
+        """
+        values = asarray(values)
+        if values.shape[:1] != (len(self), ):
+            raise ValueError('Expected {} values for attribute {}, got {}.'.format(len(self), name, values.shape[:1]))
+        self.point_attributes[name] = values
+
+    def select(self, indices):
+        """Construct a point cloud from a selection of the points.
+
+        Parameters
+        ----------
+        indices : array-like or slice
+            The indices of the selected points, or a boolean mask.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointcloudNumpy`
+
+        """
+        cloud = type(self)(self._xyz[indices])
+        cloud.point_attributes = {name: values[indices] for name, values in self.point_attributes.items()}
+        return cloud
+
+    def copy(self):
+        cloud = type(self)(self._xyz.copy())
+        cloud.point_attributes = {name: values.copy() for name, values in self.point_attributes.items()}
+        return cloud
+
+    # --------------------------------------------------------------------------
+    # geometry
+    # --------------------------------------------------------------------------
+
+    @property
+    def centroid(self):
+        return self._xyz.mean(axis=0).tolist()
+
+    @property
+    def bounding_box(self):
+        (xmin, ymin, zmin), (xmax, ymax, zmax) = self._xyz.min(axis=0).tolist(), self._xyz.max(axis=0).tolist()
+        return [[xmin, ymin, zmin],
+                [xmax, ymin, zmin],
+                [xmax, ymax, zmin],
+                [xmin, ymax, zmin],
+                [xmin, ymin, zmax],
+                [xmax, ymin, zmax],
+                [xmax, ymax, zmax],
+                [xmin, ymax, zmax]]
+
+    def transform(self, T):
+        """Transform the points, and the normals if the cloud has them.
+
+        Parameters
+        ----------
+        T : :class:`compas.geometry.Transformation` or list of list
+            The transformation matrix.
+
+        """
+        M = asarray(T, dtype=float64)
+        xyz = self._xyz.dot(M[:3, :3].T)
+        xyz += M[:3, 3]
+        if (M[3, :3] != 0).any() or M[3, 3] != 1:
+            xyz /= (self._xyz.dot(M[3, :3]) + M[3, 3])[:, None]
+        self.xyz = xyz
+        if 'normals' in self.point_attributes:
+            normals = self.point_attributes['normals'].dot(inv(M[:3, :3]))
+            self.point_attributes['normals'] = _normalize(normals)
+
+    def crop(self, box):
+        """Construct a point cloud from the points inside a box.
+
+        Parameters
+        ----------
+        box : :class:`compas.geometry.Box` or list
+            A box, or the XYZ coordinates of the corners of an axis-aligned box,
+            for example two opposite corners, or the eight corners of :attr:`bounding_box`.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointcloudNumpy`
+
+        """
+        if isinstance(box, Box):
+            frame = box.frame
+            axes = asarray([frame.xaxis, frame.yaxis, frame.zaxis], dtype=float64)
+            local = (self._xyz - asarray(frame.point, dtype=float64)).dot(axes.T)
+            half = 0.5 * asarray([box.xsize, box.ysize, box.zsize], dtype=float64)
+            inside = (abs(local) <= half).all(axis=1)
+        else:
+            corners = asarray(box, dtype=float64).reshape((-1, 3))
+            inside = ((self._xyz >= corners.min(axis=0)) & (self._xyz <= corners.max(axis=0))).all(axis=1)
+        return self.select(inside)
+
+    def voxel_downsample(self, size):
+        """Construct a point cloud with one point per occupied cell of a regular grid.
+
+        Parameters
+        ----------
+        size : float
+            The size of the cells of the grid.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointcloudNumpy`
+            The centroids of the points per cell, in the order of the cells along X, Y and Z.
+            Floating point attributes are averaged per cell, and normals are normalized after averaging.
+            Other attributes, for example classifications, are taken from the first point of every cell.
+
+        """
+        if not len(self):
+            return self.copy()
+        cells = floor((self._xyz - self._xyz.min(axis=0)) / size).astype(int64)
+        shape = (cells.max(axis=0) + 1).tolist()
+        if shape[0] * shape[1] * shape[2] < 2 ** 62:
+            keys = (cells[:, 0] * shape[1] + cells[:, 1]) * shape[2] + cells[:, 2]
+            _, first, inverse = unique(keys, return_index=True, return_inverse=True)
+        else:
+            _, first, inverse = unique(cells, axis=0, return_index=True, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        count = bincount(inverse).astype(float64)
+
+        def average(values):
+            columns = values.reshape((values.shape[0], -1))
+            means = stack([bincount(inverse, weights=column) for column in columns.T], axis=1) / count[:, None]
+            return means.reshape((-1, ) + values.shape[1:])
+
+        cloud = type(self)(average(self._xyz))
+        for name, values in self.point_attributes.items():
+            if values.dtype.kind == 'f':
+                values = average(values)
+                if name == 'normals':
+                    values = _normalize(values)
+                cloud.point_attributes[name] = values
+            else:
+                cloud.point_attributes[name] = values[first]
+        return cloud
+
+    def _neighbors(self, k):
+        """Find the ``k`` nearest neighbors of all points, per chunk of points.
+
+        Yields the start of the chunk, and the distances and indices of the neighbors.
+        The first neighbor of a point is the point itself.
+        The neighbors of the points of a chunk are searched on all available processors.
+        """
+        tree = self.tree
+        for start in range(0, len(self), CHUNK_SIZE):
+            distances, indices = tree.query(self._xyz[start:start + CHUNK_SIZE], k, workers=-1)
+            yield start, distances, indices
+
+    def statistical_outlier_removal(self, k=20, ratio=2.0):
+        """Construct a point cloud without the points that are far from their neighbors.
+
+        Parameters
+        ----------
+        k : int, optional
+            The number of neighbors of every point.
+            Default is ``20``.
+        ratio : float, optional
+            The number of standard deviations of the mean distances to the neighbors,
+            above which points are outliers.
+            Default is ``2.0``.
+
+        Returns
+        -------
+        :class:`compas.geometry.PointcloudNumpy`
+
+        Notes
+        -----
+        A point is an outlier if the mean distance to its neighbors is larger than
+        the mean of these distances over all points plus ``ratio`` times their standard deviation.
+        The nearest neighbors are searched on all available processors.
+
+        """
+        n = len(self)
+        k = min(k, n - 1)
+        if k < 1:
+            return self.copy()
+        mean = empty(n, dtype=float64)
+        for start, distances, _ in self._neighbors(k + 1):
+            mean[start:start + distances.shape[0]] = distances[:, 1:].mean(axis=1)
+        return self.select(mean <= mean.mean() + ratio * mean.std())
+
+    def estimate_normals(self, k=16, viewpoint=None):
+        """Estimate the normals of the points from their nearest neighbors.
+
+        Parameters
+        ----------
+        k : int, optional
+            The number of neighbors of every point, including the point itself.
+            Default is ``16``.
+        viewpoint : list, optional
+            The XYZ coordinates of a point towards which the normals are oriented,
+            for example the position of the scanner.
+            By default, the orientation of the normals is arbitrary.
+
+        Returns
+        -------
+        array
+            The ``(n, 3)`` array of unit normals,
+            which is also stored as the point attribute ``'normals'``.
+
+        Notes
+        -----
+        The normal of a point is the direction of least variance of the point and its neighbors,
+        that is, the eigenvector of the smallest eigenvalue of their covariance matrix.
+        The nearest neighbors are searched on all available processors.
+
+        """
+        n = len(self)
+        k = min(k, n)
+        normals = empty((n, 3), dtype=float64)
+        for start, _, indices in self._neighbors(k):
+            neighbors = self._xyz[indices]
+            neighbors -= neighbors.mean(axis=1)[:, None, :]
+            _, vectors = eigh(matmul(neighbors.transpose((0, 2, 1)), neighbors))
+            normals[start:start + indices.shape[0]] = vectors[:, :, 0]
+        if viewpoint is not None:
+            away = einsum('ij,ij->i', normals, asarray(viewpoint, dtype=float64) - self._xyz) < 0
+            normals[away] *= -1
+        self.point_attributes['normals'] = normals
+        return normals
+
+
+def _normalize(vectors):
+    lengths = sqrt(einsum('ij,ij->i', vectors, vectors))
+    lengths[lengths == 0] = 1.0
+    return vectors / lengths[:, None]
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+    doctest.testmod(globs=globals())
@@ -0,0 +1,110 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from numpy import arange
+from numpy import argsort
+from numpy import asarray
+from numpy import concatenate
+from numpy import empty
+from numpy import flatnonzero
+from numpy import float64
+from numpy import floor
+from numpy import int64
+from numpy import ones
+from numpy import unique
+
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+import compas
+from compas.utilities import weld_points
+
+
+__all__ = [
+    'weld_points_numpy',
+]
+
+
+def weld_points_numpy(points, precision=None, tolerance=None):
+    """Identify groups of points with the same coordinates up to a given precision.
+
+    Parameters
+    ----------
+    points : array-like
+        XYZ coordinates of the points.
+    precision : str, optional
+        The precision of the coordinates, with the same meaning as for :func:`compas.utilities.geometric_key`.
+        Default is ``None``, in which case the global precision setting will be used (``compas.PRECISION``).
+    tolerance : float, optional
+        If provided, groups with points that are closer to each other than this distance are merged,
+        also if their coordinates differ up to the given precision.
+        Default is ``None``.
+
+    Returns
+    -------
+    tuple
+        * For every point, the index of its group.
+          The groups are numbered in order of first occurrence.
+        * For every group, the index of its last point.
+
+    Notes
+    -----
+    This is the array version of :func:`compas.utilities.weld_points`, with identical results.
+    The coordinates are quantised to integer grid cells and the groups are identified
+    with :func:`numpy.unique`. Close points are found with :class:`scipy.spatial.cKDTree`.
+
+    Examples
+    --------
+    >>> points = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0001, 0.0, 0.0], [1.0, 0.0, 0.01]]
+    >>> index, last = weld_points_numpy(points, '3f')
+    >>> index.tolist(), last.tolist()
+    ([0, 1, 0, 2], [2, 1, 3])
+
+    """
+    xyz = asarray(points, dtype=float64).reshape((-1, 3))
+    if not xyz.shape[0]:
+        return empty(0, dtype=int64), empty(0, dtype=int64)
+
+    if not precision:
+        precision = compas.PRECISION
+    if precision == 'd':
+        cells = xyz.astype(int64)
+    elif precision[-1] == 'f' and precision[:-1].isdigit():
+        cells = floor(xyz * 10.0 ** int(precision[:-1]) + 0.5).astype(int64)
+    else:
+        index, last = weld_points(xyz.tolist(), precision)
+        cells = None
+
+    if cells is not None:
+        _, first, inverse = unique(cells, axis=0, return_index=True, return_inverse=True)
+        index = _renumber(inverse.reshape(-1), first)
+
+    index = asarray(index, dtype=int64)
+    if tolerance:
+        pairs = cKDTree(xyz).query_pairs(tolerance, output_type='ndarray')
+        n = int(index.max()) + 1
+        # the groups are connected by the pairs of close points
+        graph = coo_matrix((ones(len(pairs)), (index[pairs[:, 0]], index[pairs[:, 1]])), shape=(n, n))
+        _, labels = connected_components(graph, directed=False)
+        # the first group of every component has the smallest index
+        _, first = unique(labels, return_index=True)
+        index = _renumber(labels, first)[index]
+
+    return index, _last(index)
+
+
+def _renumber(labels, first):
+    """Renumber labels in order of the first occurrence of each label."""
+    order = argsort(first, kind='stable')
+    rank = empty(order.size, dtype=int64)
+    rank[order] = arange(order.size)
+    return rank[labels]
+
+
+def _last(index):
+    """The last occurrence of every value of an index."""
+    ordered = argsort(index, kind='stable')
+    values = index[ordered]
+    return ordered[flatnonzero(concatenate((values[1:] != values[:-1], [True])))]
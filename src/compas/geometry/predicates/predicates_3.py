@@ -10,8 +10,6 @@ from .._core import subtract_vectors
 from .._core import cross_vectors
 from .._core import dot_vectors
 from .._core import normalize_vector
-from .._core import centroid_points
-from .._core import normal_polygon
 from .._core import length_vector_sqrd
 
 from .._core import distance_point_point
@@ -694,11 +692,61 @@ def is_point_in_polyhedron(point, polyhedron):
     bool
         True, if the point lies in the polyhedron.
         False, otherwise.
+
+    Notes
+    -----
+    The polyhedron should be closed, but does not have to be convex.
+    A ray is cast from the point, and the point lies inside if the ray crosses the faces of the polyhedron
+    an odd number of times.
+    The faces are split into triangles around their first vertex,
+    which gives the same parity as the face itself, also if the face is not convex.
+    Points outside the bounding box of the vertices are rejected without casting a ray.
+    For many points, use :meth:`compas.datastructures.RayMesh.contains`,
+    which counts the crossings of all points at once.
+
+    Examples
+    --------
+    >>> vertices = [[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [1, 1, 1]]
+    >>> faces = [[3, 2, 1, 0], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]]
+    >>> is_point_in_polyhedron([1, 1, 0.5], (vertices, faces))
+    True
+    >>> is_point_in_polyhedron([0.1, 0.1, 0.5], (vertices, faces))
+    False
+
     """
     vertices, faces = polyhedron
-    polygons = [[vertices[index] for index in face] for face in faces]
-    planes = [[centroid_points(polygon), normal_polygon(polygon)] for polygon in polygons]
-    return all(is_point_behind_plane(point, plane) for plane in planes)
+    # points outside the bounding box need no rays
+    for i, coordinates in enumerate(zip(*vertices)):
+        if point[i] < min(coordinates) or point[i] > max(coordinates):
+            return False
+    # a direction that is unlikely to pass exactly through the edges or vertices
+    # of polyhedra that are aligned with the coordinate axes
+    # the crossings with the triangles are computed with the Moeller-Trumbore algorithm
+    dx, dy, dz = 0.5772, 0.5784, 0.5764
+    x, y, z = point[0], point[1], point[2]
+    crossings = 0
+    for face in faces:
+        ax, ay, az = vertices[face[0]]
+        sx, sy, sz = x - ax, y - ay, z - az
+        for i in range(1, len(face) - 1):
+            bx, by, bz = vertices[face[i]]
+            cx, cy, cz = vertices[face[i + 1]]
+            e1x, e1y, e1z = bx - ax, by - ay, bz - az
+            e2x, e2y, e2z = cx - ax, cy - ay, cz - az
+            px, py, pz = dy * e2z - dz * e2y, dz * e2x - dx * e2z, dx * e2y - dy * e2x
+            det = e1x * px + e1y * py + e1z * pz
+            if det == 0:
+                continue
+            u = (sx * px + sy * py + sz * pz) / det
+            if u < 0 or u > 1:
+                continue
+            qx, qy, qz = sy * e1z - sz * e1y, sz * e1x - sx * e1z, sx * e1y - sy * e1x
+            v = (dx * qx + dy * qy + dz * qz) / det
+            if v < 0 or u + v > 1:
+                continue
+            if (e2x * qx + e2y * qy + e2z * qz) / det > 0:
+                crossings += 1
+    return crossings % 2 == 1
 
 
 # ==============================================================================
@@ -10,10 +10,6 @@ from compas.geometry import add_vectors
 from compas.geometry import bounding_box
 
 from compas.geometry import is_point_in_polygon_xy
-from compas.geometry import is_point_in_triangle_xy
-from compas.geometry import is_point_in_circle_xy
-
-from compas.geometry import circle_from_points_xy
 
 
 __all__ = [
@@ -32,30 +28,46 @@ def delaunay_from_points(points, boundary=None, holes=None, tiny=1e-12):
         list of ordered points describing the outer boundary (optional)
     holes : list of sequences of tuples
         list of polygons (ordered points describing internal holes (optional)
+    tiny : float, optional
+        The size of the random perturbation of the points,
+        to avoid numerical issues for perfectly structured point sets.
+        Default is ``1e-12``.
 
     Returns
     -------
     list
         The faces of the triangulation.
         Each face is a triplet of indices referring to the list of point coordinates.
+        The faces are oriented counterclockwise.
 
     Notes
     -----
-    For more info, see [1]_.
+    The points are inserted one by one in a triangle that contains all points,
+    and the Delaunay property is restored with edge flips after every insertion [1]_.
+
+    The triangles are stored in flat lists of vertex indices and neighbor indices.
+    The triangle containing a new point is found by walking through the triangulation [2]_,
+    from the last triangle or from a vertex that was inserted earlier in the same cell of a grid, whichever is closer.
+    The points are inserted in rounds of increasing size, in random order,
+    and sorted along a Hilbert curve per round, which keeps the walks short [3]_.
 
     References
     ----------
     .. [1] Sloan, S. W., 1987 *A fast algorithm for constructing Delaunay triangulations in the plane*
            Advances in Engineering Software 9(1): 34-55, 1978.
+    .. [2] Devillers, O., Pion, S. and Teillaud, M., 2002 *Walking in a triangulation*.
+           International Journal of Foundations of Computer Science 13(2): 181-199.
+    .. [3] Amenta, N., Choi, S. and Rote, G., 2003 *Incremental constructions con BRIO*.
+           Proceedings of the 19th Annual Symposium on Computational Geometry: 211-219.
 
     Examples
     --------
-    >>>
+    >>> points = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0.5, 0.5, 0]]
+    >>> faces = delaunay_from_points(points)
+    >>> len(faces)
+    4
 
     """
-    from compas.datastructures import Mesh
-    from compas.datastructures import trimesh_swap_edge
-
     def super_triangle(coords, ccw=True):
         centpt = centroid_points(coords)
         bbpts = bounding_box(coords)
@@ -71,76 +83,201 @@ def delaunay_from_points(points, boundary=None, holes=None, tiny=1e-12):
             return pt1, pt3, pt2
         return pt1, pt2, pt3
 
-    mesh = Mesh()
+    n = len(points)
+    if n < 3:
+        return []
 
     # to avoid numerical issues for perfectly structured point sets
     points = [(point[0] + random.uniform(-tiny, tiny), point[1] + random.uniform(-tiny, tiny), 0.0) for point in points]
 
-    # create super triangle
-    pt1, pt2, pt3 = super_triangle(points)
-
-    # add super triangle vertices to mesh
-    n = len(points)
-    super_keys = n, n + 1, n + 2
-
-    mesh.add_vertex(super_keys[0], {'x': pt1[0], 'y': pt1[1], 'z': pt1[2]})
-    mesh.add_vertex(super_keys[1], {'x': pt2[0], 'y': pt2[1], 'z': pt2[2]})
-    mesh.add_vertex(super_keys[2], {'x': pt3[0], 'y': pt3[1], 'z': pt3[2]})
-
-    mesh.add_face(super_keys)
-
-    # iterate over points
-    for key, point in enumerate(points):
-        # newtris should be intialised here
-
-        # check in which triangle this point falls
-        for fkey in list(mesh.faces()):
-            abc = mesh.face_coordinates(fkey)
-
-            if is_point_in_triangle_xy(point, abc, True):
-                # generate 3 new triangles (faces) and delete surrounding triangle
-                key, newtris = mesh.insert_vertex(fkey, key=key, xyz=point, return_fkeys=True)
-                break
-
-        while newtris:
-            fkey = newtris.pop()
-
-            face = mesh.face_vertices(fkey)
-            i = face.index(key)
-            u = face[i - 2]
-            v = face[i - 1]
-
-            nbr = mesh.halfedge[v][u]
-
-            if nbr is not None:
-                a, b, c = mesh.face_coordinates(nbr)
-                circle = circle_from_points_xy(a, b, c)
-
-                if is_point_in_circle_xy(point, circle):
-                    fkey, nbr = trimesh_swap_edge(mesh, u, v)
-                    newtris.append(fkey)
-                    newtris.append(nbr)
-
-    # Delete faces adjacent to supertriangle
-    for key in super_keys:
-        mesh.delete_vertex(key)
+    X = [point[0] for point in points]
+    Y = [point[1] for point in points]
+    for point in super_triangle(points):
+        X.append(point[0])
+        Y.append(point[1])
+
+    # the vertices of every triangle, counterclockwise,
+    # and the neighbor opposite to every vertex
+    V = [n, n + 1, n + 2]
+    N = [-1, -1, -1]
+    vertex_triangle = [0] * (n + 3)
+
+    def incircle(t, x, y):
+        i = 3 * t
+        ax = X[V[i]] - x
+        ay = Y[V[i]] - y
+        bx = X[V[i + 1]] - x
+        by = Y[V[i + 1]] - y
+        cx = X[V[i + 2]] - x
+        cy = Y[V[i + 2]] - y
+        return ((ax * ax + ay * ay) * (bx * cy - cx * by) -
+                (bx * bx + by * by) * (ax * cy - cx * ay) +
+                (cx * cx + cy * cy) * (ax * by - bx * ay)) > 0
+
+    def locate(t, x, y):
+        # a visibility walk, which starts testing the edges of a triangle
+        # at the edge through which it was entered, to avoid cycles
+        k = 0
+        while True:
+            i = 3 * t
+            for j in (k, k + 1, k + 2):
+                j %= 3
+                u = V[i + (j + 1) % 3]
+                v = V[i + (j + 2) % 3]
+                if (X[v] - X[u]) * (y - Y[u]) - (Y[v] - Y[u]) * (x - X[u]) < 0:
+                    s = N[i + j]
+                    k = N[3 * s:3 * s + 3].index(t) + 1
+                    t = s
+                    break
+            else:
+                return t
+
+    def write(t, a, b, c, na, nb, nc):
+        i = 3 * t
+        V[i:i + 3] = a, b, c
+        N[i:i + 3] = na, nb, nc
+        vertex_triangle[a] = vertex_triangle[b] = vertex_triangle[c] = t
+
+    def relink(s, old, new):
+        if s != -1:
+            i = 3 * s
+            N[i + N[i:i + 3].index(old)] = new
+
+    grid = _Grid(X[:n], Y[:n])
+    last = 0
+    lastkey = None
+
+    for key in _brio(X[:n], Y[:n]):
+        x = X[key]
+        y = Y[key]
+
+        # jump to the closest of the last vertex and the last vertex in the same cell
+        start = last
+        cell = grid.cell(x, y)
+        other = grid.vertex.get(cell)
+        if other is not None and lastkey is not None:
+            if (X[other] - x) ** 2 + (Y[other] - y) ** 2 < (X[lastkey] - x) ** 2 + (Y[lastkey] - y) ** 2:
+                start = vertex_triangle[other]
+        grid.vertex[cell] = key
+        lastkey = key
+
+        # split the triangle containing the point
+        t = locate(start, x, y)
+        i = 3 * t
+        a, b, c = V[i:i + 3]
+        na, nb, nc = N[i:i + 3]
+        t1 = len(V) // 3
+        t2 = t1 + 1
+        V += [0, 0, 0, 0, 0, 0]
+        N += [0, 0, 0, 0, 0, 0]
+        write(t, key, a, b, nc, t1, t2)
+        write(t1, key, b, c, na, t2, t)
+        write(t2, key, c, a, nb, t, t1)
+        relink(na, t, t1)
+        relink(nb, t, t2)
+
+        # flip the edges opposite to the new vertex until all triangles are delaunay
+        stack = [t, t1, t2]
+        while stack:
+            t = stack.pop()
+            i = 3 * t
+            s = N[i]
+            if s == -1:
+                continue
+            p, u, v = V[i:i + 3]
+            j = 3 * s
+            k = N[j:j + 3].index(t)
+            q = V[j + k]
+            if not incircle(t, X[q], Y[q]):
+                continue
+            # the neighbors across the edges (u, q) and (q, v) of s
+            # and across the edges (p, u) and (v, p) of t
+            su = N[j + (k + 1) % 3]
+            sv = N[j + (k + 2) % 3]
+            tu = N[i + 2]
+            tv = N[i + 1]
+            write(t, p, u, q, su, s, tu)
+            write(s, p, q, v, sv, tv, t)
+            relink(su, s, t)
+            relink(tv, t, s)
+            stack.append(t)
+            stack.append(s)
+        last = t
+
+    faces = []
+    for i in range(0, len(V), 3):
+        a, b, c = V[i:i + 3]
+        if a < n and b < n and c < n:
+            faces.append([a, b, c])
 
     # Delete faces outside of boundary
     if boundary:
-        for fkey in list(mesh.faces()):
-            centroid = mesh.face_centroid(fkey)
-            if not is_point_in_polygon_xy(centroid, boundary):
-                mesh.delete_face(fkey)
+        faces = [face for face in faces if is_point_in_polygon_xy(centroid_points([points[i] for i in face]), boundary)]
 
     # Delete faces inside of inside boundaries
     if holes:
         for polygon in holes:
-            for fkey in list(mesh.faces()):
-                centroid = mesh.face_centroid(fkey)
-                if is_point_in_polygon_xy(centroid, polygon):
-                    mesh.delete_face(fkey)
-
-    return [mesh.face_vertices(fkey) for fkey in mesh.faces()]
+            faces = [face for face in faces if not is_point_in_polygon_xy(centroid_points([points[i] for i in face]), polygon)]
+
+    return faces
+
+
+class _Grid(object):
+    """A uniform grid over a set of points, with about two points per cell."""
+
+    def __init__(self, X, Y):
+        self.xmin = min(X)
+        self.ymin = min(Y)
+        dx = max(X) - self.xmin
+        dy = max(Y) - self.ymin
+        size = max(((dx * dy) * 2.0 / len(X)) ** 0.5, max(dx, dy) / len(X), 1e-300)
+        self.size = size
+        self.vertex = {}
+
+    def cell(self, x, y):
+        return int((x - self.xmin) / self.size), int((y - self.ymin) / self.size)
+
+
+def _hilbert(bits, x, y):
+    """The distance along a Hilbert curve of a cell of a grid of size ``2 ** bits``."""
+    d = 0
+    s = 1 << (bits - 1)
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        if not ry:
+            if rx:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+
+def _brio(X, Y):
+    """Order points for insertion in rounds of random points of increasing size, sorted along a Hilbert curve."""
+    n = len(X)
+    bits = 1
+    while 4 ** bits < n and bits < 16:
+        bits += 1
+    cells = (1 << bits) - 1
+    xmin = min(X)
+    ymin = min(Y)
+    scale = cells / max(max(X) - xmin, max(Y) - ymin, 1e-300)
+    keys = [_hilbert(bits, int((x - xmin) * scale), int((y - ymin) * scale)) for x, y in zip(X, Y)]
+    indices = list(range(n))
+    random.shuffle(indices)
+    rounds = []
+    while len(indices) > 64:
+        half = len(indices) // 2
+        rounds.append(indices[half:])
+        indices = indices[:half]
+    rounds.append(indices)
+    order = []
+    for indices in reversed(rounds):
+        order += sorted(indices, key=keys.__getitem__)
+    return order
 
 
 # def voronoi_from_delaunay(delaunay):
@@ -225,4 +362,13 @@ def delaunay_from_points(points, boundary=None, holes=None, tiny=1e-12):
 if __name__ == "__main__":
 
     import doctest
+    import time
+
     doctest.testmod(globs=globals())
+
+    for n in (1000, 10000, 100000):
+        points = [[random.random(), random.random(), 0.0] for _ in range(n)]
+        t0 = time.time()
+        faces = delaunay_from_points(points)
+        t1 = time.time()
+        print('points: {}, faces: {}, {:.3f}s'.format(n, len(faces), t1 - t0))
@@ -16,6 +16,7 @@ Solvers
     dr
     dr_numpy
     fd_numpy
+    FDSolver
     ga
     moga
     pca_numpy
@@ -4,13 +4,17 @@ from __future__ import print_function
 
 from numpy import arccos
 from numpy import array
+from numpy import asarray
 from numpy import cross
 from numpy import float64
+from numpy import flatnonzero
 from numpy import int32
 from numpy import isnan
 from numpy import mean
 from numpy import newaxis
+from numpy import ones
 from numpy import sin
+from numpy import sqrt
 from numpy import sum
 from numpy import tile
 from numpy import zeros
@@ -25,7 +29,10 @@ from compas.numerical import uvw_lengths
 from time import time
 
 
-__all__ = ['drx_numpy']
+__all__ = [
+    'drx_numpy',
+    'DRXSolver',
+]
 
 
 def drx_numpy(structure, factor=1.0, tol=0.1, steps=10000, refresh=100, update=False, callback=None, **kwargs):
@@ -201,6 +208,229 @@ def drx_solver_numpy(tol, steps, factor, C, Ct, X, M, k0, l0, f0, ind_c, ind_t,
     return X, f, l
 
 
+class DRXSolver(object):
+    """Dynamic relaxation solver for many load cases of the same structure.
+
+    Parameters
+    ----------
+    structure : compas.datastructures.Datastructure
+        The structure to analyse, with the same attributes as for :func:`drx_numpy`.
+    factor : float, optional
+        Convergence factor.
+        Default is ``1.0``.
+
+    Attributes
+    ----------
+    X : array
+        The nodal co-ordinates of the last solution of :meth:`solve`,
+        or the initial co-ordinates of the structure.
+    P : array
+        The nodal loads of the structure.
+    f0 : array
+        The initial edge forces (prestress) of the structure.
+
+    Notes
+    -----
+    The connectivity matrices, stiffnesses and initial lengths are assembled once.
+    Load cases and prestress cases only change the loads, the initial forces and the nodal masses.
+
+    By default, every analysis starts from the last solution (warm start),
+    which reduces the number of steps if the cases differ only slightly,
+    for example in a parametric study.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        solver = DRXSolver(network)
+        X, f, l = solver.solve()
+        X, f, l = solver.solve_many(loads=[P1, P2, P3])
+
+    """
+
+    def __init__(self, structure, factor=1.0):
+        X, B, P, S, V, E, A, C, Ct, f0, l0, ind_c, ind_t, u, v, M, k0, m, n, rows, cols, vals, nv = _create_arrays(structure)
+        inds, indi, indf, EIx, EIy, beams = _beam_data(structure)
+        self.structure = structure
+        self.factor = factor
+        self.X0 = X
+        self.X = X.copy()
+        self.B = B
+        self.P = P
+        self.C = C
+        self.Ct = Ct
+        self.Ca = abs(Ct)
+        self.f0 = f0
+        self.l0 = l0
+        self.k0 = k0
+        self.ind_c = ind_c
+        self.ind_t = ind_t
+        self.beams = beams
+        self.inds = inds
+        self.indi = indi
+        self.indf = indf
+        self.EIx = EIx.reshape(-1, 1)
+        self.EIy = EIy.reshape(-1, 1)
+        self._X = None
+
+    def reset(self):
+        """Restore the initial co-ordinates of the structure as starting point of the next analysis."""
+        self.X = self.X0.copy()
+        self._X = None
+
+    def solve(self, loads=None, prestress=None, tol=0.1, steps=10000, warmstart=True, refresh=0, callback=None, **kwargs):
+        """Run the analysis of one load case.
+
+        Parameters
+        ----------
+        loads : array, optional
+            The nodal loads Px, Py, Pz.
+            Default are the loads of the structure.
+        prestress : array, optional
+            The initial edge forces.
+            Default are the initial forces of the structure.
+        tol : float, optional
+            Tolerance value.
+        steps : int, optional
+            Maximum number of steps.
+        warmstart : bool, optional
+            Start from the last solution.
+            Default is ``True``.
+        refresh : int, optional
+            Update progress every nth step.
+            Default is ``0``.
+        callback : callable, optional
+            Callback function.
+
+        Returns
+        -------
+        array
+            Vertex co-ordinates.
+        array
+            Edge forces.
+        array
+            Edge lengths.
+
+        """
+        P = self.P if loads is None else asarray(loads, dtype=float64).reshape((-1, 3))
+        f0 = self.f0 if prestress is None else asarray(prestress, dtype=float64).ravel()
+        M = self.Ca.dot(self.k0 + f0 / self.l0)
+        X = (self.X if warmstart else self.X0).copy()
+        S = zeros(X.shape, dtype=float64)
+        V = zeros(X.shape, dtype=float64)
+        X, f, l = drx_solver_numpy(tol, steps, self.factor, self.C, self.Ct, X, M, self.k0, self.l0, f0, self.ind_c, self.ind_t,  # noqa: E741
+                                   P, S, self.B, V, refresh, self.beams, self.inds, self.indi, self.indf, self.EIx, self.EIy,
+                                   callback, **kwargs)
+        self.X = X.copy()
+        return X, f, l.ravel()
+
+    def solve_many(self, loads=None, prestress=None, tol=0.1, steps=10000, warmstart=True):
+        """Run the analysis of many load cases at once.
+
+        Parameters
+        ----------
+        loads : array, optional
+            The nodal loads of every case, with shape ``(k, n, 3)``.
+            Default are the loads of the structure for every case.
+        prestress : array, optional
+            The initial edge forces of every case, with shape ``(k, m)``.
+            Default are the initial forces of the structure for every case.
+        tol : float, optional
+            Tolerance value.
+        steps : int, optional
+            Maximum number of steps.
+        warmstart : bool, optional
+            Start every case from the solution of the same case in the previous call,
+            if it had the same number of cases, or from the last solution of :meth:`solve`.
+            Default is ``True``.
+
+        Returns
+        -------
+        array
+            Vertex co-ordinates, with shape ``(k, n, 3)``.
+        array
+            Edge forces, with shape ``(k, m)``.
+        array
+            Edge lengths, with shape ``(k, m)``.
+
+        Notes
+        -----
+        The co-ordinates of all cases are stacked into one ``(n, 3k)`` array,
+        such that every step needs only two sparse matrix products for all cases.
+        Every case stops moving as soon as it has converged,
+        with the same result as :meth:`solve`.
+
+        """
+        if loads is None and prestress is None:
+            raise ValueError('Provide the loads or the prestress of every case.')
+        n = self.X0.shape[0]
+        m = self.l0.shape[0]
+        if loads is not None:
+            P = asarray(loads, dtype=float64).reshape((-1, n, 3))
+            k = P.shape[0]
+        if prestress is not None:
+            f0 = asarray(prestress, dtype=float64).reshape((-1, m))
+            k = f0.shape[0]
+        if loads is None:
+            P = tile(self.P, (k, 1, 1))
+        if prestress is None:
+            f0 = tile(self.f0, (k, 1))
+        if P.shape[0] != f0.shape[0]:
+            raise ValueError('The number of load cases and prestress cases is not the same.')
+
+        # nodes x cases x coordinates
+        P = P.transpose((1, 0, 2))
+        f0 = f0.T
+        k0 = self.k0[:, newaxis]
+        l0 = self.l0[:, newaxis]
+        B = self.B[:, newaxis, :]
+        M = self.factor * self.Ca.dot(k0 + f0 / l0)[:, :, newaxis]
+        if warmstart and self._X is not None and self._X.shape[1] == k:
+            X = self._X.copy()
+        else:
+            X = tile((self.X if warmstart else self.X0)[:, newaxis, :], (1, k, 1))
+        V = zeros((n, k, 3), dtype=float64)
+        S = zeros((n, k, 3), dtype=float64)
+        Uo = zeros(k, dtype=float64)
+        F = zeros((m, k), dtype=float64)
+        L = zeros((m, k), dtype=float64)
+        active = ones(k, dtype=bool)
+        ts = 0
+
+        while ts <= steps and active.any():
+            uvw = self.C.dot(X.reshape((n, 3 * k))).reshape((m, k, 3))
+            l = sqrt(sum(uvw ** 2, axis=2))  # noqa: E741
+            f = f0 + k0 * (l - l0)
+
+            if self.ind_t:
+                f[self.ind_t] *= f[self.ind_t] > 0
+            if self.ind_c:
+                f[self.ind_c] *= f[self.ind_c] < 0
+
+            if self.beams:
+                for j in flatnonzero(active):
+                    _beam_shear(S[:, j], X[:, j], self.inds, self.indi, self.indf, self.EIx, self.EIy)
+
+            q = f / l
+            R = (P - S - self.Ct.dot((uvw * q[:, :, newaxis]).reshape((m, 3 * k))).reshape((n, k, 3))) * B
+            res = mean(sqrt(sum(R ** 2, axis=2)), axis=0)
+
+            V += R / M
+            Un = sum(M * V ** 2, axis=(0, 2))
+            V[:, Un < Uo] = 0
+            Uo = Un
+
+            # the cases that converge in this step still make their last move
+            X += V * active[newaxis, :, newaxis]
+            F[:, active] = f[:, active]
+            L[:, active] = l[:, active]
+            active &= res > tol
+            ts += 1
+
+        self._X = X.copy()
+        return X.transpose((1, 0, 2)), F.T, L.T
+
+
 def _beam_data(structure):
     if structure.attributes.get('beams', None):
         inds, indi, indf, EIx, EIy = [], [], [], [], []
@@ -222,8 +452,6 @@ def _beam_data(structure):
         EIx = EIy = array([0.], dtype=float64)
         beams = 0
 
-    print(indf)
-
     return inds, indi, indf, EIx, EIy, beams
 
 
@@ -319,8 +547,6 @@ def _create_arrays(structure):
     k0 = E * A / l0
     q0 = f0 / l0
 
-    print(k0)
-
     # Other
     C = connectivity_matrix([[k_i[i], k_i[j]] for i, j in structure.edges()], 'csr')
     Ct = C.transpose()
@@ -339,4 +565,43 @@ def _create_arrays(structure):
 # ==============================================================================
 
 if __name__ == "__main__":
-    pass
+
+    import compas
+
+    from compas.datastructures import Network
+
+    network = Network.from_obj(compas.get('lines.obj'))
+    network.update_default_node_attributes({'B': [1, 1, 1], 'P': [0, 0, 0]})
+    network.update_default_edge_attributes({'E': 10, 'A': 1, 'ct': 't', 's0': 0})
+    for key in network.leaves():
+        network.node_attribute(key, 'B', [0, 0, 0])
+
+    free = [key for key in network.nodes() if network.node_attribute(key, 'B') == [1, 1, 1]]
+    cases = [-0.1 * (i + 1) for i in range(100)]
+
+    tic = time()
+    for pz in cases:
+        for key in free:
+            network.node_attribute(key, 'P', [0, 0, pz])
+        drx_numpy(network, tol=0.01, refresh=0)
+    toc1 = time() - tic
+
+    solver = DRXSolver(network)
+    loads = tile(solver.P, (len(cases), 1, 1))
+    for index, pz in enumerate(cases):
+        loads[index, solver.B[:, 2] > 0, 2] = pz
+
+    tic = time()
+    for P in loads:
+        solver.solve(loads=P, tol=0.01)
+    toc2 = time() - tic
+
+    solver.reset()
+    tic = time()
+    solver.solve_many(loads=loads, tol=0.01, warmstart=False)
+    toc3 = time() - tic
+
+    print('{} load cases'.format(len(cases)))
+    print('drx_numpy per case: {:.3f}s'.format(toc1))
+    print('DRXSolver.solve, warm start: {:.3f}s'.format(toc2))
+    print('DRXSolver.solve_many: {:.3f}s'.format(toc3))
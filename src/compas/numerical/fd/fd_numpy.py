@@ -2,15 +2,30 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+from numpy import arange
+from numpy import array
+from numpy import array_equal
 from numpy import asarray
+from numpy import empty
+from numpy import full
+from numpy import hstack
+from numpy import ones
+from numpy import unique
+from numpy import zeros
+from scipy.sparse import coo_matrix
+from scipy.sparse import csc_matrix
 from scipy.sparse import diags
 from scipy.sparse.linalg import spsolve
+from scipy.sparse.linalg import splu
 
 from compas.numerical import connectivity_matrix
 from compas.numerical import normrow
 
 
-__all__ = ['fd_numpy']
+__all__ = [
+    'fd_numpy',
+    'FDSolver',
+]
 
 
 def fd_numpy(vertices, edges, fixed, q, loads, **kwargs):
@@ -79,6 +94,248 @@ def fd_numpy(vertices, edges, fixed, q, loads, **kwargs):
     return xyz, q, f, l, r
 
 
+class FDSolver(object):
+    """Force density solver for repeated analyses of the same network.
+
+    Parameters
+    ----------
+    vertices : list
+        XYZ coordinates of the vertices of the network.
+    edges : list
+        Edges between vertices represented by pairs of vertex indices.
+    fixed : list
+        Indices of fixed vertices.
+    q : list, optional
+        Force density of edges.
+        Default is ``1.0`` for all edges.
+    loads : list, optional
+        XYZ components of the loads on the vertices.
+        Default is no loads.
+
+    Attributes
+    ----------
+    xyz : array
+        XYZ coordinates of the vertices.
+        The coordinates of the fixed vertices can be modified between analyses.
+    q : array
+        The default force densities of the edges.
+    loads : array
+        The default loads on the vertices.
+    free : array
+        Indices of the free vertices.
+    fixed : array
+        Indices of the fixed vertices.
+
+    Notes
+    -----
+    The connectivity matrices of the network are assembled once.
+    The stiffness matrix :math:`C_i^T Q C_i` of the free vertices has the same sparsity pattern for all force densities.
+    Its non-zero values are computed directly from the force densities with a precomputed sparse mapping,
+    and the fill-reducing ordering of its first factorisation is reused for all following factorisations.
+
+    The factorisation of the last force densities is kept,
+    such that analyses with other loads or other coordinates of the fixed vertices only require a back substitution.
+
+    Examples
+    --------
+    >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]]
+    >>> edges = [(0, 1), (1, 2)]
+    >>> solver = FDSolver(vertices, edges, [0, 2], loads=[[0.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 0.0, 0.0]])
+    >>> xyz, q, f, l, r = solver.solve()
+    >>> print(round(xyz[1, 2], 3))
+    -0.5
+    >>> xyz, q, f, l, r = solver.solve(q=[2.0, 2.0])
+    >>> print(round(xyz[1, 2], 3))
+    -0.25
+
+    """
+
+    def __init__(self, vertices, edges, fixed, q=None, loads=None):
+        self.xyz = array(vertices, dtype=float).reshape((-1, 3))
+        v = self.xyz.shape[0]
+        m = len(edges)
+        self.fixed = asarray(fixed, dtype=int)
+        self.free = asarray(sorted(set(range(v)) - set(self.fixed.tolist())), dtype=int)
+        self.q = ones(m) if q is None else asarray(q, dtype=float).reshape(-1)
+        self.loads = zeros((v, 3)) if loads is None else asarray(loads, dtype=float).reshape((-1, 3))
+        self.C = connectivity_matrix(edges, 'csr')
+        self.Ct = self.C.transpose().tocsr()
+        self.Ci = self.C[:, self.free]
+        self.Cf = self.C[:, self.fixed]
+        self.Cit = self.Ci.transpose().tocsr()
+        self._edges = asarray(edges, dtype=int).reshape((-1, 2))
+        self._labels = arange(len(self.free))
+        self._ordered = False
+        self._pattern()
+        self._factor = None
+        self._factor_q = None
+
+    def _pattern(self):
+        """Map the force densities to the non-zero values of the stiffness matrix of the free vertices."""
+        n = len(self.free)
+        m = self._edges.shape[0]
+        index = full(self.xyz.shape[0], -1, dtype=int)
+        index[self.free] = self._labels
+        u = index[self._edges[:, 0]]
+        v = index[self._edges[:, 1]]
+        e = arange(m)
+        both = (u >= 0) & (v >= 0)
+        rows = hstack((u[u >= 0], v[v >= 0], u[both], v[both]))
+        cols = hstack((u[u >= 0], v[v >= 0], v[both], u[both]))
+        edges = hstack((e[u >= 0], e[v >= 0], e[both], e[both]))
+        signs = hstack((ones((u >= 0).sum() + (v >= 0).sum()), -ones(2 * both.sum())))
+        # the keys are sorted column-major, which gives the layout of a CSC matrix
+        keys, inverse = unique(cols * n + rows, return_inverse=True)
+        self._indices = keys % n
+        self._indptr = hstack(([0], (keys // n).searchsorted(arange(n), side='right')))
+        self._values = coo_matrix((signs, (inverse, edges)), shape=(len(keys), m)).tocsr()
+
+    def stiffness(self, q=None):
+        """Assemble the stiffness matrix of the free vertices.
+
+        Parameters
+        ----------
+        q : list, optional
+            Force density of edges.
+            Default is :attr:`q`.
+
+        Returns
+        -------
+        sparse matrix
+            The matrix :math:`C_i^T Q C_i` in CSC format,
+            with the rows and columns in the order of the factorisation.
+
+        """
+        q = self.q if q is None else asarray(q, dtype=float).reshape(-1)
+        n = len(self.free)
+        return csc_matrix((self._values.dot(q), self._indices, self._indptr), shape=(n, n))
+
+    def factorize(self, q=None):
+        """Factorise the stiffness matrix of the free vertices for the given force densities.
+
+        Parameters
+        ----------
+        q : list, optional
+            Force density of edges.
+            Default is :attr:`q`.
+
+        Returns
+        -------
+        SuperLU
+            The LU factorisation.
+
+        Notes
+        -----
+        If the force densities are the same as those of the previous factorisation,
+        the previous factorisation is returned.
+
+        """
+        q = self.q if q is None else asarray(q, dtype=float).reshape(-1)
+        if self._factor is not None and array_equal(q, self._factor_q):
+            return self._factor[0]
+        A = self.stiffness(q)
+        if self._ordered:
+            lu = splu(A, permc_spec='NATURAL', diag_pivot_thresh=0.0, options=dict(SymmetricMode=True))
+            self._factor = lu, self._labels
+        else:
+            lu = splu(A, permc_spec='MMD_AT_PLUS_A', diag_pivot_thresh=0.0, options=dict(SymmetricMode=True))
+            self._factor = lu, self._labels
+            # relabel the free vertices in the fill-reducing order of the first factorisation
+            self._labels = lu.perm_c[self._labels]
+            self._ordered = True
+            self._pattern()
+        self._factor_q = q.copy()
+        return lu
+
+    def _solve(self, q, b):
+        """Solve for the coordinates of the free vertices, with the loads in the columns of b."""
+        self.factorize(q)
+        lu, labels = self._factor
+        B = empty(b.shape)
+        B[labels] = b
+        return lu.solve(B)[labels]
+
+    def _rhs(self, q, loads):
+        return loads[self.free] - self.Cit.dot(q[:, None] * self.Cf.dot(self.xyz[self.fixed]))
+
+    def _results(self, q, loads, xyz):
+        uvw = self.C.dot(xyz)
+        l = normrow(uvw)  # noqa: E741
+        q = q.reshape((-1, 1))
+        f = q * l
+        r = loads - self.Ct.dot(q * uvw)
+        return xyz, q, f, l, r
+
+    def solve(self, q=None, loads=None):
+        """Compute the equilibrium geometry.
+
+        Parameters
+        ----------
+        q : list, optional
+            Force density of edges.
+            Default is :attr:`q`.
+        loads : list, optional
+            XYZ components of the loads on the vertices.
+            Default is :attr:`loads`.
+
+        Returns
+        -------
+        tuple
+            XYZ coordinates, force densities, forces, lengths and residual forces,
+            as returned by :func:`fd_numpy`.
+
+        """
+        q = self.q if q is None else asarray(q, dtype=float).reshape(-1)
+        loads = self.loads if loads is None else asarray(loads, dtype=float).reshape((-1, 3))
+        xyz = self.xyz.copy()
+        xyz[self.free] = self._solve(q, self._rhs(q, loads))
+        return self._results(q, loads, xyz)
+
+    def solve_many(self, q=None, loads=None):
+        """Compute the equilibrium geometry of many cases.
+
+        Parameters
+        ----------
+        q : array, optional
+            Force densities of the edges per case, with shape ``(k, m)``,
+            or the same force densities for all cases, with shape ``(m,)``.
+            Default is :attr:`q`.
+        loads : array, optional
+            Loads on the vertices per case, with shape ``(k, v, 3)``,
+            or the same loads for all cases, with shape ``(v, 3)``.
+            Default is :attr:`loads`.
+
+        Returns
+        -------
+        tuple
+            XYZ coordinates, force densities, forces, lengths and residual forces,
+            as returned by :func:`fd_numpy`, stacked along a first axis of size ``k``.
+
+        Notes
+        -----
+        Cases with the same force densities share one factorisation.
+        If all cases have the same force densities, all loads are solved in one back substitution.
+
+        """
+        q = self.q if q is None else asarray(q, dtype=float)
+        loads = self.loads if loads is None else asarray(loads, dtype=float)
+        v = self.xyz.shape[0]
+        if q.ndim == 1 and loads.ndim < 3:
+            loads = loads.reshape((1, v, 3))
+        k = max(q.shape[0] if q.ndim > 1 else 1, loads.shape[0] if loads.ndim > 2 else 1)
+        Q = q.reshape((-1, len(self.q))) * ones((k, 1))
+        P = loads.reshape((-1, v, 3)) * ones((k, 1, 1))
+        X = self.xyz[None, :, :] * ones((k, 1, 1))
+        if q.ndim == 1:
+            b = hstack([self._rhs(q, P[i]) for i in range(k)])
+            X[:, self.free] = self._solve(q, b).reshape((-1, k, 3)).transpose((1, 0, 2))
+        else:
+            for i in range(k):
+                X[i, self.free] = self._solve(Q[i], self._rhs(Q[i], P[i]))
+        results = [self._results(Q[i], P[i], X[i]) for i in range(k)]
+        return tuple(array(items) for items in zip(*results))
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
@@ -34,6 +34,37 @@ of the proxied package are available as if they were directly present in our env
     :nosignatures:
 
     Proxy
+    ProxyCall
+
+Server
+======
+
+The server side of the RPC setup runs the calls of a proxy in one process,
+one call after the other, or in a pool of worker processes.
+In the latter case, calls of multiple clients, or concurrent calls of one client
+(:meth:`Proxy.submit`), are executed in parallel.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    Server
+    ThreadedServer
+    Dispatcher
+    WorkerPool
+
+Transport
+=========
+
+Calls are serialised as JSON, or, if both sides support it, as binary frames
+in which NumPy arrays are stored as raw buffers.
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    binary_dumps
+    binary_loads
 
 RPC Command-line utility
 ========================
@@ -45,7 +76,7 @@ To start a new RPC server use the following command (default port is ``1753``):
 
 ::
 
-    $ compas_rpc start [--port PORT]
+    $ compas_rpc start [--port PORT] [--workers WORKERS] [--preload MODULE [MODULE ...]]
 
 Conversely, to stop an existing RPC server:
 
@@ -65,9 +96,11 @@ from __future__ import division
 from __future__ import print_function
 
 from .errors import *  # noqa: F401 F403
+from .transport import *  # noqa: F401 F403
 from .proxy import *  # noqa: F401 F403
 from .server import *  # noqa: F401 F403
 from .dispatcher import *  # noqa: F401 F403
+from .pool import *  # noqa: F401 F403
 
 
 __all__ = [name for name in dir() if not name.startswith('_')]
@@ -8,8 +8,8 @@ except ImportError:
     from xmlrpc.client import ServerProxy
 
 
-def start(port, autoreload, **kwargs):
-    start_service(port, autoreload)
+def start(port, autoreload, workers=0, preload=None, timeout=None, **kwargs):
+    start_service(port, autoreload, workers=workers, preload=preload, timeout=timeout)
 
 
 def stop(port, **kwargs):
@@ -50,6 +50,9 @@ def main():
         '--port', '-p', action='store', default=1753, type=int, help='RPC port number')
     start_command.add_argument('--autoreload', dest='autoreload', action='store_true', help='Autoreload modules')
     start_command.add_argument('--no-autoreload', dest='autoreload', action='store_false', help='Do not autoreload modules')
+    start_command.add_argument('--workers', '-w', action='store', default=0, type=int, help='Number of worker processes')
+    start_command.add_argument('--preload', action='store', nargs='*', default=None, help='Modules to import in every worker process')
+    start_command.add_argument('--timeout', action='store', default=None, type=float, help='Maximum execution time of a call in a worker process')
     start_command.set_defaults(autoreload=True, func=start)
 
     # Command: stop
@@ -10,6 +10,13 @@ import traceback
 
 from compas.utilities import DataDecoder
 from compas.utilities import DataEncoder
+from compas.rpc.transport import binary_dumps
+from compas.rpc.transport import binary_loads
+
+try:
+    from xmlrpclib import Binary
+except ImportError:
+    from xmlrpc.client import Binary
 
 try:
     from cStringIO import StringIO
@@ -42,7 +49,30 @@ class Dispatcher(object):
     message strings assigned to the `'error'` key of the output dictionary
     such that the errors can be rethrown on the client side.
 
+    The input and output dictionaries are JSON strings,
+    or binary frames with NumPy arrays as raw buffers if the input is a binary frame
+    (see :meth:`transports`).
+
     """
+
+    def transports(self):
+        """The data formats supported by the dispatcher.
+
+        Returns
+        -------
+        list
+            ``'json'``, and ``'binary'`` if NumPy is available.
+
+        Notes
+        -----
+        This method is called by :class:`compas.rpc.Proxy` to negotiate the format of the calls.
+        """
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return ['json']
+        return ['json', 'binary']
+
     def on_module_imported(self, module, newly_loaded_modules):
         """Event triggered when a module is successfully imported.
 
@@ -66,13 +96,15 @@ class Dispatcher(object):
         args : list
             List of positional arguments.
             The first argument in the list should be the JSON serialised string
-            representation of the input dictionary. The structure of the input
-            dictionary is defined by the caller.
+            representation of the input dictionary, or its binary serialisation
+            (:func:`compas.rpc.binary_dumps`) wrapped in an XMLRPC ``Binary`` object.
+            The structure of the input dictionary is defined by the caller.
 
         Returns
         -------
-        str
-            A JSON serialised string representation of the output dictionary.
+        str or Binary
+            A JSON serialised string representation of the output dictionary,
+            or its binary serialisation if the input was binary.
             The output dicmtionary has the following structure:
 
             * `'data'`    : The returned result of the function call.
@@ -86,6 +118,8 @@ class Dispatcher(object):
             'profile': None
         }
 
+        binary = bool(args) and isinstance(args[0], Binary)
+
         parts = name.split('.')
 
         functionname = parts[-1]
@@ -114,8 +148,11 @@ class Dispatcher(object):
 
             else:
                 try:
-                    idict = json.loads(args[0], cls=DataDecoder)
-                except (IndexError, TypeError):
+                    if binary:
+                        idict = binary_loads(args[0].data)
+                    else:
+                        idict = json.loads(args[0], cls=DataDecoder)
+                except (IndexError, TypeError, ValueError):
                     odict['error'] = (
                         "API methods require a single JSON encoded dictionary as input.\n"
                         "For example: input = json.dumps({'param_1': 1, 'param_2': [2, 3]})")
@@ -123,6 +160,8 @@ class Dispatcher(object):
                 else:
                     self._call(function, idict, odict)
 
+        if binary:
+            return Binary(binary_dumps(odict))
         return json.dumps(odict, cls=DataEncoder)
 
     def _call(self, function, idict, odict):
@@ -0,0 +1,384 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import importlib
+import json
+import threading
+import time
+import traceback
+
+from collections import deque
+
+from compas.rpc.dispatcher import Dispatcher
+from compas.rpc.transport import binary_insert
+
+try:
+    from xmlrpclib import Binary
+except ImportError:
+    from xmlrpc.client import Binary
+
+
+__all__ = ['WorkerPool']
+
+
+# sent by a worker process when it is ready to accept calls
+_READY = '__ready__'
+
+
+class WorkerPool(object):
+    """Dispatch remote calls to a pool of pre-warmed worker processes.
+
+    Parameters
+    ----------
+    dispatcher : :class:`compas.rpc.Dispatcher`, optional
+        The service that handles the calls in every worker.
+        It has to be picklable.
+        Default is an instance of the base dispatcher.
+    workers : int, optional
+        The number of worker processes.
+        Default is ``2``.
+    preload : list, optional
+        Names of modules to import in every worker before it accepts calls,
+        for example ``['numpy', 'scipy.linalg', 'compas.numerical']``.
+    timeout : float, optional
+        The default maximum execution time of a call, in seconds.
+        Default is ``None``, in which case calls can run indefinitely.
+
+    Notes
+    -----
+    Register the pool as instance of a :class:`compas.rpc.ThreadedServer`,
+    such that every call is handled in a separate thread of the server.
+    The calls are queued in order of arrival and every worker takes the next call
+    as soon as it is idle. The time spent in the queue is returned to the client
+    as ``'queued'``, together with the other items of the output dictionary of the dispatcher.
+
+    :meth:`start` only returns when all workers have imported the preloaded modules,
+    such that the first calls do not include the startup time of the workers.
+
+    A call is cancelled, or stopped when it runs longer than its timeout,
+    by terminating its worker process and starting a new one.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        from compas.rpc import ThreadedServer
+        from compas.rpc import WorkerPool
+
+        server = ThreadedServer(("localhost", 8888))
+        pool = WorkerPool(workers=4, preload=['numpy', 'scipy'])
+
+        server.register_function(server.ping)
+        server.register_function(server.remote_shutdown)
+        server.register_function(pool.cancel)
+        server.register_instance(pool)
+
+        pool.start()
+        try:
+            server.serve_forever()
+        finally:
+            pool.stop()
+
+    """
+
+    def __init__(self, dispatcher=None, workers=2, preload=None, timeout=None):
+        self.dispatcher = dispatcher or Dispatcher()
+        self.workers = workers
+        self.preload = preload or []
+        self.timeout = timeout
+        self._queue = deque()
+        self._calls = {}
+        self._condition = threading.Condition()
+        self._threads = []
+        self._running = False
+
+    def start(self, timeout=60.0):
+        """Start the worker processes, and wait until they are ready to accept calls.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait for the workers to start and import the preloaded modules, in seconds.
+            Default is ``60.0``.
+
+        Raises
+        ------
+        RuntimeError
+            If not all workers are ready within the timeout.
+
+        """
+        self._running = True
+        workers = []
+        for _ in range(self.workers):
+            worker = _Worker(self, timeout)
+            thread = threading.Thread(target=worker.run)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+            workers.append(worker)
+        end = time.time() + timeout
+        for worker in workers:
+            worker.started.wait(max(end - time.time(), 0))
+        if not all(worker.ready for worker in workers):
+            self.stop()
+            raise RuntimeError('Not all workers were ready within {} seconds, or they terminated while starting.'.format(timeout))
+
+    def stop(self):
+        """Stop the worker processes after the running calls are finished.
+
+        The calls that are still queued are cancelled.
+        """
+        with self._condition:
+            self._running = False
+            while self._queue:
+                self._queue.popleft().finish(_error('The worker pool was stopped.'))
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def submit(self, name, istring, options=None):
+        """Queue a call and wait for its result.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        istring : str or Binary
+            The serialised input dictionary.
+        options : dict, optional
+            The call options.
+            ``'id'`` identifies the call for :meth:`cancel`,
+            ``'timeout'`` overwrites the default timeout of the pool.
+
+        Returns
+        -------
+        str or Binary
+            The serialised output dictionary.
+
+        """
+        options = options or {}
+        timeout = options.get('timeout')
+        call = _Call(options.get('id'), name, istring, self.timeout if timeout is None else timeout)
+        with self._condition:
+            if not self._running:
+                return _error('The worker pool is not running.')
+            if call.id is not None:
+                self._calls[call.id] = call
+            self._queue.append(call)
+            self._condition.notify()
+        call.done.wait()
+        with self._condition:
+            self._calls.pop(call.id, None)
+        return call.output
+
+    def cancel(self, id):
+        """Cancel a queued or running call.
+
+        Parameters
+        ----------
+        id : str
+            The identifier of the call.
+
+        Returns
+        -------
+        bool
+            True if the call was found and cancelled.
+            False if the call is unknown or already finished.
+
+        """
+        with self._condition:
+            call = self._calls.get(id)
+            if call is None or call.done.is_set():
+                return False
+            if call in self._queue:
+                self._queue.remove(call)
+                call.finish(_error('The call was cancelled.'))
+                return True
+            call.cancelled = True
+            return True
+
+    def status(self):
+        """Get the number of queued and running calls.
+
+        Returns
+        -------
+        dict
+            ``'workers'``, ``'queued'`` and ``'running'``.
+
+        """
+        with self._condition:
+            running = sum(1 for call in self._calls.values() if call.started is not None and not call.done.is_set())
+            return {'workers': self.workers, 'queued': len(self._queue), 'running': running}
+
+    def _next(self):
+        """Take the next call from the queue, or None if the pool is stopped."""
+        with self._condition:
+            while self._running and not self._queue:
+                self._condition.wait()
+            if not self._queue:
+                return None
+            call = self._queue.popleft()
+            call.started = time.time()
+            return call
+
+    def _dispatch(self, name, args):
+        """Dispatcher method for XMLRPC API calls.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function.
+        args : list
+            The JSON serialised input dictionary,
+            optionally followed by a dictionary of call options.
+
+        Returns
+        -------
+        str or Binary
+            The serialised output dictionary.
+
+        """
+        if not args:
+            return _error("API methods require a single JSON encoded dictionary as input.")
+        options = args[1] if len(args) > 1 else None
+        return self.submit(name, args[0], options)
+
+
+class _Call(object):
+    """A call waiting in the queue of the pool."""
+
+    def __init__(self, id, name, istring, timeout):
+        self.id = id
+        self.name = name
+        self.istring = istring
+        self.timeout = timeout
+        self.queued = time.time()
+        self.started = None
+        self.cancelled = False
+        self.output = None
+        self.done = threading.Event()
+
+    def finish(self, output):
+        if self.started is not None:
+            # add the queue latency to the output dict without decoding it
+            latency = self.started - self.queued
+            if isinstance(output, Binary):
+                output = Binary(binary_insert(output.data, 'queued', latency))
+            else:
+                output = '{{"queued": {}, {}'.format(latency, output.lstrip()[1:])
+        self.output = output
+        self.done.set()
+
+
+class _Worker(object):
+    """A thread of the pool that feeds calls to one worker process."""
+
+    def __init__(self, pool, timeout):
+        self.pool = pool
+        self.timeout = timeout
+        self.process = None
+        self.connection = None
+        self.ready = False
+        self.started = threading.Event()
+
+    def spawn(self):
+        import multiprocessing
+
+        context = multiprocessing.get_context('spawn')
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_work, args=(child, self.pool.dispatcher, self.pool.preload))
+        self.process.daemon = True
+        self.process.start()
+        child.close()
+        # wait until the worker has imported the preloaded modules
+        try:
+            self.ready = self.connection.poll(self.timeout) and self.connection.recv() == _READY
+        except (EOFError, IOError, OSError):
+            self.ready = False
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+        self.process = None
+
+    def run(self):
+        self.spawn()
+        self.started.set()
+        try:
+            while True:
+                call = self.pool._next()
+                if call is None:
+                    break
+                call.finish(self.execute(call))
+        finally:
+            if self.process is not None:
+                try:
+                    self.connection.send(None)
+                except Exception:
+                    pass
+                self.process.join(1)
+                if self.process.is_alive():
+                    self.kill()
+
+    def execute(self, call):
+        try:
+            self.connection.send((call.name, call.istring))
+        except Exception:
+            self.kill()
+            self.spawn()
+            return _error('The worker process is not available.')
+        while True:
+            try:
+                if self.connection.poll(0.05):
+                    output = self.connection.recv()
+                    # a worker that was not ready in time reports later
+                    if output != _READY:
+                        return output
+            except (EOFError, IOError, OSError):
+                self.kill()
+                self.spawn()
+                return _error('The worker process terminated unexpectedly.')
+            if call.cancelled:
+                message = 'The call was cancelled.'
+            elif call.timeout is not None and time.time() - call.started > call.timeout:
+                message = 'The call did not finish within {} seconds.'.format(call.timeout)
+            else:
+                continue
+            self.kill()
+            self.spawn()
+            return _error(message)
+
+
+def _work(connection, dispatcher, preload):
+    """Main loop of a worker process."""
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            traceback.print_exc()
+    connection.send(_READY)
+    while True:
+        try:
+            message = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if message is None:
+            break
+        name, istring = message
+        connection.send(dispatcher._dispatch(name, [istring]))
+
+
+def _error(message):
+    return json.dumps({'data': None, 'error': message, 'profile': None})
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    pass
@@ -3,17 +3,25 @@ from __future__ import division
 from __future__ import print_function
 
 import json
+import threading
 import time
+import uuid
 
 import compas
 import compas._os
+from compas.rpc import RPCClientError
 from compas.rpc import RPCServerError
+from compas.rpc.transport import binary_dumps
+from compas.rpc.transport import binary_loads
 from compas.utilities import DataDecoder
 from compas.utilities import DataEncoder
+from compas.utilities import ResultCache
 
 try:
+    from xmlrpclib import Binary
     from xmlrpclib import ServerProxy
 except ImportError:
+    from xmlrpc.client import Binary
     from xmlrpc.client import ServerProxy
 
 try:
@@ -23,7 +31,7 @@ except ImportError:
     from System.Diagnostics import Process
 
 
-__all__ = ['Proxy']
+__all__ = ['Proxy', 'ProxyCall']
 
 
 class Proxy(object):
@@ -59,6 +67,29 @@ class Proxy(object):
         it will unload the module, so that the next invocation uses a fresh version.
     capture_output : :obj:`bool`, ``True`` to capture the stdout/stderr output of the remote process, otherwise ``False``.
         In general, ``capture_output`` should be ``True`` when using a ``pythonw`` as executable (default).
+    workers : :obj:`int`, optional
+        The number of worker processes of a new server.
+        Default is ``None``, in which case all calls are executed one after the other in the server process.
+        Otherwise, the calls are executed in parallel by a :class:`compas.rpc.WorkerPool`.
+    preload : :obj:`list`, optional
+        Names of modules to import in every worker process of a new server, before it accepts calls.
+        The base package of the proxy is always included.
+    timeout : :obj:`float`, optional
+        The maximum execution time of a call in a worker process, in seconds.
+        Default is ``None``.
+    transport : {'json', 'binary'}, optional
+        The format of the calls.
+        Default is ``'json'``.
+        With ``'binary'``, NumPy arrays are sent as raw buffers in both directions,
+        and arrays returned by the remote function are returned as arrays instead of lists.
+        The proxy falls back to ``'json'`` if NumPy is not available, for example in IronPython,
+        or if the server does not support binary calls.
+    cache : :obj:`bool` or :class:`compas.utilities.ResultCache`, optional
+        Cache the results of the calls, and return the cached result
+        if a function is called again with the same input, without contacting the server.
+        ``True`` creates an in-memory cache with default settings.
+        Default is ``None``, in which case the results are not cached.
+        Only use a cache for functions that always return the same result for the same input.
 
     Notes
     -----
@@ -73,6 +104,11 @@ class Proxy(object):
 
     If possible, the proxy will try to reconnect to an already existing service
 
+    With a pool of worker processes, calls can be issued concurrently with :meth:`Proxy.submit`,
+    and be cancelled with :meth:`Proxy.cancel`.
+    The time a call spent waiting for a worker is available as :attr:`Proxy.latency`,
+    or as :attr:`ProxyCall.latency`.
+
     Examples
     --------
     Minimal example showing connection to the proxy server, and ensuring the
@@ -85,9 +121,20 @@ class Proxy(object):
         with Proxy('compas.numerical') as numerical:
             pass
 
+    Concurrent calls to a pool of four worker processes:
+
+    .. code-block:: python
+
+        from compas.rpc import Proxy
+
+        with Proxy('numpy.linalg', workers=4) as linalg:
+            calls = [linalg.submit('inv', A) for A in matrices]
+            inverses = [call.result() for call in calls]
+
     """
 
-    def __init__(self, package=None, python=None, url='http://127.0.0.1', port=1753, service=None, max_conn_attempts=100, autoreload=True, capture_output=True):
+    def __init__(self, package=None, python=None, url='http://127.0.0.1', port=1753, service=None, max_conn_attempts=100, autoreload=True, capture_output=True,
+                 workers=None, preload=None, timeout=None, transport='json', cache=None):
         self._package = None
         self._python = compas._os.select_python(python)
         self._url = url
@@ -96,12 +143,21 @@ class Proxy(object):
         self._service = None
         self._process = None
         self._function = None
+        self._name = None
+        self._cache = None
         self._profile = None
+        self._latency = None
 
         self.service = service
         self.package = package
         self.autoreload = autoreload
         self.capture_output = capture_output
+        self.workers = workers
+        self.preload = preload
+        self.timeout = timeout
+        self.transport = transport
+        self.cache = cache
+        self._binary = None
 
         self._implicitely_started_server = False
         self._server = self._try_reconnect()
@@ -133,6 +189,26 @@ class Proxy(object):
     def profile(self, profile):
         self._profile = profile
 
+    @property
+    def latency(self):
+        """The time the last call spent in the queue of a pool of worker processes."""
+        return self._latency
+
+    @latency.setter
+    def latency(self, latency):
+        self._latency = latency
+
+    @property
+    def cache(self):
+        """:class:`compas.utilities.ResultCache`: The cache of the results, if any."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        if cache is True:
+            cache = ResultCache()
+        self._cache = cache or None
+
     @property
     def package(self):
         """The base package from which functionality will be called."""
@@ -219,10 +295,10 @@ class Proxy(object):
             self._process.StartInfo.RedirectStandardOutput = self.capture_output
             self._process.StartInfo.RedirectStandardError = self.capture_output
             self._process.StartInfo.FileName = self.python
-            self._process.StartInfo.Arguments = '-m {0} --port {1} --{2}autoreload'.format(self.service, self._port, '' if self.autoreload else 'no-')
+            self._process.StartInfo.Arguments = ' '.join(self._service_arguments())
             self._process.Start()
         else:
-            args = [self.python, '-m', self.service, '--port', str(self._port), '--{}autoreload'.format('' if self.autoreload else 'no-')]
+            args = [self.python] + self._service_arguments()
             kwargs = dict(env=env)
             if self.capture_output:
                 kwargs['stdout'] = PIPE
@@ -252,6 +328,20 @@ class Proxy(object):
             print("New proxy server started.")
         return server
 
+    def _service_arguments(self):
+        """The command line arguments to start the service."""
+        args = ['-m', self.service, '--port', str(self._port), '--{}autoreload'.format('' if self.autoreload else 'no-')]
+        if self.workers:
+            preload = list(self.preload or [])
+            if self.package and self.package not in preload:
+                preload.append(self.package)
+            args += ['--workers', str(self.workers)]
+            if preload:
+                args += ['--preload'] + preload
+            if self.timeout is not None:
+                args += ['--timeout', str(self.timeout)]
+        return args
+
     def stop_server(self):
         """Stop the remote server and terminate/kill the python process that was used to start it.
 
@@ -297,6 +387,7 @@ class Proxy(object):
             self._function = getattr(self._server, name)
         except Exception:
             raise RPCServerError()
+        self._name = name
         return self._proxy
 
     def _proxy(self, *args, **kwargs):
@@ -320,15 +411,68 @@ class Proxy(object):
         This means that, currently, only native Python objects are supported.
         The returned results will also always be in the form of built-in Python objects.
         """
+        data, self.profile, self.latency = self._invoke(self._name, self._function, args, kwargs, self._options())
+        return data
+
+    @property
+    def binary(self):
+        """bool : True if the calls are sent as binary frames.
+
+        The format is negotiated with the server on first use.
+        """
+        if self.transport != 'binary' or compas.IPY:
+            return False
+        if self._binary is None:
+            try:
+                import numpy  # noqa: F401
+                ostring = self._server.transports(json.dumps({'args': [], 'kwargs': {}}))
+                transports = json.loads(ostring)['data'] or []
+            except Exception:
+                transports = []
+            self._binary = 'binary' in transports
+        return self._binary
+
+    def _options(self, id=None):
+        """The options of a call, for servers with a pool of worker processes."""
+        options = {}
+        if id is not None:
+            options['id'] = id
+        if self.timeout is not None:
+            options['timeout'] = self.timeout
+        return options
+
+    def _invoke(self, name, function, args, kwargs, options):
+        """Call a remote function and decode the result.
+
+        Returns
+        -------
+        tuple
+            The returned data, the profile, and the queue latency.
+        """
         idict = {'args': args, 'kwargs': kwargs}
-        istring = json.dumps(idict, cls=DataEncoder)
+        if self.binary:
+            istring = Binary(binary_dumps(idict))
+        else:
+            istring = json.dumps(idict, cls=DataEncoder)
+
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(name, istring.data if isinstance(istring, Binary) else istring)
+            ostring = self.cache.get(key)
+            if ostring is not None:
+                result = binary_loads(ostring) if isinstance(istring, Binary) else json.loads(ostring, cls=DataDecoder)
+                return result['data'], result['profile'], None
+
         # it makes sense that there is a broken pipe error
         # because the process is not the one receiving the feedback
         # when there is a print statement on the server side
         # this counts as output
         # it should be sent as part of RPC communication
         try:
-            ostring = self._function(istring)
+            if options:
+                ostring = function(istring, options)
+            else:
+                ostring = function(istring)
         except Exception:
             # not clear what the point of this is
             # self.stop_server()
@@ -339,13 +483,176 @@ class Proxy(object):
         if not ostring:
             raise RPCServerError("No output was generated.")
 
-        result = json.loads(ostring, cls=DataDecoder)
+        if isinstance(ostring, Binary):
+            result = binary_loads(ostring.data)
+        else:
+            result = json.loads(ostring, cls=DataDecoder)
 
         if result['error']:
             raise RPCServerError(result['error'])
 
-        self.profile = result['profile']
-        return result['data']
+        if key is not None:
+            self.cache.set(key, ostring.data if isinstance(ostring, Binary) else ostring)
+
+        return result['data'], result['profile'], result.get('queued')
+
+    def submit(self, name, *args, **kwargs):
+        """Call a remote function without waiting for the result.
+
+        Parameters
+        ----------
+        name : str
+            The name of the function, relative to the base package of the proxy.
+        args : list
+            Positional arguments to be passed to the remote function.
+        kwargs : dict
+            Named arguments to be passed to the remote function.
+
+        Returns
+        -------
+        :class:`ProxyCall`
+            The running call.
+
+        Notes
+        -----
+        Every call uses its own connection to the server, in a separate thread.
+        The calls only run in parallel on the server side if it has a pool of worker processes.
+        """
+        if self.package:
+            name = "{}.{}".format(self.package, name)
+        # negotiate the transport before the call starts in its own thread
+        self.binary
+        return ProxyCall(self, name, args, kwargs)
+
+    def cancel(self, call):
+        """Cancel a call that was submitted to a pool of worker processes.
+
+        Parameters
+        ----------
+        call : :class:`ProxyCall` or str
+            The call, or its identifier.
+
+        Returns
+        -------
+        bool
+            True if the call was cancelled.
+            False if it was already finished.
+        """
+        if isinstance(call, ProxyCall):
+            call = call.id
+        try:
+            return ServerProxy(self.address).cancel(call)
+        except Exception:
+            raise RPCServerError("The server does not support cancelling calls.")
+
+    def status(self):
+        """Get the number of workers, and of queued and running calls, of a pool of worker processes.
+
+        Returns
+        -------
+        dict
+            ``'workers'``, ``'queued'`` and ``'running'``.
+        """
+        try:
+            return ServerProxy(self.address).status()
+        except Exception:
+            raise RPCServerError("The server does not have a pool of worker processes.")
+
+
+class ProxyCall(object):
+    """A call of a remote function that runs in the background.
+
+    Parameters
+    ----------
+    proxy : :class:`Proxy`
+        The proxy that issued the call.
+    name : str
+        The full name of the function.
+    args : list
+        Positional arguments to be passed to the remote function.
+    kwargs : dict
+        Named arguments to be passed to the remote function.
+
+    Attributes
+    ----------
+    id : str
+        The identifier of the call.
+    profile : str
+        A profile of the executed code, if available.
+    latency : float
+        The time the call spent in the queue of the worker pool, if available.
+
+    """
+
+    def __init__(self, proxy, name, args, kwargs):
+        self.proxy = proxy
+        self.name = name
+        self.id = uuid.uuid4().hex
+        self.profile = None
+        self.latency = None
+        self._data = None
+        self._error = None
+        self._done = threading.Event()
+        thread = threading.Thread(target=self._run, args=(args, kwargs))
+        thread.daemon = True
+        thread.start()
+
+    def _run(self, args, kwargs):
+        try:
+            # server proxies cannot be shared between threads
+            function = getattr(ServerProxy(self.proxy.address), self.name)
+            self._data, self.profile, self.latency = self.proxy._invoke(self.name, function, args, kwargs, self.proxy._options(self.id))
+        except Exception as e:
+            self._error = e
+        finally:
+            self._done.set()
+
+    def done(self):
+        """Verify that the call is finished.
+
+        Returns
+        -------
+        bool
+            True if the call is finished, successfully or not.
+        """
+        return self._done.is_set()
+
+    def result(self, timeout=None):
+        """Wait for the result of the call.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            The maximum time to wait, in seconds.
+            Default is ``None``, in which case there is no limit.
+
+        Returns
+        -------
+        object
+            The result returned by the remote function.
+
+        Raises
+        ------
+        RPCClientError
+            If the call does not finish in time.
+        RPCServerError
+            If the remote function raised an error, or the call was cancelled.
+        """
+        if not self._done.wait(timeout):
+            raise RPCClientError("The call did not finish in time.")
+        if self._error is not None:
+            raise self._error
+        return self._data
+
+    def cancel(self):
+        """Cancel the call.
+
+        Returns
+        -------
+        bool
+            True if the call was cancelled.
+        """
+        return self.proxy.cancel(self.id)
 
 
 # ==============================================================================
@@ -9,8 +9,13 @@ try:
 except ImportError:
     from xmlrpc.server import SimpleXMLRPCServer
 
+try:
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from socketserver import ThreadingMixIn
+
 
-__all__ = ['Server']
+__all__ = ['Server', 'ThreadedServer']
 
 
 class Server(SimpleXMLRPCServer):
@@ -64,6 +69,20 @@ class Server(SimpleXMLRPCServer):
         self.shutdown()
 
 
+class ThreadedServer(ThreadingMixIn, Server):
+    """Version of :class:`Server` that handles every request in a separate thread.
+
+    Notes
+    -----
+    Requests do not block each other, as long as the registered instance
+    does not execute the calls in the thread of the request,
+    for example if it is a :class:`compas.rpc.WorkerPool`.
+
+    """
+
+    daemon_threads = True
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
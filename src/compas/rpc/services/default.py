@@ -3,6 +3,8 @@
 The server binds to all network interfaces (i.e. ``0.0.0.0``) and
 it listens to requests on port ``1753``.
 
+With ``--workers``, the calls are executed in parallel by a pool of worker processes.
+
 """
 import os
 import sys
@@ -12,6 +14,8 @@ from watchdog.observers import Observer
 
 from compas.rpc import Dispatcher
 from compas.rpc import Server
+from compas.rpc import ThreadedServer
+from compas.rpc import WorkerPool
 
 
 class DefaultService(Dispatcher):
@@ -56,9 +60,13 @@ class ModuleReloader(PatternMatchingEventHandler):
                     sys.modules.pop(module)
 
 
-def start_service(port, autoreload, **kwargs):
+def start_service(port, autoreload, workers=0, preload=None, timeout=None, **kwargs):
     print('Starting default RPC service on port {0}...'.format(port))
 
+    if workers:
+        start_pool_service(port, workers, preload, timeout)
+        return
+
     # start the server on *localhost*
     # and listen to requests on port *1753*
     server = Server(("0.0.0.0", port))
@@ -81,6 +89,29 @@ def start_service(port, autoreload, **kwargs):
     server.serve_forever()
 
 
+def start_pool_service(port, workers, preload=None, timeout=None):
+    # every request is handled in a separate thread of the server
+    # and waits in the queue of the pool for an idle worker
+    # modules are not reloaded automatically
+    # because they are imported in the worker processes
+    server = ThreadedServer(("0.0.0.0", port))
+    pool = WorkerPool(DefaultService(), workers=workers, preload=preload, timeout=timeout)
+
+    server.register_function(server.ping)
+    server.register_function(server.remote_shutdown)
+    server.register_function(pool.cancel)
+    server.register_function(pool.status)
+    server.register_instance(pool)
+
+    pool.start()
+    print('Listening with {} workers...'.format(workers))
+    print('Press CTRL+C to abort')
+    try:
+        server.serve_forever()
+    finally:
+        pool.stop()
+
+
 # ==============================================================================
 # main
 # ==============================================================================
@@ -92,6 +123,9 @@ if __name__ == '__main__':
     parser.add_argument('--port', '-p', action='store', default=1753, type=int, help='RPC port number')
     parser.add_argument('--autoreload', dest='autoreload', action='store_true', help='Autoreload modules')
     parser.add_argument('--no-autoreload', dest='autoreload', action='store_false', help='Do not autoreload modules')
+    parser.add_argument('--workers', '-w', action='store', default=0, type=int, help='Number of worker processes')
+    parser.add_argument('--preload', action='store', nargs='*', default=None, help='Modules to import in every worker process')
+    parser.add_argument('--timeout', action='store', default=None, type=float, help='Maximum execution time of a call in a worker process')
     parser.set_defaults(autoreload=True, func=start_service)
 
     args = parser.parse_args()
@@ -0,0 +1,184 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+import struct
+import sys
+
+from compas.utilities import DataDecoder
+from compas.utilities import DataEncoder
+
+
+__all__ = [
+    'binary_dumps',
+    'binary_loads',
+]
+
+
+MAGIC = b'CRPC'
+ALIGNMENT = 8
+
+
+def binary_dumps(data):
+    """Serialise data to a binary frame, with arrays as raw buffers.
+
+    Parameters
+    ----------
+    data : object
+        The data, with the same restrictions as for :class:`compas.utilities.DataEncoder`.
+
+    Returns
+    -------
+    bytes
+        The binary frame.
+
+    Notes
+    -----
+    The frame consists of the magic bytes ``CRPC``, the length of the header as unsigned 64-bit integer,
+    the header, and the buffers of the arrays.
+    The header is the JSON representation of the data, in which every NumPy array is replaced by
+    ``{"__ndarray__": [offset, dtype, shape]}``, with ``offset`` relative to the start of the buffers.
+    The buffers are stored in little-endian byte order and aligned to 8 bytes.
+
+    """
+    encoder = _BinaryEncoder()
+    header = encoder.encode(data).encode('utf-8')
+    parts = [MAGIC, struct.pack('<Q', len(header)), header, _padding(len(header))]
+    parts += encoder.buffers
+    return b''.join(parts)
+
+
+def binary_loads(frame):
+    """Deserialise data from a binary frame.
+
+    Parameters
+    ----------
+    frame : bytes
+        A frame created by :func:`binary_dumps`.
+
+    Returns
+    -------
+    object
+        The data, with arrays as writable NumPy arrays.
+
+    Raises
+    ------
+    ValueError
+        If the frame is not a binary frame.
+
+    """
+    if frame[:4] != MAGIC:
+        raise ValueError('The data is not a binary frame.')
+    size = struct.unpack('<Q', frame[4:12])[0]
+    start = 12 + size
+    header = frame[12:start].decode('utf-8')
+    start += len(_padding(size))
+    return json.loads(header, cls=_BinaryDecoder, frame=frame, start=start)
+
+
+def binary_insert(frame, key, value):
+    """Insert an item in the dictionary serialised in a binary frame, without decoding the frame.
+
+    Parameters
+    ----------
+    frame : bytes
+        A frame of a dictionary.
+    key : str
+        The key of the new item.
+    value : object
+        A JSON serialisable value.
+
+    Returns
+    -------
+    bytes
+        The new frame.
+
+    """
+    size = struct.unpack('<Q', frame[4:12])[0]
+    header = frame[12:12 + size]
+    offset = 12 + size + len(_padding(size))
+    header = b'{' + json.dumps({key: value})[1:-1].encode('utf-8') + b', ' + header.lstrip()[1:]
+    return b''.join([MAGIC, struct.pack('<Q', len(header)), header, _padding(len(header)), frame[offset:]])
+
+
+def _padding(size):
+    return b'\0' * (-size % ALIGNMENT)
+
+
+class _BinaryEncoder(DataEncoder):
+    """Encoder that collects the buffers of arrays instead of converting them to lists."""
+
+    def __init__(self, *args, **kwargs):
+        super(_BinaryEncoder, self).__init__(*args, **kwargs)
+        self.buffers = []
+        self.offset = 0
+
+    def default(self, o):
+        try:
+            import numpy as np
+        except ImportError:
+            return super(_BinaryEncoder, self).default(o)
+
+        if not isinstance(o, np.ndarray) or o.dtype.hasobject or o.dtype.names:
+            return super(_BinaryEncoder, self).default(o)
+
+        # ascontiguousarray would turn scalar arrays into 1D arrays
+        a = o if o.flags['C_CONTIGUOUS'] else o.copy(order='C')
+        if a.dtype.byteorder == '>' or (a.dtype.byteorder == '=' and sys.byteorder == 'big'):
+            a = a.astype(a.dtype.newbyteorder('<'))
+        buffer = a.tobytes()
+        marker = {'__ndarray__': [self.offset, a.dtype.str, list(a.shape)]}
+        self.buffers.append(buffer)
+        self.buffers.append(_padding(len(buffer)))
+        self.offset += len(buffer) + len(_padding(len(buffer)))
+        return marker
+
+
+class _BinaryDecoder(DataDecoder):
+    """Decoder that restores arrays from the buffers of a frame."""
+
+    def __init__(self, frame=None, start=0, *args, **kwargs):
+        self.frame = frame
+        self.start = start
+        super(_BinaryDecoder, self).__init__(*args, **kwargs)
+
+    def object_hook(self, o):
+        if '__ndarray__' not in o:
+            return super(_BinaryDecoder, self).object_hook(o)
+
+        import numpy as np
+
+        offset, dtype, shape = o['__ndarray__']
+        dtype = np.dtype(dtype)
+        count = 1
+        for n in shape:
+            count *= n
+        a = np.frombuffer(self.frame, dtype=dtype, count=count, offset=self.start + offset)
+        return a.reshape(tuple(shape)).copy()
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import time
+
+    import numpy as np
+
+    xyz = np.random.rand(500000, 3)
+    edges = np.random.randint(0, 500000, (1000000, 2))
+    data = {'args': [xyz, edges], 'kwargs': {'kmax': 100}}
+
+    t0 = time.time()
+    text = json.dumps(data, cls=DataEncoder)
+    json.loads(text, cls=DataDecoder)
+    t1 = time.time()
+    frame = binary_dumps(data)
+    binary_loads(frame)
+    t2 = time.time()
+
+    print('json:   {:.3f}s, {} bytes'.format(t1 - t0, len(text)))
+    print('binary: {:.3f}s, {} bytes'.format(t2 - t1, len(frame)))
@@ -52,6 +52,15 @@ traversal
     dijkstra_path
     shortest_path
 
+search
+------
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    GraphSearch
+
 """
 from __future__ import absolute_import
 from __future__ import division
@@ -60,6 +69,7 @@ from __future__ import print_function
 import compas
 
 from .traversal import *  # noqa: F401 F403
+from .search import *  # noqa: F401 F403
 from .combinatorics import *  # noqa: F401 F403
 from .orientation import *  # noqa: F401 F403
 
@@ -2,10 +2,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from compas.geometry import KDTree
-
 from compas.utilities import pairwise
-from compas.geometry import centroid_points
 from compas.topology import breadth_first_traverse
 
 
@@ -84,60 +81,29 @@ def face_adjacency(xyz, faces):
     >>> faces = [[0, 1, 2], [0, 3, 2]]
     >>> face_adjacency(vertices, faces)
     {0: [1], 1: [0]}
+
+    Notes
+    -----
+    Two faces are neighbours if they share an edge, regardless of the direction in which they traverse it.
+    The faces are found by collecting the faces of every edge in a dictionary,
+    which takes time proportional to the total number of face edges.
+    The coordinates of the vertices are not used.
     """
-    f = len(faces)
-    if f > 100:
-        return _face_adjacency(xyz, faces)
-    adjacency = {}
+    edge_faces = {}
     for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
         for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr, _ in enumerate(faces):
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
-
-
-def _face_adjacency(xyz, faces, nmax=10, radius=2.0):
-    points = [centroid_points([xyz[index] for index in face]) for face in faces]
-    tree = KDTree(points)
-    closest = [tree.nearest_neighbors(point, nmax) for point in points]
-    closest = [[index for _, index, _ in nnbrs] for nnbrs in closest]
+            edge = (u, v) if u < v else (v, u)
+            if edge in edge_faces:
+                edge_faces[edge].append(face)
+            else:
+                edge_faces[edge] = [face]
     adjacency = {}
     for face, vertices in enumerate(faces):
         nbrs = []
-        found = set()
-        nnbrs = set(closest[face])
         for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr in nnbrs:
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
+            for nbr in edge_faces[(u, v) if u < v else (v, u)]:
+                if nbr != face and nbr not in nbrs:
+                    nbrs.append(nbr)
         adjacency[face] = nbrs
     return adjacency
 
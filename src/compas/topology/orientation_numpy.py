@@ -2,11 +2,9 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-from scipy.spatial import cKDTree
-
 from compas.utilities import pairwise
-from compas.geometry import centroid_points
 from compas.topology import breadth_first_traverse
+from compas.topology.orientation import face_adjacency
 
 
 __all__ = [
@@ -41,7 +39,7 @@ def unify_cycles_numpy(vertices, faces, root=0):
     --------
     >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 1.0]]
     >>> faces = [[0, 1, 2], [0, 3, 2]]
-    >>> unify_cycles(vertices, faces)
+    >>> unify_cycles_numpy(vertices, faces)
     [[0, 1, 2], [2, 3, 0]]
     """
     def unify(node, nbr):
@@ -82,64 +80,14 @@ def face_adjacency_numpy(xyz, faces):
     --------
     >>> vertices = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 1.0]]
     >>> faces = [[0, 1, 2], [0, 3, 2]]
-    >>> face_adjacency(vertices, faces)
+    >>> face_adjacency_numpy(vertices, faces)
     {0: [1], 1: [0]}
+
+    Notes
+    -----
+    This function is the same as :func:`compas.topology.face_adjacency`.
     """
-    f = len(faces)
-    if f > 100:
-        return _face_adjacency(xyz, faces)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr, _ in enumerate(faces):
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
-
-
-def _face_adjacency(xyz, faces, nmax=10, radius=2.0):
-    points = [centroid_points([xyz[index] for index in face]) for face in faces]
-    k = min(len(faces), nmax)
-    tree = cKDTree(points)
-    _, closest = tree.query(points, k=k, n_jobs=-1)
-    adjacency = {}
-    for face, vertices in enumerate(faces):
-        nbrs = []
-        found = set()
-        nnbrs = set(closest[face])
-        for u, v in pairwise(vertices + vertices[0:1]):
-            for nbr in nnbrs:
-                if nbr == face:
-                    continue
-                if nbr in found:
-                    continue
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if v == a and u == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-                for a, b in pairwise(faces[nbr] + faces[nbr][0:1]):
-                    if u == a and v == b:
-                        nbrs.append(nbr)
-                        found.add(nbr)
-                        break
-        adjacency[face] = nbrs
-    return adjacency
+    return face_adjacency(xyz, faces)
 
 
 # ==============================================================================
@@ -0,0 +1,359 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from compas.geometry import distance_point_point
+
+
+__all__ = [
+    'GraphSearch',
+]
+
+
+INF = float('inf')
+
+
+class GraphSearch(object):
+    """Shortest path searches on a frozen graph.
+
+    Parameters
+    ----------
+    adjacency : dict
+        An adjacency dictionary. Each key represents a vertex
+        and maps to a list of neighboring vertex keys.
+    weight : dict, optional
+        A dictionary of edge weights.
+        If the weight of an edge ``(u, v)`` is not in the dictionary,
+        the weight of ``(v, u)`` is used instead.
+        Default is the length of the edges if ``xyz`` is provided, and ``1.0`` otherwise.
+    xyz : dict, optional
+        A dictionary of vertex coordinates.
+
+    Attributes
+    ----------
+    keys : list
+        The vertex keys in the order of the vertex indices.
+    key_index : dict
+        Map of vertex keys to vertex indices.
+    indptr : list
+        Index pointers into :attr:`indices` and :attr:`weights` per vertex.
+    indices : list
+        Indices of the neighbors of the vertices, in compressed sparse row (CSR) format.
+    weights : list
+        Weights of the edges to the neighbors of the vertices, in CSR format.
+
+    Notes
+    -----
+    The adjacency and the edge weights are copied into flat lists once.
+    All searches are run on these lists with a binary heap,
+    and only store scores for the vertices they actually visit.
+
+    If the edge weights are the edge lengths, point-to-point searches use A*
+    with the distance to the target as heuristic.
+    Otherwise, they use bidirectional Dijkstra.
+
+    Examples
+    --------
+    >>> adjacency = {0: [1, 2], 1: [0, 2], 2: [0, 1, 3], 3: [2]}
+    >>> weight = {(0, 1): 1.0, (1, 2): 1.0, (0, 2): 3.0, (2, 3): 1.0}
+    >>> search = GraphSearch(adjacency, weight)
+    >>> search.shortest_path(0, 3)
+    [0, 1, 2, 3]
+    >>> search.distances([0]) == {0: 0.0, 1: 1.0, 2: 2.0, 3: 3.0}
+    True
+
+    """
+
+    def __init__(self, adjacency, weight=None, xyz=None):
+        self.keys = list(adjacency)
+        self.key_index = {key: index for index, key in enumerate(self.keys)}
+        self.indptr = [0]
+        self.indices = []
+        self.weights = []
+        self.xyz = None if xyz is None else [xyz[key] for key in self.keys]
+        self.heuristic = weight is None and xyz is not None
+        for u in self.keys:
+            for v in adjacency[u]:
+                if weight is not None:
+                    w = weight[(u, v)] if (u, v) in weight else weight[(v, u)]
+                elif xyz is not None:
+                    w = distance_point_point(xyz[u], xyz[v])
+                else:
+                    w = 1.0
+                self.indices.append(self.key_index[v])
+                self.weights.append(w)
+            self.indptr.append(len(self.indices))
+        self._reverse()
+
+    def _reverse(self):
+        """Store the reversed edges in CSR format, for the backward part of a bidirectional search."""
+        n = len(self.keys)
+        count = [0] * (n + 1)
+        for j in self.indices:
+            count[j + 1] += 1
+        for i in range(n):
+            count[i + 1] += count[i]
+        self.rindptr = count[:]
+        self.rindices = [0] * len(self.indices)
+        self.rweights = [0.0] * len(self.indices)
+        for i in range(n):
+            for k in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[k]
+                self.rindices[count[j]] = i
+                self.rweights[count[j]] = self.weights[k]
+                count[j] += 1
+
+    @classmethod
+    def from_network(cls, network, weight=None):
+        """Construct a graph search from a network.
+
+        Parameters
+        ----------
+        network : compas.datastructures.Network
+            A network.
+        weight : dict, optional
+            A dictionary of edge weights.
+            Default is the length of the edges.
+
+        Returns
+        -------
+        GraphSearch
+
+        """
+        xyz = {key: network.node_coordinates(key) for key in network.nodes()}
+        return cls(network.adjacency, weight, xyz)
+
+    @classmethod
+    def from_mesh(cls, mesh, weight=None):
+        """Construct a graph search from the vertices and edges of a mesh.
+
+        Parameters
+        ----------
+        mesh : compas.datastructures.Mesh
+            A mesh.
+        weight : dict, optional
+            A dictionary of edge weights.
+            Default is the length of the edges.
+
+        Returns
+        -------
+        GraphSearch
+
+        """
+        xyz = {key: mesh.vertex_coordinates(key) for key in mesh.vertices()}
+        return cls(mesh.adjacency, weight, xyz)
+
+    # --------------------------------------------------------------------------
+    # searches
+    # --------------------------------------------------------------------------
+
+    def _dijkstra(self, sources):
+        """Compute the distances and predecessors of all vertices reachable from a set of source indices."""
+        indptr = self.indptr
+        indices = self.indices
+        weights = self.weights
+        n = len(self.keys)
+        distance = [INF] * n
+        predecessor = [-1] * n
+        done = [False] * n
+        heap = []
+        for s in sources:
+            distance[s] = 0.0
+            heap.append((0.0, s))
+        heapify(heap)
+        while heap:
+            d, u = heappop(heap)
+            if done[u]:
+                continue
+            done[u] = True
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                dv = d + weights[k]
+                if dv < distance[v]:
+                    distance[v] = dv
+                    predecessor[v] = u
+                    heappush(heap, (dv, v))
+        return distance, predecessor
+
+    def _astar(self, s, t):
+        indptr = self.indptr
+        indices = self.indices
+        weights = self.weights
+        xyz = self.xyz
+        goal = xyz[t]
+        distance = {s: 0.0}
+        predecessor = {s: -1}
+        done = set()
+        heap = [(distance_point_point(xyz[s], goal), s)]
+        while heap:
+            _, u = heappop(heap)
+            if u == t:
+                return predecessor
+            if u in done:
+                continue
+            done.add(u)
+            d = distance[u]
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                dv = d + weights[k]
+                if dv < distance.get(v, INF):
+                    distance[v] = dv
+                    predecessor[v] = u
+                    heappush(heap, (dv + distance_point_point(xyz[v], goal), v))
+        return None
+
+    def _bidirectional(self, s, t):
+        forward = (self.indptr, self.indices, self.weights)
+        backward = (self.rindptr, self.rindices, self.rweights)
+        distance = ({s: 0.0}, {t: 0.0})
+        predecessor = ({s: -1}, {t: -1})
+        done = (set(), set())
+        heaps = ([(0.0, s)], [(0.0, t)])
+        best = 0.0 if s == t else INF
+        meet = s if s == t else -1
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            i = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, u = heappop(heaps[i])
+            if u in done[i]:
+                continue
+            done[i].add(u)
+            indptr, indices, weights = forward if i == 0 else backward
+            other = distance[1 - i]
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                dv = d + weights[k]
+                if dv < distance[i].get(v, INF):
+                    distance[i][v] = dv
+                    predecessor[i][v] = u
+                    heappush(heaps[i], (dv, v))
+                if v in other and dv + other[v] < best:
+                    best = dv + other[v]
+                    meet = v
+        if meet == -1:
+            return None
+        path = []
+        u = meet
+        while u != -1:
+            path.append(u)
+            u = predecessor[0][u]
+        path.reverse()
+        u = predecessor[1][meet]
+        while u != -1:
+            path.append(u)
+            u = predecessor[1][u]
+        return path
+
+    def shortest_path(self, source, target):
+        """Find the shortest path between two vertices.
+
+        Parameters
+        ----------
+        source : hashable
+            The key of the start vertex.
+        target : hashable
+            The key of the end vertex.
+
+        Returns
+        -------
+        list, None
+            The keys of the vertices of the path,
+            or None, if no path exists between the vertices.
+
+        """
+        s = self.key_index[source]
+        t = self.key_index[target]
+        if not self.heuristic:
+            path = self._bidirectional(s, t)
+            if path is None:
+                return None
+            return [self.keys[i] for i in path]
+        predecessor = self._astar(s, t)
+        if predecessor is None:
+            return None
+        path = [t]
+        while predecessor[path[-1]] != -1:
+            path.append(predecessor[path[-1]])
+        return [self.keys[i] for i in reversed(path)]
+
+    def distances(self, sources):
+        """Compute the distances of all vertices to the nearest of one or more source vertices.
+
+        Parameters
+        ----------
+        sources : list
+            The keys of the source vertices.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping the keys of all reachable vertices to their distance.
+
+        """
+        distance, _ = self._dijkstra([self.key_index[key] for key in sources])
+        return {key: d for key, d in zip(self.keys, distance) if d < INF}
+
+    def distances_many(self, sources):
+        """Compute the distances of all vertices to each of many source vertices.
+
+        Parameters
+        ----------
+        sources : list
+            The keys of the source vertices.
+
+        Returns
+        -------
+        list
+            For each source, a dictionary mapping the keys of all reachable vertices to their distance.
+
+        """
+        return [self.distances([key]) for key in sources]
+
+    def all_pairs_distances(self):
+        """Compute the distances between all pairs of vertices.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping the keys of all vertices
+            to a dictionary of the distances of all reachable vertices.
+
+        """
+        return dict(zip(self.keys, self.distances_many(self.keys)))
+
+    def paths(self, source):
+        """Compute the shortest paths from a source vertex to all reachable vertices.
+
+        Parameters
+        ----------
+        source : hashable
+            The key of the source vertex.
+
+        Returns
+        -------
+        dict
+            A dictionary mapping the keys of all reachable vertices
+            to the key of their predecessor on the shortest path from the source.
+            The predecessor of the source is None.
+
+        """
+        _, predecessor = self._dijkstra([self.key_index[source]])
+        tree = {key: self.keys[i] for key, i in zip(self.keys, predecessor) if i != -1}
+        tree[source] = None
+        return tree
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == "__main__":
+
+    import doctest
+
+    doctest.testmod(globs=globals())
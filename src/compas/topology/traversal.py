@@ -2,12 +2,9 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
-try:
-    from queue import PriorityQueue
-except ImportError:
-    from Queue import PriorityQueue
-
 from collections import deque
+from heapq import heappop
+from heapq import heappush
 
 from compas.geometry import distance_point_point
 
@@ -355,17 +352,24 @@ def astar_shortest_path(network, root, goal):
     ----------
     https://en.wikipedia.org/wiki/A*_search_algorithm
     """
-    root_coords = network.vertex_coordinates(root)
-    goal_coords = network.vertex_coordinates(goal)
+    if hasattr(network, 'node_coordinates'):
+        coordinates = network.node_coordinates
+    else:
+        coordinates = network.vertex_coordinates
+    adjacency = network.adjacency
+
+    # The coordinates of the nodes that were discovered so far.
+    xyz = {root: coordinates(root), goal: coordinates(goal)}
+    goal_coords = xyz[goal]
 
     # The set of nodes already evaluated
     visited_set = set()
 
-    # The set of currently discovered nodes that are not evaluated yet.
+    # The heap of currently discovered nodes that are not evaluated yet.
     # Initially, only the start node is known.
-    candidates_set = {root}
-    best_candidate_heap = PriorityQueue()
-    best_candidate_heap.put((0, root))
+    # Nodes that are discovered again with a lower score are pushed again,
+    # and their outdated entries are skipped when they are popped.
+    best_candidate_heap = [(distance_point_point(xyz[root], goal_coords), root)]
 
     # For each node, which node it can most efficiently be reached from.
     # If a node can be reached from many nodes, came_from will eventually contain the
@@ -373,51 +377,40 @@ def astar_shortest_path(network, root, goal):
     came_from = dict()
 
     # g_score is a dict mapping node index to the cost of getting from the root node to that node.
-    # The default value is Infinity.
+    # Nodes that are not in the dict have not been discovered yet,
+    # and the cost of getting to them is Infinity.
     # The cost of going from start to start is zero.
-    g_score = dict()
-
-    for v in network.vertices():
-        g_score[v] = float("inf")
-
-    g_score[root] = 0
-
-    # For each node, the total cost of getting from the start node to the goal
-    # by passing by that node. That value is partly known, partly heuristic.
-    # The default value of f_score is Infinity
-    f_score = dict()
+    g_score = {root: 0}
 
-    for v in network.vertices():
-        f_score[v] = float("inf")
-
-    # For the first node, that value is completely heuristic.
-    f_score[root] = distance_point_point(root_coords, goal_coords)
-
-    while not best_candidate_heap.empty():
-        _, current = best_candidate_heap.get()
+    while best_candidate_heap:
+        _, current = heappop(best_candidate_heap)
         if current == goal:
             break
+        if current in visited_set:
+            continue
 
         visited_set.add(current)
-        current_coords = network.vertex_coordinates(current)
-        for neighbor in network.vertex_neighbors(current):
+        current_coords = xyz[current]
+        for neighbor in adjacency[current]:
             if neighbor in visited_set:
                 continue  # Ignore the neighbor which is already evaluated.
 
+            if neighbor not in xyz:  # Discover a new node
+                xyz[neighbor] = coordinates(neighbor)
+            neighbor_coords = xyz[neighbor]
+
             # The distance from start to a neighbor
-            neighbor_coords = network.vertex_coordinates(neighbor)
             tentative_gScore = g_score[current] + distance_point_point(current_coords, neighbor_coords)
-            if neighbor not in candidates_set:  # Discover a new node
-                candidates_set.add(neighbor)
-            elif tentative_gScore >= g_score[neighbor]:
+            if tentative_gScore >= g_score.get(neighbor, float("inf")):
                 continue
 
             # This path is the best until now. Record it!
             came_from[neighbor] = current
             g_score[neighbor] = tentative_gScore
-            new_fscore = g_score[neighbor] + distance_point_point(neighbor_coords, goal_coords)
-            f_score[neighbor] = new_fscore
-            best_candidate_heap.put((new_fscore, neighbor))
+            # The total cost of getting from the start node to the goal by passing by this node.
+            # That value is partly known, partly heuristic.
+            new_fscore = tentative_gScore + distance_point_point(neighbor_coords, goal_coords)
+            heappush(best_candidate_heap, (new_fscore, neighbor))
 
     return reconstruct_path(came_from, goal)
 
@@ -447,19 +440,22 @@ def dijkstra_distances(adjacency, weight, target):
     --------
     >>>
     """
-    adjacency = {key: set(nbrs) for key, nbrs in adjacency.items()}
     distance = {key: (0 if key == target else 1e+17) for key in adjacency}
-    tovisit = set(adjacency.keys())
     visited = set()
+    heap = [(0, target)]
 
-    while tovisit:
-        u = min(tovisit, key=lambda k: distance[k])
-        tovisit.remove(u)
+    while heap:
+        d, u = heappop(heap)
+        if u in visited:
+            continue
         visited.add(u)
-        for v in adjacency[u] - visited:
-            d = distance[u] + weight[(u, v)]
-            if d < distance[v]:
-                distance[v] = d
+        for v in adjacency[u]:
+            if v in visited:
+                continue
+            dv = d + weight[(u, v)]
+            if dv < distance[v]:
+                distance[v] = dv
+                heappush(heap, (dv, v))
     return distance
 
 
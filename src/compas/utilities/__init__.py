@@ -16,6 +16,16 @@ async
     await_callback
 
 
+cache
+=====
+
+.. autosummary::
+    :toctree: generated/
+    :nosignatures:
+
+    ResultCache
+
+
 colors
 ======
 
@@ -72,6 +82,7 @@ maps
     geometric_key
     reverse_geometric_key
     geometric_key_xy
+    weld_points
 
 
 """
@@ -80,6 +91,7 @@ from __future__ import division
 from __future__ import print_function
 
 from .azync import *  # noqa: F401 F403
+from .cache import *  # noqa: F401 F403
 from .coercing import *  # noqa: F401 F403
 from .colors import *  # noqa: F401 F403
 from .datetime import *  # noqa: F401 F403
@@ -0,0 +1,264 @@
+from __future__ import print_function
+from __future__ import absolute_import
+from __future__ import division
+
+import hashlib
+import os
+import threading
+
+from collections import OrderedDict
+
+import compas
+
+
+__all__ = ['ResultCache']
+
+
+class ResultCache(object):
+    """Least-recently-used cache for the serialised results of remote function calls.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        The maximum number of results.
+        Default is ``128``.
+    maxbytes : int, optional
+        The maximum total size of the results, in bytes.
+        Default is ``None``, in which case there is no limit.
+    memory : bool, optional
+        Keep the results in memory.
+        Default is ``True``.
+    disk : bool, optional
+        Store the results on disk, such that they are also available to other sessions.
+        Default is ``False``.
+    directory : str, optional
+        The directory of the results stored on disk.
+        Default is a folder ``cache`` in ``compas.APPTEMP``.
+
+    Attributes
+    ----------
+    hits : int
+        The number of results found in the cache.
+    misses : int
+        The number of results not found in the cache.
+
+    Notes
+    -----
+    The results are identified by a hash of the name of the function and of its serialised input.
+    The cache stores the serialised output, such that every hit returns a new copy of the result,
+    which can be modified without affecting the cache.
+    The limits apply separately to the results in memory and on disk.
+
+    Examples
+    --------
+    >>> cache = ResultCache(maxsize=2)
+    >>> key = cache.key('compas.numerical.fd_numpy', '{"args": [], "kwargs": {}}')
+    >>> cache.get(key) is None
+    True
+    >>> cache.set(key, '{"data": 1}')
+    >>> cache.get(key)
+    '{"data": 1}'
+    >>> cache.hits, cache.misses
+    (1, 1)
+
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None, memory=True, disk=False, directory=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.memory = memory
+        self.disk = disk
+        self.directory = directory or os.path.join(compas.APPTEMP, 'cache')
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(name, payload):
+        """Compute the key of a call.
+
+        Parameters
+        ----------
+        name : str
+            The full name of the function.
+        payload : str or bytes
+            The serialised input of the call.
+
+        Returns
+        -------
+        str
+            A hexadecimal SHA-256 hash.
+
+        """
+        h = hashlib.sha256(name.encode('utf-8'))
+        h.update(b'\0')
+        if not isinstance(payload, bytes):
+            payload = payload.encode('utf-8')
+        h.update(payload)
+        return h.hexdigest()
+
+    def get(self, key):
+        """Get a result from the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the call.
+
+        Returns
+        -------
+        str or bytes
+            The serialised result, or ``None`` if it is not in the cache.
+
+        """
+        with self._lock:
+            payload = None
+            if self.memory and key in self._entries:
+                payload = self._entries.pop(key)
+                self._entries[key] = payload
+            elif self.disk:
+                payload = self._read(key)
+                if payload is not None and self.memory:
+                    self._add(key, payload)
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return payload
+
+    def set(self, key, payload):
+        """Add a result to the cache.
+
+        Parameters
+        ----------
+        key : str
+            The key of the call.
+        payload : str or bytes
+            The serialised result.
+
+        """
+        with self._lock:
+            if self.memory:
+                self._add(key, payload)
+            if self.disk:
+                self._write(key, payload)
+
+    def clear(self):
+        """Remove all results from the cache, in memory and on disk, and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+            if self.disk:
+                for path in self._files():
+                    _remove(path)
+
+    def stats(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            ``'hits'``, ``'misses'``, and the number (``'entries'``) and total size (``'bytes'``)
+            of the results in memory.
+
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self._nbytes}
+
+    # --------------------------------------------------------------------------
+    # memory
+    # --------------------------------------------------------------------------
+
+    def _add(self, key, payload):
+        if key in self._entries:
+            self._nbytes -= len(self._entries.pop(key))
+        self._entries[key] = payload
+        self._nbytes += len(payload)
+        while self._entries and (len(self._entries) > self.maxsize or (self.maxbytes is not None and self._nbytes > self.maxbytes)):
+            _, old = self._entries.popitem(last=False)
+            self._nbytes -= len(old)
+
+    # --------------------------------------------------------------------------
+    # disk
+    # --------------------------------------------------------------------------
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.cache')
+
+    def _files(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if name.endswith('.cache')]
+
+    def _read(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fo:
+                data = fo.read()
+            # the modification time marks the last use
+            os.utime(path, None)
+        except (IOError, OSError):
+            return None
+        if data[:1] == b't':
+            return data[1:].decode('utf-8')
+        return data[1:]
+
+    def _write(self, key, payload):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        if isinstance(payload, bytes):
+            data = b'b' + payload
+        else:
+            data = b't' + payload.encode('utf-8')
+        # write and rename, such that other sessions never read partial files
+        path = self._path(key)
+        temp = '{}.{}.{}'.format(path, os.getpid(), threading.current_thread().ident)
+        with open(temp, 'wb') as fo:
+            fo.write(data)
+        try:
+            os.rename(temp, path)
+        except OSError:
+            # the file exists on Windows
+            _remove(path)
+            try:
+                os.rename(temp, path)
+            except OSError:
+                _remove(temp)
+        self._trim()
+
+    def _trim(self):
+        files = []
+        for path in self._files():
+            try:
+                files.append((os.path.getmtime(path), os.path.getsize(path), path))
+            except OSError:
+                pass
+        files.sort(reverse=True)
+        nbytes = 0
+        for index, (_, size, path) in enumerate(files):
+            nbytes += size
+            if index >= self.maxsize or (self.maxbytes is not None and nbytes > self.maxbytes):
+                _remove(path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# ==============================================================================
+# Main
+# ==============================================================================
+
+if __name__ == '__main__':
+
+    import doctest
+    doctest.testmod(globs=globals())
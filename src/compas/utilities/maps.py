@@ -2,6 +2,8 @@ from __future__ import print_function
 from __future__ import absolute_import
 from __future__ import division
 
+from math import floor
+
 import compas
 
 
@@ -9,6 +11,7 @@ __all__ = [
     'geometric_key',
     'reverse_geometric_key',
     'geometric_key_xy',
+    'weld_points',
 ]
 
 
@@ -128,6 +131,125 @@ def geometric_key_xy(xy, precision=None, sanitize=True):
     return '{0:.{2}},{1:.{2}}'.format(x, y, precision)
 
 
+def weld_points(points, precision=None, tolerance=None):
+    """Identify groups of points with the same coordinates up to a given precision.
+
+    Parameters
+    ----------
+    points : list
+        XYZ coordinates of the points.
+    precision : str, optional
+        The precision of the coordinates, with the same meaning as for :func:`geometric_key`.
+        Default is ``None``, in which case the global precision setting will be used (``compas.PRECISION``).
+    tolerance : float, optional
+        If provided, groups with points that are closer to each other than this distance are merged,
+        also if their coordinates differ up to the given precision.
+        Default is ``None``.
+
+    Returns
+    -------
+    tuple
+        * For every point, the index of its group.
+          The groups are numbered in order of first occurrence.
+        * For every group, the index of its last point.
+
+    Notes
+    -----
+    The points are grouped in the same way as by a dictionary of geometric keys,
+    but without converting coordinates to strings.
+    For float precisions, the coordinates are quantised to integer grid cells of size
+    ``10 ** -digits``. Only coordinates that lie (almost) exactly halfway between
+    two grid values can be assigned to a different cell than by string formatting.
+
+    With a tolerance, points are also compared to the points in the neighbouring cells
+    of a grid with cells of the size of the tolerance.
+    Groups of points that are close to each other are merged transitively.
+
+    Examples
+    --------
+    >>> points = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0001, 0.0, 0.0], [1.0, 0.0, 0.01]]
+    >>> weld_points(points, '3f')
+    ([0, 1, 0, 2], [2, 1, 3])
+    >>> weld_points(points, '3f', tolerance=0.1)
+    ([0, 1, 0, 1], [2, 3])
+
+    """
+    cell = _cell_key(precision)
+    cell_group = {}
+    index = []
+    last = []
+    for i, xyz in enumerate(points):
+        key = cell(xyz)
+        group = cell_group.get(key)
+        if group is None:
+            group = cell_group[key] = len(last)
+            last.append(i)
+        else:
+            last[group] = i
+        index.append(group)
+    if tolerance:
+        return _weld_tolerance(points, index, last, tolerance)
+    return index, last
+
+
+def _cell_key(precision):
+    """Get the function that maps coordinates to a hashable key for a given precision."""
+    if not precision:
+        precision = compas.PRECISION
+    if precision == 'd':
+        return lambda xyz: (int(xyz[0]), int(xyz[1]), int(xyz[2]))
+    if precision[-1] == 'f' and precision[:-1].isdigit():
+        scale = 10.0 ** int(precision[:-1])
+        return lambda xyz: (int(floor(xyz[0] * scale + 0.5)),
+                            int(floor(xyz[1] * scale + 0.5)),
+                            int(floor(xyz[2] * scale + 0.5)))
+    return lambda xyz: geometric_key(xyz, precision)
+
+
+def _weld_tolerance(points, index, last, tolerance):
+    parent = list(range(len(last)))
+
+    def find(group):
+        while parent[group] != group:
+            parent[group] = parent[parent[group]]
+            group = parent[group]
+        return group
+
+    t2 = tolerance ** 2
+    grid = {}
+    for i, (x, y, z) in enumerate(points):
+        cx = int(floor(x / tolerance))
+        cy = int(floor(y / tolerance))
+        cz = int(floor(z / tolerance))
+        a = find(index[i])
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    for j in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                        b = find(index[j])
+                        if a == b:
+                            continue
+                        u, v, w = points[j]
+                        if (x - u) ** 2 + (y - v) ** 2 + (z - w) ** 2 <= t2:
+                            # the group with the earliest first point becomes the root
+                            if b < a:
+                                a, b = b, a
+                            parent[b] = a
+        grid.setdefault((cx, cy, cz), []).append(i)
+
+    # renumber the merged groups in order of first occurrence
+    root_group = {}
+    merged = []
+    for group in range(len(last)):
+        root = find(group)
+        if root not in root_group:
+            root_group[root] = len(merged)
+            merged.append(last[group])
+        else:
+            merged[root_group[root]] = max(merged[root_group[root]], last[group])
+    return [root_group[find(group)] for group in index], merged
+
+
 # ==============================================================================
 # Main
 # ==============================================================================
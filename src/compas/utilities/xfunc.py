@@ -11,6 +11,7 @@ import compas._os
 
 from compas.utilities import DataEncoder
 from compas.utilities import DataDecoder
+from compas.utilities.cache import ResultCache
 
 try:
     import cPickle as pickle
@@ -156,6 +157,11 @@ class XFunc(object):
     serializer : {'json', 'pickle'}, optional
         The serialisation mechnanism to be used to pass data between the caller and the subprocess.
         Default is ``'json'``.
+    cache : bool or :class:`compas.utilities.ResultCache`, optional
+        Cache the results of the calls, and return the cached result
+        if the function is called again with the same input, without starting a subprocess.
+        ``True`` creates an in-memory cache with default settings.
+        Default is ``None``, in which case the results are not cached.
 
     Attributes
     ----------
@@ -184,6 +190,9 @@ class XFunc(object):
 
         fd_numpy = XFunc('compas.numerical.fd_numpy', python='/Users/brg/environments/py2/python')
 
+    Only use a cache for functions that always return the same result for the same input.
+    Errors are not cached.
+
     Examples
     --------
     `compas.numerical` provides an implementation of the Force Density Method that
@@ -236,8 +245,9 @@ class XFunc(object):
     def __init__(self, funcname, basedir='.', tmpdir=None, delete_files=True,
                  verbose=True, callback=None, callback_args=None, python=None,
                  paths=None, serializer='json',
-                 argtypes=None, kwargtypes=None, restypes=None):
+                 argtypes=None, kwargtypes=None, restypes=None, cache=None):
         self._basedir = None
+        self._cache = None
         self._tmpdir = None
         self._callback = None
         self._python = None
@@ -255,6 +265,7 @@ class XFunc(object):
         self.argtypes = argtypes
         self.kwargtypes = kwargtypes
         self.restypes = restypes
+        self.cache = cache
         self.data = None
         self.profile = None
         self.error = None
@@ -311,6 +322,17 @@ class XFunc(object):
             raise Exception("*serializer* should be one of {'json', 'pickle'}.")
         self._serializer = serializer
 
+    @property
+    def cache(self):
+        """:class:`compas.utilities.ResultCache`: The cache of the results, if any."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache):
+        if cache is True:
+            cache = ResultCache()
+        self._cache = cache or None
+
     @property
     def ipath(self):
         return os.path.join(self.tmpdir, '%s.in' % self.funcname)
@@ -354,12 +376,28 @@ class XFunc(object):
             # 'restypes': self.restypes
         }
 
+        if self.serializer == 'json':
+            istring = json.dumps(idict, cls=DataEncoder)
+        else:
+            istring = pickle.dumps(idict, protocol=2)
+
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self.funcname, istring)
+            ostring = self.cache.get(key)
+            if ostring is not None:
+                odict = self._loads(ostring)
+                self.data = odict['data']
+                self.profile = odict['profile']
+                self.error = None
+                return self.data
+
         if self.serializer == 'json':
             with open(self.ipath, 'w+') as fo:
-                json.dump(idict, fo, cls=DataEncoder)
+                fo.write(istring)
         else:
             with open(self.ipath, 'wb+') as fo:
-                pickle.dump(idict, fo, protocol=2)
+                fo.write(istring)
 
         with open(self.opath, 'w+') as fh:
             fh.write('')
@@ -411,10 +449,11 @@ class XFunc(object):
 
         if self.serializer == 'json':
             with open(self.opath, 'r') as fo:
-                odict = json.load(fo, cls=DataDecoder)
+                ostring = fo.read()
         else:
             with open(self.opath, 'rb') as fo:
-                odict = pickle.load(fo)
+                ostring = fo.read()
+        odict = self._loads(ostring)
 
         self.data = odict['data']
         self.profile = odict['profile']
@@ -433,8 +472,16 @@ class XFunc(object):
         if self.error:
             raise Exception(self.error)
 
+        if key is not None:
+            self.cache.set(key, ostring)
+
         return self.data
 
+    def _loads(self, ostring):
+        if self.serializer == 'json':
+            return json.loads(ostring, cls=DataDecoder)
+        return pickle.loads(ostring)
+
 
 # ==============================================================================
 # Main
@@ -7,6 +7,7 @@ import pytest
 from compas.datastructures import Mesh
 from compas.datastructures import meshes_join_and_weld
 from compas.geometry import Polygon
+from compas.geometry import allclose
 from compas.geometry import Translation
 
 
@@ -543,6 +544,19 @@ def test_vertex_normal():
     assert mesh.vertex_normal(5) == [-0.482011312317331, -0.32250183520381565, 0.814651864963369]
 
 
+def test_vertices_normals():
+    mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
+    normals = mesh.vertices_normals()
+    for index, key in enumerate(mesh.vertices()):
+        assert allclose(normals[index], mesh.vertex_normal(key))
+
+
+def test_edges_lengths():
+    mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
+    lengths = mesh.edges_lengths()
+    assert allclose(lengths, [mesh.edge_length(u, v) for u, v in mesh.edges()])
+
+
 def test_vertex_curvature():
     mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
     assert mesh.vertex_curvature(0) == 0.0029617825994936453
@@ -579,6 +593,26 @@ def test_face_area():
     assert mesh.face_area(0) == 0.3374168482414756
 
 
+def test_faces_normals():
+    mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
+    normals = mesh.faces_normals()
+    for index, fkey in enumerate(mesh.faces()):
+        assert allclose(normals[index], mesh.face_normal(fkey))
+
+
+def test_faces_centroids():
+    mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
+    centroids = mesh.faces_centroids()
+    for index, fkey in enumerate(mesh.faces()):
+        assert allclose(centroids[index], mesh.face_centroid(fkey))
+
+
+def test_faces_areas():
+    mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
+    areas = mesh.faces_areas()
+    assert allclose(areas, [mesh.face_area(fkey) for fkey in mesh.faces()])
+
+
 def test_face_flatness():
     mesh = Mesh.from_obj(compas.get('quadmesh.obj'))
     assert mesh.face_flatness(0) == 0.23896112582475654
@@ -0,0 +1,75 @@
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+
+
+def test_closest_points():
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from numpy import array
+    from numpy import einsum
+    from numpy.random import RandomState
+    from compas.datastructures import MeshBVH
+    from compas.datastructures.mesh.bvh_numpy import _closest_points_on_triangles
+
+    mesh = Mesh.from_obj(compas.get('tubemesh.obj'))
+    bvh = MeshBVH.from_mesh(mesh, leafsize=4)
+    xyz = array(mesh.vertices_attributes('xyz'))
+    points = RandomState(0).uniform(xyz.min(axis=0) - 1, xyz.max(axis=0) + 1, (200, 3))
+
+    closest, faces, uvw = bvh.closest_points(points, chunksize=64)
+    assert allclose(uvw.sum(axis=1), 1.0)
+    fkeys = list(mesh.faces())
+    for point, cp, face in zip(points, closest, faces):
+        triangles = bvh.vertices[bvh.triangles]
+        p = point[None, :].repeat(len(triangles), axis=0)
+        candidates, _ = _closest_points_on_triangles(p, triangles[:, 0], triangles[:, 1], triangles[:, 2])
+        r = candidates - p
+        assert allclose(((cp - point) ** 2).sum(), einsum('ij,ij->i', r, r).min())
+        assert fkeys[face] in mesh.face
+
+
+def test_pull_points():
+    if compas.IPY:
+        return
+    from compas.datastructures import trimesh_pull_points_numpy
+
+    # long and thin triangles, where the nearest vertex is far from the closest point
+    mesh = Mesh.from_vertices_and_faces([[0, 0, 0], [100, 0, 0], [100, 1, 0], [0, 1, 0]], [[0, 1, 2], [0, 2, 3]])
+    pulled = trimesh_pull_points_numpy(mesh, [[50.0, 0.25, 3.0], [50.0, 0.75, -3.0]])
+    assert pulled == [[50.0, 0.25, 0.0], [50.0, 0.75, 0.0]]
+
+
+def test_closest_points_empty():
+    if compas.IPY:
+        return
+    from compas.datastructures import MeshBVH
+
+    bvh = MeshBVH.from_vertices_and_faces([[0, 0, 0], [1, 0, 0]], [])
+    xyz, faces, uvw = bvh.closest_points([])
+    assert xyz.shape == (0, 3)
+    assert faces.shape == (0, )
+    with pytest.raises(ValueError):
+        bvh.closest_points([[0, 0, 1]])
+
+
+def test_closest_points_degenerate():
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from numpy import einsum
+    from compas.datastructures import MeshBVH
+
+    # a triangle with two identical corners, a collinear triangle and a collapsed triangle
+    vertices = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [5, 5, 0], [5, 5, 0], [6, 5, 0], [0, 5, 0], [1, 5, 0], [2, 5, 0], [9, 9, 9]]
+    faces = [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9, 9, 9]]
+    bvh = MeshBVH.from_vertices_and_faces(vertices, faces)
+    points = [[0.2, 0.2, 1], [5.5, 5.2, 1], [5.6, 4.0, 0], [1.5, 6.0, 0], [9, 9, 8]]
+    closest, faces, uvw = bvh.closest_points(points)
+    assert allclose(closest, [[0.2, 0.2, 0], [5.5, 5, 0], [5.6, 5, 0], [1.5, 5, 0], [9, 9, 9]])
+    assert faces.tolist() == [0, 1, 1, 2, 3]
+    assert allclose(uvw.sum(axis=1), 1.0)
+    xyz = bvh.vertices[bvh.triangles[faces]]
+    assert allclose(einsum('ij,ijk->ik', uvw, xyz), closest)
@@ -0,0 +1,70 @@
+import pytest
+
+import compas
+
+from compas.datastructures import Mesh
+
+
+if not compas.IPY:
+    from compas.datastructures import CompactMesh
+
+    @pytest.fixture
+    def mesh():
+        mesh = Mesh.from_obj(compas.get('faces.obj'))
+        mesh.update_default_vertex_attributes(is_fixed=False)
+        mesh.vertex_attribute(0, 'is_fixed', True)
+        mesh.face_attribute(3, 'color', (255, 0, 0))
+        mesh.edge_attribute((1, 2), 'q', 2.0)
+        mesh.delete_face(0)
+        mesh.delete_vertex(20)
+        return mesh
+
+    def test_roundtrip(mesh):
+        compact = CompactMesh.from_mesh(mesh)
+        other = Mesh.from_compact(compact)
+        assert other.data == mesh.data
+
+    def test_halfedge(mesh):
+        compact = mesh.to_compact()
+        assert len(compact.halfedge) == mesh.number_of_vertices()
+        for key in mesh.vertices():
+            assert compact.halfedge[key] == mesh.halfedge[key]
+
+    def test_topology(mesh):
+        compact = mesh.to_compact()
+        assert list(compact.vertices()) == list(mesh.vertices())
+        assert list(compact.faces()) == list(mesh.faces())
+        assert compact.number_of_edges() == mesh.number_of_edges()
+        assert set(map(frozenset, compact.edges())) == set(map(frozenset, mesh.edges()))
+        assert compact.vertices_degrees().tolist() == [mesh.vertex_degree(key) for key in mesh.vertices()]
+        for fkey in mesh.faces():
+            assert compact.face_vertices(fkey) == mesh.face_vertices(fkey)
+            assert sorted(compact.face_neighbors(fkey)) == sorted(mesh.face_neighbors(fkey))
+        for key in mesh.vertices():
+            assert compact.vertex_coordinates(key) == mesh.vertex_coordinates(key)
+            assert compact.is_vertex_on_boundary(key) == mesh.is_vertex_on_boundary(key)
+
+    def test_attributes(mesh):
+        compact = mesh.to_compact()
+        assert compact.vertex_attribute(0, 'is_fixed')
+        assert not compact.vertex_attribute(1, 'is_fixed')
+        assert compact.face_attribute(3, 'color') == (255, 0, 0)
+        assert compact.edge_attributes((2, 1), ['q']) == [2.0]
+        assert compact.edge_attributes((2, 3), ['q']) == [None]
+
+    def test_halfedge_arrays(mesh):
+        compact = mesh.to_compact()
+        twin = compact.halfedge_twin
+        nxt = compact.halfedge_next
+        assert (twin >= 0).all()
+        assert (compact.halfedge_vertex[twin[twin]] == compact.halfedge_vertex).all()
+        assert (compact.halfedge_vertex[nxt] == compact.halfedge_vertex[twin]).all()
+
+    def test_from_vertices_and_faces():
+        vertices = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+        faces = [[0, 1, 2, 0], [0, 0, 2, 3], [1, 2]]
+        compact = CompactMesh.from_vertices_and_faces(vertices, faces)
+        mesh = Mesh.from_vertices_and_faces(vertices, faces)
+        assert compact.to_mesh().data == mesh.data
+        with pytest.raises(KeyError):
+            compact.vertex_coordinates(4)
@@ -0,0 +1,43 @@
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+
+
+@pytest.fixture
+def grid():
+    mesh = Mesh.from_obj(compas.get('faces_big.obj'))
+    mesh.quads_to_triangles()
+    return mesh
+
+
+def test_geodesic_distances(grid):
+    if compas.IPY:
+        return
+    from numpy import array
+    from numpy import median
+    from compas.datastructures import GeodesicSolver
+    from compas.numerical import normrow
+
+    xyz = array(grid.vertices_attributes('xyz'))
+    center = normrow(xyz - xyz.mean(axis=0)).argmin()
+    d = GeodesicSolver(grid).distances([center])
+    e = normrow(xyz - xyz[center]).ravel()
+    assert d[center] == 0.0
+    assert abs(median(d[e > 5] / e[e > 5]) - 1.0) < 0.05
+
+
+def test_geodesic_distances_many(grid):
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from compas.datastructures import GeodesicSolver
+    from compas.datastructures import mesh_geodesic_distances_numpy
+
+    solver = GeodesicSolver(grid)
+    sources = [[0], [10, 20], [100]]
+    D = solver.distances_many(sources)
+    assert D.shape == (3, grid.number_of_vertices())
+    for i, keys in enumerate(sources):
+        assert allclose(D[i], solver.distances(keys))
+        assert allclose(D[i], mesh_geodesic_distances_numpy(grid, keys))
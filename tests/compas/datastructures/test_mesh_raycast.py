@@ -0,0 +1,80 @@
+import compas
+from compas.datastructures import Mesh
+from compas.geometry import Box
+from compas.geometry import Frame
+
+
+def test_intersect():
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from numpy import isinf
+    from numpy.random import RandomState
+    from compas.datastructures import RayMesh
+    from compas.datastructures.mesh.raycast_numpy import _intersect_rays_triangles
+
+    mesh = Mesh.from_obj(compas.get('tubemesh.obj'))
+    raymesh = RayMesh.from_mesh(mesh)
+    random = RandomState(0)
+    origins = random.uniform(-10, 10, (100, 3))
+    directions = random.normal(size=(100, 3))
+
+    points, faces, t = raymesh.intersect(origins, directions)
+    triangles = raymesh.vertices[raymesh.triangles]
+    for o, d, ti in zip(origins, directions, t):
+        tt = _intersect_rays_triangles(o[None, :].repeat(len(triangles), 0), d[None, :].repeat(len(triangles), 0), triangles)
+        tt = tt[tt > 0]
+        assert (tt.size == 0 and isinf(ti)) or allclose(tt.min(), ti)
+
+    rays, hits, _, ts = raymesh.intersect_all(origins, directions)
+    assert set(rays) == set((faces >= 0).nonzero()[0])
+    assert allclose(hits, origins[rays] + ts[:, None] * directions[rays])
+    assert (raymesh.occluded(origins, directions) == (faces >= 0)).all()
+    assert (raymesh.occluded(origins, directions, tmax=0.5) == (t <= 0.5)).all()
+
+
+def test_contains():
+    if compas.IPY:
+        return
+    from numpy import array
+    from numpy import cross
+    from numpy.random import RandomState
+    from compas.datastructures import RayMesh
+
+    random = RandomState(0)
+
+    # an axis-aligned box, with analytic inside/outside
+    mesh = Mesh.from_shape(Box(Frame.worldXY(), 2.0, 3.0, 4.0))
+    points = random.uniform(-3, 3, (500, 3))
+    inside = (abs(points) < [1.0, 1.5, 2.0]).all(axis=1)
+    assert RayMesh.from_mesh(mesh).contains(points).tolist() == inside.tolist()
+
+    # a convex polyhedron, against the half-spaces of its faces
+    mesh = Mesh.from_polyhedron(12)
+    vertices, faces = mesh.to_vertices_and_faces()
+    vertices = array(vertices)
+    points = random.uniform(-2, 2, (500, 3))
+    inside = True
+    for face in faces:
+        a, b, c = vertices[face[:3]]
+        normal = cross(b - a, c - a)
+        # orient the normal away from the center of the polyhedron
+        if normal.dot(a - vertices.mean(axis=0)) < 0:
+            normal = -normal
+        inside = inside & ((points - a).dot(normal) < 0)
+    assert inside.any() and not inside.all()
+    assert RayMesh.from_mesh(mesh).contains(points).tolist() == inside.tolist()
+
+
+def test_empty():
+    if compas.IPY:
+        return
+    from compas.datastructures import RayMesh
+
+    raymesh = RayMesh.from_vertices_and_faces([[0, 0, 0], [1, 0, 0]], [])
+    points, faces, t = raymesh.intersect([[0, 0, -1]], [0, 0, 1])
+    assert faces.tolist() == [-1]
+    assert t.tolist() == [float('inf')]
+    assert raymesh.intersect_all([[0, 0, -1]], [0, 0, 1])[0].size == 0
+    assert raymesh.occluded([[0, 0, -1]], [0, 0, 1]).tolist() == [False]
+    assert raymesh.contains([[0, 0, 0]]).tolist() == [False]
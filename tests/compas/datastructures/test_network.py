@@ -48,3 +48,26 @@ def test_planar(k5_network):
 
     k5_network.delete_edge('a', 'b')  # Delete (a, b) edge to make K5 planar
     assert network_is_planar(k5_network) is True
+
+
+def test_find_crossings():
+    from compas.datastructures import network_count_crossings
+    from compas.datastructures import network_find_crossings
+    from compas.datastructures import network_is_crossed
+
+    network = Network()
+    for i in range(5):
+        network.add_edge(network.add_node('x{}a'.format(i), x=i, y=-1.0), network.add_node('x{}b'.format(i), x=i + 0.5, y=5.0))
+        network.add_edge(network.add_node('y{}a'.format(i), x=-1.0, y=i), network.add_node('y{}b'.format(i), x=5.0, y=i))
+    network.add_edge('x0a', 'x1a')
+
+    crossings = network_find_crossings(network)
+    assert network_is_crossed(network)
+    assert network_count_crossings(network) == 25
+    assert set(frozenset(pair) for pair in crossings) == set(
+        frozenset([('x{}a'.format(i), 'x{}b'.format(i)), ('y{}a'.format(j), 'y{}b'.format(j))]) for i in range(5) for j in range(5))
+
+    network.delete_edge('x0a', 'x0b')
+    for i in range(1, 5):
+        network.delete_edge('x{}a'.format(i), 'x{}b'.format(i))
+    assert not network_is_crossed(network)
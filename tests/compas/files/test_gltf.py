@@ -151,3 +151,75 @@ def test_gltf_content():
     assert len(node_0.children) == 0
     assert len(content.nodes) == 1
     assert len(scene.nodes) == 1
+
+
+def test_gltf_reader_numpy(interleaved_glb, sparse_gltf, morph_gltf):
+    if compas.IPY:
+        return
+    from compas.files import GLTFParser
+    from compas.files import GLTFReader
+    from compas.files import GLTFReaderNumpy
+
+    for filepath in (interleaved_glb, sparse_gltf, morph_gltf):
+        content = GLTFParser(GLTFReader(filepath)).content
+        content_numpy = GLTFParser(GLTFReaderNumpy(filepath)).content
+        for key, mesh in content.meshes.items():
+            mesh_numpy = content_numpy.meshes[key]
+            assert mesh_numpy.vertices.shape == (len(mesh.vertices), 3)
+            assert mesh_numpy.vertices.ravel().tolist() == pytest.approx([x for xyz in mesh.vertices for x in xyz])
+            assert mesh_numpy.faces.tolist() == [list(face) for face in mesh.faces]
+        for key, node in content.nodes.items():
+            if node.mesh_key is not None:
+                assert content_numpy.nodes[key].vertices.ravel().tolist() == pytest.approx([x for xyz in node.vertices for x in xyz])
+
+
+def test_gltf_export_deduplicated(tmpdir):
+    from compas.datastructures import Mesh
+
+    mesh = Mesh.from_polyhedron(20)
+    content = GLTFContent()
+    scene = content.add_scene()
+    for i in range(10):
+        node = scene.add_child()
+        content.add_mesh_to_node(node, mesh)
+
+    for filename in ('cubes.gltf', 'cubes.glb'):
+        filepath = str(tmpdir.join(filename))
+        gltf = GLTF(filepath)
+        gltf.content = content
+        gltf.export()
+
+        exporter = gltf.exporter
+        assert len(exporter._gltf_dict['meshes']) == 10
+        assert len(exporter._gltf_dict['accessors']) == 2
+        assert exporter._gltf_dict['accessors'][1]['min'] == pytest.approx([min(xyz) for xyz in zip(*mesh.vertices_attributes('xyz'))])
+
+        gltf = GLTF(filepath)
+        gltf.read()
+        assert len(gltf.content.meshes) == 10
+        for key in gltf.content.meshes:
+            vertices = gltf.content.meshes[key].vertices
+            assert len(vertices) == mesh.number_of_vertices()
+            assert len(gltf.content.meshes[key].faces) == mesh.number_of_faces()
+
+
+def test_gltf_mesh_mixed_modes():
+    from compas.files.gltf.data_classes import PrimitiveData
+    from compas.files.gltf.gltf_mesh import GLTFMesh
+
+    positions = [[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0)], [(0.0, 0.0, 1.0), (1.0, 0.0, 1.0)]]
+    indices = [[0, 1, 2], [0, 1]]
+    modes = [4, 1]
+    expected = [(0, 1, 2), (3, 4)]
+
+    content = GLTFContent()
+    primitives = [PrimitiveData({'POSITION': p}, i, mode=m) for p, i, m in zip(positions, indices, modes)]
+    assert GLTFMesh(primitives, content).faces == expected
+
+    if compas.IPY:
+        return
+    import numpy as np
+    primitives = [PrimitiveData({'POSITION': np.array(p)}, np.array(i), mode=m) for p, i, m in zip(positions, indices, modes)]
+    mesh = GLTFMesh(primitives, content)
+    assert mesh.faces == expected
+    assert mesh.vertices.shape == (5, 3)
@@ -0,0 +1,135 @@
+import struct
+
+import pytest
+
+import compas
+from compas.files import LAS
+from compas.files import LASParser
+from compas.files import LASReader
+from compas.files.las import HEADER
+
+
+def write_las(filepath, records, point_format, version=(1, 2), extra=0, vlrs=None):
+    codes = {3: '<3iHBBbBHd3H', 6: '<3iHBBBBhHd'}[point_format]
+    length = struct.calcsize(codes) + extra
+    vlrs = vlrs or []
+    vlr_data = b''.join(struct.pack('<H16sHH32s', 0, user_id, record_id, len(data), b'') + data for user_id, record_id, data in vlrs)
+    header_size = 375 if version >= (1, 4) else HEADER.size
+    n = len(records)
+    xyz = [record[:3] for record in records]
+    bounds = []
+    for axis in zip(*xyz):
+        bounds += [max(axis) * 0.01 + 10.0, min(axis) * 0.01 + 10.0]
+    header = HEADER.pack(b'LASF', 0, 0, b'', version[0], version[1], b'', b'', 1, 2020, header_size, header_size + len(vlr_data), len(vlrs),
+                         point_format, length, 0 if version >= (1, 4) else n, 0, 0, 0, 0, 0, 0.01, 0.01, 0.01, 10.0, 10.0, 10.0, *bounds)
+    if version >= (1, 4):
+        header += struct.pack('<QQIQ', 0, 0, 0, n) + b'\0' * 120
+    with open(filepath, 'wb') as fh:
+        fh.write(header)
+        fh.write(vlr_data)
+        for record in records:
+            fh.write(struct.pack(codes, *record) + b'\xff' * extra)
+
+
+@pytest.fixture
+def las_rgb(tmp_path):
+    records = []
+    for i in range(100):
+        # return 1 of 2, class i % 4
+        records.append((i * 100, (i % 10) * 100, i, i, 1 | (2 << 3), i % 4, 0, 0, 0, float(i), i, 2 * i, 3 * i))
+    filepath = str(tmp_path / 'rgb.las')
+    write_las(filepath, records, 3, vlrs=[(b'LASF_Projection', 34735, b'\x01\x00')])
+    return filepath
+
+
+@pytest.fixture
+def las_extended(tmp_path):
+    records = []
+    for i in range(50):
+        # return 2 of 3, class i % 20
+        records.append((i, -i, 2 * i, 7, 2 | (3 << 4), 0, i % 20, 0, 0, 0, 0.5 * i))
+    filepath = str(tmp_path / 'extended.las')
+    write_las(filepath, records, 6, version=(1, 4), extra=3)
+    return filepath
+
+
+def test_las_header(las_rgb, las_extended):
+    reader = LASReader(las_rgb)
+    assert reader.version == (1, 2)
+    assert reader.point_format == 3
+    assert reader.count == 100
+    assert reader.vlrs[0]['user_id'] == 'LASF_Projection'
+    assert reader.vlrs[0]['data'] == b'\x01\x00'
+    assert reader.bounds == ([10.0, 10.0, 10.0], [109.0, 19.0, 10.99])
+
+    reader = LASReader(las_extended)
+    assert reader.version == (1, 4)
+    assert reader.point_format == 6
+    assert reader.record_length == 33
+    assert reader.count == 50
+
+
+def test_las_read_points(las_rgb, las_extended):
+    parser = LASParser(LASReader(las_rgb))
+    assert len(parser.points) == 100
+    assert parser.points[3] == pytest.approx([13.0, 13.0, 10.03])
+    assert parser.classification[:5] == [0, 1, 2, 3, 0]
+    assert parser.colors[5] == [5, 10, 15]
+
+    points = LASReader(las_extended).read_points()
+    assert points['xyz'][10] == pytest.approx([10.1, 9.9, 10.2])
+    assert points['classification'][25] == 5
+    assert points['return_number'][0] == 2
+    assert points['number_of_returns'][0] == 3
+    assert points['gps_time'][4] == 2.0
+    assert 'color' not in points
+
+
+def test_las_filters(las_rgb):
+    reader = LASReader(las_rgb)
+    points = reader.read_points(box=[[10, 10, 10], [30, 11, 11]])
+    assert points['intensity'] == [0, 1, 10, 11, 20]
+    points = reader.read_points(classes=[1, 3], step=3)
+    assert points['intensity'] == [3, 9, 15, 21, 27, 33, 39, 45, 51, 57, 63, 69, 75, 81, 87, 93, 99]
+    assert list(reader.iter_points(box=[[200, 200, 200], [300, 300, 300]])) == []
+    chunks = list(reader.iter_points(chunk_size=30, step=4))
+    assert [len(chunk['xyz']) for chunk in chunks] == [7, 7, 7, 4]
+    assert sum((chunk['intensity'] for chunk in chunks), []) == list(range(0, 100, 4))
+
+
+def test_las_numpy(las_rgb, las_extended):
+    if compas.IPY:
+        return
+    from compas.files import LASParserNumpy
+    from compas.files import LASReaderNumpy
+    for filepath in (las_rgb, las_extended):
+        parser = LASParser(LASReader(filepath))
+        parser_numpy = LAS(filepath).parser
+        assert isinstance(parser_numpy, LASParserNumpy)
+        assert parser_numpy.xyz.shape == (len(parser.points), 3)
+        assert parser_numpy.points == parser.points
+        assert parser_numpy.classification.tolist() == parser.classification
+        assert parser_numpy.intensity.tolist() == parser.intensity
+
+        reader = LASReader(filepath)
+        reader_numpy = LASReaderNumpy(filepath)
+        for kwargs in ({'box': [[10, 10, 10], [30, 11, 11]]}, {'classes': [1, 3], 'step': 3}, {'step': 7}):
+            points = reader.read_points(**kwargs)
+            points_numpy = reader_numpy.read_points(**kwargs)
+            assert sorted(points) == sorted(points_numpy)
+            for name in points:
+                assert points_numpy[name].tolist() == points[name]
+        chunks = list(reader_numpy.iter_points(chunk_size=30, step=4))
+        assert [len(chunk['xyz']) for chunk in chunks] == [len(chunk['xyz']) for chunk in reader.iter_points(chunk_size=30, step=4)]
+
+    assert LAS(las_rgb).parser.colors.tolist() == LASParser(LASReader(las_rgb)).colors
+
+
+def test_las_compressed(tmp_path):
+    filepath = str(tmp_path / 'compressed.laz')
+    write_las(filepath, [(0, 0, 0, 0, 0, 0, 0, 0, 0, 0.0, 0, 0, 0)], 3)
+    with open(filepath, 'r+b') as fh:
+        fh.seek(104)
+        fh.write(b'\x83')
+    with pytest.raises(ValueError):
+        LASReader(filepath)
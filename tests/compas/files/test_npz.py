@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.datastructures import Network
+from compas.datastructures import VolMesh
+
+
+@pytest.fixture
+def mesh():
+    mesh = Mesh.from_polyhedron(6)
+    mesh.update_default_vertex_attributes(is_fixed=False, load=None)
+    mesh.update_default_face_attributes(name='face')
+    keys = list(mesh.vertices())
+    mesh.vertex_attribute(keys[0], 'is_fixed', True)
+    mesh.vertex_attribute(keys[1], 'load', [0.0, 0.0, -1.0])
+    mesh.vertex_attribute(keys[2], 'x', 1)
+    mesh.vertex_attribute(keys[3], 'weight', 2 ** 70)
+    mesh.face_attribute(mesh.get_any_face(), 'name', 'top')
+    mesh.face_attribute(mesh.get_any_face(), 'mixed', [1, 'a'])
+    u, v = next(mesh.edges())
+    mesh.edge_attribute((u, v), 'q', 2.0)
+    mesh.edge_attribute((u, v), 'label', 'a\x00')
+    mesh.delete_vertex(keys[-1])
+    return mesh
+
+
+def test_mesh_npz(tmpdir, mesh):
+    if compas.IPY:
+        return
+    filepath = os.path.join(str(tmpdir), 'mesh.npz')
+    mesh.to_npz(filepath)
+    other = Mesh.from_npz(filepath)
+    assert other.data == mesh.data
+    assert other.halfedge == mesh.halfedge
+    assert other._max_vertex == mesh._max_vertex
+    assert [type(x) for x in other.vertices_attribute('x')] == [type(x) for x in mesh.vertices_attribute('x')]
+
+
+def test_mesh_npz_json(tmpdir, mesh):
+    if compas.IPY:
+        return
+    path_json = os.path.join(str(tmpdir), 'mesh.json')
+    path_npz = os.path.join(str(tmpdir), 'mesh.npz')
+    mesh.to_json(path_json)
+    Mesh.from_json(path_json).to_npz(path_npz, compressed=True)
+    assert Mesh.from_npz(path_npz).data == Mesh.from_json(path_json).data
+
+
+@pytest.mark.parametrize('datastructure', [
+    Network.from_obj(compas.get('lines.obj')),
+    VolMesh.from_obj(compas.get('boxes.obj')),
+])
+def test_npz_data(tmpdir, datastructure):
+    if compas.IPY:
+        return
+    from compas.files import NPZ
+    filepath = os.path.join(str(tmpdir), 'data.npz')
+    datastructure.to_npz(filepath)
+    assert NPZ(filepath).data == datastructure.data
+    assert type(datastructure).from_npz(filepath).data == datastructure.copy().data
+
+
+def test_npz_columns(tmpdir, mesh):
+    if compas.IPY:
+        return
+    from compas.files import NPZ
+    filepath = os.path.join(str(tmpdir), 'mesh.npz')
+    NPZ(filepath).write(mesh)
+    reader = NPZ(filepath).reader
+    keys = reader.keys('vertex')
+    columns = reader.columns('vertex')
+    assert keys == list(mesh.vertices())
+    assert columns['x'].tolist() == mesh.vertices_attribute('x')
+    assert columns['is_fixed'].dtype == bool
+    reader.close()
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.files import OBJ
+
+
+@pytest.fixture
+def obj_with_references(tmpdir):
+    filepath = os.path.join(str(tmpdir), 'references.obj')
+    with open(filepath, 'w') as fh:
+        fh.write('# vertices with weights\n')
+        fh.write('v 0 0 0 1\nv 1 0 0 1\n')
+        fh.write('v 1 1 0 1\nv 0 1 0 1\n')
+        fh.write('vt 0 0\n')
+        fh.write('f 1/1/1 2/1/1 3/1/1\r\n')
+        fh.write('f -4 -2 \\\n -1\n')
+        fh.write('l 1 3\n')
+        fh.write('f 1 2')
+    return filepath
+
+
+@pytest.mark.parametrize('name', ['faces.obj', 'hypar.obj', 'quadmesh.obj'])
+def test_obj_fast_welded(name):
+    if compas.IPY:
+        return
+    obj = OBJ(compas.get(name), precision='3f')
+    fast = OBJ(compas.get(name), precision='3f', fast=True)
+    assert fast.faces == obj.faces
+    assert fast.vertices.tolist() == obj.vertices
+
+
+def test_obj_fast_unwelded():
+    if compas.IPY:
+        return
+    obj = OBJ(compas.get('faces.obj'))
+    fast = OBJ(compas.get('faces.obj'), fast=True)
+    assert len(fast.vertices) == len(obj.reader.vertices)
+    assert fast.faces == obj.reader.faces
+
+
+def test_obj_fast_chunks():
+    if compas.IPY:
+        return
+    from compas.files import OBJReaderNumpy
+    reader = OBJReaderNumpy(compas.get('faces.obj'))
+    reader.read()
+    chunked = OBJReaderNumpy(compas.get('faces.obj'), chunksize=100)
+    chunked.read()
+    assert (reader.vertices == chunked.vertices).all()
+    assert (reader.face_offsets == chunked.face_offsets).all()
+    assert (reader.face_indices == chunked.face_indices).all()
+
+
+def test_obj_fast_references(obj_with_references):
+    if compas.IPY:
+        return
+    obj = OBJ(obj_with_references, fast=True)
+    assert obj.vertices.shape == (4, 3)
+    assert obj.faces == [[0, 1, 2], [0, 2, 3]]
+    assert obj.lines == [[0, 2]]
+
+
+def test_mesh_from_obj_fast():
+    if compas.IPY:
+        return
+    mesh = Mesh.from_obj(compas.get('faces.obj'))
+    fast = Mesh.from_obj(compas.get('faces.obj'), precision='3f', fast=True)
+    assert fast.number_of_vertices() == mesh.number_of_vertices()
+    assert list(fast.faces()) == list(mesh.faces())
+    assert all(fast.face_vertices(fkey) == mesh.face_vertices(fkey) for fkey in mesh.faces())
+    assert all(isinstance(fast.vertex_attribute(key, 'x'), float) for key in fast.vertices())
@@ -0,0 +1,124 @@
+import os
+import struct
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.files import PLY
+from compas.files import PLYParser
+from compas.files import PLYReader
+
+BASE_FOLDER = os.path.dirname(__file__)
+
+
+@pytest.fixture
+def binary_ply():
+    return os.path.join(BASE_FOLDER, 'fixtures', 'triangle_binary.ply')
+
+
+@pytest.fixture
+def ascii_ply():
+    return os.path.join(BASE_FOLDER, 'fixtures', 'bigX_sphere.ply')
+
+
+def write_ply(filepath, faces, order='<', newline='\n', sized=False):
+    vertices = [[float(i), float(i % 3), float(i % 5)] for i in range(8)]
+    header = ['ply',
+              'format {} 1.0'.format('binary_little_endian' if order == '<' else 'binary_big_endian'),
+              'element vertex {}'.format(len(vertices)),
+              'property double x', 'property double y', 'property double z', 'property uchar red',
+              'element face {}'.format(len(faces)),
+              'property int16 flag' if sized else 'property short flag',
+              'property list uint8 int32 vertex_indices' if sized else 'property list uchar int vertex_indices',
+              'property list uint16 float32 texcoord' if sized else 'property list ushort float texcoord',
+              'property int32 material' if sized else 'property int material',
+              'end_header']
+    with open(filepath, 'wb') as fh:
+        fh.write((newline.join(header) + newline).encode('ascii'))
+        for i, xyz in enumerate(vertices):
+            fh.write(struct.pack(order + '3dB', *xyz, 10 * i))
+        for i, face in enumerate(faces):
+            fh.write(struct.pack(order + 'hB{}i'.format(len(face)), -i, len(face), *face))
+            fh.write(struct.pack(order + 'H{}f'.format(2 * len(face)), 2 * len(face), *([0.5] * 2 * len(face))))
+            fh.write(struct.pack(order + 'i', 100 + i))
+    return vertices
+
+
+def test_ply_fixtures(binary_ply, ascii_ply):
+    parser = PLYParser(PLYReader(binary_ply))
+    assert parser.faces == [[0, 1, 2]]
+    parser = PLYParser(PLYReader(ascii_ply))
+    assert len(parser.vertices) == 7876
+    assert len(parser.faces) == 15712
+
+
+def test_ply_binary_variable_faces(tmp_path):
+    faces = [[0, 1, 2], [2, 3, 4, 5], [5, 6, 7], [0, 2, 4, 6, 7]]
+    for order in '<>':
+        filepath = str(tmp_path / 'faces.ply')
+        vertices = write_ply(filepath, faces, order=order, newline='\r')
+        parser = PLYParser(PLYReader(filepath))
+        assert [list(xyz) for xyz in parser.vertices] == vertices
+        assert parser.faces == faces
+
+
+def test_ply_sized_type_names(tmp_path):
+    faces = [[0, 1, 2], [2, 3, 4, 5], [5, 6, 7], [0, 2, 4, 6, 7]]
+    filepath = str(tmp_path / 'faces.ply')
+    vertices = write_ply(filepath, faces, sized=True)
+    parser = PLYParser(PLYReader(filepath))
+    assert [list(xyz) for xyz in parser.vertices] == vertices
+    assert parser.faces == faces
+    if compas.IPY:
+        return
+    from compas.files import PLYParserNumpy
+    from compas.files import PLYReaderNumpy
+    reader = PLYReaderNumpy(filepath)
+    assert reader.face_data['material'].tolist() == [100 + i for i in range(len(faces))]
+    assert PLYParserNumpy(reader).faces == faces
+
+
+def test_ply_numpy(tmp_path, binary_ply, ascii_ply):
+    if compas.IPY:
+        return
+    from compas.files import PLYParserNumpy
+    from compas.files import PLYReaderNumpy
+
+    for faces in ([[0, 1, 2], [2, 3, 4], [5, 6, 7]], [[0, 1, 2], [2, 3, 4, 5], [5, 6, 7], [0, 2, 4, 6, 7]]):
+        for order in '<>':
+            filepath = str(tmp_path / 'faces.ply')
+            vertices = write_ply(filepath, faces, order=order)
+            reader = PLYReaderNumpy(filepath)
+            assert reader.vertex_data['red'].tolist() == [10 * i for i in range(8)]
+            assert reader.face_data['flag'].tolist() == [-i for i in range(len(faces))]
+            assert reader.face_data['material'].tolist() == [100 + i for i in range(len(faces))]
+            offsets, items = reader.face_lists['texcoord']
+            assert offsets.tolist()[-1] == 2 * sum(len(face) for face in faces)
+            assert set(items.tolist()) == {0.5}
+            parser = PLYParserNumpy(reader)
+            assert parser.vertices == vertices
+            assert parser.faces == faces
+
+    for filepath in (binary_ply, ascii_ply):
+        parser = PLY(filepath).parser
+        assert isinstance(parser, PLYParserNumpy)
+        reference = PLYParser(PLYReader(filepath))
+        assert parser.vertices == [list(xyz) for xyz in reference.vertices]
+        assert parser.faces == reference.faces
+
+    mesh = Mesh.from_ply(ascii_ply)
+    assert mesh.number_of_faces() == 15712
+
+
+def test_ply_pointcloud(tmp_path):
+    if compas.IPY:
+        return
+    from compas.geometry import Pointcloud
+    from compas.geometry import PointcloudNumpy
+    filepath = str(tmp_path / 'faces.ply')
+    vertices = write_ply(filepath, [[0, 1, 2]])
+    cloud = PointcloudNumpy.from_ply(filepath)
+    assert cloud.xyz.tolist() == vertices
+    assert cloud.point_attributes['red'].tolist() == [10 * i for i in range(8)]
+    assert [list(point) for point in Pointcloud.from_ply(filepath)] == vertices
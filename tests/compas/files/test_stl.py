@@ -45,3 +45,41 @@ def test_binary_read_write_fidelity():
     mesh_2 = Mesh.from_stl(fp)
     assert mesh.adjacency == mesh_2.adjacency
     assert mesh.vertex == mesh_2.vertex
+
+
+def test_binary_numpy_parser(binary_stl, binary_stl_with_ascii_header):
+    if compas.IPY:
+        return
+    from compas.files import STLParser
+    from compas.files import STLReader
+    from compas.files import STLParserNumpy
+    from compas.files import STLReaderNumpy
+    for filepath in (binary_stl, binary_stl_with_ascii_header):
+        assert STLReaderNumpy.is_binary(filepath)
+        parser = STLParser(STLReader(filepath))
+        parser_numpy = STLParserNumpy(STLReaderNumpy(filepath))
+        assert parser_numpy.vertices == [list(xyz) for xyz in parser.vertices]
+        assert parser_numpy.faces == parser.faces
+
+
+def test_ascii_not_binary(ascii_stl):
+    if compas.IPY:
+        return
+    from compas.files import STLReaderNumpy
+    assert not STLReaderNumpy.is_binary(ascii_stl)
+
+
+def test_binary_write_buffer():
+    if compas.IPY:
+        return
+    import struct
+    mesh = Mesh.from_stl(compas.get('cube_binary.stl'))
+    fp = compas.get('cube_binary_2.stl')
+    mesh.to_stl(fp, binary=True)
+    with open(fp, 'rb') as fh:
+        data = fh.read()
+    assert len(data) == 84 + 50 * mesh.number_of_faces()
+    for i, fkey in enumerate(mesh.faces()):
+        values = struct.unpack('<12f', data[84 + 50 * i: 84 + 50 * i + 48])
+        expected = mesh.face_normal(fkey) + [x for key in mesh.face_vertices(fkey) for x in mesh.vertex_coordinates(key)]
+        assert all(abs(a - b) < 1e-6 for a, b in zip(values, expected))
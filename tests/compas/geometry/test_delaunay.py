@@ -0,0 +1,31 @@
+import random
+
+from compas.geometry import delaunay_from_points
+from compas.geometry import circle_from_points_xy
+from compas.geometry import distance_point_point_xy
+
+
+def test_delaunay_from_points():
+    random.seed(0)
+    points = [[random.uniform(0, 10), random.uniform(0, 10), 0.0] for _ in range(300)]
+    faces = delaunay_from_points(points)
+    assert len(faces) > 0
+    for a, b, c in faces:
+        (x1, y1, _), (x2, y2, _), (x3, y3, _) = points[a], points[b], points[c]
+        assert (x2 - x1) * (y3 - y1) - (y2 - y1) * (x3 - x1) > 0
+        center, radius, _ = circle_from_points_xy(points[a], points[b], points[c])
+        assert all(distance_point_point_xy(center, point) > radius - 1e-9 for point in points)
+
+
+def test_delaunay_from_points_grid():
+    points = [[float(i), float(j), 0.0] for i in range(20) for j in range(20)]
+    faces = delaunay_from_points(points)
+    assert len(faces) == 2 * 19 * 19
+
+
+def test_delaunay_from_points_boundary_holes():
+    points = [[float(i), float(j), 0.0] for i in range(11) for j in range(11)]
+    boundary = [[-0.5, -0.5, 0], [10.5, -0.5, 0], [10.5, 10.5, 0], [-0.5, 10.5, 0]]
+    hole = [[3.9, 3.9, 0], [6.1, 3.9, 0], [6.1, 6.1, 0], [3.9, 6.1, 0]]
+    faces = delaunay_from_points(points, boundary=boundary, holes=[hole])
+    assert len(faces) == 2 * 10 * 10 - 2 * 2 * 2
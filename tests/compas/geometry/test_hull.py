@@ -0,0 +1,77 @@
+import itertools
+import random
+
+import pytest
+
+import compas
+from compas.geometry import IncrementalHull
+from compas.geometry import convex_hull
+from compas.geometry import cross_vectors
+from compas.geometry import dot_vectors
+from compas.geometry import subtract_vectors
+
+
+@pytest.fixture
+def cloud():
+    random.seed(0)
+    points = [[random.uniform(-1, 1) for _ in range(3)] for _ in range(500)]
+    # add coplanar points on the hull
+    points += [[float(x), float(y), float(z)] for x, y, z in itertools.product(range(-1, 2), repeat=3)]
+    return points
+
+
+def volume(points, faces):
+    return sum(dot_vectors(points[a], cross_vectors(points[b], points[c])) for a, b, c in faces) / 6.0
+
+
+def assert_valid(hull, points):
+    edges = set()
+    for a, b, c in hull.faces:
+        for edge in ((a, b), (b, c), (c, a)):
+            assert edge not in edges
+            edges.add(edge)
+    assert all((v, u) in edges for u, v in edges)
+    for a, b, c in hull.faces:
+        n = cross_vectors(subtract_vectors(points[b], points[a]), subtract_vectors(points[c], points[a]))
+        assert max(dot_vectors(n, subtract_vectors(point, points[a])) for point in points) < 1e-9
+
+
+def test_convex_hull(cloud):
+    faces = convex_hull(cloud)
+    assert volume(cloud, faces) == pytest.approx(8.0)
+    assert convex_hull([[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0], [0.5, 0.5, 0]]) == []
+
+
+def test_incremental_hull(cloud):
+    hull = IncrementalHull(cloud)
+    assert_valid(hull, cloud)
+    assert set(hull.vertices) <= set(range(500, len(cloud)))
+    assert sorted(hull.vertices) == [i + 500 for i, (x, y, z) in enumerate(itertools.product(range(-1, 2), repeat=3)) if x and y and z]
+
+
+def test_incremental_hull_add_points(cloud):
+    hull = IncrementalHull()
+    assert hull.add_points(cloud[:3]) == ([], [])
+    faces = {}
+    for i in range(3, len(cloud), 50):
+        created, deleted = hull.add_points(cloud[i:i + 50])
+        for key in deleted:
+            del faces[key]
+        for key in created:
+            faces[key] = hull.face[key]
+        assert faces == hull.face
+    assert_valid(hull, cloud)
+    assert volume(cloud, hull.faces) == pytest.approx(8.0)
+
+
+def test_incremental_hull_numpy(cloud):
+    if compas.IPY:
+        return
+    from scipy.spatial import ConvexHull
+
+    random.seed(1)
+    points = [[random.gauss(0, 1) for _ in range(3)] for _ in range(5000)]
+    hull = IncrementalHull(points, numpy=True)
+    assert_valid(hull, points)
+    assert volume(points, hull.faces) == pytest.approx(ConvexHull(points).volume)
+    assert sorted(hull.vertices) == sorted(ConvexHull(points).vertices)
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+import compas
+from compas.geometry import KDTree
+from compas.geometry import distance_point_point
+
+
+@pytest.fixture
+def cloud():
+    random.seed(0)
+    return [[random.uniform(-10, 10) for _ in range(3)] for _ in range(500)]
+
+
+@pytest.fixture
+def trees(cloud):
+    trees = [KDTree(cloud)]
+    if not compas.IPY:
+        from compas.geometry import KDTreeNumpy
+        trees.append(KDTreeNumpy(cloud))
+    return trees
+
+
+def brute_force(cloud, point):
+    return sorted(range(len(cloud)), key=lambda i: distance_point_point(point, cloud[i]))
+
+
+def test_kdtree_nearest_neighbor(cloud, trees):
+    for tree in trees:
+        for point in cloud[:20]:
+            xyz, label, distance = tree.nearest_neighbor(point)
+            assert distance == 0.0
+            assert xyz == cloud[label]
+            xyz, label, distance = tree.nearest_neighbor(point, exclude={label})
+            assert label == brute_force(cloud, point)[1]
+
+
+def test_kdtree_nearest_neighbors(cloud, trees):
+    point = [0.5, -0.5, 1.5]
+    expected = brute_force(cloud, point)[:10]
+    for tree in trees:
+        nnbrs = tree.nearest_neighbors(point, 10, distance_sort=True)
+        assert [label for _, label, _ in nnbrs] == expected
+        distances = [distance for _, _, distance in nnbrs]
+        assert distances == sorted(distances)
+
+
+def test_kdtree_nearest_neighbors_many(cloud, trees):
+    points = cloud[:20]
+    for tree in trees:
+        result = tree.nearest_neighbors_many(points, 5)
+        assert len(result) == len(points)
+        for point, nnbrs in zip(points, result):
+            assert [label for _, label, _ in nnbrs] == brute_force(cloud, point)[:5]
+
+
+def test_kdtree_nearest_neighbors_more_than_points():
+    tree = KDTree([[0, 0, 0], [1, 0, 0], [2, 0, 0]])
+    nnbrs = tree.nearest_neighbors([1.9, 0, 0], 5)
+    assert [label for _, label, _ in nnbrs] == [2, 1, 0]
+
+
+def test_kdtree_radius_search(cloud, trees):
+    point = [1.0, 2.0, -1.0]
+    radius = 4.0
+    expected = [i for i in brute_force(cloud, point) if distance_point_point(point, cloud[i]) <= radius]
+    for tree in trees:
+        nnbrs = tree.radius_search(point, radius, distance_sort=True)
+        assert [label for _, label, _ in nnbrs] == expected
+        assert all(distance <= radius for _, _, distance in nnbrs)
+
+
+def test_kdtree_empty():
+    tree = KDTree()
+    assert tree.root is None
+    assert tree.nearest_neighbor([0, 0, 0]) == [None, None, float('inf')]
+    assert tree.nearest_neighbors([0, 0, 0], 3) == []
+
+
+def test_kdtree_numpy_query_workers(cloud):
+    if compas.IPY:
+        return
+    from compas.geometry import KDTreeNumpy
+    tree = KDTreeNumpy(cloud)
+    distances, indices = tree.query(cloud, 5)
+    parallel_distances, parallel_indices = tree.query(cloud, 5, workers=-1)
+    assert (parallel_distances == distances).all()
+    assert (parallel_indices == indices).all()
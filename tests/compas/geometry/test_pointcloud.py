@@ -0,0 +1,92 @@
+import pytest
+
+import compas
+from compas.geometry import Box
+from compas.geometry import Frame
+from compas.geometry import Pointcloud
+from compas.geometry import Rotation
+from compas.geometry import Translation
+
+if not compas.IPY:
+    import numpy as np
+    from compas.geometry import PointcloudNumpy
+
+
+@pytest.fixture
+def grid():
+    # a 10 x 10 grid in the XY plane with unit spacing
+    return [[float(i), float(j), 0.0] for i in range(10) for j in range(10)]
+
+
+def test_pointcloud_numpy_interface(grid):
+    if compas.IPY:
+        return
+    cloud = PointcloudNumpy(grid, {'index': range(100)})
+    reference = Pointcloud(grid)
+    assert len(cloud) == 100
+    assert cloud[12] == reference[12]
+    assert list(cloud) == list(reference)
+    assert cloud.centroid == pytest.approx(reference.centroid)
+    assert cloud.bounding_box == reference.bounding_box
+
+    T = Translation.from_vector([1, 2, 3]) * Rotation.from_axis_and_angle([0, 0, 1], 0.3)
+    cloud.transform(T)
+    reference.transform(T)
+    assert np.allclose(cloud.xyz, [list(point) for point in reference])
+
+    copy = PointcloudNumpy.from_data(cloud.data)
+    assert np.array_equal(copy.xyz, cloud.xyz)
+    assert copy.point_attributes['index'].tolist() == list(range(100))
+
+    with pytest.raises(ValueError):
+        cloud.set_point_attribute('color', [[0, 0, 0]])
+
+
+def test_pointcloud_numpy_crop(grid):
+    if compas.IPY:
+        return
+    cloud = PointcloudNumpy(grid, {'index': range(100)})
+    cropped = cloud.crop([[1.5, 1.5, -1], [3.5, 2.5, 1]])
+    assert cropped.xyz.tolist() == [[2, 2, 0], [3, 2, 0]]
+    assert cropped.point_attributes['index'].tolist() == [22, 32]
+
+    frame = Frame([2, 2, 0], [1, 1, 0], [-1, 1, 0])
+    box = Box(frame, 2.9, 1.0, 1.0)
+    cropped = cloud.crop(box)
+    assert sorted(cropped.point_attributes['index'].tolist()) == [11, 22, 33]
+
+
+def test_pointcloud_numpy_voxel_downsample(grid):
+    if compas.IPY:
+        return
+    cloud = PointcloudNumpy(grid, {'index': range(100), 'weight': np.ones(100)})
+    sampled = cloud.voxel_downsample(2.0)
+    assert len(sampled) == 25
+    assert sampled.xyz[0].tolist() == [0.5, 0.5, 0.0]
+    assert sampled.point_attributes['index'][:3].tolist() == [0, 2, 4]
+    assert np.allclose(sampled.point_attributes['weight'], 1.0)
+
+
+def test_pointcloud_numpy_outliers(grid):
+    if compas.IPY:
+        return
+    cloud = PointcloudNumpy(grid + [[4.5, 4.5, 20.0]])
+    inliers = cloud.statistical_outlier_removal(k=8, ratio=2.0)
+    assert len(inliers) == 100
+    assert inliers.xyz[:, 2].max() == 0.0
+
+
+def test_pointcloud_numpy_normals():
+    if compas.IPY:
+        return
+    # points on a sphere
+    points = np.random.default_rng(0).normal(size=(2000, 3))
+    points /= np.linalg.norm(points, axis=1)[:, None]
+    cloud = PointcloudNumpy(points)
+    normals = cloud.estimate_normals(k=10, viewpoint=[0, 0, 0])
+    assert cloud.point_attributes['normals'] is normals
+    assert np.allclose(np.linalg.norm(normals, axis=1), 1.0)
+    assert np.allclose(normals, -cloud.xyz, atol=0.1)
+
+    cloud.transform(Rotation.from_axis_and_angle([1, 0, 0], 0.5))
+    assert np.allclose(cloud.point_attributes['normals'], -cloud.xyz, atol=0.1)
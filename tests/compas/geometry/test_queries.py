@@ -1,8 +1,25 @@
 from compas.geometry import Line
 from compas.geometry import Point
 from compas.geometry import is_colinear_line_line
+from compas.geometry import is_point_in_polyhedron
 
 
 def test_is_colinear_line_line():
     assert is_colinear_line_line(Line(Point(0, 0, 0), Point(1, 1, 1)), Line(Point(3, 3, 3), Point(2, 2, 2))) is True
     assert is_colinear_line_line(Line(Point(0, 0, 0), Point(1, 1, 1)), Line(Point(4, 1, 0), Point(5, 2, 1))) is False
+
+
+def test_is_point_in_polyhedron():
+    # an L-shaped prism, which is not convex
+    outline = [[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]]
+    vertices = [[x, y, 0] for x, y in outline] + [[x, y, 1] for x, y in outline]
+    faces = [[5, 4, 3, 2, 1, 0], [6, 7, 8, 9, 10, 11]]
+    faces += [[i, (i + 1) % 6, (i + 1) % 6 + 6, i + 6] for i in range(6)]
+    assert is_point_in_polyhedron([0.5, 0.5, 0.5], (vertices, faces)) is True
+    assert is_point_in_polyhedron([1.5, 0.5, 0.5], (vertices, faces)) is True
+    assert is_point_in_polyhedron([0.5, 1.5, 0.5], (vertices, faces)) is True
+    assert is_point_in_polyhedron([1.5, 1.5, 0.5], (vertices, faces)) is False
+    assert is_point_in_polyhedron([0.5, 0.5, 1.5], (vertices, faces)) is False
+    # the orientation of the faces does not matter
+    faces = [face[::-1] for face in faces]
+    assert is_point_in_polyhedron([0.5, 0.5, 0.5], (vertices, faces)) is True
@@ -0,0 +1,52 @@
+import pytest
+
+import compas
+from compas.datastructures import Network
+
+
+@pytest.fixture
+def network():
+    network = Network.from_obj(compas.get('lines.obj'))
+    network.update_default_node_attributes({'B': [1, 1, 1], 'P': [0, 0, -0.5]})
+    network.update_default_edge_attributes({'E': 10, 'A': 1, 'ct': 't', 's0': 0})
+    for key in network.leaves():
+        network.node_attribute(key, 'B', [0, 0, 0])
+    return network
+
+
+def test_drx_solver(network):
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from compas.numerical.drx import drx_numpy
+    from compas.numerical.drx import DRXSolver
+
+    X, f, l, _ = drx_numpy(network, tol=0.01, refresh=0)
+    solver = DRXSolver(network)
+    Xs, fs, ls = solver.solve(tol=0.01)
+    assert allclose(X, Xs)
+    assert allclose(f, fs)
+    assert allclose(l.ravel(), ls)
+
+
+def test_drx_solver_many(network):
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from numpy import array
+    from compas.numerical.drx import DRXSolver
+
+    solver = DRXSolver(network)
+    loads = array([solver.P * factor for factor in (0.5, 1.0, 2.0)])
+    prestress = array([solver.f0 + force for force in (0.0, 1.0, 0.5)])
+    X, f, l = solver.solve_many(loads, prestress, tol=0.01)  # noqa: E741
+    assert X.shape == (3, ) + solver.X0.shape
+    for i in range(3):
+        Xi, fi, li = solver.solve(loads[i], prestress[i], tol=0.01, warmstart=False)
+        assert allclose(X[i], Xi)
+        assert allclose(f[i], fi)
+        assert allclose(l[i], li)
+
+    # a warm start converges in fewer steps to the same solution
+    Xw, fw, lw = solver.solve_many(loads, prestress, tol=0.01)
+    assert allclose(Xw, X, atol=0.05)
@@ -0,0 +1,63 @@
+import pytest
+
+import compas
+
+
+@pytest.fixture
+def grid():
+    n = 10
+    vertices = [[float(i), float(j), 0.0] for i in range(n + 1) for j in range(n + 1)]
+    edges = []
+    for i in range(n + 1):
+        for j in range(n):
+            edges.append((i * (n + 1) + j, i * (n + 1) + j + 1))
+            edges.append((j * (n + 1) + i, (j + 1) * (n + 1) + i))
+    fixed = [i * (n + 1) + j for i in range(n + 1) for j in range(n + 1) if i in (0, n) or j in (0, n)]
+    loads = [[0.0, 0.0, -1.0] for _ in vertices]
+    return vertices, edges, fixed, loads
+
+
+def test_fd_solver(grid):
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from compas.numerical import fd_numpy
+    from compas.numerical.fd import FDSolver
+
+    vertices, edges, fixed, loads = grid
+    solver = FDSolver(vertices, edges, fixed, loads=loads)
+    for i in range(3):
+        q = [1.0 + 0.1 * i + 0.01 * (index % 7) for index in range(len(edges))]
+        result = fd_numpy(vertices, edges, fixed, q, loads)
+        for a, b in zip(result, solver.solve(q=q)):
+            assert allclose(a, b)
+
+    # moving the supports only requires a back substitution
+    solver.xyz[fixed, 2] = 1.0
+    result = fd_numpy(solver.xyz.tolist(), edges, fixed, q, loads)
+    for a, b in zip(result, solver.solve(q=q)):
+        assert allclose(a, b)
+
+
+def test_fd_solver_many(grid):
+    if compas.IPY:
+        return
+    from numpy import allclose
+    from numpy import array
+    from compas.numerical.fd import FDSolver
+
+    vertices, edges, fixed, loads = grid
+    solver = FDSolver(vertices, edges, fixed, loads=loads)
+    Q = array([[1.0 + 0.5 * i] * len(edges) for i in range(3)])
+    P = array([array(loads) * (i + 1) for i in range(3)])
+
+    xyz, q, f, l, r = solver.solve_many(Q, P)  # noqa: E741
+    assert xyz.shape == (3, len(vertices), 3)
+    for i in range(3):
+        result = solver.solve(Q[i], P[i])
+        assert allclose(xyz[i], result[0])
+        assert allclose(f[i], result[2])
+
+    xyz, q, f, l, r = solver.solve_many(loads=P)  # noqa: E741
+    for i in range(3):
+        assert allclose(xyz[i], solver.solve(loads=P[i])[0])
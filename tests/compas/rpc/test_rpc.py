@@ -1,7 +1,11 @@
 # import os
+import time
+
+import pytest
 
 from compas.geometry import allclose
 from compas.rpc import Proxy
+from compas.rpc import RPCServerError
 
 
 def test_basic_rpc_call():
@@ -18,3 +22,73 @@ def test_switch_package():
         r = proxy.inv(A)
 
     assert allclose(r, [[-2, 1], [1.5, -0.5]])
+
+
+def test_binary_transport():
+    import numpy as np
+    from compas.rpc import binary_dumps
+    from compas.rpc import binary_loads
+
+    data = {'a': np.arange(6, dtype='>i4').reshape((2, 3)).T, 'b': [np.array(1.5), np.zeros((0, 3))], 'c': 'c'}
+    result = binary_loads(binary_dumps(data))
+    assert result['a'].tolist() == data['a'].tolist()
+    assert result['b'][0].shape == ()
+    assert result['b'][1].shape == (0, 3)
+    assert result['c'] == 'c'
+
+    with Proxy('numpy', python='python', port=1756, transport='binary') as proxy:
+        assert proxy.binary
+        a = proxy.arange(20)
+        assert isinstance(a, np.ndarray)
+        assert proxy.sum(np.ones((3, 3))) == 9.0
+
+
+def test_cache():
+    with Proxy('numpy', python='python', port=1758, cache=True) as proxy:
+        assert proxy.arange(5) == [0, 1, 2, 3, 4]
+        proxy.stop_server()
+        # the server is no longer needed
+        assert proxy.arange(5) == [0, 1, 2, 3, 4]
+        assert proxy.cache.stats()['hits'] == 1
+
+
+def test_worker_pool_concurrent_calls():
+    with Proxy(python='python', port=1754, workers=2, preload=['time']) as proxy:
+        calls = [proxy.submit('time.sleep', 1.0) for _ in range(2)]
+        # both calls run at the same time, before either of them is finished
+        running = 0
+        while running < 2 and not any(call.done() for call in calls):
+            running = proxy.status()['running']
+        assert running == 2
+        assert [call.result() for call in calls] == [None, None]
+        assert all(call.latency is not None for call in calls)
+
+        assert proxy.submit('numpy.arange', 5).result() == list(range(5))
+
+    with Proxy(python='python', port=1757, workers=1, transport='binary') as proxy:
+        assert proxy.submit('numpy.arange', 5).result().tolist() == list(range(5))
+        assert proxy.latency is None
+        proxy.package = 'numpy'
+        assert proxy.ones(3).tolist() == [1.0, 1.0, 1.0]
+        assert proxy.latency is not None
+
+
+def test_worker_pool_timeout_and_cancel():
+    with Proxy(python='python', port=1755, workers=1, timeout=1.0) as proxy:
+        with pytest.raises(RPCServerError):
+            proxy.submit('time.sleep', 10).result()
+
+        proxy.timeout = None
+        call = proxy.submit('time.sleep', 10)
+        queued = proxy.submit('time.sleep', 10)
+        time.sleep(0.5)
+        assert proxy.status()['queued'] == 1
+        assert queued.cancel()
+        assert call.cancel()
+        with pytest.raises(RPCServerError):
+            call.result()
+        with pytest.raises(RPCServerError):
+            queued.result()
+
+        # the worker is replaced
+        assert proxy.submit('numpy.arange', 3).result() == [0, 1, 2]
@@ -0,0 +1,53 @@
+import random
+
+import compas
+from compas.datastructures import Mesh
+from compas.datastructures import mesh_unify_cycles
+from compas.topology import face_adjacency
+from compas.topology import unify_cycles
+
+
+def soup():
+    random.seed(0)
+    mesh = Mesh.from_obj(compas.get('faces.obj'))
+    vertices, faces = mesh.to_vertices_and_faces()
+    for face in faces:
+        if random.random() < 0.5:
+            face.reverse()
+    return vertices, faces
+
+
+def is_unified(faces):
+    halfedges = set()
+    for face in faces:
+        for u, v in zip(face, face[1:] + face[:1]):
+            if (u, v) in halfedges:
+                return False
+            halfedges.add((u, v))
+    return True
+
+
+def test_face_adjacency():
+    vertices, faces = soup()
+    adjacency = face_adjacency(vertices, faces)
+    for face, nbrs in adjacency.items():
+        for nbr in nbrs:
+            assert face in adjacency[nbr]
+            assert len(set(faces[face]) & set(faces[nbr])) == 2
+    mesh = Mesh.from_obj(compas.get('faces.obj'))
+    interior = [edge for edge in mesh.edges() if not mesh.is_edge_on_boundary(*edge)]
+    assert sum(len(nbrs) for nbrs in adjacency.values()) == 2 * len(interior)
+
+
+def test_unify_cycles():
+    vertices, faces = soup()
+    assert not is_unified(faces)
+    faces = unify_cycles(vertices, faces)
+    assert is_unified(faces)
+
+
+def test_mesh_unify_cycles():
+    vertices, faces = soup()
+    mesh = Mesh.from_vertices_and_faces(vertices, faces)
+    mesh_unify_cycles(mesh)
+    assert is_unified([mesh.face_vertices(fkey) for fkey in mesh.faces()])
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+import compas
+from compas.datastructures import Mesh
+from compas.datastructures import Network
+from compas.topology import GraphSearch
+from compas.topology import astar_shortest_path
+from compas.topology import dijkstra_distances
+
+
+@pytest.fixture
+def mesh():
+    return Mesh.from_obj(compas.get('faces_big.obj'))
+
+
+@pytest.fixture
+def network():
+    return Network.from_obj(compas.get('lines.obj'))
+
+
+def path_length(search, path):
+    length = 0
+    for u, v in zip(path[:-1], path[1:]):
+        i = search.key_index[u]
+        k = search.indices.index(search.key_index[v], search.indptr[i], search.indptr[i + 1])
+        length += search.weights[k]
+    return length
+
+
+def test_shortest_path_mesh(mesh):
+    search = GraphSearch.from_mesh(mesh)
+    keys = list(mesh.vertices())
+    random.seed(0)
+    for _ in range(10):
+        u, v = random.sample(keys, 2)
+        path = search.shortest_path(u, v)
+        assert path[0] == u and path[-1] == v
+        assert abs(path_length(search, path) - search.distances([u])[v]) < 1e-9
+        assert path_length(search, astar_shortest_path(mesh, u, v)) == pytest.approx(path_length(search, path))
+
+
+def test_shortest_path_bidirectional(mesh):
+    weight = {}
+    random.seed(0)
+    for u, v in mesh.edges():
+        weight[(u, v)] = weight[(v, u)] = random.random()
+    search = GraphSearch.from_mesh(mesh, weight)
+    distances = dijkstra_distances(mesh.adjacency, weight, 0)
+    for key, d in search.distances([0]).items():
+        assert d == pytest.approx(distances[key])
+    for key in (1, 100, 1000):
+        path = search.shortest_path(0, key)
+        assert path_length(search, path) == pytest.approx(distances[key])
+    assert search.shortest_path(5, 5) == [5]
+
+
+def test_distances(network):
+    search = GraphSearch.from_network(network)
+    leaves = network.leaves()
+    many = search.distances_many(leaves)
+    nearest = search.distances(leaves)
+    for key in network.nodes():
+        assert nearest[key] == pytest.approx(min(d[key] for d in many))
+    pairs = search.all_pairs_distances()
+    for key, d in zip(leaves, many):
+        assert pairs[key] == d
+    tree = search.paths(leaves[0])
+    assert tree[leaves[0]] is None
+    assert len(tree) == network.number_of_nodes()
+
+
+def test_disconnected():
+    search = GraphSearch({0: [1], 1: [0], 2: []})
+    assert search.shortest_path(0, 2) is None
+    assert search.distances([0]) == {0: 0.0, 1: 1.0}
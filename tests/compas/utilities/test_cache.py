@@ -0,0 +1,51 @@
+import os
+
+from compas.utilities import ResultCache
+from compas.utilities import XFunc
+
+
+def test_cache_lru():
+    cache = ResultCache(maxsize=2)
+    cache.set('a', '1')
+    cache.set('b', '2')
+    assert cache.get('a') == '1'
+    cache.set('c', '3')
+    assert cache.get('b') is None
+    assert cache.get('a') == '1'
+    assert cache.get('c') == '3'
+    assert cache.stats() == {'hits': 3, 'misses': 1, 'entries': 2, 'bytes': 2}
+
+
+def test_cache_maxbytes():
+    cache = ResultCache(maxbytes=10)
+    cache.set('a', b'12345')
+    cache.set('b', b'12345')
+    cache.set('c', b'1')
+    assert cache.get('a') is None
+    assert cache.get('b') == b'12345'
+
+
+def test_cache_disk(tmpdir):
+    directory = os.path.join(str(tmpdir), 'cache')
+    key = ResultCache.key('f', '{"args": [1]}')
+    assert key != ResultCache.key('f', '{"args": [2]}')
+    assert key != ResultCache.key('g', '{"args": [1]}')
+    cache = ResultCache(maxsize=2, memory=False, disk=True, directory=directory)
+    cache.set(key, '{"data": 1}')
+    cache.set('b', b'\x00\x01')
+    other = ResultCache(disk=True, directory=directory)
+    assert other.get(key) == '{"data": 1}'
+    assert other.get('b') == b'\x00\x01'
+    cache.set('c', 'c')
+    assert len(os.listdir(directory)) == 2
+    cache.clear()
+    assert os.listdir(directory) == []
+
+
+def test_xfunc_cache():
+    f = XFunc('compas.geometry.add_vectors', python='python', verbose=False, cache=True)
+    assert f([1, 2, 3], [4, 5, 6]) == [5, 7, 9]
+    assert f([1, 2, 3], [4, 5, 6]) == [5, 7, 9]
+    assert f([1, 2, 3], [1, 1, 1]) == [2, 3, 4]
+    assert f.cache.stats()['hits'] == 1
+    assert f.cache.stats()['misses'] == 2
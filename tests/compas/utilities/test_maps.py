@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+import compas
+from compas.utilities import geometric_key
+from compas.utilities import weld_points
+
+
+@pytest.fixture
+def points():
+    random.seed(1)
+    points = [[random.uniform(-1, 1) for _ in range(3)] for _ in range(300)]
+    # duplicates up to rounding, including negative zeros
+    points += [[x + 1e-5, y - 1e-5, z] for x, y, z in points[:100]]
+    points += [[-1e-5, 1e-5, 0.0], [0.0, 0.0, 0.0]]
+    random.shuffle(points)
+    return points
+
+
+def geometric_key_groups(points, precision):
+    gkey_group = {}
+    index = [gkey_group.setdefault(geometric_key(xyz, precision), len(gkey_group)) for xyz in points]
+    gkey_last = {geometric_key(xyz, precision): i for i, xyz in enumerate(points)}
+    return index, list(gkey_last.values())
+
+
+@pytest.mark.parametrize('precision', ['3f', '1f', 'd', None])
+def test_weld_points_geometric_key(points, precision):
+    assert weld_points(points, precision) == geometric_key_groups(points, precision)
+
+
+def test_weld_points_tolerance():
+    points = [[0, 0, 0], [0.9, 0, 0], [1.8, 0, 0], [5, 5, 5], [0.05, 0, 0]]
+    index, last = weld_points(points, '3f', tolerance=1.0)
+    assert index == [0, 0, 0, 1, 0]
+    assert last == [4, 3]
+
+
+@pytest.mark.parametrize('precision', ['3f', '1f', 'd', '2e'])
+@pytest.mark.parametrize('tolerance', [None, 0.05])
+def test_weld_points_numpy(points, precision, tolerance):
+    if compas.IPY:
+        return
+    from compas.geometry import weld_points_numpy
+    index, last = weld_points_numpy(points, precision, tolerance)
+    assert (index.tolist(), last.tolist()) == weld_points(points, precision, tolerance)